@@ -106,7 +106,7 @@ mentored by Vaclav Petras, Stephan Blumentrath, and Helena Mitasova.
 .. _GitHub: https://github.com/OSGeo/grass/blob/main/doc/examples/notebooks/jupyter_example.ipynb
 """
 
-from .interactivemap import InteractiveMap, Raster, Vector
+from .interactivemap import InteractiveMap, Raster, TiledRaster, Vector
 from .map import Map
 from .map3d import Map3D
 from .seriesmap import SeriesMap
@@ -119,6 +119,7 @@ __all__ = [
     "Map3D",
     "Raster",
     "SeriesMap",
+    "TiledRaster",
     "TimeSeriesMap",
     "Vector",
     "init",
@@ -13,20 +13,148 @@
 #            License (>=v2). Read the file COPYING that comes with GRASS
 #            for details.
 
-"""Base class for SeriesMap and TimeSeriesMap"""
+"""Base class for SeriesMap and TimeSeriesMap
 
+Frames are rendered incrementally. The base layers are rendered once to a
+background image, the layers of each frame are rendered to a transparent
+image which is composited over the background in memory. Rendered frames
+are cached by the display calls of the frame and the modification times
+of the maps used in them, so only frames which changed are rendered again.
+"""
+
+import hashlib
+import json
 import os
-from pathlib import Path
+import shutil
 import tempfile
 import weakref
-import shutil
-import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import grass.script as gs
 
 from .map import Map
 from .utils import get_number_of_cores, save_gif
 
+# Parameters of display tools with names of maps
+MAP_PARAMETERS = (
+    "map",
+    "raster",
+    "red",
+    "green",
+    "blue",
+    "hue",
+    "intensity",
+    "saturation",
+    "shade",
+    "color",
+)
+
+
+def alpha_composite(background, foreground):
+    """Composite a foreground image over a background image
+
+    Both images are arrays with RGBA values in the range 0-255 with
+    straight (not premultiplied) alpha as stored in PNG files.
+
+    :param background: array of shape (rows, cols, 4)
+    :param foreground: array of the same shape as background
+    :return: composited image as an uint8 array
+    """
+    # Lazy import to avoid an import-time dependency on NumPy.
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    background = np.asarray(background, dtype=np.float32) / 255
+    foreground = np.asarray(foreground, dtype=np.float32) / 255
+    fg_alpha = foreground[..., 3:]
+    bg_alpha = background[..., 3:] * (1 - fg_alpha)
+    alpha = fg_alpha + bg_alpha
+    color = foreground[..., :3] * fg_alpha + background[..., :3] * bg_alpha
+    np.divide(color, alpha, out=color, where=alpha > 0)
+    result = np.concatenate([color, alpha], axis=-1)
+    return np.rint(result * 255).astype(np.uint8)
+
+
+class MapTimestamps:
+    """Modification times of raster and vector maps
+
+    Maps are searched in the mapsets of the search path and the times are
+    read from the files of the maps, so no tool is run for each map.
+    """
+
+    def __init__(self, env=None):
+        """Reads the search path of the current mapset.
+
+        :param dict env: environment
+        """
+        gisenv = gs.gisenv(env=env)
+        self._location = Path(gisenv["GISDBASE"]) / gisenv["LOCATION_NAME"]
+        self._current_mapset = gisenv["MAPSET"]
+        self._search_path = gs.mapsets(search_path=True, env=env)
+        self._times = {}
+
+    def _paths(self, name, mapset, element):
+        """Return the files of a map which change when the map changes"""
+        mapset_path = self._location / mapset
+        if element == "vector":
+            directory = mapset_path / "vector" / name
+            return sorted(directory.iterdir()) if directory.is_dir() else []
+        paths = [
+            mapset_path / directory / name
+            for directory in ("cellhd", "cell", "fcell", "colr")
+        ]
+        # Color tables of rasters from other mapsets are stored in the current mapset
+        paths.append(self._location / self._current_mapset / "colr2" / mapset / name)
+        return paths
+
+    def get(self, name, element):
+        """Return the modification times of a map
+
+        :param str name: name of the map, optionally with mapset
+        :param str element: "raster" or "vector"
+        :return: tuple with the full name and the modification times of the files,
+                 the times are empty if the map was not found
+        """
+        key = (name, element)
+        if key not in self._times:
+            if "@" in name:
+                name, mapset = name.split("@", 1)
+                mapsets = [mapset]
+            else:
+                mapsets = self._search_path
+            self._times[key] = (name, ())
+            header = "vector" if element == "vector" else "cellhd"
+            for mapset in mapsets:
+                if (self._location / mapset / header / name).exists():
+                    times = tuple(
+                        path.stat().st_mtime_ns if path.exists() else 0
+                        for path in self._paths(name, mapset, element)
+                    )
+                    self._times[key] = (f"{name}@{mapset}", times)
+                    break
+        return self._times[key]
+
+    def for_calls(self, calls):
+        """Return the modification times of all maps used in display calls"""
+        times = []
+        for grass_module, kwargs in calls:
+            if grass_module is None:
+                continue
+            element = "vector" if grass_module.startswith("d.vect") else "raster"
+            for parameter in MAP_PARAMETERS:
+                value = kwargs.get(parameter)
+                if isinstance(value, str):
+                    times.extend(
+                        self.get(name, element) for name in value.split(",") if name
+                    )
+        return times
+
+
+def get_calls_key(*items):
+    """Return a hash of display calls and other JSON-serializable items"""
+    text = json.dumps(items, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
 
 class BaseSeriesMap:
     """
@@ -58,6 +186,12 @@ class BaseSeriesMap:
         self._labels = []
         self._indices = []
         self.base_file = None
+        # Key of the rendered base image and its pixels
+        self._base_key = None
+        self._base_image = None
+        # Keys and calls of the frames by index and files of rendered frames
+        self._frames = {}
+        self._frame_files = {}
 
         # Create a temporary directory for our PNG images
         # Resource managed by weakref.finalize.
@@ -101,28 +235,12 @@ class BaseSeriesMap:
         for grass_module, kwargs in self._base_layer_calls:
             img.run(grass_module, **kwargs)
 
-    def _render_worker(self, i):
-        """Function to render a single layer."""
-        filename = os.path.join(self._tmpdir.name, f"{i}.png")
-        shutil.copyfile(self.base_file, filename)
-        img = Map(
-            width=self._width,
-            height=self._height,
-            filename=filename,
-            use_region=True,
-            env=self._env,
-            read_file=True,
-        )
-        for grass_module, kwargs in self._calls[i]:
-            if grass_module is not None:
-                img.run(grass_module, **kwargs)
-        return self._indices[i], filename
-
-    def render(self):
-        """Renders image for each raster in series.
+    def _update_frames(self):
+        """Render the base image if needed and compute the keys of all frames.
 
-        Save PNGs to temporary directory. Must be run before creating a visualization
-        (i.e. show or save).
+        The keys of the frames depend on the base image, the display calls of
+        each frame, and the modification times of the maps, so frames are
+        rendered again only when one of them changes.
         """
         if not self._baseseries_added:
             msg = (
@@ -130,9 +248,36 @@ class BaseSeriesMap:
                 "Use SeriesMap.add_rasters() or SeriesMap.add_vectors()"
             )
             raise RuntimeError(msg)
-        tasks = [(i,) for i in range(len(self._indices))]
-
-        # Make base image (background and baselayers)
+        timestamps = MapTimestamps(env=self._env)
+        region = gs.region_env(env=self._env)
+        base_key = get_calls_key(
+            self._width,
+            self._height,
+            region,
+            self._base_layer_calls,
+            timestamps.for_calls(self._base_layer_calls),
+        )
+        if base_key != self._base_key:
+            self._render_base(base_key)
+        self._frames = {
+            index: (get_calls_key(base_key, calls, timestamps.for_calls(calls)), calls)
+            for index, calls in zip(self._indices, self._calls, strict=False)
+        }
+        self._base_filename_dict = {
+            index: self._frame_files[key]
+            for index, (key, unused) in self._frames.items()
+            if key in self._frame_files
+        }
+        self._layers_rendered = len(self._base_filename_dict) == len(self._frames)
+
+    def _render_base(self, base_key):
+        """Render the background and the base layers"""
+        # Lazy imports to avoid import-time dependencies on NumPy and PIL.
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        import PIL.Image  # pylint: disable=import-outside-toplevel
+
+        if self.base_file:
+            Path(self.base_file).unlink(missing_ok=True)
         # Random name needed to avoid potential conflict with layer names
         random_name_base = gs.append_random("base", 8) + ".png"
         self.base_file = os.path.join(self._tmpdir.name, random_name_base)
@@ -149,15 +294,77 @@ class BaseSeriesMap:
         img.d_erase()
         # Add baselayers
         self._render_baselayers(img)
+        with PIL.Image.open(self.base_file) as image:
+            self._base_image = np.asarray(image.convert("RGBA"))
+        self._base_key = base_key
 
-        # Render layers in respective classes
-        cores = get_number_of_cores(len(tasks), env=self._env)
-        with multiprocessing.Pool(processes=cores) as pool:
-            results = pool.starmap(self._render_worker, tasks)
+    def _render_frame(self, key, calls):
+        """Render the layers of a frame and composite them over the base image.
 
-        for i, filename in results:
-            self._base_filename_dict[i] = filename
+        :return: filename of the frame
+        """
+        # Lazy import to avoid an import-time dependency on PIL.
+        import PIL.Image  # pylint: disable=import-outside-toplevel
 
+        filename = os.path.join(self._tmpdir.name, f"{key}.png")
+        layers_file = os.path.join(self._tmpdir.name, f"{key}_layers.png")
+        # Layers are rendered over a transparent background
+        img = Map(
+            width=self._width,
+            height=self._height,
+            filename=layers_file,
+            use_region=True,
+            env=self._env,
+        )
+        for grass_module, kwargs in calls:
+            if grass_module is not None:
+                img.run(grass_module, **kwargs)
+        if Path(layers_file).exists():
+            with PIL.Image.open(layers_file) as image:
+                layers = image.convert("RGBA")
+            frame = alpha_composite(self._base_image, layers)
+            PIL.Image.fromarray(frame).save(filename)
+            os.remove(layers_file)
+        else:
+            shutil.copyfile(self.base_file, filename)
+        return filename
+
+    def _get_frame(self, index):
+        """Return the filename of a frame, render the frame if needed"""
+        filename = self._base_filename_dict.get(index)
+        if filename is None:
+            key, calls = self._frames[index]
+            filename = self._frame_files.get(key)
+            if filename is None:
+                filename = self._render_frame(key, calls)
+                self._frame_files[key] = filename
+            self._base_filename_dict[index] = filename
+        return filename
+
+    def render(self):
+        """Renders image for each raster in series.
+
+        Save PNGs to temporary directory. Must be run before creating a visualization
+        (i.e. show or save).
+
+        Only frames which changed since the last rendering are rendered.
+        """
+        self._update_frames()
+        tasks = {}
+        for key, calls in self._frames.values():
+            if key not in self._frame_files:
+                tasks[key] = calls
+        if tasks:
+            # Rendering runs the display tools in subprocesses, so threads are
+            # enough to render frames in parallel
+            cores = get_number_of_cores(len(tasks), env=self._env)
+            with ThreadPoolExecutor(max_workers=cores) as executor:
+                filenames = executor.map(self._render_frame, tasks, tasks.values())
+                self._frame_files.update(zip(tasks, filenames, strict=True))
+        self._base_filename_dict = {
+            index: self._frame_files[key]
+            for index, (key, unused) in self._frames.items()
+        }
         self._layers_rendered = True
 
     def show(self, slider_width=None):
@@ -174,9 +381,8 @@ class BaseSeriesMap:
         # Lazy Imports
         import ipywidgets as widgets  # pylint: disable=import-outside-toplevel
 
-        # Render images if they have not been already
-        if not self._layers_rendered:
-            self.render()
+        # Frames are rendered when the slider reaches them for the first time
+        self._update_frames()
 
         # Set default slider width
         if not slider_width:
@@ -214,7 +420,7 @@ class BaseSeriesMap:
 
         # Display image associated with datetime
         def change_image(index):
-            filename = self._base_filename_dict[index]
+            filename = self._get_frame(index)
             out_img.value = Path(filename).read_bytes()
 
         widgets.interactive_output(change_image, {"index": slider})
@@ -248,9 +454,8 @@ class BaseSeriesMap:
         param str text_color: color to use for the text.
         """
 
-        # Render images if they have not been already
-        if not self._layers_rendered:
-            self.render()
+        # Render frames which are not rendered or changed
+        self.render()
 
         input_files = [self._base_filename_dict[index] for index in self._indices]
 
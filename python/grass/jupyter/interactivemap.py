@@ -19,6 +19,7 @@ import base64
 import json
 from pathlib import Path
 from .reprojection_renderer import ReprojectionRenderer
+from .tileserver import RasterTileServer
 
 from .utils import (
     get_region_bounds_latlon,
@@ -144,6 +145,66 @@ class Raster(Layer):
             interactive_map.add(image)
 
 
+class TiledRaster(Layer):
+    """Overlays rasters on a folium or ipyleaflet map as XYZ tiles.
+
+    The tiles are rendered on demand by a local tile server, so only the
+    tiles in view are reprojected and rendered at the resolution of the
+    current zoom level. This is faster than Raster for large rasters.
+    The browser needs to be able to connect to the notebook kernel host.
+
+    :Basic usage:
+      .. code-block:: pycon
+
+        >>> m = ipyleaflet.Map()
+        >>> gj.TiledRaster("elevation", opacity=0.5).add_to(m)
+        >>> m
+    """
+
+    def __init__(
+        self,
+        name,
+        title=None,
+        use_region=False,
+        saved_region=None,
+        renderer=None,
+        tile_server=None,
+        **kwargs,
+    ):
+        """Register GRASS raster with a tile server.
+
+        :param tile_server: instance of RasterTileServer, a new server
+                            is started if not provided
+        """
+        super().__init__(name, title, use_region, saved_region, renderer, **kwargs)
+        if not tile_server:
+            tile_server = RasterTileServer(self._renderer)
+        self._tile_server = tile_server
+        self._url = self._tile_server.add_raster(name)
+
+    def add_to(self, interactive_map):
+        """Add tiled raster to map object which is an instance of either
+        folium.Map or ipyleaflet.Map"""
+        if get_backend(interactive_map) == "folium":
+            import folium  # pylint: disable=import-outside-toplevel
+
+            layer = folium.raster_layers.TileLayer(
+                tiles=self._url,
+                attr="GRASS",
+                name=self._title,
+                overlay=True,
+                **self._layer_kwargs,
+            )
+            layer.add_to(interactive_map)
+        else:
+            import ipyleaflet  # pylint: disable=import-outside-toplevel
+
+            layer = ipyleaflet.TileLayer(
+                url=self._url, name=self._title, **self._layer_kwargs
+            )
+            interactive_map.add(layer)
+
+
 class Vector(Layer):
     """Adds vectors to a folium or ipyleaflet map.
 
@@ -335,6 +396,7 @@ class InteractiveMap:
         self._renderer = ReprojectionRenderer(
             use_region=use_region, saved_region=saved_region
         )
+        self._tile_server = None
 
     def add_vector(self, name, title=None, **kwargs):
         """Imports vector into temporary WGS84 location, re-formats to a GeoJSON and
@@ -348,10 +410,17 @@ class InteractiveMap:
         self.vector_name.append(name)
         Vector(name, title=title, renderer=self._renderer, **kwargs).add_to(self.map)
 
-    def add_raster(self, name, title=None, **kwargs):
+    def add_raster(self, name, title=None, tiled=False, **kwargs):
         """Imports raster into temporary WGS84 location,
         exports as png and overlays on a map.
 
+        With tiled=True, the raster is displayed as XYZ tiles rendered on demand
+        by a local tile server instead, which is faster for large rasters.
+        Only the tiles in view are reprojected and rendered at the resolution
+        of the zoom level. Rendered tiles are cached, the cache is invalidated
+        when the raster or its color table changes and the raster is added again.
+        The browser needs to be able to connect to the notebook kernel host.
+
         Color table for the raster can be modified with `r.colors` before calling
         this function.
 
@@ -363,9 +432,21 @@ class InteractiveMap:
 
         :param str name: name of raster to add to display; positional-only parameter
         :param str title: raster name for layer control
-        :param kwargs: keyword arguments passed to image overlay
+        :param bool tiled: display raster as tiles rendered on demand
+        :param kwargs: keyword arguments passed to image overlay or tile layer
         """
         self.raster_name.append(name)
+        if tiled:
+            if not self._tile_server:
+                self._tile_server = RasterTileServer(self._renderer)
+            TiledRaster(
+                name,
+                title=title,
+                renderer=self._renderer,
+                tile_server=self._tile_server,
+                **kwargs,
+            ).add_to(self.map)
+            return
         Raster(name, title=title, renderer=self._renderer, **kwargs).add_to(self.map)
 
     def add_layer_control(self, **kwargs):
@@ -63,6 +63,7 @@ class ReprojectionRenderer:
         # Remember original environment; all environments used
         # in this class are derived from this one
         self._src_env = os.environ.copy()
+        self._use_region = bool(use_region or saved_region)
 
         # Set up temporary locations  in WGS84 and Pseudo-Mercator
         # We need two because folium uses WGS84 for vectors and coordinates
@@ -79,32 +80,117 @@ class ReprojectionRenderer:
             use_region, saved_region, self._src_env, self._psmerc_env
         )
 
+    @property
+    def src_env(self):
+        """Environment of the source location"""
+        return self._src_env
+
     def get_bbox(self):
         """Return bounding box of computation region in WGS84"""
         return self._region_manager.bbox
 
+    def _find_raster(self, name):
+        """Return file info of raster, raise ValueError if it does not exist"""
+        file_info = gs.find_file(name, element="cell", env=self._src_env)
+        if not file_info["fullname"]:
+            msg = (
+                f"Raster map <{name}> not found. "
+                "Please check the raster name and ensure it exists in the current project."
+            )
+            raise ValueError(msg)
+        return file_info
+
+    def get_raster_tile_bounds(self, name):
+        """Return full name of raster and its bounds in Pseudo-Mercator.
+
+        The bounds are limited to the computational region
+        if the region is used. Also enlarges the bounding box of the rendered
+        layers.
+
+        param str name: name of raster
+        """
+        full_name = self._find_raster(name)["fullname"]
+        self._region_manager.set_region_from_raster(full_name)
+        env = self._src_env.copy()
+        env["GRASS_REGION"] = gs.region_env(raster=full_name, env=env)
+        bounds = reproject_region(
+            get_region(env),
+            get_location_proj_string(env=self._src_env),
+            get_location_proj_string(env=self._psmerc_env),
+        )
+        if self._use_region:
+            region = gs.region(env=self._psmerc_env)
+            bounds["north"] = min(bounds["north"], region["n"])
+            bounds["south"] = max(bounds["south"], region["s"])
+            bounds["east"] = min(bounds["east"], region["e"])
+            bounds["west"] = max(bounds["west"], region["w"])
+        return full_name, bounds
+
+    def render_raster_tile(self, full_name, bounds, filename, size=256):
+        """Reprojects part of raster to Pseudo-Mercator and saves PNG.
+
+        Only the cells within the bounds are reprojected with the resolution
+        given by the bounds and the size of the image. The method can be called
+        from several threads at once.
+
+        param str full_name: full name of raster
+        param dict bounds: bounds of the tile in Pseudo-Mercator
+        param str filename: name of the PNG file
+        param int size: width and height of the image in pixels
+        """
+        name, mapset = full_name.split("@")
+        env = self._psmerc_env.copy()
+        env["GRASS_REGION"] = gs.region_env(
+            n=bounds["north"],
+            s=bounds["south"],
+            e=bounds["east"],
+            w=bounds["west"],
+            rows=size,
+            cols=size,
+            env=env,
+        )
+        env_info = gs.gisenv(env=self._src_env)
+        tile_name = gs.append_uuid(f"tile_{name}")
+        gs.run_command(
+            "r.proj",
+            input=name,
+            output=tile_name,
+            mapset=mapset,
+            project=env_info["LOCATION_NAME"],
+            dbase=env_info["GISDBASE"],
+            quiet=True,
+            env=env,
+        )
+        try:
+            img = Map(
+                width=size,
+                height=size,
+                env=env,
+                filename=filename,
+                use_region=True,
+            )
+            img.run("d.rast", map=tile_name)
+        finally:
+            gs.run_command(
+                "g.remove",
+                flags="f",
+                type="raster",
+                name=tile_name,
+                quiet=True,
+                env=env,
+            )
+
     def render_raster(self, name):
         """Reprojects raster to Pseudo-Mercator and saves PNG in working directory.
         Return PNG filename and bounding box of WGS84.
 
         param str name: name of raster
         """
-        # Store original name before find_file overwrites it
-        original_name = name
         # Find full name of raster
-        file_info = gs.find_file(name, element="cell", env=self._src_env)
+        file_info = self._find_raster(name)
         full_name = file_info["fullname"]
-        name = file_info["name"]
         mapset = file_info["mapset"]
 
-        # Validate that raster exists
-        if not full_name:
-            msg = (
-                f"Raster map <{original_name}> not found. "
-                "Please check the raster name and ensure it exists in the current project."
-            )
-            raise ValueError(msg)
-
         self._region_manager.set_region_from_raster(full_name)
         # Reproject raster into WGS84/epsg3857 location
         env_info = gs.gisenv(env=self._src_env)
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 import grass.jupyter as gj
+from grass.jupyter.baseseriesmap import alpha_composite
 
 IPython = pytest.importorskip("IPython", reason="IPython package not available")
 ipywidgets = pytest.importorskip(
@@ -46,3 +47,35 @@ def test_save(space_time_raster_dataset, tmp_path):
     img.add_rasters(space_time_raster_dataset.raster_names)
     gif_file = img.save(tmp_path / "image.gif")
     assert Path(gif_file).is_file()
+
+
+def test_alpha_composite():
+    """Check compositing of transparent, opaque, and semi-transparent pixels"""
+    np = pytest.importorskip("numpy", reason="numpy package not available")
+    background = np.array([[[255, 0, 0, 255], [0, 0, 0, 0], [0, 0, 255, 255]]])
+    foreground = np.array([[[0, 0, 0, 0], [0, 255, 0, 255], [255, 255, 255, 128]]])
+    result = alpha_composite(background, foreground)
+    assert result.dtype == np.uint8
+    assert result[0, 0].tolist() == [255, 0, 0, 255]
+    assert result[0, 1].tolist() == [0, 255, 0, 255]
+    assert result[0, 2].tolist() == [128, 128, 255, 255]
+
+
+@pytest.mark.needs_solo_run
+def test_render_changed_frames(space_time_raster_dataset):
+    """Check that only frames with changed calls are rendered again"""
+    img = gj.SeriesMap()
+    img.add_rasters(space_time_raster_dataset.raster_names)
+    img.render()
+    # We need to check values which are only in protected attributes
+    # pylint: disable=protected-access
+    first = dict(img._base_filename_dict)
+    img.render()
+    assert img._base_filename_dict == first
+    img.add_names([f"name {i}" for i in range(len(first))])
+    img._calls[0].append(("d.barscale", {}))
+    img.render()
+    filenames = list(img._base_filename_dict.values())
+    assert filenames[0] != first[0]
+    assert filenames[1:] == list(first.values())[1:]
+    assert all(Path(filename).is_file() for filename in filenames)
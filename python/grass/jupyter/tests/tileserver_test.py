@@ -0,0 +1,83 @@
+"""Test RasterTileServer functions"""
+
+import math
+import urllib.error
+import urllib.request
+
+import pytest
+
+from grass.jupyter.reprojection_renderer import ReprojectionRenderer
+from grass.jupyter.tileserver import (
+    WEB_MERCATOR_HALF_WORLD,
+    RasterTileServer,
+    TileCache,
+    tile_bounds,
+)
+
+
+def test_tile_bounds():
+    """Check bounds of tiles in Pseudo-Mercator"""
+    world = tile_bounds(0, 0, 0)
+    assert world["west"] == pytest.approx(-WEB_MERCATOR_HALF_WORLD)
+    assert world["north"] == pytest.approx(WEB_MERCATOR_HALF_WORLD)
+    assert world["east"] == pytest.approx(WEB_MERCATOR_HALF_WORLD)
+    assert world["south"] == pytest.approx(-WEB_MERCATOR_HALF_WORLD)
+    tile = tile_bounds(3, 1, 2)
+    assert tile["west"] == pytest.approx(WEB_MERCATOR_HALF_WORLD / 2)
+    assert tile["east"] == pytest.approx(WEB_MERCATOR_HALF_WORLD)
+    assert tile["north"] == pytest.approx(WEB_MERCATOR_HALF_WORLD / 2)
+    assert tile["south"] == pytest.approx(0, abs=1e-6)
+
+
+def test_tile_cache_eviction(tmp_path):
+    """Check that least recently used tiles are removed"""
+    cache = TileCache(tmp_path, max_tiles=2)
+    for key in ["a", "b"]:
+        cache.path(key).write_bytes(b"png")
+        cache.add(key)
+    # Use a so that b is the least recently used tile
+    assert cache.get("a") == tmp_path / "a.png"
+    cache.path("c").write_bytes(b"png")
+    cache.add("c")
+    assert "b" not in cache
+    assert not (tmp_path / "b.png").exists()
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    # Existing tiles are loaded when the cache is created again
+    assert len(TileCache(tmp_path, max_tiles=2)) == 2
+
+
+def get_tile_indices(bounds, zoom):
+    """Return the indices of the tile with the center of the bounds"""
+    size = 2 * WEB_MERCATOR_HALF_WORLD / 2**zoom
+    x = (bounds["west"] + bounds["east"]) / 2
+    y = (bounds["north"] + bounds["south"]) / 2
+    return (
+        math.floor((x + WEB_MERCATOR_HALF_WORLD) / size),
+        math.floor((WEB_MERCATOR_HALF_WORLD - y) / size),
+    )
+
+
+def test_render_tiles(simple_dataset, tmp_path):
+    """Check that tiles are rendered, cached and empty tiles are not served"""
+    renderer = ReprojectionRenderer()
+    server = RasterTileServer(renderer, cache_dir=tmp_path, nprocs=2)
+    try:
+        url = server.add_raster(simple_dataset.raster_name)
+        assert url.startswith(server.url)
+        unused, bounds = renderer.get_raster_tile_bounds(simple_dataset.raster_name)
+        x, y = get_tile_indices(bounds, 18)
+        tile_url = url.format(z=18, x=x, y=y)
+        with urllib.request.urlopen(tile_url) as response:
+            data = response.read()
+        assert data.startswith(b"\x89PNG")
+        assert len(server.cache) == 1
+        # Second request is served from the cache
+        with urllib.request.urlopen(tile_url) as response:
+            assert response.read() == data
+        assert len(server.cache) == 1
+        # Tile without data
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(url.format(z=18, x=0, y=0))
+    finally:
+        server.stop()
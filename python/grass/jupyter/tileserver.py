@@ -0,0 +1,332 @@
+#
+# AUTHOR(S): GRASS Development Team
+#
+# PURPOSE:   This module contains a local XYZ tile server which renders
+#            tiles of GRASS rasters on demand for interactive maps.
+#
+# COPYRIGHT: (C) 2025 by the GRASS Development Team
+#
+#            This program is free software under the GNU General Public
+#            License (>=v2). Read the file COPYING that comes with GRASS
+#            for details.
+
+"""Local XYZ tile server rendering GRASS rasters on demand
+
+Instead of reprojecting and rendering a whole raster at once, the tile server
+renders only the tiles requested by the map in the browser. Each tile is
+reprojected to Pseudo-Mercator with the resolution of its zoom level.
+Rendered tiles are kept in an on-disk cache with least recently used eviction.
+"""
+
+import hashlib
+import re
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import grass.script as gs
+from grass.exceptions import CalledModuleError
+
+from .utils import get_number_of_cores
+
+# Half of the extent of the Pseudo-Mercator (EPSG:3857) world in meters
+WEB_MERCATOR_HALF_WORLD = 20037508.342789244
+
+TILE_URL_PATTERN = re.compile(r"^/(\w+)/(\d+)/(\d+)/(\d+)\.png$")
+
+
+def tile_bounds(x, y, z):
+    """Return the bounds of an XYZ tile in Pseudo-Mercator
+
+    :param int x: column of the tile
+    :param int y: row of the tile counted from the north
+    :param int z: zoom level
+    :return dict: bounds with keys north, south, east, and west
+    """
+    size = 2 * WEB_MERCATOR_HALF_WORLD / 2**z
+    west = -WEB_MERCATOR_HALF_WORLD + x * size
+    north = WEB_MERCATOR_HALF_WORLD - y * size
+    return {"north": north, "south": north - size, "east": west + size, "west": west}
+
+
+def bounds_overlap(first, second):
+    """Return True if two bounds dictionaries overlap"""
+    return (
+        first["west"] < second["east"]
+        and second["west"] < first["east"]
+        and first["south"] < second["north"]
+        and second["south"] < first["north"]
+    )
+
+
+def get_raster_cache_key(full_name, env=None):
+    """Return a key which changes when the raster or its color table changes
+
+    The key is computed from the full name of the raster and the modification
+    times of its header, data, and color table files.
+
+    :param str full_name: full name of the raster
+    :param dict env: environment
+    """
+    name, mapset = full_name.split("@")
+    env_info = gs.gisenv(env=env)
+    location_path = Path(env_info["GISDBASE"]) / env_info["LOCATION_NAME"]
+    mapset_path = location_path / mapset
+    paths = [
+        mapset_path / element / name for element in ("cellhd", "cell", "fcell", "colr")
+    ]
+    # Color tables of rasters from other mapsets are stored in the current mapset
+    paths.append(location_path / env_info["MAPSET"] / "colr2" / mapset / name)
+    times = [path.stat().st_mtime_ns if path.exists() else 0 for path in paths]
+    text = "|".join([full_name, *map(str, times)])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class TileCache:
+    """On-disk cache of rendered tiles with least recently used eviction
+
+    Tiles already present in the directory are added to the cache in the
+    order of their modification times, so the directory can be reused
+    between sessions.
+    """
+
+    def __init__(self, directory, max_tiles=10000):
+        """Creates a tile cache in a directory.
+
+        :param directory: path to the cache directory
+        :param int max_tiles: maximum number of tiles kept in the cache
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_tiles = max_tiles
+        self._lock = threading.Lock()
+        self._tiles = OrderedDict()
+        existing = sorted(
+            self._directory.glob("*.png"), key=lambda path: path.stat().st_mtime
+        )
+        for path in existing:
+            self._tiles[path.stem] = path
+        self._evict()
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def __contains__(self, key):
+        return key in self._tiles
+
+    def path(self, key):
+        """Return the path where the tile with the given key is stored"""
+        return self._directory / f"{key}.png"
+
+    def temporary_path(self, key):
+        """Return a path for writing the tile before it is added to the cache
+
+        The path is in a subdirectory, so incomplete tiles are never served
+        or loaded to the cache.
+        """
+        directory = self._directory / "tmp"
+        directory.mkdir(exist_ok=True)
+        return directory / f"{key}.png"
+
+    def get(self, key):
+        """Return the path of a cached tile or None if it is not cached"""
+        with self._lock:
+            path = self._tiles.get(key)
+            if path is None:
+                return None
+            self._tiles.move_to_end(key)
+            return path
+
+    def add(self, key):
+        """Add a tile which was written to path(key) to the cache"""
+        with self._lock:
+            self._tiles[key] = self.path(key)
+            self._tiles.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Remove the least recently used tiles over the limit"""
+        while len(self._tiles) > self._max_tiles:
+            unused, path = self._tiles.popitem(last=False)
+            path.unlink(missing_ok=True)
+
+
+class _TileRequestHandler(BaseHTTPRequestHandler):
+    """Serves tiles with URLs in the form /{layer}/{z}/{x}/{y}.png"""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return the requested tile or 404 if there is no data"""
+        match = TILE_URL_PATTERN.match(self.path.split("?", 1)[0])
+        data = None
+        if match:
+            layer, z, x, y = match.groups()
+            try:
+                data = self.server.tile_server.get_tile(layer, int(z), int(x), int(y))
+            except (KeyError, OSError, CalledModuleError):
+                data = None
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Do not log the requests"""
+
+
+class RasterTileServer:
+    """Local XYZ tile server for GRASS rasters
+
+    The server runs in a background thread of the notebook kernel and renders
+    the requested tiles with a pool of worker threads. Each rendering
+    reprojects the part of the raster covered by the tile to Pseudo-Mercator
+    at the resolution of the zoom level and renders it with d.rast.
+
+    :Basic usage:
+      .. code-block:: pycon
+
+        >>> server = RasterTileServer(ReprojectionRenderer())
+        >>> url = server.add_raster("elevation")
+        >>> ipyleaflet.Map().add(ipyleaflet.TileLayer(url=url))
+
+    The browser needs to be able to connect to the kernel host, i.e., this
+    works when Jupyter runs on the local machine.
+    """
+
+    def __init__(
+        self,
+        renderer,
+        cache_dir=None,
+        max_tiles=10000,
+        nprocs=4,
+        tile_size=256,
+        host="127.0.0.1",
+        port=0,
+    ):
+        """Starts the tile server.
+
+        :param renderer: instance of ReprojectionRenderer
+        :param cache_dir: directory of the tile cache, a temporary directory
+                          is used if not provided
+        :param int max_tiles: maximum number of tiles in the cache
+        :param int nprocs: number of tiles rendered in parallel
+        :param int tile_size: width and height of the tiles in pixels
+        :param str host: address the server listens on
+        :param int port: port of the server, a free port is used for 0
+        """
+        self._renderer = renderer
+        self._tile_size = tile_size
+        if not cache_dir:
+            # Resource managed by weakref.finalize.
+            self._tmp_dir = (
+                # pylint: disable=consider-using-with
+                tempfile.TemporaryDirectory()
+            )
+            cache_dir = self._tmp_dir.name
+        else:
+            self._tmp_dir = None
+        self._cache = TileCache(cache_dir, max_tiles=max_tiles)
+        self._layers = {}
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=get_number_of_cores(nprocs, env=renderer.src_env)
+        )
+        self._server = ThreadingHTTPServer((host, port), _TileRequestHandler)
+        self._server.daemon_threads = True
+        self._server.tile_server = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        def cleanup(server, executor, tmp_dir):
+            server.shutdown()
+            server.server_close()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if tmp_dir:
+                tmp_dir.cleanup()
+
+        self._finalizer = weakref.finalize(
+            self, cleanup, self._server, self._executor, self._tmp_dir
+        )
+
+    @property
+    def url(self):
+        """Base URL of the server"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def cache(self):
+        """Tile cache of the server"""
+        return self._cache
+
+    def add_raster(self, name):
+        """Register a raster and return the URL template of its tiles.
+
+        The raster is identified by its full name and the modification times
+        of its data and color table, so a new layer is created after the
+        raster or its color table changes.
+
+        :param str name: name of the raster
+        :return str: URL template with {z}, {x}, and {y} placeholders
+        """
+        full_name, bounds = self._renderer.get_raster_tile_bounds(name)
+        layer = get_raster_cache_key(full_name, env=self._renderer.src_env)
+        self._layers[layer] = (full_name, bounds)
+        return f"{self.url}/{layer}/{{z}}/{{x}}/{{y}}.png"
+
+    def get_tile(self, layer, z, x, y):
+        """Return the PNG data of a tile or None if it is outside of the raster
+
+        Tiles are rendered once and then served from the cache. Concurrent
+        requests of the same tile wait for a single rendering.
+        """
+        full_name, bounds = self._layers[layer]
+        if not 0 <= x < 2**z or not 0 <= y < 2**z:
+            return None
+        tile = tile_bounds(x, y, z)
+        if not bounds_overlap(tile, bounds):
+            return None
+        key = f"{layer}_{self._tile_size}_{z}_{x}_{y}"
+        path = self._cache.get(key)
+        if path is None:
+            with self._lock:
+                # The tile may have been rendered in the meantime
+                path = self._cache.get(key)
+                future = self._pending.get(key)
+                if path is None and future is None:
+                    future = self._executor.submit(
+                        self._render_tile, key, full_name, tile
+                    )
+                    self._pending[key] = future
+            if path is None:
+                path = future.result()
+        return path.read_bytes()
+
+    def _render_tile(self, key, full_name, bounds):
+        """Render a tile to the cache and return its path"""
+        path = self._cache.path(key)
+        tmp_path = self._cache.temporary_path(key)
+        try:
+            self._renderer.render_raster_tile(
+                full_name, bounds, str(tmp_path), size=self._tile_size
+            )
+            tmp_path.replace(path)
+            self._cache.add(key)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        return path
+
+    def stop(self):
+        """Stop the server and the rendering threads"""
+        self._finalizer()
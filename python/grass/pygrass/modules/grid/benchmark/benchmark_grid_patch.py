@@ -0,0 +1,90 @@
+"""Benchmarking of GridModule patching after all tiles vs. streaming patching"""
+
+import time
+
+import grass.benchmark as bm
+from grass.exceptions import CalledModuleError
+from grass.pygrass.modules import Module
+from grass.pygrass.modules.grid import GridModule
+
+
+class GridModuleBenchmark:
+    """Run r.slope.aspect with GridModule and measure the time including patching"""
+
+    def __init__(self, elevation, stream_patch, tiles_per_process=4):
+        self.elevation = elevation
+        self.stream_patch = stream_patch
+        self.tiles_per_process = tiles_per_process
+        self.nprocs = 1
+        self.time = None
+
+    def __str__(self):
+        return (
+            f"GridModule r.slope.aspect elevation={self.elevation} "
+            f"stream_patch={self.stream_patch} "
+            f"tiles_per_process={self.tiles_per_process}"
+        )
+
+    def update(self, nprocs):
+        self.nprocs = nprocs
+
+    def run(self):
+        grid = GridModule(
+            "r.slope.aspect",
+            overlap=2,
+            processes=self.nprocs,
+            tiles_per_process=self.tiles_per_process,
+            stream_patch=self.stream_patch,
+            elevation=self.elevation,
+            slope="benchmark_grid_slope",
+            aspect="benchmark_grid_aspect",
+            overwrite=True,
+        )
+        start = time.perf_counter()
+        grid.run()
+        self.time = time.perf_counter() - start
+
+
+def main():
+    results = []
+
+    # Users can add more or modify existing reference maps
+    benchmark(5000, "25M", results)
+    benchmark(10000, "100M", results)
+
+    bm.nprocs_plot(results, filename="benchmark_grid_patch.svg")
+
+
+def benchmark(size, label, results):
+    reference = "benchmark_grid_patch_reference"
+    generate_map(rows=size, cols=size, fname=reference)
+    for stream_patch in (False, True):
+        module = GridModuleBenchmark(reference, stream_patch=stream_patch)
+        mode = "streaming" if stream_patch else "after all tiles"
+        results.append(
+            bm.benchmark_nprocs(
+                module, label=f"{label} patch {mode}", max_nprocs=8, repeat=3
+            )
+        )
+    Module(
+        "g.remove",
+        quiet=True,
+        flags="f",
+        type="raster",
+        name=(reference, "benchmark_grid_slope", "benchmark_grid_aspect"),
+    )
+
+
+def generate_map(rows, cols, fname):
+    Module("g.region", flags="p", rows=rows, cols=cols, res=1)
+    # Generate using r.random.surface if r.surf.fractal fails
+    try:
+        print("Generating reference map using r.surf.fractal...")
+        Module("r.surf.fractal", output=fname, overwrite=True)
+    except CalledModuleError:
+        print("r.surf.fractal fails, using r.random.surface instead...")
+        Module("r.random.surface", output=fname, overwrite=True)
+
+
+if __name__ == "__main__":
+    main()
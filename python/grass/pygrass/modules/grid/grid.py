@@ -4,11 +4,12 @@ import sys
 import multiprocessing as mltp
 import subprocess as sub
 import shutil as sht
+import time
 from math import ceil
 from pathlib import Path
 
 from grass.script.setup import write_gisrc
-from grass.script import append_node_pid, legalize_vector_name
+from grass.script import append_node_pid, legalize_vector_name, region_env
 
 from grass.pygrass.gis import Mapset, Location
 from grass.pygrass.gis.region import Region
@@ -19,7 +20,11 @@ from grass.pygrass.modules.grid.split import (
     split_region_tiles,
     split_region_in_overlapping_tiles,
 )
-from grass.pygrass.modules.grid.patch import rpatch_map, rpatch_map_r_patch_backend
+from grass.pygrass.modules.grid.patch import (
+    RasterRowPatcher,
+    rpatch_map,
+    rpatch_map_r_patch_backend,
+)
 
 
 def select(parms, ptype):
@@ -398,6 +403,64 @@ def cmd_exe(args):
     Path(gisrc_dst).unlink()
 
 
+def cmd_exe_region(args):
+    """Execute a cmd in an existing mapset using a region environment.
+
+    Unlike :func:`cmd_exe`, no mapset is created for the tile, the computational
+    region is passed to the command using the GRASS_REGION variable and the
+    raster outputs are renamed to be unique for the tile.
+
+    :param args: is a tuple that contains several information see below
+    :type args: tuple
+    :returns: None
+
+    The tuple has to contain:
+
+    - bbox (dict): a dict with the region parameters (n, s, e, w, etc.)
+      that we want to set before to apply the command.
+    - mapnames (dict): a dictionary to substitute the input if the domain has
+      been split in several tiles.
+    - gisrc (str): path of the GISRC file of the mapset where the command runs.
+    - cmd (dict): a dictionary with all the parameter of a GRASS module.
+    - outnames (dict): a dictionary to substitute the outputs with the
+      names of the tile outputs.
+
+    """
+    bbox, mapnames, gisrc, cmd, outnames = args
+    env = os.environ.copy()
+    env["GISRC"] = gisrc
+    env.pop("WIND_OVERRIDE", None)
+    shell = sys.platform == "win32"
+    if mapnames:
+        inputs = dict(cmd["inputs"])
+        inputs.update(mapnames)
+        cmd["inputs"] = inputs.items()
+        # set the region to the tile
+        region = region_env(raster=next(iter(mapnames.values())), env=env)
+    else:
+        region = region_env(env=env, **bbox)
+    env["GRASS_REGION"] = region
+    outputs = dict(cmd["outputs"])
+    outputs.update(outnames)
+    cmd["outputs"] = outputs.items()
+    # run the grass command
+    sub.Popen(get_cmd(cmd), shell=shell, env=env).wait()
+
+
+def run_tile(work):
+    """Run the function executing a tile and measure its duration.
+
+    :param work: a tuple with the tile key, the function to run
+                 (:func:`cmd_exe` or :func:`cmd_exe_region`) and its argument
+    :type work: tuple
+    :returns: a tuple with the tile key and the elapsed time in seconds
+    """
+    key, function, args = work
+    start = time.perf_counter()
+    function(args)
+    return key, time.perf_counter() - start
+
+
 class GridModule:
     # TODO maybe also i.* could be supported easily
     """Run GRASS raster commands in a multiprocessing mode.
@@ -418,6 +481,16 @@ class GridModule:
     :type mapset_prefix: str
     :param patch_backend: "r.patch", "RasterRow", or None for for default
     :type patch_backend: None or str
+    :param tiles_per_process: number of tiles per process used when the
+                              width or the height of the tiles is estimated
+    :type tiles_per_process: int
+    :param tile_mapsets: if False the tiles run in the current mapset with
+                         the region passed as an environment variable instead
+                         of creating a new mapset for each tile
+    :type tile_mapsets: bool
+    :param stream_patch: if True the results are patched while the tiles are
+                         running, each band of tiles as soon as it is finished
+    :type stream_patch: bool
     :param run\\_: if False only instantiate the object
     :type run\\_: bool
     :param args: give all the parameters to the command
@@ -427,6 +500,18 @@ class GridModule:
     When patch_backend is "r.patch", r.patch is used with nprocs=processes.
     r.patch can only be used when overlap is 0.
 
+    The tiles are dispatched to the processes one by one, the largest tiles
+    first, so a process picks a new tile as soon as it finishes the previous
+    one. Using more tiles than processes (*tiles_per_process* > 1) balances
+    the load when some tiles take longer to compute than others.
+    After running, the *timings* attribute contains the elapsed time in seconds
+    of each tile as a dictionary with (row, col) keys.
+
+    With *stream_patch*, the tiles are dispatched row by row and each band of
+    tiles is patched (and its temporary data removed when cleaning) as soon
+    as it is finished, so patching overlaps with the computation.
+    Streaming requires the RasterRow patch backend and can't be used with *move*.
+
     >>> grd = GridModule(
     ...     "r.slope.aspect",
     ...     width=500,
@@ -464,6 +549,9 @@ class GridModule:
         out_prefix="",
         mapset_prefix=None,
         patch_backend=None,
+        tiles_per_process=1,
+        tile_mapsets=True,
+        stream_patch=False,
         *args,
         **kargs,
     ):
@@ -480,6 +568,10 @@ class GridModule:
         self.out_prefix = out_prefix
         self.log = log
         self.move = move
+        self.tiles_per_process = tiles_per_process
+        self.tile_mapsets = tile_mapsets
+        self.stream_patch = stream_patch
+        self.timings = {}
         # by default RasterRow is used as previously
         # if overlap > 0, r.patch won't work properly
         if not patch_backend:
@@ -494,6 +586,10 @@ class GridModule:
             )
         else:
             self.patch_backend = patch_backend
+        if stream_patch and self.patch_backend != "RasterRow":
+            raise RuntimeError(_("Streaming patch requires 'RasterRow' patch_backend"))
+        if stream_patch and move:
+            raise RuntimeError(_("Streaming patch doesn't work with move"))
         self.gisrc_src = os.environ["GISRC"]
         self.n_mset, self.gisrc_dst = None, None
         self.estimate_tile_size()
@@ -531,6 +627,8 @@ class GridModule:
         else:
             self.mapset_prefix = append_node_pid("grid_" + legalize_vector_name(cmd))
         self.msetstr = self.mapset_prefix + "_%03d_%03d"
+        # name of the raster outputs of the tiles if tile_mapsets is False
+        self.tilestr = None if tile_mapsets else self.msetstr + "_%s"
         self.inlist = None
         if split:
             self.split()
@@ -555,6 +653,12 @@ class GridModule:
         mapsets = location.mapsets(self.mapset_prefix + "_*")
         for mset in mapsets:
             Mapset(mset).delete()
+        if not self.tile_mapsets:
+            rasters = (self.n_mset or self.mset).glist(
+                type="raster", pattern=self.mapset_prefix + "_*"
+            )
+            if rasters:
+                Module("g.remove", flags="f", type="raster", name=rasters)
         if self.n_mset and self.n_mset.is_current():
             self.mset.current()
 
@@ -594,20 +698,23 @@ class GridModule:
                 processes = len(os.sched_getaffinity(0))
             except AttributeError:
                 processes = mltp.cpu_count()
+        n_tiles = processes * self.tiles_per_process
         if self.width:
             n_tiles_x = ceil(region.cols / self.width)
-            n_tiles_y = ceil(processes / n_tiles_x)
+            n_tiles_y = ceil(n_tiles / n_tiles_x)
             self.height = ceil(region.rows / n_tiles_y)
         elif self.height:
             n_tiles_y = ceil(region.rows / self.height)
-            n_tiles_x = ceil(processes / n_tiles_y)
+            n_tiles_x = ceil(n_tiles / n_tiles_y)
             self.width = ceil(region.cols / n_tiles_x)
         else:
             self.width = region.cols
-            self.height = ceil(region.rows / processes)
+            self.height = ceil(region.rows / n_tiles)
 
     def get_works(self):
-        """Return a list of tuples with the parameters for cmd_exe function"""
+        """Return a list of tuples with the parameters for cmd_exe function,
+        or for cmd_exe_region function if tile_mapsets is False
+        """
         works = []
         reg = Region()
         if self.move:
@@ -633,6 +740,17 @@ class GridModule:
                     "ewres": "%f" % reg.ewres,
                 }
 
+                if not self.tile_mapsets:
+                    works.append(
+                        (
+                            bbox,
+                            inms,
+                            self.gisrc_dst if self.move else self.gisrc_src,
+                            cmd,
+                            self.get_tile_outputs(row, col),
+                        )
+                    )
+                    continue
                 new_mset = (
                     self.msetstr % (self.start_row + row, self.start_col + col),
                 )
@@ -648,6 +766,45 @@ class GridModule:
                 )
         return works
 
+    def get_tile_outputs(self, row, col):
+        """Return a dictionary with the names of the raster outputs of a tile
+        computed in the current mapset
+
+        :param row: the row of the tile
+        :type row: int
+        :param col: the column of the tile
+        :type col: int
+        """
+        outnames = {}
+        row, col = self.start_row + row, self.start_col + col
+        for key in self.module.outputs:
+            par = self.module.outputs[key]
+            if par.typedesc == "raster" and par.value:
+                if par.multiple:
+                    outnames[key] = [self.tilestr % (row, col, v) for v in par.value]
+                else:
+                    outnames[key] = self.tilestr % (row, col, par.value)
+        return outnames
+
+    def get_scheduled_works(self):
+        """Return the works in the order of execution, the largest tiles first,
+        or row by row if the results are patched while running.
+
+        Each work is a tuple with the (row, col) key of the tile, the function
+        to run and the parameters returned by :meth:`get_works`.
+        """
+        function = cmd_exe if self.tile_mapsets else cmd_exe_region
+        keys, sizes = [], []
+        for row, box_row in enumerate(self.bboxes):
+            for col, box in enumerate(box_row):
+                keys.append((row, col))
+                sizes.append((box.north - box.south) * (box.east - box.west))
+        works = list(zip(keys, [function] * len(keys), self.get_works(), strict=True))
+        if self.stream_patch:
+            return works
+        order = sorted(range(len(works)), key=sizes.__getitem__, reverse=True)
+        return [works[i] for i in order]
+
     def define_mapset_inputs(self):
         """Add the mapset information to the input maps"""
         for inmap in self.module.inputs:
@@ -669,29 +826,67 @@ class GridModule:
         with contextlib.ExitStack() as stack:
             if clean:
                 stack.callback(self._clean)
-            self._actual_run(patch=patch)
+            self._actual_run(patch=patch, clean=clean)
 
-    def _actual_run(self, patch):
+    def _actual_run(self, patch, clean=False):
         """Run the GRASS command
 
         :param patch: set False if you does not want to patch the results
+        :param clean: set True to remove the tiles patched while running
         """
         self.module.flags.overwrite = True
         self.define_mapset_inputs()
 
-        if self.debug:
-            for wrk in self.get_works():
-                cmd_exe(wrk)
-        else:
-            pool = mltp.Pool(processes=self.processes)
-            result = pool.map_async(cmd_exe, self.get_works())
-            result.wait()
-            pool.close()
-            pool.join()
-            if not result.successful():
-                raise RuntimeError(_("Execution of subprocesses was not successful"))
-
-        if patch:
+        self.timings = {}
+        patcher = None
+        if patch and self.stream_patch:
+            patcher = RasterRowPatcher(
+                rasters=self.get_patch_rasters(),
+                mapset=self.mset.name,
+                mset_str=self.msetstr,
+                bbox_list=split_region_tiles(width=self.width, height=self.height),
+                overwrite=self.module.flags.overwrite,
+                start_row=self.start_row,
+                start_col=self.start_col,
+                prefix=self.out_prefix,
+                name_str=self.tilestr,
+            )
+
+        def tile_done(key, elapsed):
+            self.timings[key] = elapsed
+            if patcher:
+                for row in patcher.add(*key):
+                    if clean:
+                        self.rm_band(row)
+
+        try:
+            if self.debug:
+                for wrk in self.get_scheduled_works():
+                    tile_done(*run_tile(wrk))
+            else:
+                pool = mltp.Pool(processes=self.processes)
+                # dispatch the tiles one by one to the first free process
+                result = pool.imap_unordered(
+                    run_tile, self.get_scheduled_works(), chunksize=1
+                )
+                try:
+                    for key, elapsed in result:
+                        tile_done(key, elapsed)
+                except Exception as error:
+                    raise RuntimeError(
+                        _("Execution of subprocesses was not successful")
+                    ) from error
+                finally:
+                    pool.close()
+                    pool.join()
+        finally:
+            # the outputs are closed also when a tile failed
+            if patcher:
+                patcher.close_outputs()
+
+        if patcher:
+            patcher.close()
+        elif patch:
             if self.move:
                 os.environ["GISRC"] = self.gisrc_dst
                 self.n_mset.current()
@@ -735,6 +930,40 @@ class GridModule:
             sht.rmtree(os.path.join(self.move, "PERMANENT"))
             sht.rmtree(os.path.join(self.move, self.mset.name))
 
+    def get_patch_rasters(self):
+        """Return the names of the raster outputs to patch."""
+        rasters = [
+            otm.value
+            for otm in (self.module.outputs[key] for key in self.module.outputs)
+            if otm.typedesc == "raster" and otm.value
+        ]
+        if not rasters:
+            msg = "No raster output option defined for <{}>".format(self.module.name)
+            if self.module.name == "r.mapcalc":
+                msg += ". Use <{}.simple> instead".format(self.module.name)
+            raise RuntimeError(msg)
+        return rasters
+
+    def rm_band(self, row):
+        """Remove the temporary mapsets or maps of a band of tiles.
+
+        :param row: the row of the band of tiles
+        :type row: int
+        """
+        row += self.start_row
+        for col in range(len(self.bboxes[0])):
+            mset = self.msetstr % (row, self.start_col + col)
+            if self.tile_mapsets:
+                Mapset(mset).delete()
+            else:
+                Module(
+                    "g.remove",
+                    flags="f",
+                    type="raster",
+                    pattern=mset + "_*",
+                    quiet=True,
+                )
+
     def patch(self):
         """Patch the final results."""
         bboxes = split_region_tiles(width=self.width, height=self.height)
@@ -752,6 +981,7 @@ class GridModule:
                         start_row=self.start_row,
                         start_col=self.start_col,
                         prefix=self.out_prefix,
+                        name_str=self.tilestr,
                     )
                 else:
                     rpatch_map_r_patch_backend(
@@ -763,6 +993,8 @@ class GridModule:
                         start_col=self.start_col,
                         prefix=self.out_prefix,
                         processes=self.processes,
+                        mapset=self.mset.name,
+                        name_str=self.tilestr,
                     )
                 noutputs += 1
         if noutputs < 1:
@@ -27,6 +27,36 @@ def get_start_end_index(bbox_list):
     return ss_list
 
 
+def get_tile_raster(raster, mapset, mset_str, row, col, name_str=None):
+    """Return the name and the mapset of the raster map of a tile.
+
+    :param raster: the name of the patched raster
+    :type raster: str
+    :param mapset: the name of the mapset containing the tiles if name_str is
+                   used
+    :type mapset: str
+    :param mset_str: the string to format with row and col to get the mapset
+                     of the tile
+    :type mset_str: str
+    :param row: the row of the tile
+    :type row: int
+    :param col: the column of the tile
+    :type col: int
+    :param name_str: the string to format with row, col and raster to get
+                     the name of the tile, if None the tile is the raster
+                     in the mapset of the tile
+    :type name_str: str
+
+    >>> get_tile_raster("slope", "user", "grid_%03d_%03d", 1, 2)
+    ('slope', 'grid_001_002')
+    >>> get_tile_raster("slope", "user", "grid_%03d_%03d", 1, 2, "grid_%03d_%03d_%s")
+    ('grid_001_002_slope', 'user')
+    """
+    if name_str:
+        return name_str % (row, col, raster), mapset
+    return raster, mset_str % (row, col)
+
+
 def rpatch_row(rast, rasts, bboxes):
     """Patch a row of bound boxes.
 
@@ -58,6 +88,7 @@ def rpatch_map(
     start_row=0,
     start_col=0,
     prefix="",
+    name_str=None,
 ):
     # TODO is prefix useful??
     """Patch raster using a bounding box list to trim the raster.
@@ -78,10 +109,16 @@ def rpatch_map(
     :type start_col: int
     :param prefix: the prefix of output raster
     :type prefix: str
+    :param name_str: the string to format with row, col and raster to get the
+                     name of the tiles in mapset, see :func:`get_tile_raster`
+    :type name_str: str
     """
     # Instantiate the RasterRow input objects
     rast = RasterRow(prefix + raster, mapset)
-    rtype = RasterRow(name=raster, mapset=mset_str % (0, 0))
+    name, tile_mapset = get_tile_raster(
+        raster, mapset, mset_str, start_row, start_col, name_str
+    )
+    rtype = RasterRow(name=name, mapset=tile_mapset)
     rtype.open("r")
     rast.open("w", mtype=rtype.mtype, overwrite=overwrite)
     rtype.close()
@@ -89,11 +126,10 @@ def rpatch_map(
     for row, rbbox in enumerate(bbox_list):
         rrasts = []
         for col in range(len(rbbox)):
-            rrasts.append(
-                RasterRow(
-                    name=raster, mapset=mset_str % (start_row + row, start_col + col)
-                )
+            name, tile_mapset = get_tile_raster(
+                raster, mapset, mset_str, start_row + row, start_col + col, name_str
             )
+            rrasts.append(RasterRow(name=name, mapset=tile_mapset))
             rrasts[-1].open("r")
         rasts.append(rrasts)
         rpatch_row(rast, rrasts, rbbox)
@@ -105,6 +141,122 @@ def rpatch_map(
     rast.close()
 
 
+class RasterRowPatcher:
+    """Patch raster tiles band by band as soon as the tiles are available.
+
+    The tiles can be added in any order, a band (a row of tiles) is written
+    as soon as all its tiles and all the previous bands are available.
+
+    >>> patcher = RasterRowPatcher(
+    ...     rasters=[], mapset="user", mset_str="grid_%03d_%03d", bbox_list=[[0, 0]]
+    ... )
+    >>> patcher.add(0, 1)
+    []
+    >>> patcher.add(0, 0)
+    [0]
+    >>> patcher.close()
+    """
+
+    def __init__(
+        self,
+        rasters,
+        mapset,
+        mset_str,
+        bbox_list,
+        overwrite=False,
+        start_row=0,
+        start_col=0,
+        prefix="",
+        name_str=None,
+    ):
+        """
+        :param rasters: the names of the output rasters
+        :type rasters: list of str
+
+        The other parameters are the same as in :func:`rpatch_map`.
+        """
+        self.rasters = rasters
+        self.mapset = mapset
+        self.mset_str = mset_str
+        self.bbox_list = bbox_list
+        self.overwrite = overwrite
+        self.start_row = start_row
+        self.start_col = start_col
+        self.prefix = prefix
+        self.name_str = name_str
+        self.next_row = 0
+        self._done = [set() for _ in bbox_list]
+        self._outputs = None
+
+    def _tile(self, raster, row, col):
+        """Return the RasterRow object of a tile"""
+        name, mapset = get_tile_raster(
+            raster,
+            self.mapset,
+            self.mset_str,
+            self.start_row + row,
+            self.start_col + col,
+            self.name_str,
+        )
+        return RasterRow(name=name, mapset=mapset)
+
+    def _open_outputs(self):
+        """Open the output rasters using the type of the first tiles"""
+        self._outputs = []
+        for raster in self.rasters:
+            rtype = self._tile(raster, 0, 0)
+            rtype.open("r")
+            rast = RasterRow(self.prefix + raster, self.mapset)
+            rast.open("w", mtype=rtype.mtype, overwrite=self.overwrite)
+            rtype.close()
+            self._outputs.append(rast)
+
+    def _patch_band(self, row):
+        """Write the band of tiles of a row in all the output rasters"""
+        if self._outputs is None:
+            self._open_outputs()
+        for raster, rast in zip(self.rasters, self._outputs, strict=True):
+            rrasts = []
+            for col in range(len(self.bbox_list[row])):
+                rrasts.append(self._tile(raster, row, col))
+                rrasts[-1].open("r")
+            rpatch_row(rast, rrasts, self.bbox_list[row])
+            for rst in rrasts:
+                rst.close()
+
+    def add(self, row, col):
+        """Add a finished tile and patch the bands which are complete.
+
+        :param row: the row of the tile
+        :type row: int
+        :param col: the column of the tile
+        :type col: int
+        :returns: the list of rows of the bands that were patched
+        """
+        self._done[row].add(col)
+        patched = []
+        while self.next_row < len(self.bbox_list) and len(
+            self._done[self.next_row]
+        ) == len(self.bbox_list[self.next_row]):
+            self._patch_band(self.next_row)
+            patched.append(self.next_row)
+            self.next_row += 1
+        return patched
+
+    def close_outputs(self):
+        """Close the output rasters which are open"""
+        for rast in self._outputs or []:
+            if rast.is_open():
+                rast.close()
+
+    def close(self):
+        """Close the output rasters, all the tiles must have been added"""
+        self.close_outputs()
+        if self.next_row < len(self.bbox_list):
+            msg = "Only %d of %d bands of tiles were patched"
+            raise RuntimeError(msg % (self.next_row, len(self.bbox_list)))
+
+
 def rpatch_map_r_patch_backend(
     raster,
     mset_str,
@@ -114,6 +266,8 @@ def rpatch_map_r_patch_backend(
     start_col=0,
     prefix="",
     processes=1,
+    mapset=None,
+    name_str=None,
 ):
     """Patch raster using a r.patch. Only use with overlap=0.
     Will be faster than rpatch_map, since r.patch is parallelized.
@@ -134,12 +288,19 @@ def rpatch_map_r_patch_backend(
     :type prefix: str
     :param processes: number of parallel process for r.patch
     :type processes: int
+    :param mapset: the name of mapset containing the tiles if name_str is used
+    :type mapset: str
+    :param name_str: the string to format with row, col and raster to get the
+                     name of the tiles in mapset, see :func:`get_tile_raster`
+    :type name_str: str
     """
     rasts = []
     for row, rbbox in enumerate(bbox_list):
         for col in range(len(rbbox)):
-            mapset = mset_str % (start_row + row, start_col + col)
-            rasts.append(f"{raster}@{mapset}")
+            name, tile_mapset = get_tile_raster(
+                raster, mapset, mset_str, start_row + row, start_col + col, name_str
+            )
+            rasts.append(f"{name}@{tile_mapset}")
     Module(
         "r.patch",
         input=rasts,
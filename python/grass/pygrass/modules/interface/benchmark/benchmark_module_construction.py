@@ -0,0 +1,61 @@
+"""Benchmarking of pygrass Module construction with the interface description cache
+
+Compares creating a Module without cache (the interface description is obtained
+by running the module), with the on-disk cache only, with the in-memory cache,
+and copying an existing Module object using copy and deepcopy.
+
+Run in a GRASS session.
+"""
+
+import copy
+import time
+
+from grass.pygrass.modules import Module
+from grass.pygrass.modules.interface import cache
+
+MODULES = ["r.mapcalc", "r.series.accumulate", "v.to.rast", "t.rast.list"]
+
+
+def measure(function, repeat):
+    """Return the mean time of the function call in microseconds"""
+    start = time.perf_counter()
+    for unused in range(repeat):
+        function()
+    return 1e6 * (time.perf_counter() - start) / repeat
+
+
+def no_cache(name):
+    # Skip caching by resetting the cache and clearing the disk files
+    cache.clear(disk=True)
+    Module(name, run_=False)
+
+
+def disk_cache(name):
+    cache.clear()
+    Module(name, run_=False)
+
+
+def main():
+    repeat = 100
+    for name in MODULES:
+        print(name)
+        print(f"  no cache:        {measure(lambda: no_cache(name), 10):10.1f} us")
+        Module(name, run_=False)
+        print(
+            f"  on-disk cache:   {measure(lambda: disk_cache(name), repeat):10.1f} us"
+        )
+        Module(name, run_=False)
+        print(
+            "  in-memory cache: "
+            f"{measure(lambda: Module(name, run_=False), repeat):10.1f} us"
+        )
+        module = Module(name, run_=False)
+        print(f"  copy:            {measure(module.copy, repeat):10.1f} us")
+        print(
+            "  deepcopy:        "
+            f"{measure(lambda: copy.deepcopy(module), repeat):10.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Cache of interface descriptions of GRASS modules
+
+Getting the interface description requires running the module with
+``--interface-description``. The descriptions are kept in memory and on disk
+in the user configuration directory, so a module is run at most once for each
+version of its executable.
+
+The cache key consists of the path, modification time, and size of the executable,
+the GRASS version, and the language settings which affect the translated texts
+in the description.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from grass.exceptions import GrassError
+from grass.script.core import PIPE, Popen
+
+# Environment variables which change the language of the interface description
+_LANGUAGE_VARIABLES = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+_memory_cache = {}
+# Parsed objects created from the descriptions (e.g., Module prototypes)
+_prototypes = {}
+_cache_dir = None
+_grass_version = None
+
+
+def _get_grass_version():
+    """Return the GRASS version as a string (empty if unknown)"""
+    global _grass_version
+    if _grass_version is None:
+        try:
+            from grass.app.runtime import RuntimePaths
+
+            paths = RuntimePaths()
+            _grass_version = f"{paths.version} {paths.grass_version_git}"
+        except (ImportError, AttributeError):
+            _grass_version = os.environ.get("GRASS_VERSION", "")
+    return _grass_version
+
+
+def get_cache_dir():
+    """Return the directory for the on-disk cache or None if not available"""
+    global _cache_dir
+    if _cache_dir is None:
+        try:
+            from grass.app.runtime import get_grass_config_dir
+
+            _cache_dir = (
+                Path(get_grass_config_dir(env=os.environ))
+                / "cache"
+                / "interface_descriptions"
+            )
+        except (ImportError, AttributeError, RuntimeError, OSError):
+            _cache_dir = False
+    return _cache_dir or None
+
+
+def get_cache_key(cmd):
+    """Return the cache key for the module or None if the executable is not found
+
+    :param str cmd: name of the module
+    """
+    path = shutil.which(cmd)
+    if not path:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    language = tuple(os.environ.get(name, "") for name in _LANGUAGE_VARIABLES)
+    return (cmd, path, stat.st_mtime_ns, stat.st_size, _get_grass_version(), language)
+
+
+def _read_interface_description(cmd):
+    """Run the module to get its interface description"""
+    try:
+        # call the command with --interface-description
+        process = Popen([cmd, "--interface-description"], stdout=PIPE)
+    except OSError as e:
+        str_err = "Error running: `%s --interface-description`."
+        raise GrassError(str_err % cmd) from e
+    xml = process.communicate()[0]
+    return xml, process.returncode
+
+
+def _disk_cache_path(key):
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.xml"
+
+
+def _read_disk_cache(key):
+    path = _disk_cache_path(key)
+    if path is None:
+        return None
+    try:
+        return path.read_bytes() or None
+    except OSError:
+        return None
+
+
+def _write_disk_cache(key, xml):
+    path = _disk_cache_path(key)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that other processes never
+        # read an incomplete file.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(xml)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass
+
+
+def get_interface_description(cmd):
+    """Return the cache key and the XML interface description of a module
+
+    The description is taken from the in-memory cache, the on-disk cache,
+    or by running the module, in this order. The key is None when the
+    executable was not found and the description was obtained without caching.
+
+    :param str cmd: name of the module
+    :return: tuple with the cache key and the interface description (bytes)
+    """
+    key = get_cache_key(cmd)
+    if key is None:
+        return None, _read_interface_description(cmd)[0]
+    xml = _memory_cache.get(key)
+    if xml is not None:
+        return key, xml
+    xml = _read_disk_cache(key)
+    if xml is None:
+        xml, returncode = _read_interface_description(cmd)
+        if returncode or not xml:
+            # Do not cache failures
+            return None, xml
+        _write_disk_cache(key, xml)
+    _memory_cache[key] = xml
+    return key, xml
+
+
+def get_prototype(key):
+    """Return the object created from the description with the key or None"""
+    return _prototypes.get(key)
+
+
+def set_prototype(key, prototype):
+    """Store an object created from the description with the key
+
+    The object should not be modified after it was stored.
+    """
+    if key is not None:
+        _prototypes[key] = prototype
+
+
+def clear(disk=False):
+    """Clear the in-memory cache and optionally also the on-disk cache
+
+    :param bool disk: remove also the files of the on-disk cache
+    """
+    _memory_cache.clear()
+    _prototypes.clear()
+    if disk:
+        cache_dir = get_cache_dir()
+        if cache_dir is not None and cache_dir.is_dir():
+            for path in cache_dir.glob("*.xml"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
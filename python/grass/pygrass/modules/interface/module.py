@@ -1,10 +1,14 @@
+import copy
+import heapq
 from multiprocessing import cpu_count, Process, Queue
+import threading
 import time
 from xml.etree.ElementTree import fromstring
 
 from grass.exceptions import CalledModuleError, GrassError, ParameterError
 from grass.script.core import Popen, PIPE, use_temp_region, del_temp_region
 from grass.script.utils import decode
+from . import cache as interface_cache
 from .docstring import docstring_property
 from .parameter import Parameter
 from .flag import Flag
@@ -26,12 +30,22 @@ class ParallelModuleQueue:
     Objects of type :py:class:`grass.pygrass.modules.Module` or
     :py:class:`grass.pygrass.modules.MultiModule` can be put into the
     queue using :py:meth:`put` method. When the queue is full with the maximum
-    number of parallel processes it will wait for all processes to finish,
-    sets the stdout and stderr of the Module object and removes it
-    from the queue when its finished.
-
-    To finish the queue before the maximum number of parallel
-    processes was reached, call :py:meth:`wait`.
+    number of parallel processes it will wait until any of the processes
+    finishes, sets the stdout and stderr of the Module object, removes it
+    from the queue, and starts the new process in its place. Hence, a new
+    process is started as soon as a slot is available and fast processes
+    do not wait for the slowest process of a batch.
+
+    Modules put into the queue with a priority are started immediately when
+    a slot is available, otherwise they wait in the queue without blocking
+    the caller. Waiting modules are started in order of decreasing priority
+    as slots become available, for example, to start the longest running
+    processes first.
+
+    To wait for all processes to finish, call :py:meth:`wait`.
+    The run time of each finished process is available from
+    :py:meth:`get_run_times` and a function passed as *callback* is called
+    for each finished process.
 
     This class will raise a GrassError in case a Module process exits
     with a return code other than 0.
@@ -202,17 +216,15 @@ class ParallelModuleQueue:
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_3 =3")
-        >>> queue.put(
-        ...     m
-        ... )  # Now it will wait until all procs finish and set the counter back to 0
+        >>> queue.put(m)
         >>> queue.get_num_run_procs()
-        0
+        3
         >>> new_mapcalc = copy.deepcopy(mapcalc)
         >>> mapcalc_list.append(new_mapcalc)
         >>> m = new_mapcalc(expression="test_pygrass_%i = %i" % (i, i))
-        >>> queue.put(m)
-        >>> queue.get_num_run_procs()
-        1
+        >>> queue.put(m)  # Now it will wait until any of the procs finishes
+        >>> queue.get_num_run_procs() <= 3
+        True
         >>> queue.wait()
         >>> mapcalc_list = queue.get_finished_modules()
         >>> queue.get_num_run_procs()
@@ -226,41 +238,167 @@ class ParallelModuleQueue:
         0
         0
 
+      Check priorities, the module with the highest priority is started first
+
+      .. code-block:: pycon
+
+        >>> finished = []
+        >>> queue = ParallelModuleQueue(nprocs=1, callback=finished.append)
+        >>> for i in range(3):
+        ...     m = copy.deepcopy(mapcalc)(expression="test_pygrass_%i = %i" % (i, i))
+        ...     queue.put(m, priority=i)
+        >>> queue.get_num_run_procs()
+        1
+        >>> queue.wait()
+        >>> finished[0].inputs.expression
+        'test_pygrass_0 = 0'
+        >>> len(queue.get_run_times())
+        3
+
     """  # noqa: E501
 
-    def __init__(self, nprocs=1):
+    # Time in seconds between checks of running processes
+    poll_interval = 0.01
+
+    def __init__(self, nprocs=1, callback=None):
         """Constructor
 
         :param nprocs: The maximum number of Module processes that
                        can be run in parallel, default is 1, if None
                        then use all the available CPUs.
         :type nprocs: int
+        :param callback: A function called with each finished Module object,
+                         or with the list of Module objects of a finished
+                         MultiModule
+        :type callback: callable
         """
         nprocs = int(nprocs) if nprocs else cpu_count()
         self._num_procs = nprocs
         self._list = nprocs * [None]
         self._proc_count = 0
         self._finished_modules = []  # Store all processed modules in a list
-
-    def put(self, module):
+        self._callback = callback
+        self._pending = []  # Heap of modules put with a priority
+        self._pending_count = 0
+        self._start_times = {}
+        self._run_times = []
+        # Threads waiting for the running Module objects and their results
+        self._waiters = {}
+
+    def put(self, module, priority=None):
         r"""Put the next Module or MultiModule object in the queue
 
         To run the Module objects in parallel the ``run_`` and ``finish_`` options
         of the Module must be set to False.
 
+        Without a priority, the module is started immediately if the number
+        of running processes is lower than the maximum, otherwise this method
+        waits until any of the running processes finishes. With a priority,
+        the module is started immediately if a slot is free, otherwise it is
+        added to the queue without waiting and it is started by a later call
+        of this method or by :py:meth:`wait`. Modules with higher priority
+        are started first.
+
         :param module: a preconfigured Module or MultiModule object that were configured
                        with ``run_`` and ``finish_`` set to False,
         :type module: Module or MultiModule object
+        :param priority: priority of the module, None to start it immediately
+        :type priority: int or float
         """
-        self._list[self._proc_count] = module
         # Force that finish is False, otherwise the execution
         # will not be parallel
-        self._list[self._proc_count].finish_ = False
-        self._list[self._proc_count].run()
+        module.finish_ = False
+        if priority is not None:
+            # The counter keeps the order of modules with the same priority
+            heapq.heappush(self._pending, (-priority, self._pending_count, module))
+            self._pending_count += 1
+            self._collect_finished()
+            self._start_pending()
+            return
+        if self._proc_count >= self._num_procs:
+            self._wait_for_free_slot()
+        self._start(module)
+        # Slots freed while waiting are used by the modules put with a priority.
+        self._start_pending()
+
+    def _start(self, module):
+        """Run the module in the first free slot"""
+        num = self._list.index(None)
+        self._list[num] = module
+        self._start_times[id(module)] = time.perf_counter()
+        module.run()
+        if isinstance(module, Module):
+            # The module is waited for in a thread, so the standard input is
+            # passed and the piped outputs are read while the process runs.
+            result = {}
+            thread = threading.Thread(
+                target=self._wait_module, args=(module, result), daemon=True
+            )
+            thread.start()
+            self._waiters[id(module)] = (thread, result)
         self._proc_count += 1
 
-        if self._proc_count == self._num_procs:
-            self.wait()
+    def _start_pending(self):
+        """Run modules put with a priority while there are free slots"""
+        while self._pending and self._proc_count < self._num_procs:
+            unused_priority, unused_count, module = heapq.heappop(self._pending)
+            self._start(module)
+
+    @staticmethod
+    def _wait_module(module, result):
+        """Wait for the module and store it or the raised error in result"""
+        try:
+            result["module"] = module.wait()
+        except Exception as error:  # noqa: BLE001
+            result["error"] = error
+
+    def _is_finished(self, proc):
+        """Check if the process of a running Module or MultiModule finished"""
+        if isinstance(proc, Module):
+            return not self._waiters[id(proc)][0].is_alive()
+        # The process of MultiModule puts the modules into the queue at the end,
+        # the process may not end before the queue is read.
+        return proc.p is None or not proc.q.empty() or not proc.p.is_alive()
+
+    def _finish(self, num):
+        """Wait for the process in the slot, store it, and free the slot"""
+        proc = self._list[num]
+        self._list[num] = None
+        self._proc_count -= 1
+        if isinstance(proc, Module):
+            thread, result = self._waiters.pop(id(proc))
+            thread.join()
+            if "error" in result:
+                raise result["error"]
+            finished = result["module"]
+        else:
+            finished = proc.wait()
+        self._run_times.append(
+            (proc, time.perf_counter() - self._start_times.pop(id(proc)))
+        )
+        if isinstance(proc, Module):
+            self._finished_modules.append(finished)
+        else:
+            self._finished_modules.extend(finished)
+        if self._callback:
+            self._callback(finished)
+
+    def _collect_finished(self):
+        """Store all finished processes and free their slots
+
+        :return: True if any process finished, False otherwise
+        """
+        collected = False
+        for num, proc in enumerate(self._list):
+            if proc is not None and self._is_finished(proc):
+                self._finish(num)
+                collected = True
+        return collected
+
+    def _wait_for_free_slot(self):
+        """Wait until any of the running processes finishes"""
+        while not self._collect_finished():
+            time.sleep(self.poll_interval)
 
     def get(self, num):
         """Get a Module object or list of Module objects from the queue
@@ -297,35 +435,38 @@ class ParallelModuleQueue:
                        run in parallel
         :type nprocs: int
         """
-        self._num_procs = int(nprocs)
         self.wait()
+        self._num_procs = int(nprocs)
+        self._list = self._num_procs * [None]
 
     def get_finished_modules(self):
         """Return all finished processes that were run by this queue
 
+        The modules are in the order in which they finished.
+
         :return: A list of Module objects
         """
         return self._finished_modules
 
+    def get_run_times(self):
+        """Return the run times of all finished processes
+
+        :return: A list of tuples with the Module or MultiModule object and
+                 its run time in seconds in the order in which they finished
+        """
+        return self._run_times
+
     def wait(self):
-        """Wait for all Module processes that are in the list to finish
+        """Wait for all Module processes that are in the queue to finish
         and set the modules stdout and stderr output options
 
-        :return: A list of modules that were run
+        Modules put with a priority are started in order of decreasing
+        priority as slots become available.
         """
-        for proc in self._list:
-            if proc:
-                if isinstance(proc, Module):
-                    self._finished_modules.extend(
-                        [
-                            proc.wait(),
-                        ]
-                    )
-                else:
-                    self._finished_modules.extend(proc.wait())
-
-        self._list = self._num_procs * [None]
-        self._proc_count = 0
+        self._start_pending()
+        while self._proc_count:
+            self._wait_for_free_slot()
+            self._start_pending()
 
 
 class Module:
@@ -565,47 +706,13 @@ class Module:
             msg = "Problem initializing the module {s}".format(s=cmd)
             raise GrassError(msg)
         self.name = cmd
-        try:
-            # call the command with --interface-description
-            get_cmd_xml = Popen([cmd, "--interface-description"], stdout=PIPE)
-        except OSError as e:
-            print("OSError error({0}): {1}".format(e.errno, e.strerror))
-            str_err = "Error running: `%s --interface-description`."
-            raise GrassError(str_err % self.name) from e
-        # get the xml of the module
-        self.xml = get_cmd_xml.communicate()[0]
-        # transform and parse the xml into an Element class:
-        # https://docs.python.org/library/xml.etree.elementtree.html
-        tree = fromstring(self.xml)
-
-        for e in tree:
-            if e.tag not in {"parameter", "flag"}:
-                self.__setattr__(e.tag, GETFROMTAG[e.tag](e))
-
-        #
-        # extract parameters from the xml
-        #
-        self.params_list = [Parameter(p) for p in tree.findall("parameter")]
-        self.inputs = TypeDict(Parameter)
-        self.outputs = TypeDict(Parameter)
-        self.required = []
-
-        # Insert parameters into input/output and required
-        for par in self.params_list:
-            if par.input:
-                self.inputs[par.name] = par
-            else:
-                self.outputs[par.name] = par
-            if par.required:
-                self.required.append(par.name)
-
-        #
-        # extract flags from the xml
-        #
-        flags_list = [Flag(f) for f in tree.findall("flag")]
-        self.flags = TypeDict(Flag)
-        for flag in flags_list:
-            self.flags[flag.name] = flag
+        key, self.xml = interface_cache.get_interface_description(cmd)
+        prototype = interface_cache.get_prototype(key)
+        if prototype is not None:
+            # Copy the parsed interface instead of parsing the xml again
+            self._copy_interface(prototype)
+        else:
+            self._parse_interface()
 
         #
         # Add new attributes to the class
@@ -637,10 +744,102 @@ class Module:
         self._finished = False
         self.returncode = None
 
+        if prototype is None and key is not None:
+            interface_cache.set_prototype(key, self.copy())
         if args or kargs:
             self.__call__(*args, **kargs)
         self.__call__.__func__.__doc__ = self.__doc__
 
+    def _parse_interface(self):
+        """Create parameters and flags from the xml interface description"""
+        # transform and parse the xml into an Element class:
+        # https://docs.python.org/library/xml.etree.elementtree.html
+        tree = fromstring(self.xml)
+
+        for e in tree:
+            if e.tag not in {"parameter", "flag"}:
+                self.__setattr__(e.tag, GETFROMTAG[e.tag](e))
+
+        #
+        # extract parameters from the xml
+        #
+        self.params_list = [Parameter(p) for p in tree.findall("parameter")]
+        self.inputs = TypeDict(Parameter)
+        self.outputs = TypeDict(Parameter)
+        self.required = []
+
+        # Insert parameters into input/output and required
+        for par in self.params_list:
+            if par.input:
+                self.inputs[par.name] = par
+            else:
+                self.outputs[par.name] = par
+            if par.required:
+                self.required.append(par.name)
+
+        #
+        # extract flags from the xml
+        #
+        flags_list = [Flag(f) for f in tree.findall("flag")]
+        self.flags = TypeDict(Flag)
+        for flag in flags_list:
+            self.flags[flag.name] = flag
+
+    def _copy_interface(self, other):
+        """Set attributes, parameters, and flags to copies of the ones of
+        the other module
+
+        The descriptive attributes are shared with the other module,
+        only the objects holding values are copied.
+        """
+        for key, value in other.__dict__.items():
+            if key not in self.__dict__:
+                self.__dict__[key] = value
+        params = {}
+        for key in ("inputs", "outputs"):
+            typedict = TypeDict(Parameter)
+            for name, par in getattr(other, key).items():
+                new_par = copy.copy(par)
+                # Values with multiple items are lists which must not be shared
+                if isinstance(new_par._value, list):
+                    new_par._value = list(new_par._value)
+                if isinstance(new_par._rawvalue, list):
+                    new_par._rawvalue = list(new_par._rawvalue)
+                params[id(par)] = new_par
+                typedict[name] = new_par
+            self.__dict__[key] = typedict
+        self.params_list = [params[id(par)] for par in other.params_list]
+        self.required = list(other.required)
+        self.flags = TypeDict(Flag)
+        for name, flag in other.flags.items():
+            self.flags[name] = copy.copy(flag)
+        if isinstance(self.env_, dict):
+            self.env_ = dict(self.env_)
+
+    def copy(self):
+        """Return a copy of the module with the same parameters, flags,
+        and options which can be run independently
+
+        The copy is much faster than :py:func:`copy.deepcopy` because the
+        interface description is shared and only the values are copied.
+        The state of a running or finished process is not copied.
+
+        :return: A new Module object
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.name = self.name
+        new.xml = self.xml
+        new._copy_interface(self)
+        new._popen = None
+        new.time = None
+        new.start_time = None
+        new._finished = False
+        new.returncode = None
+        return new
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
     def __call__(self, *args, **kargs):
         """Set module parameters to the class and, if ``run_`` is True execute the
         module, therefore valid parameters are all the module parameters
@@ -4,15 +4,21 @@ Created on Tue Jun 24 09:43:53 2014
 @author: pietro
 """
 
+import copy
+import os
+import tempfile
+import unittest
 from fnmatch import fnmatch
 from io import BytesIO
+from pathlib import Path
 
 from grass.gunittest.case import TestCase
 from grass.gunittest.main import test
 
-from grass.script.core import get_commands
+from grass.script.core import PIPE, get_commands
 from grass.exceptions import ParameterError
-from grass.pygrass.modules.interface import Module
+from grass.pygrass.modules.interface import Module, ParallelModuleQueue
+from grass.pygrass.modules.interface import cache as interface_cache
 
 
 SKIP = [
@@ -66,5 +72,109 @@ class TestModulesCheck(TestCase):
         self.assertIsNone(gextension.check())
 
 
+class TestModulesCopy(TestCase):
+    def test_copy(self):
+        """Test that a copy has the same values which can be changed independently"""
+        mapcalc = Module("r.mapcalc", expression="a = 1", run_=False, overwrite=True)
+        copied = mapcalc.copy()
+        self.assertEqual(copied.get_bash(), mapcalc.get_bash())
+        copied.inputs.expression = "b = 2"
+        copied.flags.overwrite = False
+        self.assertEqual(mapcalc.inputs.expression, "a = 1")
+        self.assertTrue(mapcalc.flags.overwrite)
+        self.assertEqual(copy.deepcopy(mapcalc).get_bash(), mapcalc.get_bash())
+
+    def test_cached_interface(self):
+        """Test that a module created from the cache has default values"""
+        Module("r.mapcalc", expression="a = 1", run_=False)
+        mapcalc = Module("r.mapcalc", run_=False)
+        self.assertIsNone(mapcalc.inputs.expression)
+        self.assertEqual(mapcalc.name, "r.mapcalc")
+        self.assertTrue(mapcalc.description)
+
+    def test_cached_interface_bytes(self):
+        """Test that the description is bytes when run and from the disk cache"""
+        interface_cache.clear(disk=True)
+        self.assertIsInstance(Module("r.mapcalc", run_=False).xml, bytes)
+        # only the on-disk cache is left
+        interface_cache.clear()
+        self.assertIsInstance(Module("r.mapcalc", run_=False).xml, bytes)
+
+
+class TestParallelModuleQueue(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.use_temp_region()
+        cls.runModule("g.region", n=300, s=0, e=300, w=0, res=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.del_temp_region()
+
+    def test_piped_streams(self):
+        """Test modules with standard input and large outputs in a pipe"""
+        name = "test_modules_piped_streams"
+        queue = ParallelModuleQueue(nprocs=2)
+        mapcalc = Module(
+            "r.mapcalc", file="-", stdin_=f"{name} = 1", overwrite=True, run_=False
+        )
+        queue.put(mapcalc, priority=1)
+        queue.wait()
+        try:
+            # The output of 90000 cells is larger than the buffer of the pipe
+            ascii_out = Module(
+                "r.out.ascii", input=name, output="-", stdout_=PIPE, run_=False
+            )
+            queue.put(ascii_out, priority=1)
+            queue.wait()
+        finally:
+            self.runModule("g.remove", flags="f", type="raster", name=name)
+        self.assertEqual(mapcalc.returncode, 0)
+        self.assertEqual(ascii_out.returncode, 0)
+        self.assertGreater(len(ascii_out.outputs.stdout), 2**16)
+        self.assertEqual(ascii_out.outputs.stdout.count("1"), 300 * 300)
+
+    def test_rolling_queue(self):
+        """Test that all modules run with more modules than processes"""
+        finished = []
+        queue = ParallelModuleQueue(nprocs=2, callback=finished.append)
+        for unused in range(5):
+            queue.put(Module("g.region", flags="p", run_=False))
+            self.assertLessEqual(queue.get_num_run_procs(), 2)
+        queue.wait()
+        self.assertEqual(queue.get_num_run_procs(), 0)
+        self.assertEqual(len(queue.get_finished_modules()), 5)
+        self.assertEqual(finished, queue.get_finished_modules())
+        self.assertEqual(len(queue.get_run_times()), 5)
+        for module in finished:
+            self.assertEqual(module.returncode, 0)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "Named pipes are not available")
+    def test_priority(self):
+        """Test that modules with higher priority are started first"""
+        queue = ParallelModuleQueue(nprocs=1)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The first module runs until the expression is written to the pipe
+            fifo = Path(tmp_dir) / "expression"
+            os.mkfifo(fifo)
+            first = Module("r.mapcalc", file=str(fifo), overwrite=True, run_=False)
+            first.priority = 0
+            queue.put(first, priority=0)
+            self.assertEqual(queue.get_num_run_procs(), 1)
+            for priority in (1, 3, 2):
+                module = Module("g.region", flags="p", run_=False)
+                module.priority = priority
+                queue.put(module, priority=priority)
+                self.assertEqual(queue.get_num_run_procs(), 1)
+            fifo.write_text("test_modules_priority = 1\n")
+            queue.wait()
+        self.runModule(
+            "g.remove", flags="f", type="raster", name="test_modules_priority"
+        )
+        self.assertEqual(
+            [module.priority for module in queue.get_finished_modules()], [0, 3, 2, 1]
+        )
+
+
 if __name__ == "__main__":
     test()
@@ -4,20 +4,14 @@ from grass.pygrass.modules.interface import Module
 
 
 def _get_commands():
-    """Get a list of commands (tool names)"""
-    if _get_commands.list_of_commands is None:
-        # Retrieve and store the list during the the first call of the function.
-        # pylint: disable=import-outside-toplevel
-        from grass.script.core import get_commands
-
-        _get_commands.list_of_commands = list(get_commands()[0])
-        _get_commands.list_of_commands.sort()
-    return _get_commands.list_of_commands
+    """Get a sorted list of commands (tool names)
 
+    The list is cached by get_commands() until the installation changes.
+    """
+    # pylint: disable=import-outside-toplevel
+    from grass.script.core import get_commands
 
-# Initialize the attribute of the function to indicate
-# that the data is not initialized.
-_get_commands.list_of_commands = None
+    return sorted(get_commands()[0])
 
 
 class MetaModule:
@@ -280,3 +280,126 @@ def test_patching_error(tmp_path, processes, backend):
 
         info = gs.parse_command("r.univar", flags="g", map=surface)
         assert int(info["null_cells"]) == 0
+
+
+@xfail_mp_spawn
+@pytest.mark.parametrize("tile_mapsets", [True, False])
+@pytest.mark.parametrize("patch_backend", ["r.patch", "RasterRow"])
+def test_tile_mapsets(tmp_path, tile_mapsets, patch_backend):
+    """Check running tiles without creating mapsets gives the same result"""
+    project = tmp_path / "test"
+    mapset_prefix = "abc"
+    gs.create_project(project)
+    with gs.setup.init(project):
+        gs.run_command("g.region", s=0, n=50, w=0, e=50, res=1)
+
+        points = "points"
+        reference = "reference"
+        gs.run_command("v.random", output=points, npoints=100)
+        gs.run_command(
+            "v.to.rast", input=points, output=reference, type="point", use="cat"
+        )
+
+        def run_grid_module():
+            grid = GridModule(
+                "v.to.rast",
+                width=10,
+                height=5,
+                overlap=0,
+                patch_backend=patch_backend,
+                processes=max_processes(),
+                mapset_prefix=mapset_prefix,
+                tile_mapsets=tile_mapsets,
+                input=points,
+                output="output",
+                type="point",
+                use="cat",
+            )
+            grid.run()
+            assert len(grid.timings) == 50
+
+        run_in_subprocess(run_grid_module)
+
+        mean_ref = float(gs.parse_command("r.univar", map=reference, flags="g")["mean"])
+        mean = float(gs.parse_command("r.univar", map="output", flags="g")["mean"])
+        assert abs(mean - mean_ref) < 0.0001
+        assert not gs.list_strings(type="raster", pattern=f"{mapset_prefix}_*")
+        for item in project.iterdir():
+            assert not item.name.startswith(mapset_prefix), "Mapset not cleaned"
+
+
+@xfail_mp_spawn
+@pytest.mark.parametrize("tiles_per_process", [1, 3])
+def test_tiles_per_process(tmp_path, tiles_per_process):
+    """Check over-decomposition into more tiles than processes works"""
+    project = tmp_path / "test"
+    gs.create_project(project)
+    with gs.setup.init(project):
+        gs.run_command("g.region", s=0, n=50, w=0, e=50, res=1)
+
+        surface = "surface"
+        gs.run_command("r.surf.fractal", output=surface)
+
+        def run_grid_module():
+            grid = GridModule(
+                "r.slope.aspect",
+                overlap=2,
+                processes=max_processes(),
+                tiles_per_process=tiles_per_process,
+                elevation=surface,
+                slope="slope",
+                aspect="aspect",
+            )
+            assert len(grid.get_scheduled_works()) >= max_processes()
+            grid.run()
+
+        run_in_subprocess(run_grid_module)
+
+        info = gs.raster_info("slope")
+        assert info["min"] > 0
+
+
+@xfail_mp_spawn
+@pytest.mark.parametrize("tile_mapsets", [True, False])
+@pytest.mark.parametrize("debug", [True, False])
+def test_stream_patch(tmp_path, tile_mapsets, debug):
+    """Check patching while tiles are running gives the same result"""
+    project = tmp_path / "test"
+    mapset_prefix = "abc"
+    gs.create_project(project)
+    with gs.setup.init(project):
+        gs.run_command("g.region", s=0, n=50, w=0, e=50, res=1)
+
+        points = "points"
+        reference = "reference"
+        gs.run_command("v.random", output=points, npoints=100)
+        gs.run_command(
+            "v.to.rast", input=points, output=reference, type="point", use="cat"
+        )
+
+        def run_grid_module():
+            grid = GridModule(
+                "v.to.rast",
+                width=10,
+                height=5,
+                overlap=0,
+                processes=max_processes(),
+                mapset_prefix=mapset_prefix,
+                tile_mapsets=tile_mapsets,
+                stream_patch=True,
+                debug=debug,
+                input=points,
+                output="output",
+                type="point",
+                use="cat",
+            )
+            grid.run()
+
+        run_in_subprocess(run_grid_module)
+
+        mean_ref = float(gs.parse_command("r.univar", map=reference, flags="g")["mean"])
+        mean = float(gs.parse_command("r.univar", map="output", flags="g")["mean"])
+        assert abs(mean - mean_ref) < 0.0001
+        assert not gs.list_strings(type="raster", pattern=f"{mapset_prefix}_*")
+        for item in project.iterdir():
+            assert not item.name.startswith(mapset_prefix), "Mapset not cleaned"
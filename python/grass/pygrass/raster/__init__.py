@@ -1,4 +1,6 @@
 import ctypes
+from typing import NamedTuple
+
 import numpy as np
 
 #
@@ -33,6 +35,41 @@ WARN_OVERWRITE = "Raster map <{0}> already exists and will be overwritten"
 test_raster_name = "Raster_test_map"
 
 
+class TileWindow(NamedTuple):
+    """Position of a tile in the computational region.
+
+    `row_start`, `row_end`, `col_start` and `col_end` define the tile
+    itself, `top`, `bottom`, `left` and `right` define the tile extended
+    by the overlap (halo) and clipped to the region, i.e. the extent of
+    the array yielded together with the window.
+    """
+
+    row_start: int
+    row_end: int
+    col_start: int
+    col_end: int
+    top: int
+    bottom: int
+    left: int
+    right: int
+
+    @property
+    def shape(self):
+        """Return the shape of the tile without the overlap"""
+        return (self.row_end - self.row_start, self.col_end - self.col_start)
+
+    def core(self, array):
+        """Return the view of the array without the overlap
+
+        :param array: an array with the extent of the tile with overlap
+        :type array: numpy.ndarray
+        """
+        return array[
+            self.row_start - self.top : self.row_end - self.top,
+            self.col_start - self.left : self.col_end - self.left,
+        ]
+
+
 class RasterRow(RasterAbstractBase):
     """Raster_row_access": Inherits: "Raster_abstract_base" and implements
     the default row access of the Rast library.
@@ -166,6 +203,78 @@ class RasterRow(RasterAbstractBase):
         """
         libraster.Rast_put_row(self._fd, row.p, self._gtype)
 
+    @must_be_open
+    def read_block(self, row_start=0, row_end=None, out=None):
+        """Read the rows between `row_start` and `row_end` into a 2D array.
+
+        The rows are read with `Rast_get_row` directly into the memory of
+        the output array, no intermediate Buffer is allocated.
+
+        :param int row_start: the first row to read
+        :param int row_end: the row after the last row to read, if None
+                            read until the last row of the region
+        :param out: a C-contiguous array with shape
+                    (row_end - row_start, cols) and the dtype of the map
+                    type that will be filled and returned, if None a new
+                    array is allocated
+        :type out: numpy.ndarray
+        :return: the array with the values of the rows
+
+        >>> elev = RasterRow(test_raster_name)
+        >>> elev.open()
+        >>> elev.read_block(1, 3)
+        array([[12, 22, 32, 42],
+               [13, 23, 33, 43]], dtype=int32)
+        >>> elev.close()
+
+        """
+        if row_end is None:
+            row_end = self._rows
+        if not 0 <= row_start <= row_end <= self._rows:
+            msg = "The row range [{0}, {1}) is out of range [0, {2}).".format(
+                row_start, row_end, self._rows
+            )
+            raise IndexError(msg)
+        shape = (row_end - row_start, self._cols)
+        dtype = RTYPE[self.mtype]["numpy"]
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape or out.dtype != dtype:
+            msg = "Output array is different: %r %s != %r %s"
+            raise TypeError(msg % (out.shape, out.dtype, shape, np.dtype(dtype)))
+        elif not out.flags.c_contiguous:
+            msg = "Output array must be C-contiguous"
+            raise TypeError(msg)
+        get_row = libraster.Rast_get_row
+        address = out.ctypes.data
+        stride = out.strides[0]
+        for row in range(row_start, row_end):
+            get_row(self._fd, ctypes.c_void_p(address), row, self._gtype)
+            address += stride
+        return out
+
+    @must_be_open
+    def write_block(self, array):
+        """Write the rows of a 2D array sequentially.
+
+        The rows are written with `Rast_put_row` directly from the memory
+        of the array, the array is converted only if it is not C-contiguous
+        or if its dtype differs from the map type.
+
+        :param array: an array with shape (nrows, cols)
+        :type array: numpy.ndarray
+        """
+        if array.ndim != 2 or array.shape[1] != self._cols:
+            msg = "Array and region columns are different: %r != %r"
+            raise TypeError(msg % (array.shape, (array.shape[0], self._cols)))
+        array = np.ascontiguousarray(array, dtype=RTYPE[self.mtype]["numpy"])
+        put_row = libraster.Rast_put_row
+        address = array.ctypes.data
+        stride = array.strides[0]
+        for _ in range(array.shape[0]):
+            put_row(self._fd, ctypes.c_void_p(address), self._gtype)
+            address += stride
+
     def open(self, mode=None, mtype=None, overwrite=None):
         """Open the raster if exist or created a new one.
 
@@ -616,7 +725,7 @@ def raster2numpy(rastname, mapset=""):
     :parar str mapset: the name of mapset containing raster map
     """
     with RasterRow(rastname, mapset=mapset, mode="r") as rast:
-        return np.array(rast)
+        return rast.read_block()
 
 
 def raster2numpy_img(rastname, region, color="ARGB", array=None):
@@ -701,10 +810,129 @@ def numpy2raster(array, mtype, rastname, overwrite=False):
         msg = "Region and array are different: %r != %r"
         raise TypeError(msg % ((reg.rows, reg.cols), array.shape))
     with RasterRow(rastname, mode="w", mtype=mtype, overwrite=overwrite) as new:
-        newrow = Buffer((array.shape[1],), mtype=mtype)
-        for row in array:
-            newrow[:] = row[:]
-            new.put_row(newrow)
+        new.write_block(array)
+
+
+def tile_windows(rows, cols, tile_rows, tile_cols=None, overlap=0):
+    """Return the list of windows splitting a grid in row major order
+
+    :param int rows: number of rows of the grid
+    :param int cols: number of columns of the grid
+    :param int tile_rows: number of rows of a tile
+    :param int tile_cols: number of columns of a tile, if None tiles span
+                          all the columns
+    :param int overlap: number of rows and columns added on each side of
+                        the tile
+
+    >>> for window in tile_windows(4, 4, 3, 2, overlap=1):
+    ...     window
+    TileWindow(row_start=0, row_end=3, col_start=0, col_end=2, top=0, bottom=4, left=0, right=3)
+    TileWindow(row_start=0, row_end=3, col_start=2, col_end=4, top=0, bottom=4, left=1, right=4)
+    TileWindow(row_start=3, row_end=4, col_start=0, col_end=2, top=2, bottom=4, left=0, right=3)
+    TileWindow(row_start=3, row_end=4, col_start=2, col_end=4, top=2, bottom=4, left=1, right=4)
+    """
+    if tile_cols is None:
+        tile_cols = cols
+    if tile_rows < 1 or tile_cols < 1 or overlap < 0:
+        msg = "Tile size must be positive and overlap not negative"
+        raise ValueError(msg)
+    windows = []
+    for row_start in range(0, rows, tile_rows):
+        row_end = min(row_start + tile_rows, rows)
+        top = max(row_start - overlap, 0)
+        bottom = min(row_end + overlap, rows)
+        for col_start in range(0, cols, tile_cols):
+            col_end = min(col_start + tile_cols, cols)
+            windows.append(
+                TileWindow(
+                    row_start,
+                    row_end,
+                    col_start,
+                    col_end,
+                    top,
+                    bottom,
+                    max(col_start - overlap, 0),
+                    min(col_end + overlap, cols),
+                )
+            )
+    return windows
+
+
+def raster2numpy_tiles(rastname, tile_rows=256, tile_cols=None, overlap=0, mapset=""):
+    """Yield the raster map as a sequence of ``(window, array)`` tiles
+
+    Only the rows of one band of tiles (plus the overlap) are kept in
+    memory, so maps larger than the memory can be processed with numpy.
+    The array of each tile covers the window extended by the overlap,
+    use `TileWindow.core` to get the tile without the overlap.
+
+    The arrays are views of a buffer that is reused for the next band of
+    tiles, copy them if they have to be kept.
+
+    :param str rastname: the name of raster map
+    :param int tile_rows: number of rows of a tile
+    :param int tile_cols: number of columns of a tile, if None tiles span
+                          all the columns
+    :param int overlap: number of rows and columns added on each side of
+                        the tile, e.g. for neighborhood operations
+    :param str mapset: the name of mapset containing raster map
+    """
+    with RasterRow(rastname, mapset=mapset, mode="r") as rast:
+        band = None
+        band_start = None
+        for window in tile_windows(
+            rast._rows, rast._cols, tile_rows, tile_cols, overlap
+        ):
+            if window.row_start != band_start:
+                band_start = window.row_start
+                if band is None:
+                    band = np.empty(
+                        (min(tile_rows + 2 * overlap, rast._rows), rast._cols),
+                        dtype=RTYPE[rast.mtype]["numpy"],
+                    )
+                block = band[: window.bottom - window.top]
+                rast.read_block(window.top, window.bottom, out=block)
+            yield window, block[:, window.left : window.right]
+
+
+def numpy2raster_tiles(tiles, mtype, rastname, overwrite=False):
+    """Save a sequence of ``(window, array)`` tiles to a raster map
+
+    The tiles must be in row major order and cover the computational
+    region, as yielded by `raster2numpy_tiles`. The overlap of the arrays
+    is discarded and each band of tiles is written as soon as it is
+    complete.
+
+    :param tiles: an iterable of (TileWindow, numpy.ndarray) pairs
+    :param obj mtype: the datatype of the raster map
+    :param str rastname: the name of output map
+    :param bool overwrite: True to overwrite existing map
+    """
+    reg = Region()
+    with RasterRow(rastname, mode="w", mtype=mtype, overwrite=overwrite) as new:
+        band = None
+        next_row = 0
+        next_col = 0
+        for window, array in tiles:
+            if (window.row_start, window.col_start) != (next_row, next_col):
+                msg = "Tiles are not in row major order: expected %r got %r"
+                raise ValueError(
+                    msg % ((next_row, next_col), (window.row_start, window.col_start))
+                )
+            if band is None or band.shape[0] != window.row_end - window.row_start:
+                band = np.empty(
+                    (window.row_end - window.row_start, reg.cols),
+                    dtype=RTYPE[mtype]["numpy"],
+                )
+            band[:, window.col_start : window.col_end] = window.core(array)
+            next_col = window.col_end
+            if next_col == reg.cols:
+                new.write_block(band)
+                next_row = window.row_end
+                next_col = 0
+        if next_row != reg.rows:
+            msg = "Tiles do not cover the region: %d of %d rows written"
+            raise ValueError(msg % (next_row, reg.rows))
 
 
 if __name__ == "__main__":
@@ -7,8 +7,15 @@ Created on Thu Jul 30 18:27:22 2015
 from grass.gunittest.case import TestCase
 from grass.gunittest.main import test
 from grass.gunittest.utils import xfail_windows
+import numpy as np
 from numpy.random import default_rng
-from grass.pygrass.raster import raster2numpy, numpy2raster, RasterRow
+from grass.pygrass.raster import (
+    RasterRow,
+    numpy2raster,
+    numpy2raster_tiles,
+    raster2numpy,
+    raster2numpy_tiles,
+)
 
 
 def check_raster(name):
@@ -55,6 +62,82 @@ class NumpyTestCase(TestCase):
         numpy2raster(rng.random([40, 60]), "FCELL", self.name, True)
         self.assertTrue(check_raster(self.name))
 
+    def test_read_block(self):
+        with RasterRow(self.name) as rast:
+            block = rast.read_block(10, 20)
+            out = np.empty((40, 60), dtype=block.dtype)
+            rast.read_block(out=out)
+        self.assertEqual(block.shape, (10, 60))
+        self.assertTrue(np.array_equal(block, out[10:20]))
+
+    def test_read_block_out_of_range(self):
+        with RasterRow(self.name) as rast, self.assertRaises(IndexError):
+            rast.read_block(30, 50)
+
+    @xfail_windows
+    def test_write_block(self):
+        name = self.name + "_block"
+        data = np.arange(40 * 60, dtype=np.float64).reshape(40, 60)
+        for mtype in ("CELL", "FCELL", "DCELL"):
+            numpy2raster(data, mtype, name, True)
+            result = raster2numpy(name)
+            self.assertTrue(np.array_equal(result, data))
+        self.runModule("g.remove", flags="f", type="raster", name=name)
+
+
+class NumpyTilesTestCase(TestCase):
+    name = "RasterTilesTestCase_map"
+
+    @classmethod
+    def setUpClass(cls):
+        """Create test raster map and region"""
+        cls.use_temp_region()
+        cls.runModule("g.region", n=40, s=0, e=60, w=0, res=1)
+        cls.runModule(
+            "r.mapcalc",
+            expression="%s = row() + (100 * col())" % (cls.name),
+            overwrite=True,
+        )
+        cls.numpy_obj = raster2numpy(cls.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the generated raster maps"""
+        cls.runModule(
+            "g.remove", flags="f", type="raster", name=[cls.name, cls.name + "_out"]
+        )
+        cls.del_temp_region()
+
+    def test_read_tiles(self):
+        count = 0
+        for window, array in raster2numpy_tiles(
+            self.name, tile_rows=15, tile_cols=25, overlap=2
+        ):
+            count += 1
+            self.assertTrue(
+                np.array_equal(
+                    array,
+                    self.numpy_obj[
+                        window.top : window.bottom, window.left : window.right
+                    ],
+                )
+            )
+            self.assertEqual(window.core(array).shape, window.shape)
+        self.assertEqual(count, 9)
+
+    @xfail_windows
+    def test_write_tiles(self):
+        tiles = (
+            (window, array * 2)
+            for window, array in raster2numpy_tiles(
+                self.name, tile_rows=7, tile_cols=16, overlap=1
+            )
+        )
+        numpy2raster_tiles(tiles, "CELL", self.name + "_out", overwrite=True)
+        self.assertTrue(
+            np.array_equal(raster2numpy(self.name + "_out"), self.numpy_obj * 2)
+        )
+
 
 if __name__ == "__main__":
     test()
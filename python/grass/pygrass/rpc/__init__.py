@@ -10,9 +10,13 @@ for details.
 :authors: Soeren Gebbert
 """
 
+import os
 import sys
 from ctypes import CFUNCTYPE, c_void_p
-from multiprocessing import Lock, Pipe, Process
+from multiprocessing import Lock, Pipe, Process, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
 
 import grass.lib.gis as libgis
 from grass.exceptions import FatalError
@@ -21,6 +25,7 @@ from grass.pygrass.gis.region import Region
 from grass.pygrass.raster import RasterRow, raster2numpy_img
 from grass.pygrass.vector import VectorTopo
 from grass.pygrass.vector.basic import Bbox
+from grass.pygrass.vector.geometry import FeatureArrays
 
 from .base import RPCServerBase
 
@@ -34,6 +39,7 @@ class RPCDefs:
     GET_VECTOR_TABLE_AS_DICT = 1
     GET_VECTOR_FEATURES_AS_WKB = 2
     GET_RASTER_IMAGE_AS_NP = 3
+    GET_VECTOR_FEATURES_AS_ARRAYS = 4
     G_FATAL_ERROR = 14
 
 
@@ -174,6 +180,159 @@ def _get_vector_features_as_wkb_list(lock, conn, data):
         conn.send(wkb_list)
 
 
+# Shared memory of the last response, it is unlinked with the next request
+_shared_memory = None
+
+
+def _release_shared_memory():
+    """Close and unlink the shared memory of the last response"""
+    global _shared_memory
+    if _shared_memory is not None:
+        _shared_memory.close()
+        _shared_memory.unlink()
+        _shared_memory = None
+
+
+def _arrays_to_shared_memory(arrays):
+    """Copy the arrays of a named tuple to a new shared memory block
+
+    The block is kept until the next request, so that the client can attach
+    to it in the meantime.
+
+    :param arrays: A named tuple of NumPy arrays or None
+    :return: The name of the shared memory and a list of tuples with
+             the field name, dtype, shape and offset of each array
+    """
+    global _shared_memory
+    present = [
+        (field, array)
+        for field, array in zip(arrays._fields, arrays, strict=True)
+        if array is not None
+    ]
+    layout = []
+    size = 0
+    for field, array in present:
+        layout.append((field, array.dtype.str, array.shape, size))
+        # Keep the arrays aligned to 8 bytes
+        size += -(-array.nbytes // 8) * 8
+    _shared_memory = _SharedMemory(create=True, size=max(size, 1))
+    for (unused, dtype, shape, offset), (unused, array) in zip(
+        layout, present, strict=True
+    ):
+        np.ndarray(shape, dtype, buffer=_shared_memory.buf, offset=offset)[...] = array
+    return _shared_memory.name, layout
+
+
+class _SharedMemory(SharedMemory):
+    """Shared memory which is not registered in the resource tracker
+
+    The server creates the memory and the client attaches to it. The server
+    and the client processes may share the resource tracker, so the memory
+    is not registered there and the server unlinks it explicitly.
+    """
+
+    def __init__(self, name=None, create=False, size=0):
+        if sys.version_info >= (3, 13):
+            super().__init__(name, create, size, track=False)
+        else:
+            super().__init__(name, create, size)
+            if os.name == "posix":
+                resource_tracker.unregister(self._name, "shared_memory")
+
+    def unlink(self):
+        if sys.version_info < (3, 13) and os.name == "posix":
+            # Unlinking unregisters the memory before Python 3.13
+            resource_tracker.register(self._name, "shared_memory")
+        super().unlink()
+
+
+class _AttachedSharedMemory(_SharedMemory):
+    """Shared memory created by the server process
+
+    The memory is unlinked by the server. It is never closed explicitly,
+    it is unmapped when the last array using its buffer is deleted.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        if os.name == "posix":
+            # The mapping does not need the file descriptor
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self):
+        # NumPy arrays keep a reference to the buffer, but they do not keep
+        # it exported, so closing the memory would unmap their data
+        pass
+
+
+def _arrays_from_shared_memory(name, layout, cls):
+    """Create a named tuple of arrays in shared memory without copying them
+
+    :param name: The name of the shared memory
+    :param layout: The layout returned by _arrays_to_shared_memory()
+    :param cls: The named tuple class, missing fields are None
+    """
+    memory = _AttachedSharedMemory(name)
+    arrays = dict.fromkeys(cls._fields)
+    for field, dtype, shape, offset in layout:
+        arrays[field] = np.ndarray(shape, dtype, buffer=memory.buf, offset=offset)
+    return cls(**arrays)
+
+
+def _get_vector_features_as_arrays(lock, conn, data):
+    """Return vector layer features as arrays in shared memory
+
+    supported feature types:
+    point, centroid, line, boundary, area
+
+    :param lock: A multiprocessing.Lock instance
+    :param conn: A multiprocessing.connection.Connection object obtained from
+                 multiprocessing.Pipe used to send True or False
+    :param data: The list of data entries [function_id,name,mapset,extent,
+                                           feature_type, field, wkb]
+
+    """
+    ret = None
+    try:
+        name = data[1]
+        mapset = data[2]
+        extent = data[3]
+        feature_type = data[4]
+        field = data[5]
+        wkb = data[6]
+        bbox = None
+
+        mapset = utils.get_mapset_vector(name, mapset)
+
+        if not mapset:
+            raise ValueError("Unable to find vector map <%s>" % (name))
+
+        layer = VectorTopo(name, mapset)
+
+        if layer.exist() is True:
+            if extent is not None:
+                bbox = Bbox(
+                    north=extent["north"],
+                    south=extent["south"],
+                    east=extent["east"],
+                    west=extent["west"],
+                )
+
+            layer.open("r")
+            if feature_type.lower() == "area":
+                arrays = layer.areas_to_arrays(bbox=bbox, field=field, wkb=wkb)
+            else:
+                arrays = layer.features_to_arrays(
+                    bbox=bbox, feature_type=feature_type, field=field, wkb=wkb
+                )
+            layer.close()
+            ret = _arrays_to_shared_memory(arrays)
+    finally:
+        # Send even if an exception was raised.
+        conn.send(ret)
+
+
 ###############################################################################
 
 
@@ -186,6 +345,7 @@ def _fatal_error(lock, conn, data):
 
 
 def _stop(lock, conn, data):
+    _release_shared_memory()
     conn.close()
     lock.release()
     sys.exit()
@@ -226,6 +386,7 @@ def data_provider_server(lock, conn):
     functions[RPCDefs.GET_VECTOR_TABLE_AS_DICT] = _get_vector_table_as_dict
     functions[RPCDefs.GET_VECTOR_FEATURES_AS_WKB] = _get_vector_features_as_wkb_list
     functions[RPCDefs.GET_RASTER_IMAGE_AS_NP] = _get_raster_image_as_np
+    functions[RPCDefs.GET_VECTOR_FEATURES_AS_ARRAYS] = _get_vector_features_as_arrays
     functions[RPCDefs.STOP] = _stop
     functions[RPCDefs.G_FATAL_ERROR] = _fatal_error
 
@@ -234,6 +395,8 @@ def data_provider_server(lock, conn):
         conn.poll(None)
         data = conn.recv()
         with lock:
+            # The client has attached to the memory of the last response
+            _release_shared_memory()
             functions[data[0]](lock, conn, data)
 
 
@@ -458,6 +621,72 @@ class DataProvider(RPCServerBase):
         )
         return self.safe_receive("get_vector_features_as_wkb_list")
 
+    def get_vector_features_as_arrays(
+        self, name, mapset=None, extent=None, feature_type="point", field=1, wkb=False
+    ):
+        """Return the features of a vector map as arrays.
+
+        The arrays are transferred from the server process in shared memory,
+        they are not pickled and copied.
+
+        :param extent: A dictionary of {"north":double, "south":double,
+                                        "east":double, "west":double}
+        :param feature_type: point, centroid, line, boundary or area
+        :param wkb: Include the Well Known Binary representations
+
+        See documentation: pygrass.vector.VectorTopo::features_to_arrays
+                           pygrass.vector.VectorTopo::areas_to_arrays
+
+        Usage:
+
+        .. code-block:: pycon
+
+            >>> from grass.pygrass.rpc import DataProvider
+            >>> provider = DataProvider()
+            >>> arrays = provider.get_vector_features_as_arrays(
+            ...     name=test_vector_name, extent=None, feature_type="point"
+            ... )
+            >>> arrays.ids.tolist(), arrays.cats.tolist()
+            ([1, 2, 3], [1, 1, 1])
+            >>> arrays.coords.tolist()
+            [[10.0, 6.0], [12.0, 6.0], [14.0, 6.0]]
+            >>> arrays.wkb is None
+            True
+
+            >>> extent = {"north": 6.6, "south": 5.5, "east": 14.5, "west": 13.5}
+            >>> arrays = provider.get_vector_features_as_arrays(
+            ...     name=test_vector_name, extent=extent, feature_type="point", wkb=True
+            ... )
+            >>> arrays.ids.tolist(), len(arrays.wkb_bytes(0))
+            ([3], 21)
+
+            >>> arrays = provider.get_vector_features_as_arrays(
+            ...     name=test_vector_name, extent=None, feature_type="area", wkb=True
+            ... )
+            >>> arrays.ids.tolist(), arrays.wkb_offsets.tolist()
+            ([1, 2, 3, 4], [0, 225, 366, 459, 600])
+
+            >>> provider.get_vector_features_as_arrays(name="no_map")
+            >>> provider.stop()
+
+        """  # noqa: E501
+        self.check_server()
+        self.client_conn.send(
+            [
+                RPCDefs.GET_VECTOR_FEATURES_AS_ARRAYS,
+                name,
+                mapset,
+                extent,
+                feature_type,
+                field,
+                wkb,
+            ]
+        )
+        ret = self.safe_receive("get_vector_features_as_arrays")
+        if ret is None:
+            return None
+        return _arrays_from_shared_memory(*ret, FeatureArrays)
+
 
 if __name__ == "__main__":
     import doctest
@@ -3,6 +3,7 @@ from pathlib import Path
 import grass.lib.gis as libgis
 import ctypes
 
+import numpy as np
 
 # flake8: noqa: E402
 libgis.G_gisinit("")
@@ -16,6 +17,10 @@ from grass.pygrass.vector.geometry import (
     read_line,
     read_next_line,
     Area as _Area,
+    AttrsCache,
+    FeatureArraysBuilder,
+    Line,
+    Point,
 )
 from grass.pygrass.vector.abstract import Info
 from grass.pygrass.vector.basic import Bbox, Cats, Ilist
@@ -70,7 +75,9 @@ class Vector(Info):
         self._topo_level = 1
         self._class_name = "Vector"
         self.overwrite = False
-        self._cats = []
+        # Categories with attributes written in this session and the last of them
+        self._cats = set()
+        self._last_cat = 0
 
     def __repr__(self):
         if self.exist():
@@ -194,17 +201,28 @@ class Vector(Info):
         if attrs and cat is None:
             # TODO: this does not work as expected when there are
             # already features in the map when we opened it
-            cat = (self._cats[-1] if self._cats else 0) + 1
-
+            cat = self._last_cat + 1
+
+        if cat is not None and self._add_cat(cat):
+            if self.table is not None and attrs is not None:
+                attr = [cat, *attrs]
+                cur = self.table.conn.cursor()
+                cur.execute(self.table.columns.insert_str, attr)
+                cur.close()
+
+        self._write_feature(geo_obj, cat)
+
+    def _add_cat(self, cat):
+        """Register a category, return False if it was already written"""
+        if cat in self._cats:
+            return False
+        self._cats.add(cat)
+        self._last_cat = cat
+        return True
+
+    def _write_feature(self, geo_obj, cat=None):
+        """Set the category of a geometry feature and write it to the map"""
         if cat is not None:
-            if cat not in self._cats:
-                self._cats.append(cat)
-                if self.table is not None and attrs is not None:
-                    attr = [cat, *attrs]
-                    cur = self.table.conn.cursor()
-                    cur.execute(self.table.columns.insert_str, attr)
-                    cur.close()
-
             cats = Cats(geo_obj.c_cats)
             cats.reset()
             cats.set(cat, self.layer)
@@ -224,6 +242,138 @@ class Vector(Info):
             # return offset into file where the feature starts (on level 1)
             geo_obj.offset = result
 
+    @must_be_open
+    def write_many(self, features, cats=None, attrs=None, batch_size=10000):
+        """Write many geometry features and their attributes.
+
+        The attributes are inserted with ``executemany`` in batches of
+        *batch_size* rows. Like with ``write()``, the changes of the attribute
+        table are not committed. Points can be provided as an array of
+        coordinates, which are written without creating a geometry object
+        for each point.
+
+        :param features: geometry objects, or an array of point coordinates
+                         with two or three columns
+        :type features: list or numpy.ndarray
+        :param cats: the categories of the features, if None and attributes
+                     are provided, the categories continue after the last
+                     written category, otherwise the categories of the
+                     geometry objects are used
+        :type cats: list of int
+        :param attrs: the attributes of the features without the category,
+                      attributes are inserted only for the first feature
+                      with each category
+        :type attrs: list of tuple
+        :param batch_size: the number of rows inserted at once
+        :type batch_size: int
+
+        ::
+
+            >>> import numpy as np
+            >>> new = VectorTopo("newvect_many")
+            >>> cols = [("cat", "INTEGER PRIMARY KEY"), ("value", "DOUBLE")]
+            >>> new.open("w", tab_name="newvect_many", tab_cols=cols)
+            >>> coords = np.array([(0, 0), (1, 1), (2, 2)])
+            >>> new.write_many(coords, attrs=[(0.5,), (1.5,), (2.5,)])
+            >>> new.table.conn.commit()
+            >>> new.table.execute().fetchall()
+            [(1, 0.5), (2, 1.5), (3, 2.5)]
+            >>> new.close()
+            >>> new.open(mode="r")
+            >>> new.read(3)
+            Point(2.000000, 2.000000)
+            >>> new.close()
+            >>> new.remove()
+
+        ..
+        """
+        is_array = isinstance(features, np.ndarray)
+        if is_array:
+            features = np.asarray(features, dtype=np.float64)
+            if features.ndim != 2 or features.shape[1] not in {2, 3}:
+                msg = "The coordinates must have two or three columns, not shape {}"
+                raise ValueError(msg.format(features.shape))
+        n_features = len(features)
+        if attrs is not None and cats is None:
+            cats = range(self._last_cat + 1, self._last_cat + 1 + n_features)
+        for name, values in (("categories", cats), ("attributes", attrs)):
+            if values is not None and len(values) != n_features:
+                msg = "The number of {name} ({n}) does not match the features ({f})"
+                raise ValueError(msg.format(name=name, n=len(values), f=n_features))
+        insert = self.table is not None and attrs is not None
+        rows = []
+
+        if is_array:
+            # One structure is reused for all points
+            point = Point()
+            c_points = point.c_points
+            c_cats = point.c_cats
+            coords = features.tolist()
+        for i in range(n_features):
+            cat = None if cats is None else cats[i]
+            if cat is not None and self._add_cat(cat) and insert:
+                rows.append((cat, *attrs[i]))
+                if len(rows) >= batch_size:
+                    self.table.insert(rows, many=True)
+                    rows = []
+            if not is_array:
+                self._write_feature(features[i], cat)
+                continue
+            libvect.Vect_reset_line(c_points)
+            libvect.Vect_append_point(c_points, *coords[i])
+            libvect.Vect_reset_cats(c_cats)
+            if cat is not None:
+                libvect.Vect_cat_set(c_cats, self.layer, cat)
+            if (
+                libvect.Vect_write_line(
+                    self.c_mapinfo, libvect.GV_POINT, c_points, c_cats
+                )
+                == -1
+            ):
+                msg = "Not able to write the vector feature."
+                raise GrassError(msg)
+        if rows:
+            self.table.insert(rows, many=True)
+        self.n_lines += n_features
+
+    @must_be_open
+    def prefetch_attrs(self, columns=None, block_size=10000):
+        """Prefetch attributes of features and buffer their updates.
+
+        The values of the columns are loaded for blocks of categories with one
+        query, so reading ``feature.attrs`` of many features does not run
+        a query for each of them. Updates of attributes are buffered and
+        written with ``executemany`` by ``feature.attrs.commit()``,
+        ``cache.commit()``, or when the map is closed.
+
+        :param columns: names of the columns to prefetch, all columns are
+                        prefetched if None
+        :type columns: list of str
+        :param block_size: number of categories loaded by one query
+        :type block_size: int
+        :return: the attribute cache, set to ``self.table.attrs_cache``
+
+        ::
+
+            >>> test_vect = VectorTopo(test_vector_name)
+            >>> test_vect.open("r")
+            >>> cache = test_vect.prefetch_attrs(["name", "value"])
+            >>> [point.attrs["value"] for point in test_vect.viter("points")]
+            [1.0, 1.0, 1.0]
+            >>> test_vect.close()
+
+        ..
+        """
+        if self.table is None:
+            msg = "The vector map has no attribute table."
+            raise GrassError(msg)
+        if self.table.attrs_cache is not None:
+            self.table.attrs_cache.flush()
+        self.table.attrs_cache = AttrsCache(
+            self.table, columns=columns, block_size=block_size
+        )
+        return self.table.attrs_cache
+
     @must_be_open
     def has_color_table(self):
         """Return if vector has color table associated in file system;
@@ -943,6 +1093,196 @@ class VectorTopo(Vector):
 
         return wkb_list
 
+    @must_be_open
+    def features_to_arrays(self, bbox=None, feature_type="point", field=1, wkb=False):
+        """Return all features of type point, line, boundary or centroid
+        located in a specific bounding box as contiguous arrays.
+
+        Unlike features_to_wkb_list(), the features are collected in a single
+        pass into a few NumPy arrays instead of a tuple for each feature,
+        see FeatureArrays for the layout.
+
+        :param bbox: The boundingbox to search for features,
+                    if bbox=None the boundingbox of the whole
+                    vector map layer is used
+        :type bbox: grass.pygrass.vector.basic.Bbox
+
+        :param feature_type: The type of feature, supported are point, line,
+                             boundary, and centroid
+        :type feature_type: string
+
+        :param field: The category field
+        :type field: integer
+
+        :param wkb: Include the Well Known Binary representations
+                    of the features
+        :type wkb: bool
+
+        :return: FeatureArrays, the arrays are empty if nothing was found
+
+        Examples:
+
+        .. code-block:: pycon
+
+         >>> from grass.pygrass.vector import VectorTopo
+         >>> from grass.pygrass.vector.basic import Bbox
+         >>> test_vect = VectorTopo(test_vector_name)
+         >>> test_vect.open("r")
+
+         >>> bbox = Bbox(north=20, south=-1, east=20, west=-1)
+         >>> arrays = test_vect.features_to_arrays(bbox=bbox, wkb=True)
+         >>> arrays.ids.tolist(), arrays.cats.tolist()
+         ([1, 2, 3], [1, 1, 1])
+         >>> arrays.coords.tolist()
+         [[10.0, 6.0], [12.0, 6.0], [14.0, 6.0]]
+         >>> arrays.wkb_offsets.tolist()
+         [0, 21, 42, 63]
+
+         >>> arrays = test_vect.features_to_arrays(feature_type="line")
+         >>> arrays.ids.tolist(), arrays.cats.tolist()
+         ([4, 5, 6], [2, 2, 2])
+         >>> arrays.ring_offsets.tolist()
+         [0, 3, 6, 9]
+         >>> arrays.rings(0)[0].tolist()
+         [[10.0, 4.0], [10.0, 2.0], [10.0, 0.0]]
+
+         >>> arrays = test_vect.features_to_arrays(bbox=bbox, feature_type="boundary")
+         >>> arrays.n_features
+         11
+         >>> arrays.cats.tolist()
+         [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1]
+
+         >>> test_vect.close()
+
+        """  # noqa: E501
+        supported = ["point", "line", "boundary", "centroid"]
+
+        if feature_type.lower() not in supported:
+            raise GrassError(
+                "Unsupported feature type <%s>, "
+                "supported are <%s>" % (feature_type, ",".join(supported))
+            )
+
+        if bbox is None:
+            bbox = self.bbox()
+
+        bboxlist = self.find_by_bbox.geos(
+            bbox, type=feature_type.lower(), bboxlist_only=True
+        )
+
+        builder = FeatureArraysBuilder(with_z=self.is_3D(), with_wkb=wkb)
+        # The line is used only to hold the points and categories
+        line = Line()
+        size = ctypes.c_size_t()
+        cat = ctypes.c_int()
+        error = ctypes.c_int()
+
+        for f_id in bboxlist.ids if bboxlist else []:
+            barray = None
+            if wkb:
+                barray = libvect.Vect_read_line_to_wkb(
+                    self.c_mapinfo,
+                    line.c_points,
+                    line.c_cats,
+                    f_id,
+                    ctypes.byref(size),
+                    ctypes.byref(error),
+                )
+                if not barray:
+                    if error.value == -1:
+                        raise GrassError(_("Unable to read line of feature %i") % f_id)
+                    continue
+            elif (
+                libvect.Vect_read_line(self.c_mapinfo, line.c_points, line.c_cats, f_id)
+                == -1
+            ):
+                raise GrassError(_("Unable to read line of feature %i") % f_id)
+            ok = libvect.Vect_cat_get(line.c_cats, field, ctypes.byref(cat))
+            builder.add_feature(f_id, cat.value if ok > 0 else -1, barray, size.value)
+            builder.add_ring(line.c_points)
+            if barray:
+                libgis.G_free(barray)
+
+        return builder.build()
+
+    @must_be_open
+    def areas_to_arrays(self, bbox=None, field=1, wkb=False):
+        """Return all areas located in a specific bounding box
+        as contiguous arrays.
+
+        The outer ring of each area is followed by the rings of its isles,
+        see FeatureArrays for the layout.
+
+        :param bbox: The boundingbox to search for areas,
+                    if bbox=None the boundingbox of the whole
+                    vector map layer is used
+        :type bbox: grass.pygrass.vector.basic.Bbox
+
+        :param field: The centroid category field
+        :type field: integer
+
+        :param wkb: Include the Well Known Binary representations of the areas
+        :type wkb: bool
+
+        :return: FeatureArrays, the arrays are empty if nothing was found
+
+        Examples:
+
+        .. code-block:: pycon
+
+         >>> from grass.pygrass.vector import VectorTopo
+         >>> test_vect = VectorTopo(test_vector_name)
+         >>> test_vect.open("r")
+
+         >>> arrays = test_vect.areas_to_arrays(wkb=True)
+         >>> arrays.ids.tolist(), arrays.cats.tolist()
+         ([1, 2, 3, 4], [3, 3, 3, 3])
+         >>> arrays.geometry_offsets.tolist()
+         [0, 2, 3, 4, 5]
+         >>> np.diff(arrays.wkb_offsets).tolist()
+         [225, 141, 93, 141]
+
+         >>> test_vect.close()
+        """
+        if bbox is None:
+            bbox = self.bbox()
+
+        bboxlist = self.find_by_bbox.areas(bbox, bboxlist_only=True)
+
+        builder = FeatureArraysBuilder(with_z=self.is_3D(), with_wkb=wkb)
+        # The line is used only to hold the points and categories
+        line = Line()
+        size = ctypes.c_size_t()
+        cat = ctypes.c_int()
+
+        for a_id in bboxlist.ids if bboxlist else []:
+            barray = None
+            if wkb:
+                barray = libvect.Vect_read_area_to_wkb(
+                    self.c_mapinfo, a_id, ctypes.byref(size)
+                )
+                if not barray:
+                    raise GrassError(_("Unable to read area with id %i") % a_id)
+
+            pcat = -1
+            c_ok = libvect.Vect_get_area_cats(self.c_mapinfo, a_id, line.c_cats)
+            if c_ok == 0:  # Centroid found
+                ok = libvect.Vect_cat_get(line.c_cats, field, ctypes.byref(cat))
+                if ok > 0:
+                    pcat = cat.value
+
+            builder.add_feature(a_id, pcat, barray, size.value)
+            if barray:
+                libgis.G_free(barray)
+            libvect.Vect_get_area_points(self.c_mapinfo, a_id, line.c_points)
+            builder.add_ring(line.c_points)
+            for i in range(libvect.Vect_get_area_num_isles(self.c_mapinfo, a_id)):
+                isle = libvect.Vect_get_area_isle(self.c_mapinfo, a_id, i)
+                libvect.Vect_get_isle_points(self.c_mapinfo, isle, line.c_points)
+                builder.add_ring(line.c_points)
+
+        return builder.build()
+
 
 if __name__ == "__main__":
     import doctest
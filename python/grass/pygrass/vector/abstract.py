@@ -457,6 +457,10 @@ class Info:
         :type build: bool
         """
         if hasattr(self, "table") and self.table is not None:
+            if self.table.attrs_cache is not None:
+                # Write and commit the buffered updates of attributes
+                self.table.attrs_cache.commit()
+                self.table.attrs_cache = None
             self.table.conn.close()
         if self.is_open():
             if (
@@ -0,0 +1,61 @@
+"""Benchmarking of writing many points with pygrass
+
+Writes 10^6 points with attributes using Vector.write() for each point and
+using Vector.write_many() with the coordinates in a NumPy array.
+
+Run in a GRASS session, the vector maps are removed at the end.
+"""
+
+import time
+
+import numpy as np
+
+import grass.script as gs
+from grass.pygrass.vector import Vector
+from grass.pygrass.vector.geometry import Point
+
+NUM_POINTS = 1000000
+NAME = "benchmark_write_many"
+COLUMNS = [("cat", "INTEGER PRIMARY KEY"), ("value", "DOUBLE PRECISION")]
+
+
+def write_each(name, coords, values):
+    """Write the points one by one"""
+    with Vector(name, mode="w", tab_cols=COLUMNS, overwrite=True) as vect:
+        for (x, y), value in zip(coords.tolist(), values.tolist(), strict=True):
+            vect.write(Point(x, y), attrs=(value,))
+        vect.table.conn.commit()
+
+
+def write_many(name, coords, values):
+    """Write all points at once"""
+    with Vector(name, mode="w", tab_cols=COLUMNS, overwrite=True) as vect:
+        vect.write_many(coords, attrs=[(value,) for value in values.tolist()])
+        vect.table.conn.commit()
+
+
+def measure(function, *args):
+    """Return the time of the function call in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(1)
+    coords = rng.uniform(0, 1000, size=(NUM_POINTS, 2))
+    values = rng.uniform(0, 100, size=NUM_POINTS)
+    try:
+        print(f"{NUM_POINTS} points with attributes")
+        seconds = measure(write_each, f"{NAME}_each", coords, values)
+        print(f"  write() per point: {seconds:8.2f} s")
+        seconds = measure(write_many, f"{NAME}_many", coords, values)
+        print(f"  write_many():      {seconds:8.2f} s")
+    finally:
+        gs.run_command(
+            "g.remove", flags="f", type="vector", pattern=f"{NAME}_*", quiet=True
+        )
+
+
+if __name__ == "__main__":
+    main()
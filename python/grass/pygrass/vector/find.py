@@ -6,12 +6,17 @@ Created on Tue Mar 19 11:09:30 2013
 
 from __future__ import annotations
 
+import ctypes
+from multiprocessing import Pool
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 import grass.lib.vector as libvect
 from grass.pygrass.errors import must_be_open
-from grass.pygrass.vector.basic import BoxList, Ilist
-from grass.pygrass.vector.geometry import Area, Isle, Node, read_line
+from grass.pygrass.utils import decode
+from grass.pygrass.vector.basic import Bbox, BoxList, Ilist
+from grass.pygrass.vector.geometry import Area, Isle, Line, Node, read_line
 
 if TYPE_CHECKING:
     from grass.pygrass.vector.table import Table
@@ -19,6 +24,36 @@ if TYPE_CHECKING:
 # For test purposes
 test_vector_name = "find_doctest_map"
 
+# Vector map opened in the processes of the batch queries
+_worker_vector = None
+
+
+def _init_finder_worker(name, mapset):
+    """Open the vector map in a process of the batch queries"""
+    from grass.pygrass.vector import VectorTopo
+
+    global _worker_vector
+    _worker_vector = VectorTopo(name, mapset)
+    _worker_vector.open("r")
+
+
+def _find_in_worker(task):
+    """Run a batch query on a part of the queries in a worker process"""
+    finder, method, args, kwargs = task
+    return getattr(_worker_vector.find[finder], method)(*args, **kwargs)
+
+
+def _concatenate_id_lists(results):
+    """Concatenate the offsets and ids returned for parts of the queries"""
+    offsets = [np.zeros(1, dtype=np.int64)]
+    ids = []
+    start = 0
+    for part_offsets, part_ids in results:
+        offsets.append(part_offsets[1:] + start)
+        ids.append(part_ids)
+        start += len(part_ids)
+    return np.concatenate(offsets), np.concatenate(ids)
+
 
 class AbstractFinder:
     def __init__(
@@ -50,6 +85,57 @@ class AbstractFinder:
 
         return abstract.is_open(self.c_mapinfo)
 
+    def _map_parts(self, finder, method, arrays, kwargs, nprocs):
+        """Run a batch query split into parts in parallel processes
+
+        The search functions of the vector library use static buffers,
+        so each process opens the vector map itself.
+
+        :param finder: The key of the finder in Vector.find
+        :param method: The name of the batch query method
+        :param arrays: The arrays with the queries, None is passed unchanged
+        :param kwargs: The keyword arguments of the method
+        :param nprocs: The number of processes
+        :return: A list with the results of the parts in the order of queries
+        """
+        name, mapset = decode(libvect.Vect_get_full_name(self.c_mapinfo)).split("@")
+        n_queries = len(arrays[0])
+        parts = np.array_split(np.arange(n_queries), min(n_queries, 4 * nprocs))
+        tasks = [
+            (
+                finder,
+                method,
+                [None if array is None else array[part] for array in arrays],
+                kwargs,
+            )
+            for part in parts
+        ]
+        with Pool(
+            nprocs, initializer=_init_finder_worker, initargs=(name, mapset)
+        ) as pool:
+            return pool.map(_find_in_worker, tasks)
+
+
+def _point_coordinates(x, y, z=None):
+    """Return the coordinates of points as arrays of the same size"""
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if z is not None:
+        z = np.asarray(z, dtype=np.float64).ravel()
+    if len(y) != len(x) or (z is not None and len(z) != len(x)):
+        msg = "The coordinates must have the same number of points"
+        raise ValueError(msg)
+    return x, y, z
+
+
+def _bbox_edges(bboxes):
+    """Return the edges of boundingboxes as an array with four or six columns"""
+    bboxes = np.asarray(bboxes, dtype=np.float64)
+    if bboxes.ndim != 2 or bboxes.shape[1] not in {4, 6}:
+        msg = "The boundingboxes must have four or six columns, not shape {}"
+        raise ValueError(msg.format(bboxes.shape))
+    return bboxes
+
 
 class PointFinder(AbstractFinder):
     """Point finder
@@ -393,6 +479,146 @@ class PointFinder(AbstractFinder):
                 writeable=self.writeable,
             )
 
+    @must_be_open
+    def geo_many(self, x, y, maxdist, type="all", z=None, nprocs=1):
+        """Find the nearest vector feature around many points.
+
+        The same as geo(), but for arrays of coordinates and without
+        creating geometry objects.
+
+        :param x: The x coordinates of the points
+        :param y: The y coordinates of the points
+        :param maxdist: The maximum search distance around the points
+        :type maxdist: float
+
+        :param type: The type of feature to search for
+                     Valid type are all the keys in find.vtype dictionary
+        :type type: string
+
+        :param z: The z coordinates of the points, if None the search is 2D
+        :param nprocs: The number of processes for the search, each of them
+                       opens the vector map
+        :type nprocs: int
+
+        :return: A tuple of arrays with the ids of the features and the
+                 distances to them, the id is 0 and the distance NaN for
+                 points with no feature within the maximum distance
+
+        This methods uses libvect.Vect_find_line() and
+        libvect.Vect_line_distance()
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> from grass.pygrass.vector import VectorTopo
+            >>> test_vect = VectorTopo(test_vector_name)
+            >>> test_vect.open("r")
+
+            >>> ids, dists = test_vect.find_by_point.geo_many(
+            ...     x=[10, 10, 14.5, 20], y=[0, 6, 2, 20], maxdist=1
+            ... )
+            >>> ids.tolist()
+            [4, 1, 6, 0]
+            >>> dists.tolist()
+            [0.0, 0.0, 0.5, nan]
+
+            >>> test_vect.close()
+        """
+        x, y, z = _point_coordinates(x, y, z)
+        if nprocs > 1 and len(x) > 1:
+            results = self._map_parts(
+                "by_point",
+                "geo_many",
+                (x, y, z),
+                {"maxdist": maxdist, "type": type},
+                nprocs,
+            )
+            return tuple(
+                np.concatenate(arrays) for arrays in zip(*results, strict=True)
+            )
+
+        ids = np.zeros(len(x), dtype=np.int64)
+        dists = np.full(len(x), np.nan)
+        with_z = int(z is not None)
+        vtype = self.vtype[type]
+        maxdist = float(maxdist)
+        # The line is used only to hold the points of the found features
+        line = Line()
+        dist = ctypes.c_double()
+        zs = np.zeros_like(x) if z is None else z
+        for i, (px, py, pz) in enumerate(
+            zip(x.tolist(), y.tolist(), zs.tolist(), strict=True)
+        ):
+            f_id = libvect.Vect_find_line(
+                self.c_mapinfo, px, py, pz, vtype, maxdist, with_z, 0
+            )
+            if not f_id:
+                continue
+            libvect.Vect_read_line(self.c_mapinfo, line.c_points, None, f_id)
+            libvect.Vect_line_distance(
+                line.c_points,
+                px,
+                py,
+                pz,
+                with_z,
+                None,
+                None,
+                None,
+                ctypes.byref(dist),
+                None,
+                None,
+            )
+            ids[i] = f_id
+            dists[i] = dist.value
+        return ids, dists
+
+    @must_be_open
+    def area_many(self, x, y, nprocs=1):
+        """Find the areas of many points.
+
+        The same as area(), but for arrays of coordinates and without
+        creating Area objects.
+
+        :param x: The x coordinates of the points
+        :param y: The y coordinates of the points
+        :param nprocs: The number of processes for the search, each of them
+                       opens the vector map
+        :type nprocs: int
+
+        :return: An array with the area ids, 0 for points outside of areas
+
+        This methods uses libvect.Vect_find_area()
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> from grass.pygrass.vector import VectorTopo
+            >>> test_vect = VectorTopo(test_vector_name)
+            >>> test_vect.open("r")
+
+            >>> test_vect.find_by_point.area_many(
+            ...     x=[0.5, 5, 7, 2, 20], y=[0.5, 1, 1, 2, 20]
+            ... ).tolist()
+            [1, 2, 4, 3, 0]
+
+            >>> test_vect.close()
+        """
+        x, y, unused = _point_coordinates(x, y)
+        if nprocs > 1 and len(x) > 1:
+            results = self._map_parts("by_point", "area_many", (x, y), {}, nprocs)
+            return np.concatenate(results)
+
+        return np.fromiter(
+            (
+                libvect.Vect_find_area(self.c_mapinfo, px, py)
+                for px, py in zip(x.tolist(), y.tolist(), strict=True)
+            ),
+            dtype=np.int64,
+            count=len(x),
+        )
+
 
 class BboxFinder(AbstractFinder):
     """Bounding Box finder
@@ -595,6 +821,133 @@ class BboxFinder(AbstractFinder):
                 for a_id in boxlist.ids
             )
 
+    @must_be_open
+    def geos_many(self, bboxes, type="all", nprocs=1):
+        """Find vector features inside many boundingboxes.
+
+        The same as geos(), but for an array of boundingboxes and without
+        creating geometry objects.
+
+        :param bboxes: An array with the north, south, east, and west edges
+                       of the boundingboxes, optionally followed by the top
+                       and bottom
+        :param type: The type of feature to search for
+                     Valid type are all the keys in find.vtype dictionary
+        :type type: string
+
+        :param nprocs: The number of processes for the search, each of them
+                       opens the vector map
+        :type nprocs: int
+
+        :return: A tuple of the offsets and the ids of the found features,
+                 the features of the boundingbox ``i`` are
+                 ``ids[offsets[i]:offsets[i + 1]]``
+
+        This methods uses :py:meth:`libvect.Vect_select_lines_by_box`
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> from grass.pygrass.vector import VectorTopo
+            >>> test_vect = VectorTopo(test_vector_name)
+            >>> test_vect.open("r")
+
+            >>> bboxes = [(7, -1, 11, 9), (20, 18, 20, 18), (7, 5, 15, 11)]
+            >>> offsets, ids = test_vect.find_by_bbox.geos_many(bboxes)
+            >>> offsets.tolist(), ids.tolist()
+            ([0, 2, 2, 4], [4, 1, 2, 3])
+
+            >>> test_vect.close()
+        """
+        bboxes = _bbox_edges(bboxes)
+        if nprocs > 1 and len(bboxes) > 1:
+            results = self._map_parts(
+                "by_bbox", "geos_many", (bboxes,), {"type": type}, nprocs
+            )
+            return _concatenate_id_lists(results)
+
+        vtype = self.vtype[type]
+        return self._select_many(
+            bboxes,
+            lambda c_bbox, c_boxlist: libvect.Vect_select_lines_by_box(
+                self.c_mapinfo, c_bbox, vtype, c_boxlist
+            ),
+        )
+
+    @must_be_open
+    def areas_many(self, bboxes, nprocs=1):
+        """Find areas inside many boundingboxes.
+
+        The same as areas(), but for an array of boundingboxes and without
+        creating Area objects.
+
+        :param bboxes: An array with the north, south, east, and west edges
+                       of the boundingboxes, optionally followed by the top
+                       and bottom
+        :param nprocs: The number of processes for the search, each of them
+                       opens the vector map
+        :type nprocs: int
+
+        :return: A tuple of the offsets and the ids of the found areas,
+                 the areas of the boundingbox ``i`` are
+                 ``ids[offsets[i]:offsets[i + 1]]``
+
+        This methods uses libvect.Vect_select_areas_by_box()
+
+        Examples:
+
+        .. code-block:: pycon
+
+            >>> from grass.pygrass.vector import VectorTopo
+            >>> test_vect = VectorTopo(test_vector_name)
+            >>> test_vect.open("r")
+
+            >>> bboxes = [(5, -1, 5, 3.5), (20, 18, 20, 18)]
+            >>> offsets, ids = test_vect.find_by_bbox.areas_many(bboxes)
+            >>> offsets.tolist(), ids.tolist()
+            ([0, 2, 2], [1, 2])
+
+            >>> test_vect.close()
+        """
+        bboxes = _bbox_edges(bboxes)
+        if nprocs > 1 and len(bboxes) > 1:
+            results = self._map_parts("by_bbox", "areas_many", (bboxes,), {}, nprocs)
+            return _concatenate_id_lists(results)
+
+        return self._select_many(
+            bboxes,
+            lambda c_bbox, c_boxlist: libvect.Vect_select_areas_by_box(
+                self.c_mapinfo, c_bbox, c_boxlist
+            ),
+        )
+
+    def _select_many(self, bboxes, select):
+        """Run a selection by boundingbox for each row of the bboxes array
+
+        One Bbox and one BoxList holding only ids are reused for all
+        selections.
+        """
+        bbox = Bbox()
+        found = BoxList()
+        found.c_boxlist.contents.have_boxes = 0
+        sizes = np.zeros(len(bboxes), dtype=np.int64)
+        ids = []
+        for i, edges in enumerate(bboxes.tolist()):
+            bbox.north, bbox.south, bbox.east, bbox.west = edges[:4]
+            if len(edges) == 6:
+                bbox.top, bbox.bottom = edges[4:]
+            if select(bbox.c_bbox, found.c_boxlist) and found.n_values:
+                ids.append(
+                    np.ctypeslib.as_array(
+                        found.c_boxlist.contents.id, shape=(found.n_values,)
+                    ).astype(np.int64)
+                )
+                sizes[i] = found.n_values
+        offsets = np.zeros(len(bboxes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        return offsets, np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+
     @must_be_open
     def islands(self, bbox, bboxlist_only=False):
         """Find isles inside a boundingbox.
@@ -6,7 +6,8 @@ Created on Wed Jul 18 10:46:25 2012
 
 import ctypes
 import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from itertools import pairwise
 
 import numpy as np
 
@@ -135,6 +136,324 @@ def get_xyz(pnt):
     return x, y, z
 
 
+def c_points_to_arrays(c_points):
+    """Return NumPy views of the x, y, and z coordinates of a line_pnts structure.
+
+    The arrays share the memory with the structure, no coordinates are copied.
+    The views are valid only until points are added to or removed from
+    the structure or until it is freed.
+
+    >>> line = Line([(0, 0), (1, 2)])
+    >>> x, y, z = c_points_to_arrays(line.c_points)
+    >>> x, y
+    (array([0., 1.]), array([0., 2.]))
+
+    """
+    n_points = c_points.contents.n_points
+    if n_points == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty
+    return tuple(
+        np.ctypeslib.as_array(coords, shape=(n_points,))
+        for coords in (c_points.contents.x, c_points.contents.y, c_points.contents.z)
+    )
+
+
+def arrays_to_c_points(c_points, x, y, z=None):
+    """Replace the points of a line_pnts structure by coordinates from arrays.
+
+    The coordinates are copied with a single call of ``Vect_copy_xyz_to_pnts``.
+
+    :param c_points: A pointer to a libvect.line_pnts structure
+    :param x: The x coordinates
+    :param y: The y coordinates
+    :param z: The z coordinates, zeros are used if None
+    """
+    c_double_p = ctypes.POINTER(ctypes.c_double)
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        msg = "The x and y coordinates must be one-dimensional arrays of equal size"
+        raise ValueError(msg)
+    if z is not None:
+        z = np.ascontiguousarray(z, dtype=np.float64)
+        if z.shape != x.shape:
+            msg = "The z coordinates must have the same size as the x coordinates"
+            raise ValueError(msg)
+    if not len(x):
+        libvect.Vect_reset_line(c_points)
+        return
+    if (
+        libvect.Vect_copy_xyz_to_pnts(
+            c_points,
+            x.ctypes.data_as(c_double_p),
+            y.ctypes.data_as(c_double_p),
+            None if z is None else z.ctypes.data_as(c_double_p),
+            len(x),
+        )
+        < 0
+    ):
+        msg = "Unable to allocate memory for {n} points".format(n=len(x))
+        raise MemoryError(msg)
+
+
+class FeatureArrays(
+    namedtuple(
+        "FeatureArrays", "ids cats geometry_offsets ring_offsets coords wkb_offsets wkb"
+    )
+):
+    """Vector features stored in contiguous arrays.
+
+    The coordinates are nested with offsets like in Apache Arrow. The rings
+    of the feature ``i`` are ``geometry_offsets[i]`` to
+    ``geometry_offsets[i + 1] - 1`` and the coordinates of the ring ``r`` are
+    ``coords[ring_offsets[r]:ring_offsets[r + 1]]``. Points and lines have
+    a single ring, areas have the outer ring followed by the isles.
+
+    :ids: The feature or area ids
+    :cats: The categories, -1 for features without category
+    :geometry_offsets: The offsets of the features in ring_offsets
+    :ring_offsets: The offsets of the rings in coords
+    :coords: The coordinates with two or three columns
+    :wkb_offsets: The offsets of the features in wkb or None
+    :wkb: The Well Known Binary representations of all features as one
+          byte array or None
+
+    >>> arrays = FeatureArrays(
+    ...     ids=np.array([1, 2]),
+    ...     cats=np.array([1, -1]),
+    ...     geometry_offsets=np.array([0, 1, 2]),
+    ...     ring_offsets=np.array([0, 2, 5]),
+    ...     coords=np.arange(10.0).reshape(5, 2),
+    ...     wkb_offsets=None,
+    ...     wkb=None,
+    ... )
+    >>> arrays.n_features
+    2
+    >>> [ring.tolist() for ring in arrays.rings(1)]
+    [[[4.0, 5.0], [6.0, 7.0], [8.0, 9.0]]]
+
+    """
+
+    __slots__ = ()
+
+    @property
+    def n_features(self):
+        """The number of features"""
+        return len(self.ids)
+
+    def rings(self, index):
+        """Return views of the coordinates of the rings of a feature"""
+        first, last = self.geometry_offsets[index : index + 2].tolist()
+        offsets = self.ring_offsets[first : last + 1].tolist()
+        return [self.coords[start:stop] for start, stop in pairwise(offsets)]
+
+    def wkb_bytes(self, index):
+        """Return the Well Known Binary representation of a feature"""
+        start, stop = self.wkb_offsets[index : index + 2].tolist()
+        return self.wkb[start:stop].tobytes()
+
+
+class FeatureArraysBuilder:
+    """Collect vector features read one by one into FeatureArrays.
+
+    The coordinates and the Well Known Binary are copied from the C
+    structures once, no Python objects are created for the features.
+
+    :param with_z: Store three coordinates instead of two
+    :param with_wkb: Store the Well Known Binary representations
+    """
+
+    def __init__(self, with_z=False, with_wkb=False):
+        self._n_columns = 3 if with_z else 2
+        self._with_wkb = with_wkb
+        self._ids = []
+        self._cats = []
+        self._ring_counts = []
+        self._ring_sizes = []
+        self._coords = []
+        self._wkb = bytearray()
+        self._wkb_sizes = []
+
+    def add_feature(self, f_id, cat, c_wkb=None, wkb_size=0):
+        """Start a new feature, its rings are added with add_ring()
+
+        :param f_id: The feature or area id
+        :param cat: The category, -1 for features without category
+        :param c_wkb: The pointer to the Well Known Binary returned by
+                      the vector library, used only if with_wkb is True
+        :param wkb_size: The size of the Well Known Binary in bytes
+        """
+        self._ids.append(f_id)
+        self._cats.append(cat)
+        self._ring_counts.append(0)
+        if self._with_wkb:
+            self._wkb += ctypes.cast(
+                c_wkb, ctypes.POINTER(ctypes.c_ubyte * wkb_size)
+            ).contents
+            self._wkb_sizes.append(wkb_size)
+
+    def add_ring(self, c_points):
+        """Copy the points of a line_pnts structure as a ring of the last feature"""
+        coords = c_points_to_arrays(c_points)[: self._n_columns]
+        self._coords.append(np.column_stack(coords))
+        self._ring_sizes.append(len(coords[0]))
+        self._ring_counts[-1] += 1
+
+    def build(self):
+        """Return the collected features as FeatureArrays"""
+
+        def offsets(sizes):
+            result = np.zeros(len(sizes) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=result[1:])
+            return result
+
+        if self._coords:
+            coords = np.concatenate(self._coords)
+        else:
+            coords = np.empty((0, self._n_columns), dtype=np.float64)
+        return FeatureArrays(
+            ids=np.array(self._ids, dtype=np.int64),
+            cats=np.array(self._cats, dtype=np.int64),
+            geometry_offsets=offsets(self._ring_counts),
+            ring_offsets=offsets(self._ring_sizes),
+            coords=coords,
+            wkb_offsets=offsets(self._wkb_sizes) if self._with_wkb else None,
+            wkb=np.frombuffer(self._wkb, dtype=np.uint8) if self._with_wkb else None,
+        )
+
+
+class AttrsCache:
+    """Prefetched attribute columns and buffered updates of a table
+
+    Rows are loaded for blocks of consecutive categories with one query and
+    kept in memory by columns, so reading attributes of many features does not
+    run a query for each feature. Updates are collected and written with
+    ``executemany`` when they are flushed.
+
+    >>> from grass.pygrass.vector import VectorTopo
+    >>> test_vect = VectorTopo(test_vector_name)
+    >>> test_vect.open("r")
+    >>> cache = test_vect.prefetch_attrs(["name", "value"])
+    >>> [feature.attrs["name"] for feature in test_vect.viter("points")]
+    ['point', 'point', 'point']
+    >>> cache.get(2, ("name", "value"))
+    ('line', 2.0)
+    >>> test_vect.close()
+
+    """
+
+    def __init__(self, table, columns=None, block_size=10000, max_blocks=100):
+        """
+        :param table: the attribute table
+        :param columns: the names of the prefetched columns, all columns of
+                        the table are prefetched if None
+        :param block_size: the number of categories loaded by one query,
+                           also the number of buffered updates which are
+                           written at once
+        :param max_blocks: the maximum number of blocks kept in memory
+        """
+        self.table = table
+        self.columns = list(columns) if columns else table.columns.names()
+        for column in self.columns:
+            if column not in table.columns:
+                raise KeyError("Column: %s not in table" % column)
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self._column_index = {column: i for i, column in enumerate(self.columns)}
+        # Blocks by their first category, each is a tuple with a dictionary
+        # of row positions by category and a list of columns
+        self._blocks = OrderedDict()
+        # Buffered updates by category and column
+        self._updates = {}
+
+    def __contains__(self, column):
+        return column in self._column_index
+
+    def _block_start(self, cat):
+        """Return the first category of the block with the category"""
+        return (cat - 1) // self.block_size * self.block_size + 1
+
+    def _get_block(self, cat):
+        """Return the block with the category, load it if needed"""
+        first = self._block_start(cat)
+        block = self._blocks.get(first)
+        if block is not None:
+            self._blocks.move_to_end(first)
+            return block
+        # SELECT {cols} FROM {tname} WHERE {condition}
+        sqlcode = sql.SELECT_WHERE.format(
+            cols=", ".join([self.table.key, *self.columns]),
+            tname=self.table.name,
+            condition="{key} BETWEEN {first} AND {last}".format(
+                key=self.table.key, first=first, last=first + self.block_size - 1
+            ),
+        )
+        rows = self.table.execute(sqlcode).fetchall()
+        block = (
+            {row[0]: i for i, row in enumerate(rows)},
+            [list(column) for column in zip(*rows, strict=True)][1:],
+        )
+        self._blocks[first] = block
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def get(self, cat, columns):
+        """Return the values of the columns of the row with the category
+
+        :param cat: the category
+        :param columns: a sequence of names of the prefetched columns
+        :return: a tuple of values or None if there is no row with the category
+        """
+        positions, values = self._get_block(cat)
+        row = positions.get(cat)
+        if row is None:
+            return None
+        updates = self._updates.get(cat, {})
+        return tuple(
+            updates[column]
+            if column in updates
+            else values[self._column_index[column]][row]
+            for column in columns
+        )
+
+    def set(self, cat, columns, values):
+        """Buffer an update of the columns of the row with the category"""
+        self._updates.setdefault(cat, {}).update(zip(columns, values, strict=True))
+        if len(self._updates) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered updates to the table
+
+        The updates are written with one ``executemany`` call for each
+        combination of updated columns. The transaction is not committed.
+        """
+        groups = {}
+        for cat, updates in self._updates.items():
+            columns = tuple(updates)
+            groups.setdefault(columns, []).append((*updates.values(), cat))
+        for columns, rows in groups.items():
+            # "UPDATE {tname} SET {values} WHERE {condition};"
+            sqlcode = sql.UPDATE_WHERE.format(
+                tname=self.table.name,
+                values=",".join(["%s=?" % column for column in columns]),
+                condition="%s=?" % self.table.key,
+            )
+            self.table.execute(sqlcode, many=True, values=rows)
+        # Prefetched blocks with updated rows are loaded again when needed,
+        # so the values are converted by the database like other values
+        for cat in self._updates:
+            self._blocks.pop(self._block_start(cat), None)
+        self._updates.clear()
+
+    def commit(self):
+        """Write the buffered updates and commit the transaction"""
+        self.flush()
+        self.table.conn.commit()
+
+
 class Attrs:
     def __init__(self, cat, table, writeable=False):
         self._cat = None
@@ -167,7 +486,20 @@ class Attrs:
         ('point', 1.0)
         >>> test_vect.close()
 
+        When attributes are prefetched with ``Vector.prefetch_attrs()``,
+        the values of prefetched columns are taken from the cache.
         """
+        cache = self.table.attrs_cache
+        if cache is not None and self.cat:
+            columns = (keys,) if np.isscalar(keys) else tuple(keys)
+            if all(column in cache for column in columns):
+                results = cache.get(self.cat, columns)
+                if results is None:
+                    return None
+                return results[0] if len(results) == 1 else results
+            # buffered updates of prefetched columns are written before
+            # the columns are read together with other columns
+            cache.flush()
         sqlcode = sql.SELECT_WHERE.format(
             cols=(keys if np.isscalar(keys) else ", ".join(keys)),
             tname=self.table.name,
@@ -199,6 +531,9 @@ class Attrs:
         >>> v1.attrs.table.conn.commit()
         >>> test_vect.close()
 
+        When attributes are prefetched with ``Vector.prefetch_attrs()``,
+        updates of the prefetched columns are buffered and written together
+        by ``commit()`` or when the vector map is closed.
         """
         if not self.writeable:
             str_err = "You can only read the attributes if the map is in another mapset"
@@ -209,6 +544,20 @@ class Attrs:
         for key in keys:
             if key not in self.table.columns:
                 raise KeyError("Column: %s not in table" % key)
+        cache = self.table.attrs_cache
+        if cache is not None and self.cat:
+            # only updates of prefetched columns are buffered, other columns
+            # are written directly, so the reads of them from the table
+            # see the new values
+            buffered = {}
+            direct = {}
+            for key, value in zip(keys, values, strict=True):
+                (buffered if key in cache else direct)[key] = value
+            if buffered:
+                cache.set(self.cat, tuple(buffered), tuple(buffered.values()))
+            if not direct:
+                return
+            keys, values = tuple(direct), tuple(direct.values())
         # prepare the string using as paramstyle: qmark
         vals = ",".join(["%s=?" % k for k in keys])
         # "UPDATE {tname} SET {values} WHERE {condition};"
@@ -234,6 +583,9 @@ class Attrs:
          >>> test_vect.close()
 
         """
+        if self.table.attrs_cache is not None:
+            # buffered updates are written before the whole row is read
+            self.table.attrs_cache.flush()
         # SELECT {cols} FROM {tname} WHERE {condition}
         cur = self.table.execute(
             sql.SELECT_WHERE.format(
@@ -258,6 +610,8 @@ class Attrs:
 
     def commit(self):
         """Save the changes"""
+        if self.table.attrs_cache is not None:
+            self.table.attrs_cache.flush()
         self.table.conn.commit()
 
 
@@ -640,9 +994,48 @@ class Line(Geo):
 
     def __init__(self, points=None, **kargs):
         super().__init__(**kargs)
-        if points is not None:
-            for pnt in points:
-                self.append(pnt)
+        if points is None:
+            return
+        # Copy coordinates from arrays and lists of tuples at once
+        if isinstance(points, (np.ndarray, list, tuple)):
+            try:
+                array = np.asarray(points, dtype=np.float64)
+            except (TypeError, ValueError):
+                array = None
+            if array is not None and array.ndim == 2 and array.shape[1] in {2, 3}:
+                self._set_array(array)
+                return
+        for pnt in points:
+            self.append(pnt)
+
+    @classmethod
+    def from_array(cls, array, **kargs):
+        """Create a line from an array of coordinates in a single call. ::
+
+            >>> line = Line.from_array(np.array([[0, 0], [1, 1], [2, 0]]))
+            >>> line.to_list()
+            [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]
+
+        :param array: An array with two columns with x and y coordinates or
+                      three columns with x, y, and z coordinates
+        :param kargs: Parameters passed to the constructor
+        """
+        line = cls(**kargs)
+        line._set_array(array)
+        return line
+
+    def _set_array(self, array):
+        """Replace the points of the line by coordinates from an array"""
+        array = np.asarray(array, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] not in {2, 3}:
+            msg = "The array must have two or three columns, not shape {shape}"
+            raise ValueError(msg.format(shape=array.shape))
+        arrays_to_c_points(
+            self.c_points,
+            array[:, 0],
+            array[:, 1],
+            array[:, 2] if array.shape[1] == 3 else None,
+        )
 
     def __getitem__(self, key):
         """Get line point of given index,  slice allowed. ::
@@ -663,16 +1056,7 @@ class Line(Geo):
         # pnt.c_px = ctypes.cast(id(self.c_points.contents.x[indx]),
         # ctypes.POINTER(ctypes.c_double))
         if isinstance(key, slice):
-            # import pdb; pdb.set_trace()
-            # Get the start, stop, and step from the slice
-            return [
-                Point(
-                    self.c_points.contents.x[indx],
-                    self.c_points.contents.y[indx],
-                    None if self.is2D else self.c_points.contents.z[indx],
-                )
-                for indx in range(*key.indices(len(self)))
-            ]
+            return self._points(key)
         if isinstance(key, int):
             if key < 0:  # Handle negative indices
                 key += self.c_points.contents.n_points
@@ -703,7 +1087,7 @@ class Line(Geo):
 
     def __iter__(self):
         """Return a Point generator of the Line"""
-        return (self.__getitem__(i) for i in range(self.__len__()))
+        return iter(self._points(slice(None)))
 
     def __len__(self):
         """Return the number of points of the line."""
@@ -715,6 +1099,38 @@ class Line(Geo):
     def __repr__(self):
         return "Line([%s])" % ", ".join([repr(pnt) for pnt in self.__iter__()])
 
+    def _coords(self, key=None):
+        """Return lists of the coordinates of the points selected by a slice.
+
+        The z coordinates are None for 2D lines.
+        """
+        x, y, z = c_points_to_arrays(self.c_points)
+        if key is not None:
+            x, y, z = x[key], y[key], z[key]
+        if self.is2D:
+            return x.tolist(), y.tolist(), [None] * len(x)
+        return x.tolist(), y.tolist(), z.tolist()
+
+    def _points(self, key):
+        """Return a list of Point objects selected by a slice"""
+        return [Point(*xyz) for xyz in zip(*self._coords(key), strict=True)]
+
+    def coords_views(self):
+        """Return NumPy views of the x, y, and z coordinates of the line.
+
+        No coordinates are copied, the arrays share the memory with the line.
+        The views are valid only until points are added to or removed from
+        the line, or until the line is deleted. ::
+
+            >>> line = Line([(0, 0), (1, 1), (2, 0)])
+            >>> x, y, z = line.coords_views()
+            >>> y
+            array([0., 1., 0.])
+
+        ..
+        """
+        return c_points_to_arrays(self.c_points)
+
     def point_on_line(self, distance, angle=0, slope=0):
         """Return a Point object on line in the specified distance, using the
         `Vect_point_on_line` C function.
@@ -1102,7 +1518,10 @@ class Line(Geo):
 
         ..
         """
-        return [pnt.coords() for pnt in iter(self)]
+        x, y, z = self._coords()
+        if self.is2D:
+            return list(zip(x, y, strict=True))
+        return list(zip(x, y, z, strict=True))
 
     def to_array(self):
         """Return an array of coordinates. ::
@@ -1116,7 +1535,10 @@ class Line(Geo):
 
         ..
         """
-        return np.array(self.to_list())
+        x, y, z = c_points_to_arrays(self.c_points)
+        if self.is2D:
+            return np.column_stack((x, y))
+        return np.column_stack((x, y, z))
 
     def to_wkt_p(self):
         """Return a Well Known Text string of the line. ::
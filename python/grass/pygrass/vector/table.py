@@ -1105,6 +1105,8 @@ class Table:
         self.key = key
         self.columns = Columns(self.name, self.conn, self.key)
         self.filters = Filters(self.name)
+        # Cache of prefetched attributes and buffered updates (AttrsCache)
+        self.attrs_cache = None
 
     def __repr__(self):
         """
@@ -136,6 +136,27 @@ class LineTestCase(TestCase):
         with self.assertRaises(IndexError):
             line[5]
 
+    def test_from_array(self):
+        """Test from_array method and initialization from arrays"""
+        coords = np.array([(0, 0, 1), (1, 1, 2), (2, 0, 3)])
+        line = Line.from_array(coords[:, :2])
+        self.assertListEqual(line.to_list(), [(0, 0), (1, 1), (2, 0)])
+        line = Line(coords, is2D=False)
+        self.assertListEqual(line.to_list(), [(0, 0, 1), (1, 1, 2), (2, 0, 3)])
+        self.assertTrue(np.array_equal(line.to_array(), coords))
+        self.assertEqual(len(Line.from_array(np.empty((0, 2)))), 0)
+        with self.assertRaises(ValueError):
+            Line.from_array(np.zeros((2, 4)))
+
+    def test_coords_views(self):
+        """Test that coords_views shares the memory with the line"""
+        line = Line([(0, 0), (1, 1)])
+        x, y, unused = line.coords_views()
+        self.assertListEqual(y.tolist(), [0, 1])
+        x[1] = 10
+        self.assertTupleEqual(line[1].coords(), (10, 1))
+        self.assertTrue(np.array_equal(line.to_array(), [(0, 0), (10, 1)]))
+
     def test_setitem(self):
         """Test __setitem__ magic method"""
         line = Line([(0, 0), (1, 1)])
@@ -59,6 +59,53 @@ class GeometryAttrsTestCase(TestCase):
         self.attrs.__setitem__(("name", "value"), newpairs)  # noqa: PLC2801
         self.assertEqual(self.attrs["name", "value"], newpairs)
 
+    def test_prefetch(self):
+        """Test reading prefetched attributes and buffered updates"""
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            cache = vect.prefetch_attrs(["name", "value"])
+            attrs = [line.attrs for line in vect.viter("lines")]
+            self.assertTupleEqual(attrs[0]["name", "value"], ("line", 2.0))
+            attrs[0]["value"] = 20.0
+            # All lines have the same category
+            self.assertEqual(attrs[1]["value"], 20.0)
+            sqlcode = "SELECT value FROM %s WHERE cat=2" % vect.table.name
+            self.assertEqual(vect.table.execute(sqlcode).fetchone()[0], 2.0)
+            cache.commit()
+            self.assertEqual(vect.table.execute(sqlcode).fetchone()[0], 20.0)
+            # Buffered updates are committed when the map is closed
+            attrs[0]["value"] = 2.0
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            self.assertEqual(vect[4].attrs["value"], 2.0)
+
+    def test_prefetch_other_columns(self):
+        """Test reading updates of columns which are not prefetched"""
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            vect.prefetch_attrs(["name"])
+            attrs = vect[4].attrs
+            attrs["value"] = 5.0
+            self.assertEqual(attrs["value"], 5.0)
+            attrs["name", "value"] = "new_line", 6.0
+            self.assertEqual(attrs["name"], "new_line")
+            self.assertTupleEqual(attrs["name", "value"], ("new_line", 6.0))
+            attrs["name", "value"] = "line", 2.0
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            self.assertTupleEqual(vect[4].attrs["name", "value"], ("line", 2.0))
+
+    def test_prefetch_values(self):
+        """Test reading the whole row after buffered updates"""
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            vect.prefetch_attrs(["name", "value"])
+            attrs = vect[4].attrs
+            attrs["value"] = 7.0
+            self.assertTupleEqual(attrs.values(), (2, "line", 7.0))
+            attrs["name"] = "new_line"
+            self.assertDictEqual(
+                attrs.__dict__(), {"cat": 2, "name": "new_line", "value": 7.0}
+            )
+            attrs["name", "value"] = "line", 2.0
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            self.assertTupleEqual(vect[4].attrs.values(), (2, "line", 2.0))
+
 
 if __name__ == "__main__":
     test()
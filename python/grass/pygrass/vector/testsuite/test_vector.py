@@ -4,9 +4,13 @@ Created on Wed Jun 18 17:21:42 2014
 @author: pietro
 """
 
+import numpy as np
+
 from grass.gunittest.case import TestCase
 from grass.gunittest.main import test
 from grass.pygrass.vector import VectorTopo
+from grass.pygrass.vector.basic import Bbox
+from grass.pygrass.vector.geometry import Line, Point
 
 
 class VectorTopoTestCase(TestCase):
@@ -62,6 +66,93 @@ class VectorTopoTestCase(TestCase):
 
             self.vect.close()
 
+    def test_features_to_arrays(self):
+        """Test that the arrays contain the same features as the WKB list"""
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            for feature_type in ["point", "line", "boundary", "centroid", "area"]:
+                if feature_type == "area":
+                    wkb_list = vect.areas_to_wkb_list()
+                    arrays = vect.areas_to_arrays(wkb=True)
+                else:
+                    wkb_list = vect.features_to_wkb_list(feature_type=feature_type)
+                    arrays = vect.features_to_arrays(
+                        feature_type=feature_type, wkb=True
+                    )
+                self.assertEqual(arrays.n_features, len(wkb_list))
+                for i, (f_id, cat, wkb) in enumerate(wkb_list):
+                    self.assertEqual(arrays.ids[i], f_id)
+                    self.assertEqual(arrays.cats[i], -1 if cat is None else cat)
+                    self.assertEqual(arrays.wkb_bytes(i), wkb)
+                self.assertEqual(arrays.ring_offsets[-1], len(arrays.coords))
+            arrays = vect.features_to_arrays(feature_type="line")
+            self.assertListEqual(
+                arrays.rings(1)[0].tolist(), [[12.0, 4.0], [12.0, 2.0], [12.0, 0.0]]
+            )
+            self.assertIsNone(arrays.wkb)
+
+    def test_find_many(self):
+        """Test that batch queries match single queries in all processes"""
+        rng = np.random.default_rng(1)
+        x = rng.uniform(-1, 16, 50)
+        y = rng.uniform(-1, 7, 50)
+        with VectorTopo(self.tmpname, mode="r") as vect:
+            ids, dists = vect.find_by_point.geo_many(x, y, maxdist=1)
+            for i, (px, py) in enumerate(zip(x, y, strict=True)):
+                feature = vect.find_by_point.geo(Point(px, py), maxdist=1)
+                self.assertEqual(ids[i], feature.id if feature else 0)
+                if feature:
+                    # Lines return LineDist, points the distance only
+                    distance = feature.distance(Point(px, py))
+                    self.assertAlmostEqual(
+                        dists[i], getattr(distance, "dist", distance)
+                    )
+            areas = vect.find_by_point.area_many(x, y)
+            for i, (px, py) in enumerate(zip(x, y, strict=True)):
+                area = vect.find_by_point.area(Point(px, py))
+                self.assertEqual(areas[i], area.id if area else 0)
+            bboxes = np.column_stack((y + 1, y - 1, x + 1, x - 1))
+            offsets, found = vect.find_by_bbox.geos_many(bboxes)
+            for i, edges in enumerate(bboxes):
+                boxlist = vect.find_by_bbox.geos(Bbox(*edges), bboxlist_only=True)
+                self.assertListEqual(
+                    found[offsets[i] : offsets[i + 1]].tolist(),
+                    boxlist.ids if boxlist else [],
+                )
+
+            for result, parallel in [
+                ((ids, dists), vect.find_by_point.geo_many(x, y, 1, nprocs=2)),
+                ((offsets, found), vect.find_by_bbox.geos_many(bboxes, nprocs=2)),
+            ]:
+                for expected, array in zip(result, parallel, strict=True):
+                    np.testing.assert_array_equal(array, expected)
+            np.testing.assert_array_equal(
+                vect.find_by_point.area_many(x, y, nprocs=2), areas
+            )
+
+    def test_write_many(self):
+        """Test writing points from an array and geometry objects at once"""
+        name = "VectorTopoTestCase_write_many"
+        cols = [("cat", "INTEGER PRIMARY KEY"), ("name", "varchar(50)")]
+        coords = np.array([(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)])
+        try:
+            with VectorTopo(name, mode="w", tab_cols=cols, overwrite=True) as vect:
+                vect.write_many(coords, attrs=[("a",), ("b",), ("c",)], batch_size=2)
+                lines = [Line([(0, 0), (1, 1)]), Line([(1, 1), (2, 0)])]
+                vect.write_many(lines, cats=[4, 4], attrs=[("d",), ("e",)])
+                with self.assertRaises(ValueError):
+                    vect.write_many(coords, cats=[5, 6])
+                vect.table.conn.commit()
+            with VectorTopo(name, mode="r") as vect:
+                self.assertEqual(vect.number_of("points"), 3)
+                self.assertEqual(vect.number_of("lines"), 2)
+                self.assertTupleEqual(vect[3].coords(), (2.0, 2.0))
+                self.assertEqual(vect[3].cat, 3)
+                self.assertEqual(vect[5].cat, 4)
+                rows = vect.table.execute().fetchall()
+                self.assertListEqual(rows, [(1, "a"), (2, "b"), (3, "c"), (4, "d")])
+        finally:
+            self.runModule("g.remove", flags="f", type="vector", name=name)
+
 
 if __name__ == "__main__":
     test()
@@ -107,11 +107,384 @@ for details.
 .. sectionauthor:: Glynn Clements
 """
 
+import math
+import os
+from contextlib import contextmanager
+
 import numpy as np
 
-from .utils import try_remove
+from .utils import decode, try_remove
 from . import core as gcore
-from grass.exceptions import CalledModuleError
+from grass.exceptions import CalledModuleError, OpenError
+
+# number of rows (2D) read or written at once by the direct backend
+_DIRECT_BLOCK_ROWS = 1024
+
+
+###############################################################################
+
+
+def _check_backend(backend, env):
+    """Check that the backend is known and usable with the environment"""
+    if backend not in {"bin", "direct"}:
+        raise ValueError(_("Invalid backend <%s>") % backend)
+    if backend != "direct":
+        return
+    # the raster libraries are initialized once for the session of this process
+    if env is not None and any(
+        env.get(variable) != os.environ.get(variable)
+        for variable in ("GISRC", "GRASS_MASK")
+    ):
+        raise ValueError(
+            _(
+                "Backend 'direct' can only access the session of the current "
+                "process, use backend 'bin' for other sessions"
+            )
+        )
+    if not os.environ.get("GISRC"):
+        raise ValueError(_("Backend 'direct' requires a GRASS session"))
+    _check_direct_session()
+
+
+def _check_direct_session():
+    """Check that the raster library uses the current session of the process
+
+    The library reads the session when it is initialized and does not follow
+    later changes, e.g., of the current mapset by g.mapset, so the direct
+    backend can't be used after such changes.
+    """
+    import grass.lib.gis as libgis
+
+    libgis.G_gisinit("")
+    with open(os.environ["GISRC"], encoding="utf-8") as file:
+        variables = {
+            key.strip(): value.strip()
+            for key, sep, value in (line.partition(":") for line in file)
+            if sep
+        }
+    if (
+        os.path.normpath(variables.get("GISDBASE", ""))
+        != os.path.normpath(decode(libgis.G_gisdbase()))
+        or variables.get("LOCATION_NAME") != decode(libgis.G_location())
+        or variables.get("MAPSET") != decode(libgis.G_mapset())
+    ):
+        raise ValueError(
+            _(
+                "Backend 'direct' can't be used after the session of the current "
+                "process changed, use backend 'bin'"
+            )
+        )
+
+
+def _map_dtype(mapname, env, backend):
+    """Return the NumPy data type corresponding to the type of a raster map"""
+    if backend == "direct":
+        return {"CELL": np.int32, "FCELL": np.float32}.get(
+            _raster_mtype(mapname), np.float64
+        )
+    try:
+        map_type = gcore.parse_command("r.info", map=mapname, format="json", env=env)[
+            "datatype"
+        ]
+    except CalledModuleError:
+        return np.double
+    return {"CELL": np.int32, "FCELL": np.float32}.get(map_type, np.float64)
+
+
+def _bin_flags(dtype):
+    """Return r.out.bin flags and number of bytes for a NumPy data type"""
+    kind = np.dtype(dtype).kind
+    size = np.dtype(dtype).itemsize
+
+    if kind == "f":
+        flags = "f"
+    elif kind in "biu":
+        if size == 8:
+            message = (
+                "64-bit integers are not supported by GRASS raster maps. "
+                "Use dtype=numpy.int32 or a smaller integer type."
+            )
+            raise ValueError(message)
+        flags = "i"
+    else:
+        raise ValueError(_("Invalid kind <%s>") % kind)
+
+    if size not in {1, 2, 4, 8}:
+        raise ValueError(_("Invalid size <%d>") % size)
+    return flags, size
+
+
+def _overwrite(overwrite, env):
+    """Return True if an existing map can be overwritten"""
+    if overwrite is not None:
+        return bool(overwrite)
+    return (env or os.environ).get("GRASS_OVERWRITE", "0") != "0"
+
+
+def _null_value(null):
+    """Return the value used for null cells when reading"""
+    return 0 if null is None else float(null)
+
+
+@contextmanager
+def _raster_window(reg):
+    """Set the raster window of the current process to the region
+    returned by :func:`grass.script.core.region`
+    """
+    from grass.pygrass.gis.region import Region
+
+    current = Region()
+    current.get_current()
+    window = Region()
+    window.north = reg["n"]
+    window.south = reg["s"]
+    window.east = reg["e"]
+    window.west = reg["w"]
+    window.c_region.rows = int(reg["rows"])
+    window.c_region.cols = int(reg["cols"])
+    window.adjust(rows=True, cols=True)
+    window.set_raster_region()
+    try:
+        yield
+    finally:
+        current.set_raster_region()
+
+
+def _find_raster(mapname):
+    """Return the name and the mapset of an existing raster map
+
+    The map is looked up before the raster library accesses it because
+    the library ends the process with a fatal error for missing maps.
+    """
+    import grass.lib.gis as libgis
+
+    name, unused, mapset = mapname.partition("@")
+    mapset = libgis.G_find_raster2(name, mapset)
+    if not mapset:
+        raise ValueError(_("Raster map <%s> not found") % mapname)
+    return name, decode(mapset)
+
+
+def _raster_mtype(mapname):
+    """Return the type of a raster map using the raster library"""
+    import grass.lib.raster as libraster
+    from grass.pygrass.raster.raster_type import RTYPE_STR
+
+    name, mapset = _find_raster(mapname)
+    return RTYPE_STR[libraster.Rast_map_type(name, mapset)]
+
+
+def _read_raster_direct(mapname, out, null, reg):
+    """Fill an array with a raster map using the raster library"""
+    from grass.pygrass.raster import raster2numpy_tiles
+
+    null = _null_value(null)
+    name, mapset = _find_raster(mapname)
+    with _raster_window(reg):
+        for window, block in raster2numpy_tiles(
+            name, tile_rows=_DIRECT_BLOCK_ROWS, mapset=mapset
+        ):
+            target = out[window.row_start : window.row_end]
+            np.copyto(target, block, casting="unsafe")
+            if block.dtype.kind == "f":
+                target[np.isnan(block)] = null
+            else:
+                target[block == np.iinfo(block.dtype).min] = null
+
+
+def _write_raster_direct(array, mapname, mtype, title, null, overwrite, reg):
+    """Write an array into a raster map using the raster library
+
+    :return: 0 on success, 1 if the map can not be written
+    """
+    import grass.lib.raster as libraster
+    from grass.pygrass.raster import RasterRow
+    from grass.pygrass.raster.raster_type import TYPE as RTYPE
+
+    dtype = RTYPE[mtype]["numpy"]
+    null_value = np.nan if mtype != "CELL" else np.iinfo(dtype).min
+    try:
+        with (
+            _raster_window(reg),
+            RasterRow(mapname, mode="w", mtype=mtype, overwrite=overwrite) as rast,
+        ):
+            for start in range(0, array.shape[0], _DIRECT_BLOCK_ROWS):
+                source = array[start : start + _DIRECT_BLOCK_ROWS]
+                block = np.array(source, dtype=dtype)
+                if null is not None:
+                    block[source == float(null)] = null_value
+                rast.write_block(block)
+    except OpenError as e:
+        gcore.warning(str(e))
+        return 1
+    if title:
+        libraster.Rast_put_cell_title(mapname, title)
+    return 0
+
+
+def _raster3d_region(reg):
+    """Return the RASTER3D_Region of the region returned by
+    :func:`grass.script.core.region` with region3d=True
+    """
+    import ctypes
+    import grass.lib.raster3d as libraster3d
+
+    region = libraster3d.RASTER3D_Region()
+    libraster3d.Rast3d_get_window(ctypes.byref(region))
+    region.north = reg["n"]
+    region.south = reg["s"]
+    region.east = reg["e"]
+    region.west = reg["w"]
+    region.top = reg["t"]
+    region.bottom = reg["b"]
+    region.rows = int(reg["rows3"])
+    region.cols = int(reg["cols3"])
+    region.depths = int(reg["depths"])
+    libraster3d.Rast3d_adjust_region(ctypes.byref(region))
+    return region
+
+
+def _init_raster3d():
+    """Initialize the gis and raster3d libraries in the current process"""
+    import grass.lib.gis as libgis
+    import grass.lib.raster3d as libraster3d
+
+    libgis.G_gisinit("")
+    libraster3d.Rast3d_init_defaults()
+
+
+def _open_raster3d_old(mapname, reg):
+    """Open an existing 3D raster map with the region matching the
+    current 3D region
+
+    The 3D raster library reads blocks in the region of the map only,
+    so the direct backend does not resample the map to the region.
+    """
+    import ctypes
+    import grass.lib.gis as libgis
+    import grass.lib.raster3d as libraster3d
+
+    _init_raster3d()
+    name, unused, mapset = mapname.partition("@")
+    mapset = libgis.G_find_raster3d(name, mapset)
+    if not mapset:
+        raise ValueError(_("3D raster map <%s> not found") % mapname)
+    region = libraster3d.RASTER3D_Region()
+    libraster3d.Rast3d_read_region_map(name, mapset, ctypes.byref(region))
+    window = _raster3d_region(reg)
+    if (region.rows, region.cols, region.depths) != (
+        window.rows,
+        window.cols,
+        window.depths,
+    ) or not all(
+        math.isclose(getattr(region, key), getattr(window, key))
+        for key in ("north", "south", "east", "west", "top", "bottom")
+    ):
+        raise ValueError(
+            _(
+                "Backend 'direct' requires the current 3D region to match "
+                "the region of 3D raster map <%s>, use backend 'bin'"
+            )
+            % mapname
+        )
+    g3map = ctypes.cast(
+        libraster3d.Rast3d_open_cell_old(
+            name,
+            mapset,
+            libraster3d.RASTER3D_DEFAULT_WINDOW,
+            libraster3d.RASTER3D_TILE_SAME_AS_FILE,
+            libraster3d.RASTER3D_NO_CACHE,
+        ),
+        ctypes.POINTER(libraster3d.RASTER3D_Map),
+    )
+    if not g3map:
+        raise OpenError(_("Unable to open 3D raster map <%s>") % mapname)
+    return g3map
+
+
+def _raster3d_mtype(mapname, reg):
+    """Return the type of a 3D raster map using the raster3d library"""
+    import grass.lib.raster as libraster
+    import grass.lib.raster3d as libraster3d
+
+    g3map = _open_raster3d_old(mapname, reg)
+    maptype = libraster3d.Rast3d_file_type_map(g3map)
+    libraster3d.Rast3d_close(g3map)
+    return "FCELL" if maptype == libraster.FCELL_TYPE else "DCELL"
+
+
+def _read_raster3d_direct(mapname, out, null, reg):
+    """Fill an array with a 3D raster map using the raster3d library"""
+    import grass.lib.raster as libraster
+    import grass.lib.raster3d as libraster3d
+
+    null = _null_value(null)
+    g3map = _open_raster3d_old(mapname, reg)
+    if libraster3d.Rast3d_file_type_map(g3map) == libraster.FCELL_TYPE:
+        layer = np.empty(out.shape[1:], dtype=np.float32)
+        maptype = libraster.FCELL_TYPE
+    else:
+        layer = np.empty(out.shape[1:], dtype=np.float64)
+        maptype = libraster.DCELL_TYPE
+    depths, rows, cols = out.shape
+    for depth in range(depths):
+        libraster3d.Rast3d_get_block(
+            g3map, 0, 0, depth, cols, rows, 1, layer.ctypes.data, maptype
+        )
+        np.copyto(out[depth], layer, casting="unsafe")
+        out[depth][np.isnan(layer)] = null
+    libraster3d.Rast3d_close(g3map)
+
+
+def _write_raster3d_direct(array, mapname, mtype, null, overwrite, reg):
+    """Write an array into a 3D raster map using the raster3d library
+
+    Each depth is written as a single tile of the new map.
+
+    :return: 0 on success, 1 if the map can not be written
+    """
+    import ctypes
+    import grass.lib.gis as libgis
+    import grass.lib.raster as libraster
+    import grass.lib.raster3d as libraster3d
+
+    _init_raster3d()
+    if libgis.G_find_raster3d(mapname, libgis.G_mapset()) and not overwrite:
+        gcore.warning(_("3D raster map <%s> already exists") % mapname)
+        return 1
+    if mtype == "FCELL":
+        dtype, maptype = np.float32, libraster.FCELL_TYPE
+    else:
+        dtype, maptype = np.float64, libraster.DCELL_TYPE
+    depths, rows, cols = array.shape
+    region = _raster3d_region(reg)
+    tile_x, tile_y, tile_z = ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+    libraster3d.Rast3d_get_tile_dimension(
+        ctypes.byref(tile_x), ctypes.byref(tile_y), ctypes.byref(tile_z)
+    )
+    libraster3d.Rast3d_set_tile_dimension(cols, rows, 1)
+    try:
+        g3map = libraster3d.Rast3d_open_cell_new(
+            mapname, maptype, libraster3d.RASTER3D_NO_CACHE, ctypes.byref(region)
+        )
+    finally:
+        libraster3d.Rast3d_set_tile_dimension(tile_x.value, tile_y.value, tile_z.value)
+    if not g3map:
+        gcore.warning(_("Unable to create 3D raster map <%s>") % mapname)
+        return 1
+    g3map = ctypes.cast(g3map, ctypes.POINTER(libraster3d.RASTER3D_Map))
+    for depth in range(depths):
+        layer = np.array(array[depth], dtype=dtype)
+        if null is not None:
+            layer[array[depth] == float(null)] = np.nan
+        if not libraster3d.Rast3d_write_tile(g3map, depth, layer.ctypes.data, maptype):
+            libraster3d.Rast3d_close(g3map)
+            gcore.warning(_("Unable to write 3D raster map <%s>") % mapname)
+            return 1
+    if not libraster3d.Rast3d_close(g3map):
+        gcore.warning(_("Unable to close 3D raster map <%s>") % mapname)
+        return 1
+    return 0
 
 
 ###############################################################################
@@ -130,13 +503,21 @@ class _tempfile:
 
 class array(np.memmap):
     # pylint: disable-next=signature-differs; W0222
-    def __new__(cls, mapname=None, null=None, dtype=None, env=None):
+    def __new__(cls, mapname=None, null=None, dtype=None, env=None, backend="bin"):
         """Define new numpy array
 
+        With the default *bin* backend, the raster map is exported by
+        ``r.out.bin`` and written by ``r.in.bin``. The *direct* backend reads
+        and writes the raster map in this process using the raster library,
+        which avoids the tool runs and the extra copy of the data on disk,
+        but it can only be used for the session of the current process.
+
         :param cls:
         :param dtype: data type (based on map type, fallbacks to numpy.double)
         :param env: environment
+        :param str backend: *bin* or *direct*
         """
+        _check_backend(backend, env)
         reg = gcore.region(env=env)
         r = reg["rows"]
         c = reg["cols"]
@@ -145,48 +526,21 @@ class array(np.memmap):
         tempfile = _tempfile(env)
         if mapname:
             if not dtype:
-                try:
-                    map_type = gcore.parse_command(
-                        "r.info", map=mapname, format="json", env=env
-                    )["datatype"]
-                    if map_type == "CELL":
-                        dtype = np.int32
-                    elif map_type == "FCELL":
-                        dtype = np.float32
-                    elif map_type == "DCELL":
-                        dtype = np.float64
-                except CalledModuleError:
-                    dtype = np.double
-            kind = np.dtype(dtype).kind
-            size = np.dtype(dtype).itemsize
-
-            if kind == "f":
-                flags = "f"
-            elif kind in "biu":
-                if size == 8:
-                    message = (
-                        "64-bit integers are not supported by GRASS raster maps. "
-                        "Use dtype=numpy.int32 or a smaller integer type."
-                    )
-                    raise ValueError(message)
-                flags = "i"
-            else:
-                raise ValueError(_("Invalid kind <%s>") % kind)
-
-            if size not in {1, 2, 4, 8}:
-                raise ValueError(_("Invalid size <%d>") % size)
-
-            gcore.run_command(
-                "r.out.bin",
-                flags=flags,
-                input=mapname,
-                output=tempfile.filename,
-                bytes=size,
-                null=null,
-                quiet=True,
-                overwrite=True,
-                env=env,
-            )
+                dtype = _map_dtype(mapname, env, backend)
+            flags, size = _bin_flags(dtype)
+
+            if backend == "bin":
+                gcore.run_command(
+                    "r.out.bin",
+                    flags=flags,
+                    input=mapname,
+                    output=tempfile.filename,
+                    bytes=size,
+                    null=null,
+                    quiet=True,
+                    overwrite=True,
+                    env=env,
+                )
 
         self = np.memmap.__new__(
             cls,
@@ -195,23 +549,31 @@ class array(np.memmap):
             mode="r+",
             shape=shape,
         )
+        if mapname and backend == "direct":
+            _read_raster_direct(mapname, self, null, reg)
 
         self.tempfile = tempfile
         self.filename = tempfile.filename
         self._env = env
+        self._backend = backend
         return self
 
-    def write(self, mapname, title=None, null=None, overwrite=None, quiet=None):
+    def write(
+        self, mapname, title=None, null=None, overwrite=None, quiet=None, backend=None
+    ):
         """Write array into raster map
 
         :param str mapname: name for raster map
         :param str title: title for raster map
         :param null: null value
         :param bool overwrite: True for overwriting existing raster maps
+        :param str backend: *bin* or *direct*, the backend of the array by default
 
         :return: 0 on success
         :return: non-zero code on failure
         """
+        backend = backend or self._backend
+        _check_backend(backend, self._env)
         kind = self.dtype.kind
         size = self.dtype.itemsize
 
@@ -238,11 +600,22 @@ class array(np.memmap):
         else:
             raise ValueError(_("Invalid kind <%s>") % kind)
 
+        reg = gcore.region(env=self._env)
+
+        if backend == "direct":
+            return _write_raster_direct(
+                self,
+                mapname,
+                {"f": "FCELL", "d": "DCELL"}.get(flags, "CELL"),
+                title=title,
+                null=null,
+                overwrite=_overwrite(overwrite, self._env),
+                reg=reg,
+            )
+
         # ensure all array content is written to the file
         self.flush()
 
-        reg = gcore.region(env=self._env)
-
         try:
             gcore.run_command(
                 "r.in.bin",
@@ -271,15 +644,172 @@ class array(np.memmap):
 ###############################################################################
 
 
+def read_raster(mapname, dtype=None, null=None, env=None, backend="bin"):
+    """Read a raster map into a NumPy array in memory
+
+    Unlike :class:`array`, the result is a plain in-memory NumPy array without
+    a temporary file. With the default *bin* backend, the output of
+    ``r.out.bin`` is read through a pipe into the array, so the data are never
+    written to a file. The *direct* backend reads the map using the raster
+    library in this process, see :class:`array`.
+
+    :param str mapname: name of the raster map
+    :param dtype: data type (based on map type by default)
+    :param null: value used for null cells (0 by default)
+    :param env: environment
+    :param str backend: *bin* or *direct*
+
+    :return: array with the shape of the computational region
+    """
+    _check_backend(backend, env)
+    if not dtype:
+        dtype = _map_dtype(mapname, env, backend)
+    flags, size = _bin_flags(dtype)
+    reg = gcore.region(env=env)
+    out = np.empty((reg["rows"], reg["cols"]), dtype=dtype)
+    if backend == "direct":
+        _read_raster_direct(mapname, out, null, reg)
+        return out
+
+    args = {
+        "flags": flags,
+        "input": mapname,
+        "output": "-",
+        "bytes": size,
+        "null": null,
+        "quiet": True,
+    }
+    process = gcore.start_command(
+        "r.out.bin", stdout=gcore.PIPE, universal_newlines=False, env=env, **args
+    )
+    buffer = memoryview(out).cast("B")
+    filled = 0
+    while filled < len(buffer):
+        count = process.stdout.readinto(buffer[filled:])
+        if not count:
+            break
+        filled += count
+    process.stdout.close()
+    returncode = process.wait()
+    if returncode or filled != len(buffer):
+        raise CalledModuleError(
+            module="r.out.bin",
+            code=" ".join(gcore.make_command("r.out.bin", **args)),
+            returncode=returncode or 1,
+        )
+    return out
+
+
+def write_raster(
+    array, mapname, title=None, null=None, overwrite=None, env=None, backend="bin"
+):
+    """Write a NumPy array into a raster map
+
+    The array is broadcast to the shape of the computational region.
+    With the default *bin* backend, the map is written by ``r.in.bin`` from
+    a file which is the file of the array itself for :class:`array` objects
+    (no copy is made) or a temporary file for other arrays. The *direct* backend
+    writes the map using the raster library in this process, see :class:`array`.
+
+    :param array: NumPy array or a compatible object
+    :param str mapname: name for raster map
+    :param str title: title for raster map
+    :param null: null value
+    :param bool overwrite: True for overwriting existing raster maps
+    :param env: environment
+    :param str backend: *bin* or *direct*
+
+    :return: 0 on success
+    :return: non-zero code on failure
+    """
+    _check_backend(backend, env)
+    reg = gcore.region(env=env)
+    shape = (reg["rows"], reg["cols"])
+    data = np.broadcast_to(array, shape)
+    kind = data.dtype.kind
+    size = data.dtype.itemsize
+    if kind == "f":
+        if size not in {4, 8}:
+            raise ValueError(_("Invalid FP size <%d>") % size)
+        mtype = "FCELL" if size == 4 else "DCELL"
+        flags = "f" if size == 4 else "d"
+        size = None
+    elif kind in "biu":
+        if size not in {1, 2, 4}:
+            raise ValueError(_("Invalid integer size <%d>") % size)
+        mtype = "CELL"
+        flags = None
+    else:
+        raise ValueError(_("Invalid kind <%s>") % kind)
+
+    if backend == "direct":
+        return _write_raster_direct(
+            data,
+            mapname,
+            mtype,
+            title=title,
+            null=null,
+            overwrite=_overwrite(overwrite, env),
+            reg=reg,
+        )
+
+    if (
+        isinstance(array, np.memmap)
+        and array.filename
+        and array.shape == shape
+        and array.flags.c_contiguous
+        and array.offset == 0
+    ):
+        array.flush()
+        filename = array.filename
+    else:
+        tempfile = _tempfile(env)
+        data.tofile(tempfile.filename)
+        filename = tempfile.filename
+    try:
+        gcore.run_command(
+            "r.in.bin",
+            flags=flags,
+            input=filename,
+            output=mapname,
+            title=title,
+            bytes=size,
+            anull=null,
+            overwrite=overwrite,
+            quiet=True,
+            north=reg["n"],
+            south=reg["s"],
+            east=reg["e"],
+            west=reg["w"],
+            rows=reg["rows"],
+            cols=reg["cols"],
+            env=env,
+        )
+    except CalledModuleError:
+        return 1
+    return 0
+
+
+###############################################################################
+
+
 class array3d(np.memmap):
     # pylint: disable-next=signature-differs; W0222
-    def __new__(cls, mapname=None, null=None, dtype=None, env=None):
+    def __new__(cls, mapname=None, null=None, dtype=None, env=None, backend="bin"):
         """Define new 3d numpy array
 
+        With the default *bin* backend, the 3D raster map is exported by
+        ``r3.out.bin`` and written by ``r3.in.bin``. The *direct* backend reads
+        and writes the 3D raster map in this process using the raster3d library,
+        it can only be used for the session of the current process and
+        for maps with the same region as the current 3D region.
+
         :param cls:
         :param dtype: data type (based on map type, fallbacks to numpy.double)
         :param env: environment
+        :param str backend: *bin* or *direct*
         """
+        _check_backend(backend, env)
         reg = gcore.region(True, env=env)
         r = reg["rows3"]
         c = reg["cols3"]
@@ -288,6 +818,11 @@ class array3d(np.memmap):
 
         tempfile = _tempfile(env=env)
         if mapname:
+            if not dtype and backend == "direct":
+                if _raster3d_mtype(mapname, reg) == "FCELL":
+                    dtype = np.float32
+                else:
+                    dtype = np.float64
             if not dtype:
                 try:
                     map_type = gcore.parse_command(
@@ -312,17 +847,18 @@ class array3d(np.memmap):
             if size not in {1, 2, 4, 8}:
                 raise ValueError(_("Invalid size <%d>") % size)
 
-            gcore.run_command(
-                "r3.out.bin",
-                flags=flags,
-                input=mapname,
-                output=tempfile.filename,
-                bytes=size,
-                null=null,
-                quiet=True,
-                overwrite=True,
-                env=env,
-            )
+            if backend == "bin":
+                gcore.run_command(
+                    "r3.out.bin",
+                    flags=flags,
+                    input=mapname,
+                    output=tempfile.filename,
+                    bytes=size,
+                    null=null,
+                    quiet=True,
+                    overwrite=True,
+                    env=env,
+                )
 
         self = np.memmap.__new__(
             cls,
@@ -331,23 +867,29 @@ class array3d(np.memmap):
             mode="r+",
             shape=shape,
         )
+        if mapname and backend == "direct":
+            _read_raster3d_direct(mapname, self, null, reg)
 
         self.tempfile = tempfile
         self.filename = tempfile.filename
         self._env = env
+        self._backend = backend
 
         return self
 
-    def write(self, mapname, null=None, overwrite=None, quiet=None):
+    def write(self, mapname, null=None, overwrite=None, quiet=None, backend=None):
         """Write array into 3D raster map
 
         :param str mapname: name for 3D raster map
         :param null: null value
         :param bool overwrite: True for overwriting existing raster maps
+        :param str backend: *bin* or *direct*, the backend of the array by default
 
         :return: 0 on success
         :return: non-zero code on failure
         """
+        backend = backend or self._backend
+        _check_backend(backend, self._env)
         kind = self.dtype.kind
         size = self.dtype.itemsize
         flags = None
@@ -362,11 +904,21 @@ class array3d(np.memmap):
         else:
             raise ValueError(_("Invalid kind <%s>") % kind)
 
+        reg = gcore.region(True, env=self._env)
+
+        if backend == "direct":
+            return _write_raster3d_direct(
+                self,
+                mapname,
+                "FCELL" if kind == "f" and size == 4 else "DCELL",
+                null=null,
+                overwrite=_overwrite(overwrite, self._env),
+                reg=reg,
+            )
+
         # ensure all array content is written to the file
         self.flush()
 
-        reg = gcore.region(True, env=self._env)
-
         try:
             gcore.run_command(
                 "r3.in.bin",
@@ -193,10 +193,58 @@ def _make_unicode(val, enc):
     return decode(val, encoding=enc)
 
 
+# Commands found in installations by the path to the installation,
+# each entry is reused until a modification time of the scanned directories changes
+_commands_cache = {}
+
+
+def _scan_commands(gisbase):
+    """Return commands and scripts of an installation, scan directories if needed
+
+    :return: tuple with a frozenset of commands and a dictionary of tuples
+             of scripts by extension (MS Windows only)
+    """
+    directories = [os.path.join(gisbase, directory) for directory in ("bin", "scripts")]
+    mtimes = []
+    for directory in directories:
+        try:
+            mtimes.append(Path(directory).stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    mtimes = tuple(mtimes)
+    cached = _commands_cache.get(gisbase)
+    if cached and cached[0] == mtimes:
+        return cached[1], cached[2]
+
+    cmd = []
+    scripts = {".py": []} if sys.platform == "win32" else {}
+
+    for directory, mtime in zip(directories, mtimes, strict=True):
+        if mtime is None:
+            continue
+        for fname in os.listdir(directory):
+            if scripts:  # win32
+                name, ext = os.path.splitext(fname)
+                if ext != ".manifest":
+                    cmd.append(name)
+                if ext in scripts.keys():
+                    scripts[ext].append(name)
+            else:
+                cmd.append(fname)
+
+    cmd = frozenset(cmd)
+    scripts = {ext: tuple(names) for ext, names in scripts.items()}
+    _commands_cache[gisbase] = (mtimes, cmd, scripts)
+    return cmd, scripts
+
+
 def get_commands(*, env=None):
     """Create list of available GRASS commands to use when parsing
     string from the command line
 
+    The directories are scanned only when they were modified since the previous
+    call, otherwise the commands are taken from a cache.
+
     :return: list of commands (set) and directory of scripts (collected
              by extension - MS Windows only)
 
@@ -218,26 +266,9 @@ def get_commands(*, env=None):
 
         gisbase = get_install_path()
 
-    cmd = []
-    scripts = {".py": []} if sys.platform == "win32" else {}
-
-    def scan(gisbase, directory):
-        dir_path = os.path.join(gisbase, directory)
-        if Path(dir_path).exists():
-            for fname in os.listdir(os.path.join(gisbase, directory)):
-                if scripts:  # win32
-                    name, ext = os.path.splitext(fname)
-                    if ext != ".manifest":
-                        cmd.append(name)
-                    if ext in scripts.keys():
-                        scripts[ext].append(name)
-                else:
-                    cmd.append(fname)
-
-    for directory in ("bin", "scripts"):
-        scan(gisbase, directory)
-
-    return set(cmd), scripts
+    cmd, scripts = _scan_commands(gisbase)
+    # Return copies, so that the cached values cannot be modified
+    return set(cmd), {ext: list(names) for ext, names in scripts.items()}
 
 
 # Added because of scripts calling scripts on MS Windows.
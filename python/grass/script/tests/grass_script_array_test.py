@@ -1,14 +1,33 @@
 """Tests for grass.script.array"""
 
+import multiprocessing
 import os
 
 import pytest
 import numpy as np
 
 import grass.script as gs
+from grass.exceptions import CalledModuleError
 from grass.script import array as garray
 from grass.tools import Tools
 
+xfail_mp_spawn = pytest.mark.xfail(
+    multiprocessing.get_start_method() == "spawn",
+    reason="Multiprocessing using 'spawn' start method requires pickable functions",
+    raises=AttributeError,
+    strict=True,
+)
+
+
+# The direct backend uses C libraries which can easily initialize only once
+# and thus can't easily change location/mapset, so we use a subprocess.
+def run_in_subprocess(function):
+    """Run function in a separate process and return its exit code"""
+    process = multiprocessing.Process(target=function)
+    process.start()
+    process.join()
+    return process.exitcode
+
 
 @pytest.fixture
 def session_3x4(tmp_path):
@@ -142,3 +161,173 @@ class TestArray3dDtypeAutoDetection:
         """Empty 3D array without mapname should default to float64."""
         arr = garray.array3d(env=session_3d.env)
         assert arr.dtype == np.float64
+
+
+class TestArrayDirectBackend:
+    """Test the backend reading and writing maps in the current process."""
+
+    def test_invalid_backend(self, session_3x4):
+        """Unknown backend should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid backend"):
+            garray.array(mapname="int_map", backend="unknown", env=session_3x4.env)
+
+    def test_direct_backend_other_session(self, session_3x4):
+        """Direct backend can't be used with a session of another process."""
+        with pytest.raises(ValueError, match="current process"):
+            garray.array(mapname="int_map", backend="direct", env=session_3x4.env)
+
+    @xfail_mp_spawn
+    def test_direct_matches_bin(self, tmp_path):
+        """Direct backend should read and write the same values as bin."""
+        project = tmp_path / "test_project"
+        gs.create_project(project)
+
+        def compare():
+            with gs.setup.init(project):
+                gs.run_command("g.region", rows=3, cols=4)
+                gs.mapcalc("int_map = if(row() == 2, null(), row() + col())")
+                gs.mapcalc("float_map = float(row() + col()) / 3")
+                gs.mapcalc("double_map = double(row() + col()) / 3")
+                for name in ("int_map", "float_map", "double_map"):
+                    expected = garray.array(mapname=name)
+                    actual = garray.array(mapname=name, backend="direct")
+                    assert actual.dtype == expected.dtype
+                    np.testing.assert_array_equal(actual, expected)
+                    assert actual.write(mapname="direct", overwrite=True) == 0
+                    written = garray.array(mapname="direct")
+                    assert written.dtype == expected.dtype
+                    np.testing.assert_array_equal(written, expected)
+
+        assert run_in_subprocess(compare) == 0
+
+    @xfail_mp_spawn
+    def test_direct_missing_map(self, tmp_path):
+        """Direct backend should raise for a missing map without ending the process."""
+        project = tmp_path / "test_project"
+        gs.create_project(project)
+
+        def read_missing():
+            with gs.setup.init(project):
+                gs.run_command("g.region", rows=3, cols=4)
+                with pytest.raises(ValueError, match="not found"):
+                    garray.array(mapname="does_not_exist", backend="direct")
+                with pytest.raises(ValueError, match="not found"):
+                    garray.array(
+                        mapname="does_not_exist", dtype=np.float64, backend="direct"
+                    )
+
+        assert run_in_subprocess(read_missing) == 0
+
+    @xfail_mp_spawn
+    def test_direct_matches_bin_3d(self, tmp_path):
+        """Direct backend should read and write the same 3D values as bin."""
+        project = tmp_path / "test_project_3d"
+        gs.create_project(project)
+
+        def compare():
+            with gs.setup.init(project):
+                gs.run_command("g.region", n=2, s=0, e=3, w=0, res3=1, b=0, t=2)
+                gs.run_command(
+                    "r3.mapcalc", expression="float3d = float(row() + col() + depth())"
+                )
+                gs.run_command(
+                    "r3.mapcalc",
+                    expression="double3d = double(row() + 2 * col() + 3 * depth())",
+                )
+                for name in ("float3d", "double3d"):
+                    expected = garray.array3d(mapname=name)
+                    actual = garray.array3d(mapname=name, backend="direct")
+                    assert actual.dtype == expected.dtype
+                    np.testing.assert_array_equal(actual, expected)
+                    assert actual.write(mapname="direct", overwrite=True) == 0
+                    np.testing.assert_array_equal(
+                        garray.array3d(mapname="direct"), expected
+                    )
+
+        assert run_in_subprocess(compare) == 0
+
+
+class TestReadWriteRaster:
+    """Test reading and writing rasters as plain in-memory arrays."""
+
+    def test_read_raster_matches_array(self, session_3x4):
+        """Array read through a pipe should be the same as the memmap array."""
+        for name in ("int_map", "float_map", "double_map"):
+            expected = garray.array(mapname=name, env=session_3x4.env)
+            actual = garray.read_raster(name, env=session_3x4.env)
+            assert not isinstance(actual, np.memmap)
+            assert actual.dtype == expected.dtype
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_read_raster_missing_map(self, session_3x4):
+        """Reading a map which does not exist should raise."""
+        with pytest.raises(CalledModuleError):
+            garray.read_raster("does_not_exist", dtype=np.float64, env=session_3x4.env)
+
+    def test_read_raster_direct_other_session(self, session_3x4):
+        """Direct backend can't be used with a session of another process."""
+        with pytest.raises(ValueError, match="current process"):
+            garray.read_raster("int_map", backend="direct", env=session_3x4.env)
+
+    @xfail_mp_spawn
+    def test_read_write_raster_direct(self, tmp_path):
+        """Direct backend should read and write the same values as bin."""
+        project = tmp_path / "test_project"
+        gs.create_project(project)
+
+        def compare():
+            with gs.setup.init(project):
+                gs.run_command("g.region", rows=3, cols=4)
+                gs.mapcalc("int_map = if(row() == 2, null(), row() + col())")
+                gs.mapcalc("double_map = double(row() + col()) / 3")
+                for name in ("int_map", "double_map"):
+                    expected = garray.read_raster(name, null=-1)
+                    actual = garray.read_raster(name, null=-1, backend="direct")
+                    assert actual.dtype == expected.dtype
+                    np.testing.assert_array_equal(actual, expected)
+                    assert (
+                        garray.write_raster(
+                            actual, "direct", null=-1, overwrite=True, backend="direct"
+                        )
+                        == 0
+                    )
+                    np.testing.assert_array_equal(
+                        garray.read_raster("direct", null=-1), expected
+                    )
+                with pytest.raises(ValueError, match="not found"):
+                    garray.read_raster("does_not_exist", backend="direct")
+                with pytest.raises(ValueError, match="not found"):
+                    garray.read_raster(
+                        "does_not_exist", dtype=np.float64, backend="direct"
+                    )
+                # The library keeps the mapset it was initialized with.
+                gs.run_command("g.mapset", mapset="other", flags="c")
+                with pytest.raises(ValueError, match="session"):
+                    garray.read_raster("int_map@PERMANENT", backend="direct")
+                assert garray.read_raster("int_map@PERMANENT", null=-1).shape == (3, 4)
+
+        assert run_in_subprocess(compare) == 0
+
+    def test_write_raster_roundtrip(self, session_3x4):
+        """Plain arrays and memmap arrays should be written as they are."""
+        data = np.arange(12, dtype=np.float32).reshape(3, 4)
+        assert garray.write_raster(data, "from_plain", env=session_3x4.env) == 0
+        memmap = garray.array(mapname="double_map", env=session_3x4.env)
+        assert garray.write_raster(memmap, "from_memmap", env=session_3x4.env) == 0
+        actual = garray.read_raster("from_plain", env=session_3x4.env)
+        assert actual.dtype == np.float32
+        np.testing.assert_array_equal(actual, data)
+        np.testing.assert_array_equal(
+            garray.read_raster("from_memmap", env=session_3x4.env), memmap
+        )
+
+    def test_write_raster_broadcast(self, session_3x4):
+        """Arrays should be broadcast to the region shape."""
+        data = np.array([1, 2, 3, 4], dtype=np.int32)
+        assert garray.write_raster(data, "broadcast", env=session_3x4.env) == 0
+        np.testing.assert_array_equal(
+            garray.read_raster("broadcast", env=session_3x4.env),
+            np.broadcast_to(data, (3, 4)),
+        )
+        with pytest.raises(ValueError, match="broadcast"):
+            garray.write_raster(np.ones((2, 3)), "wrong", env=session_3x4.env)
@@ -65,3 +65,16 @@ def test_in_session(tmp_path):
     with gs.setup.init(project, env=os.environ.copy()) as session:
         executables_set, scripts_dict = gs.get_commands(env=session.env)
     common_test_code(executables_set, scripts_dict)
+
+
+def test_cache_invalidated_by_new_tool(tmp_path):
+    """Check that a new tool is found and returned values are copies"""
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "r.first").touch()
+    env = {"GISBASE": str(tmp_path)}
+    executables_set, unused = gs.get_commands(env=env)
+    executables_set.add("r.modified")
+    assert gs.get_commands(env=env)[0] == {"r.first"}
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "r.second").touch()
+    assert gs.get_commands(env=env)[0] == {"r.first", "r.second"}
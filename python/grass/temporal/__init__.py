@@ -81,6 +81,7 @@ from .factory import dataset_factory
 from .gui_support import tlist, tlist_grouped
 from .list_stds import get_dataset_list, list_maps_of_stds
 from .mapcalc import dataset_mapcalculator
+from .map_list import RegisteredMapList
 from .metadata import (
     Raster3DMetadata,
     RasterMetadata,
@@ -99,6 +100,15 @@ from .open_stds import (
     open_new_stds,
     open_old_stds,
 )
+from .point_sampling import (
+    PointSampler,
+    coordinates_to_cells,
+    format_sampled_values,
+    read_vector_points,
+    sample_raster_map,
+    scan_coordinates,
+    write_sampled_columns,
+)
 from .register import (
     assign_valid_time_to_map,
     register_map_object_list,
@@ -186,6 +196,7 @@ from .temporal_vector_algebra import (
     TemporalVectorAlgebraParser,
 )
 from .univar_statistics import (
+    compute_raster_univar_stats,
     compute_univar_stats,
     print_gridded_dataset_univar_statistics,
     print_vector_dataset_univar_statistics,
@@ -205,6 +216,7 @@ __all__ = [
     "DictSQLSerializer",
     "FatalError",
     "GlobalTemporalVar",
+    "PointSampler",
     "RPCDefs",
     "Raster3DAbsoluteTime",
     "Raster3DBase",
@@ -221,6 +233,7 @@ __all__ = [
     "RasterRelativeTime",
     "RasterSTDSRegister",
     "RasterSpatialExtent",
+    "RegisteredMapList",
     "RelativeTemporalExtent",
     "SQLDatabaseInterface",
     "SQLDatabaseInterfaceConnection",
@@ -284,8 +297,10 @@ __all__ = [
     "compute_common_absolute_time_granularity_simple",
     "compute_common_relative_time_granularity",
     "compute_datetime_delta",
+    "compute_raster_univar_stats",
     "compute_relative_time_granularity",
     "compute_univar_stats",
+    "coordinates_to_cells",
     "count_temporal_topology_relationships",
     "create_numeric_suffix",
     "create_suffix_from_datetime",
@@ -298,6 +313,7 @@ __all__ = [
     "decrement_datetime_by_string",
     "export_stds",
     "extract_dataset",
+    "format_sampled_values",
     "gcd",
     "gcd_list",
     "get_available_temporal_mapsets",
@@ -339,6 +355,7 @@ __all__ = [
     "print_temporal_topology_relationships",
     "print_vector_dataset_univar_statistics",
     "profile_function",
+    "read_vector_points",
     "register_map_object_list",
     "register_maps_in_space_time_dataset",
     "relative_time_to_time_delta",
@@ -346,7 +363,9 @@ __all__ = [
     "run_mapcalc2d",
     "run_mapcalc3d",
     "run_vector_extraction",
+    "sample_raster_map",
     "sample_stds_by_stds_topology",
+    "scan_coordinates",
     "set_raise_on_error",
     "set_spatial_relationship",
     "set_temporal_relationship",
@@ -357,4 +376,5 @@ __all__ = [
     "tlist",
     "tlist_grouped",
     "upgrade_temporal_database",
+    "write_sampled_columns",
 ]
@@ -436,6 +436,26 @@ class AbstractDataset(
             dbif.close()
         return statement
 
+    def get_insert_statements(self):
+        """Return the INSERT statements of the dataset
+
+        Unlike *insert* with `execute=False`, the statements are not mogrified,
+        so statements of many datasets of the same type can be executed together
+        with *execute_many_transaction* of the database interface.
+
+        :return: A list of tuples with the SQL statement with DBMI specific
+                 place holders and the arguments
+        """
+        statements = [
+            self.base.get_insert_statement(),
+            self.temporal_extent.get_insert_statement(),
+            self.spatial_extent.get_insert_statement(),
+            self.metadata.get_insert_statement(),
+        ]
+        if self.is_stds() is False:
+            statements.append(self.stds_register.get_insert_statement())
+        return statements
+
     def update(self, dbif=None, execute: bool = True, ident=None):
         """Update the dataset entry in the database from the internal structure
         excluding None variables
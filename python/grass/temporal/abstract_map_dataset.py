@@ -127,6 +127,59 @@ class AbstractMapDataset(AbstractDataset):
         """Load the content of this object from the grass
         file system based database"""
 
+    @staticmethod
+    def _get_names_and_mapsets(maps):
+        """Return the lists of names and mapsets of the map objects"""
+        return (
+            [map_object.get_name() for map_object in maps],
+            [map_object.get_mapset() for map_object in maps],
+        )
+
+    @classmethod
+    def map_exists_many(cls, maps):
+        """Check for many maps if they exist in the grass spatial database
+
+        Subclasses check all maps using a single request to the C-library
+        interface.
+
+        :param maps: A list of map objects of this class
+        :return: A list with True or False for each map
+        """
+        return [map_object.map_exists() for map_object in maps]
+
+    @classmethod
+    def has_grass_timestamp_many(cls, maps):
+        """Check for many maps if a grass file based time stamp exists
+
+        :param maps: A list of map objects of this class
+        :return: A list with True or False for each map
+        """
+        return [map_object.has_grass_timestamp() for map_object in maps]
+
+    @classmethod
+    def load_many(cls, maps):
+        """Load the content of many map objects from the grass
+        file system based database
+
+        Subclasses read the metadata of all maps using a few requests
+        to the C-library interface instead of several requests for each map.
+
+        :param maps: A list of map objects of this class
+        :return: A list with the result of :meth:`load` for each map
+        """
+        return [map_object.load() for map_object in maps]
+
+    @classmethod
+    def read_timestamp_from_grass_many(cls, maps):
+        """Read the timestamps of many maps from the grass file system
+        based database and set them in the map objects
+
+        :param maps: A list of map objects of this class
+        :return: A list with the result of :meth:`read_timestamp_from_grass`
+                 for each map
+        """
+        return [map_object.read_timestamp_from_grass() for map_object in maps]
+
     def _convert_timestamp(self):
         """Convert the valid time into a grass datetime library
         compatible timestamp string
@@ -19,6 +19,9 @@ import uuid
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from pathlib import Path
+
+import numpy as np
+
 from grass.exceptions import FatalError
 
 from .abstract_dataset import AbstractDataset, AbstractDatasetComparisonKeyStartTime
@@ -29,10 +32,12 @@ from .core import (
     init_dbif,
 )
 from .datetime_math import increment_datetime_by_string, string_to_datetime
+from .map_list import RegisteredMapList
 from .spatio_temporal_relationships import (
     SpatioTemporalTopologyBuilder,
     count_temporal_topology_relationships,
     create_temporal_relation_sql_where_statement,
+    find_intersecting_intervals,
     print_spatio_temporal_topology_relationships,
 )
 from .temporal_granularity import (
@@ -494,9 +499,10 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         """
 
         if maps is None:
-            maps = self.get_registered_maps_as_objects(
+            maps = self.get_registered_maps_as_columns(
                 where=None, order="start_time", dbif=dbif
             )
+            return maps.count_gaps()
 
         gaps = 0
 
@@ -1163,7 +1169,8 @@ class AbstractSpaceTimeDataset(AbstractDataset):
         if start is None or end is None:
             return None
 
-        maps = self.get_registered_maps_as_objects(dbif=dbif, order="start_time")
+        # Map objects are created only for maps related to a granule
+        maps = self.get_registered_maps_as_columns(dbif=dbif, order="start_time")
 
         if not maps:
             return None
@@ -1214,9 +1221,13 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         Gaps between maps are identified as unregistered maps with id==None.
 
+        The maps related to each granule are found by a binary search in the
+        start times of the maps, so that the runtime does not grow with the
+        product of the number of granules and maps.
+
         :param maps: An ordered list (by start time) of AbstractMapDatasets
-                objects. All maps must have the same temporal type
-                and the same unit in case of relative time.
+                objects or a RegisteredMapList. All maps must have the same
+                temporal type and the same unit in case of relative time.
         :param start: The start time of the provided map list
         :param end:   The end time of the provided map list
         :param gran: The granularity string to be used, if None the
@@ -1348,68 +1359,144 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             return None
 
         first = maps[0]
+        absolute = first.is_time_absolute()
 
         # Build the gaplist
         gap_list = []
+        gap_start = []
+        gap_end = []
         while start < end:
-            if first.is_time_absolute():
+            if absolute:
                 next = increment_datetime_by_string(start, gran)
             else:
                 next = start + gran
 
             map = first.get_new_instance(None)
             map.set_spatial_extent_from_values(0, 0, 0, 0, 0, 0)
-            if first.is_time_absolute():
+            if absolute:
                 map.set_absolute_time(start, next)
             else:
                 map.set_relative_time(start, next, first.get_relative_time_unit())
 
             gap_list.append(copy.copy(map))
+            gap_start.append(start)
+            gap_end.append(next)
             start = next
 
-        tb = SpatioTemporalTopologyBuilder()
-        tb.build(gap_list, maps)
+        if not gap_list:
+            return None
 
-        relations_order = ["EQUAL", "DURING", "OVERLAPS", "OVERLAPPED", "CONTAINS"]
+        # Time stamps of the maps and granules as arrays
+        if isinstance(maps, RegisteredMapList):
+            map_start = maps.start_time.tolist()
+            map_end = maps.end_time.tolist()
+        else:
+            map_start = []
+            map_end = []
+            for map in maps:
+                start_time, end_time = map.get_temporal_extent_as_tuple()
+                map_start.append(start_time)
+                map_end.append(end_time)
+        # Maps without start time have no relation to any granule
+        valid = np.array([time is not None for time in map_start], dtype=bool)
+        indices = np.flatnonzero(valid)
+        dtype = "datetime64[us]" if absolute else np.float64
+        map_start = np.array(
+            [time for time in map_start if time is not None], dtype=dtype
+        )
+        map_has_end = np.array([time is not None for time in map_end], dtype=bool)[
+            valid
+        ]
+        map_end = np.array(map_end, dtype=dtype)[valid]
+        map_end[~map_has_end] = map_start[~map_has_end]
+        gap_start = np.array(gap_start, dtype=dtype)
+        gap_end = np.array(gap_end, dtype=dtype)
+
+        # Find the candidate maps of each granule and the relation of the
+        # maps to the granule, the lowest rank is used for each granule
+        num_ranks = 5
+        best_rank = np.full(len(gap_list), num_ranks)
+        pairs = []
+        for i, j in find_intersecting_intervals(map_start, map_end, gap_start, gap_end):
+            rank = AbstractSpaceTimeDataset._rank_granule_relations(
+                map_start[i], map_end[i], map_has_end[i], gap_start[j], gap_end[j]
+            )
+            related = rank < num_ranks
+            i, j, rank = i[related], j[related], rank[related]
+            np.minimum.at(best_rank, j, rank)
+            pairs.append((indices[i], j, rank))
+
+        if pairs:
+            map_index = np.concatenate([pair[0] for pair in pairs])
+            gap_index = np.concatenate([pair[1] for pair in pairs])
+            rank = np.concatenate([pair[2] for pair in pairs])
+            selected = rank == best_rank[gap_index]
+            map_index = map_index[selected]
+            gap_index = gap_index[selected]
+            # Maps of each granule in the order of the map list
+            order = np.lexsort((map_index, gap_index))
+            map_index = map_index[order].tolist()
+            bounds = np.searchsorted(
+                gap_index[order], np.arange(len(gap_list) + 1)
+            ).tolist()
+        else:
+            map_index = []
+            bounds = [0] * (len(gap_list) + 1)
 
         gran_list = []
-        for gap in gap_list:
-            # If not temporal relations then gap
-            if not gap.get_temporal_relations():
+        for k, gap in enumerate(gap_list):
+            if bounds[k] == bounds[k + 1]:
                 gran_list.append(
                     [
                         gap,
                     ]
                 )
-            else:
-                relations = gap.get_temporal_relations()
-
-                map_list = []
-
-                for relation in relations_order:
-                    if relation in relations:
-                        map_list += relations[relation]
-                        break
-
-                if map_list:
-                    new_maps = []
-                    for map in map_list:
-                        new_map = map.get_new_instance(map.get_id())
-                        new_map.set_temporal_extent(gap.get_temporal_extent())
-                        new_map.set_spatial_extent(map.get_spatial_extent())
-                        new_maps.append(new_map)
-                    gran_list.append(new_maps)
-                else:
-                    gran_list.append(
-                        [
-                            gap,
-                        ]
-                    )
+                continue
 
-        if gran_list:
-            return gran_list
+            new_maps = []
+            for index in map_index[bounds[k] : bounds[k + 1]]:
+                map = maps[index]
+                new_map = map.get_new_instance(map.get_id())
+                new_map.set_temporal_extent(gap.get_temporal_extent())
+                new_map.set_spatial_extent(map.get_spatial_extent())
+                new_maps.append(new_map)
+            gran_list.append(new_maps)
 
-        return None
+        return gran_list
+
+    @staticmethod
+    def _rank_granule_relations(map_start, map_end, map_has_end, gap_start, gap_end):
+        """Rank the temporal relations of maps to granules
+
+        The ranks follow the search order of resample_maplist_by_granularity():
+        0 for maps equal to the granule, 1 for maps which contain the granule,
+        2 for maps overlapped by the granule, 3 for maps overlapping the
+        granule, 4 for maps during the granule, and 5 for other relations.
+        The conditions are the same as in TemporalExtent.temporal_relation()
+        (e.g., maps which contain the granule include started and finished).
+
+        All arguments are NumPy arrays of the same length, the end time of
+        time instances must be set to the start time.
+        """
+        equal = map_has_end & (map_start == gap_start) & (map_end == gap_end)
+        conditions = [
+            equal,
+            map_has_end & (map_start <= gap_start) & (map_end >= gap_end),
+            map_has_end
+            & (map_start > gap_start)
+            & (map_start < gap_end)
+            & (map_end > gap_end),
+            map_has_end
+            & (map_start < gap_start)
+            & (map_end > gap_start)
+            & (map_end < gap_end),
+            np.where(
+                map_has_end,
+                (map_start >= gap_start) & (map_end <= gap_end),
+                (map_start >= gap_start) & (map_start < gap_end),
+            ),
+        ]
+        return np.select(conditions, np.arange(len(conditions)), default=5)
 
     def get_registered_maps_as_objects_with_gaps(
         self, where=None, dbif=None, spatial_extent=None, spatial_relation=None
@@ -1580,9 +1667,47 @@ class AbstractSpaceTimeDataset(AbstractDataset):
                 In case nothing is found, an empty list is returned
         """
 
-        dbif, connection_state_changed = init_dbif(dbif)
+        return self.get_registered_maps_as_columns(
+            where=where,
+            order=order,
+            dbif=dbif,
+            spatial_extent=spatial_extent,
+            spatial_relation=spatial_relation,
+        ).tolist()
 
-        obj_list = []
+    def get_registered_maps_as_columns(
+        self,
+        where=None,
+        order="start_time",
+        dbif=None,
+        spatial_extent=None,
+        spatial_relation=None,
+    ):
+        """Return all or a subset of the registered maps as ordered
+        columnar map list
+
+        The ids, start and end times, spatial extents and semantic labels
+        of the maps are stored in NumPy arrays. The map objects are created
+        only when they are accessed, so this method is more efficient than
+        get_registered_maps_as_objects() in case only the ids or the
+        time stamps are needed.
+
+        :param where: The SQL where statement to select a subset of
+                      the registered maps without "WHERE"
+        :param order: The SQL order statement to be used to order the
+                      objects in the list without "ORDER BY"
+        :param dbif: The database interface to be used
+        :param spatial_extent: Spatial extent dict and projection information
+            e.g. from g.region -ug3 with GRASS region keys
+            "n", "s", "e", "w", "b", "t", and "projection".
+        :param spatial_relation: Spatial relation to the provided
+            spatial extent, see get_registered_maps_as_objects()
+
+        :return: The ordered map list as RegisteredMapList object.
+                 In case nothing is found, an empty list is returned
+        """
+
+        dbif, connection_state_changed = init_dbif(dbif)
 
         # use all columns
         rows = self.get_registered_maps(
@@ -1594,59 +1719,12 @@ class AbstractSpaceTimeDataset(AbstractDataset):
             spatial_relation=spatial_relation,
         )
 
-        if rows:
-            # Older temporal databases have no bottom and top columns
-            # in their views so we need a work around to set the full
-            # spatial extent as well
-
-            # check keys in first row
-            # note that 'if "bottom" in row' does not work
-            # because row is not a dict but some db backend object
-            has_bt_columns = "bottom" in rows[0].keys()
-            has_semantic_label = "semantic_label" in rows[0].keys()
-        else:
-            return obj_list
-
-        for row in rows:
-            map = self.get_new_map_instance(row["id"])
-            # time
-            if self.is_time_absolute():
-                map.set_absolute_time(row["start_time"], row["end_time"])
-            elif self.is_time_relative():
-                map.set_relative_time(
-                    row["start_time"],
-                    row["end_time"],
-                    self.get_relative_time_unit(),
-                )
-            # space
-            # The fast way
-            if has_bt_columns:
-                map.set_spatial_extent_from_values(
-                    west=row["west"],
-                    east=row["east"],
-                    south=row["south"],
-                    top=row["top"],
-                    north=row["north"],
-                    bottom=row["bottom"],
-                )
-            # The slow work around
-            else:
-                map.spatial_extent.select(dbif)
-
-            # labels
-            if (
-                has_semantic_label
-                and row["semantic_label"] is not None
-                and row["semantic_label"] != "None"
-            ):
-                map.metadata.set_semantic_label(row["semantic_label"])
-
-            obj_list.append(copy.copy(map))
+        maps = RegisteredMapList.from_rows(self, rows or [], dbif)
 
         if connection_state_changed:
             dbif.close()
 
-        return obj_list
+        return maps
 
     def _update_where_statement_by_semantic_label(self, where):
         """Update given SQL WHERE statement by semantic label.
@@ -2701,6 +2779,152 @@ class AbstractSpaceTimeDataset(AbstractDataset):
 
         return True
 
+    def register_maps(self, maps, dbif=None) -> int:
+        """Register many maps in the space time dataset at once.
+
+        This is a bulk variant of :meth:`register_map` which uses a constant
+        number of database queries regardless of the number of maps.
+        Unlike :meth:`register_map`, the map objects are not selected from
+        the temporal database again, so their content must correspond
+        to the temporal database, e.g., right after they were inserted.
+
+        Maps which are already registered are skipped with a warning.
+        The extent and metadata of the space time dataset are not updated,
+        call :meth:`update_from_registered_maps` afterwards.
+
+        :param maps: A list of AbstractMapDataset objects
+        :param dbif: The database interface to be used
+        :return: The number of newly registered maps
+
+        :raises ~grass.exceptions.FatalError:
+            This method raises a :exc:`~grass.exceptions.FatalError` exception
+            in case of a fatal error
+        """
+        mapset = get_current_mapset()
+
+        if self.get_mapset() != mapset:
+            self.msgr.fatal(
+                _(
+                    "Unable to register map in dataset <%(ds)s> of "
+                    "type %(type)s. The mapset of the database does "
+                    "not match the current mapset"
+                )
+                % {"ds": self.get_id(), "type": self.get_type()}
+            )
+
+        if not maps:
+            return 0
+
+        dbif, connection_state_changed = init_dbif(dbif)
+
+        stds_id = self.base.get_id()
+        stds_register_table = self.get_map_register()
+        stds_ttype = self.get_temporal_type()
+        map_register_table = maps[0].stds_register.get_table_name()
+
+        # The gathered SQL statements are stored here
+        statement = ""
+
+        registered_ids = {
+            row[0] for row in self._select_registered_ids(dbif, stds_register_table)
+        }
+        registered_stds = {
+            row[0]: row[1]
+            for row in dbif.select_by_ids(
+                map_register_table,
+                [map.get_id() for map in maps],
+                columns="id, registered_stds",
+                mapset=mapset,
+            )
+        }
+
+        register_updates = []
+        register_inserts = []
+        for map in maps:
+            map_id = map.base.get_id()
+
+            if not map.check_for_correct_time():
+                if map.get_layer():
+                    self.msgr.fatal(
+                        _("Map <%(id)s> with layer %(l)s has invalid time")
+                        % {"id": map.get_map_id(), "l": map.get_layer()}
+                    )
+                else:
+                    self.msgr.fatal(_("Map <%s> has invalid time") % map.get_map_id())
+
+            if stds_ttype != map.get_temporal_type():
+                self.msgr.fatal(
+                    _(
+                        "Temporal type of space time dataset "
+                        "<%(id)s> and map <%(map)s> are different"
+                    )
+                    % {"id": self.get_id(), "map": map.get_map_id()}
+                )
+
+            map_rel_time_unit = map.get_relative_time_unit()
+            # In case no map has been registered yet, set the
+            # relative time unit from the first map
+            if (
+                not self.metadata.get_number_of_maps()
+                and self.map_counter == 0
+                and not registered_ids
+                and self.is_time_relative()
+            ):
+                self.set_relative_time_unit(map_rel_time_unit)
+                statement += self.relative_time.get_update_all_statement_mogrified(dbif)
+
+            if self.is_time_relative() and (
+                self.get_relative_time_unit() != map_rel_time_unit
+            ):
+                self.msgr.fatal(
+                    _(
+                        "Relative time units of space time dataset "
+                        "<%(id)s> and map <%(map)s> are different"
+                    )
+                    % {"id": self.get_id(), "map": map.get_map_id()}
+                )
+
+            if map_id in registered_ids:
+                self.msgr.warning(_("Map <%s> is already registered.") % map_id)
+                continue
+            registered_ids.add(map_id)
+
+            # Register the stds in the map stds register table column
+            datasets = registered_stds.get(map_id)
+            datasets = datasets.split(",") if datasets else []
+            if stds_id not in datasets:
+                datasets.append(stds_id)
+                registered_stds[map_id] = ",".join(datasets)
+                map.stds_register.set_registered_stds(registered_stds[map_id])
+                register_updates.append((registered_stds[map_id], map_id))
+            register_inserts.append((map_id,))
+
+        if statement:
+            dbif.execute_transaction(statement, mapset=mapset)
+
+        placeholder = "?" if dbif.get_dbmi().paramstyle == "qmark" else "%s"
+        update_sql = (
+            f"UPDATE {map_register_table} SET registered_stds = {placeholder}"
+            f" WHERE id = {placeholder};\n"
+        )
+        insert_sql = f"INSERT INTO {stds_register_table} (id) VALUES ({placeholder});\n"
+        dbif.execute_many_transaction(
+            [(update_sql, register_updates), (insert_sql, register_inserts)],
+            mapset=mapset,
+        )
+
+        if connection_state_changed:
+            dbif.close()
+
+        self.map_counter += len(register_inserts)
+
+        return len(register_inserts)
+
+    def _select_registered_ids(self, dbif, stds_register_table):
+        """Return rows with ids of all maps in the map register table"""
+        dbif.execute("SELECT id FROM " + stds_register_table, mapset=self.base.mapset)
+        return dbif.fetchall(mapset=self.base.mapset) or []
+
     def unregister_map(self, map, dbif=None, execute: bool = True):
         """Unregister a map from the space time dataset.
 
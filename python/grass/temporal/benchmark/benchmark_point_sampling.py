@@ -0,0 +1,82 @@
+"""Benchmarking of the sampling of raster maps at point locations
+
+Creates 10^4 random points and 2 * 10^4 raster maps and measures the
+sampling with PointSampler, which reads the raster maps in-process, with one
+and several processes. For comparison, the maps are sampled with one r.what
+run for each 400 maps, which was the approach of t.rast.what before.
+
+Run in a GRASS session, the maps are removed at the end.
+"""
+
+import time
+
+import grass.script as gs
+import grass.temporal as tgis
+
+NUM_MAPS = 20000
+NUM_POINTS = 10000
+NAME = "benchmark_sampling"
+
+
+def create_maps(num_maps):
+    """Create the raster maps with a single r.mapcalc run for each batch"""
+    names = [f"{NAME}_{i}" for i in range(num_maps)]
+    batch_size = 100
+    for start in range(0, num_maps, batch_size):
+        expression = "\n".join(
+            f"{name} = rand(0, {i + 100})"
+            for i, name in enumerate(names[start : start + batch_size], start)
+        )
+        gs.mapcalc(expression, seed=1, overwrite=True, quiet=True)
+    return names
+
+
+def sample_by_module(names, points):
+    """Sample the maps with one r.what run for each 400 maps"""
+    for start in range(0, len(names), 400):
+        gs.read_command(
+            "r.what", map=names[start : start + 400], points=points, quiet=True
+        )
+
+
+def sample_in_process(names, east, north, nprocs):
+    """Sample the maps with the point sampler"""
+    sampler = tgis.PointSampler(east, north)
+    for unused, values in sampler.sample(names, nprocs):
+        tgis.format_sampled_values(values)
+
+
+def measure(function, *args):
+    """Return the time of the function call in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    tgis.init()
+    gs.use_temp_region()
+    gs.run_command("g.region", n=200, s=0, e=200, w=0, res=1)
+    names = create_maps(NUM_MAPS)
+    points = f"{NAME}_points"
+    gs.run_command(
+        "v.random", output=points, npoints=NUM_POINTS, seed=1, overwrite=True
+    )
+    try:
+        unused, east, north = tgis.read_vector_points(points)
+        print(f"{NUM_POINTS} points, {NUM_MAPS} maps with {200 * 200} cells")
+        for nprocs in [1, 4]:
+            seconds = measure(sample_in_process, names, east, north, nprocs)
+            print(f"  in-process, {nprocs} processes: {seconds:8.2f} s")
+        seconds = measure(sample_by_module, names, points)
+        print(f"  r.what per 400 maps:       {seconds:8.2f} s")
+    finally:
+        gs.run_command(
+            "g.remove", flags="f", type="raster", pattern=f"{NAME}_*", quiet=True
+        )
+        gs.run_command("g.remove", flags="f", type="vector", name=points, quiet=True)
+        gs.del_temp_region()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmarking of the granularity resampling of map lists
+
+Measures AbstractSpaceTimeDataset.resample_maplist_by_granularity() for
+10^5 and 10^6 maps with interval time resampled to coarser granules
+and 10^5 maps resampled to finer granules. The maps are provided as
+RegisteredMapList, so that map objects are created only for the resampled
+maps. For 10^4 maps, the resampling is compared with the previous approach
+which builds the full temporal topology between the granules and the maps.
+
+Run in a GRASS session.
+"""
+
+import copy
+import time
+from datetime import datetime
+
+import numpy as np
+
+import grass.temporal as tgis
+
+START = datetime(2000, 1, 1)
+
+
+def create_map_list(num_maps, step):
+    """Create a list of consecutive maps with interval time
+
+    :param num_maps: Number of maps
+    :param step: Duration of each map as NumPy timedelta64
+    """
+    dataset = tgis.SpaceTimeRasterDataset(None)
+    dataset.base.set_ttype("absolute")
+    start = np.datetime64(START, "us") + np.arange(num_maps) * step
+    ids = [f"benchmark_map_{i}@PERMANENT" for i in range(num_maps)]
+    extent = np.tile([1.0, 0.0, 1.0, 0.0, 0.0, 0.0], (num_maps, 1))
+    return tgis.RegisteredMapList(dataset, ids, start, start + step, extent)
+
+
+def resample_by_topology(maps, start, end, gran):
+    """Resample by building the temporal topology between granules and maps
+
+    This was the implementation of resample_maplist_by_granularity() before
+    it used a binary search over the start times.
+    """
+    first = maps[0]
+    gap_list = []
+    while start < end:
+        next_ = tgis.increment_datetime_by_string(start, gran)
+        map_ = first.get_new_instance(None)
+        map_.set_spatial_extent_from_values(0, 0, 0, 0, 0, 0)
+        map_.set_absolute_time(start, next_)
+        gap_list.append(copy.copy(map_))
+        start = next_
+
+    tb = tgis.SpatioTemporalTopologyBuilder()
+    tb.build(gap_list, maps)
+
+    relations_order = ["EQUAL", "DURING", "OVERLAPS", "OVERLAPPED", "CONTAINS"]
+    gran_list = []
+    for gap in gap_list:
+        relations = gap.get_temporal_relations()
+        map_list = []
+        for relation in relations_order:
+            if relation in relations:
+                map_list += relations[relation]
+                break
+        if not map_list:
+            gran_list.append([gap])
+            continue
+        new_maps = []
+        for map_ in map_list:
+            new_map = map_.get_new_instance(map_.get_id())
+            new_map.set_temporal_extent(gap.get_temporal_extent())
+            new_map.set_spatial_extent(map_.get_spatial_extent())
+            new_maps.append(new_map)
+        gran_list.append(new_maps)
+    return gran_list
+
+
+def measure(function, *args):
+    """Return the time of the function call in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    tgis.init()
+    reference_size = 10**4
+    # Label, duration of the maps, granularity, numbers of maps
+    cases = [
+        (
+            "daily maps, 1 month granules",
+            np.timedelta64(1, "D"),
+            "1 month",
+            [10**5, 10**6],
+        ),
+        (
+            "hourly maps, 1 day granules",
+            np.timedelta64(1, "h"),
+            "1 day",
+            [10**5, 10**6],
+        ),
+        # Four granules per map
+        ("daily maps, 6 hours granules", np.timedelta64(1, "D"), "6 hours", [10**5]),
+    ]
+    resample = tgis.AbstractSpaceTimeDataset.resample_maplist_by_granularity
+
+    for label, step, gran, sizes in cases:
+        print(label)
+        for num_maps in [reference_size, *sizes]:
+            maps = create_map_list(num_maps, step)
+            end = maps.end_time[-1].item()
+            seconds = measure(resample, maps, START, end, gran)
+            print(f"  {num_maps:>8} maps: {seconds:8.2f} s")
+            if num_maps == reference_size:
+                maps = maps.tolist()
+                seconds = measure(resample_by_topology, maps, START, end, gran)
+                print(f"  {num_maps:>8} maps: {seconds:8.2f} s (topology builder)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmarking of the univariate statistics of space time raster datasets
+
+Creates a daily space time raster dataset and measures
+print_gridded_dataset_univar_statistics(), which reads the raster maps
+in-process, with one and several processes. For comparison, the statistics
+are computed with one r.univar run per map using compute_univar_stats().
+
+Run in a GRASS session, the maps and the dataset are removed at the end.
+"""
+
+import os
+import time
+from subprocess import PIPE
+
+import grass.script as gs
+import grass.temporal as tgis
+from grass.pygrass.modules import Module
+
+NUM_MAPS = 10000
+NAME = "benchmark_univar"
+
+
+def create_dataset(num_maps):
+    """Create the raster maps and register them in a daily dataset"""
+    names = [f"{NAME}_{i}" for i in range(num_maps)]
+    # Create the maps in batches with a single r.mapcalc run each
+    batch_size = 100
+    for start in range(0, num_maps, batch_size):
+        expression = "\n".join(
+            f"{name} = rand(0, {i + 100})"
+            for i, name in enumerate(names[start : start + batch_size], start)
+        )
+        gs.mapcalc(expression, seed=1, overwrite=True, quiet=True)
+    gs.run_command(
+        "t.create",
+        output=NAME,
+        type="strds",
+        temporaltype="absolute",
+        title=NAME,
+        description=NAME,
+        overwrite=True,
+        quiet=True,
+    )
+    # The list of maps is too long for the command line
+    map_file = gs.tempfile()
+    with open(map_file, "w") as file:
+        file.write("\n".join(names))
+    gs.run_command(
+        "t.register",
+        flags="i",
+        input=NAME,
+        file=map_file,
+        start="2000-01-01",
+        increment="1 day",
+        quiet=True,
+    )
+    os.remove(map_file)
+
+
+def univar_by_module(output):
+    """Compute the statistics with one r.univar run per map"""
+    strds = tgis.open_old_stds(NAME, "strds")
+    rows = strds.get_registered_maps(
+        "id,start_time,end_time,semantic_label", None, "start_time"
+    )
+    module = Module("r.univar", flags="g", stdout_=PIPE, run_=False)
+    with open(output, "w") as out_file:
+        out_file.writelines(
+            tgis.compute_univar_stats(row, module, "|") + "\n" for row in rows
+        )
+
+
+def measure(function, *args, **kwargs):
+    """Return the time of the function call in seconds"""
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    tgis.init()
+    gs.use_temp_region()
+    gs.run_command("g.region", n=100, s=0, e=100, w=0, res=1)
+    create_dataset(NUM_MAPS)
+    output = gs.tempfile()
+    try:
+        print(f"{NUM_MAPS} maps with {100 * 100} cells")
+        for nprocs in [1, 4]:
+            seconds = measure(
+                tgis.print_gridded_dataset_univar_statistics,
+                "strds",
+                NAME,
+                output,
+                None,
+                False,
+                nprocs=nprocs,
+            )
+            print(f"  in-process, {nprocs} processes: {seconds:8.2f} s")
+        seconds = measure(univar_by_module, output)
+        print(f"  r.univar per map:          {seconds:8.2f} s")
+    finally:
+        os.remove(output)
+        gs.run_command("t.remove", flags="df", inputs=NAME, quiet=True)
+        gs.del_temp_region()
+
+
+if __name__ == "__main__":
+    main()
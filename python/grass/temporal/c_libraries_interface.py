@@ -65,6 +65,7 @@ class RPCDefs:
     READ_SEMANTIC_LABEL = 16
     REMOVE_SEMANTIC_LABEL = 17
     READ_MAP_HISTORY = 18
+    CALL_MANY = 19
     G_FATAL_ERROR = 49
 
     TYPE_RASTER = 0
@@ -1176,6 +1177,61 @@ def _convert_timestamp_from_grass(ts):
 ###############################################################################
 
 
+class _ResultCollector:
+    """Stand-in for the connection which keeps the sent object
+
+    Used to call the functions for a single map when processing many maps
+    in one request.
+    """
+
+    def __init__(self) -> None:
+        self.result = None
+
+    def send(self, obj) -> None:
+        self.result = obj
+
+
+# Functions which can be called for many maps in a single request using
+# CALL_MANY, only the ones which read data
+_MANY_FUNCTIONS = {
+    RPCDefs.MAP_EXISTS: _map_exists,
+    RPCDefs.READ_MAP_INFO: _read_map_info,
+    RPCDefs.READ_MAP_HISTORY: _read_map_history,
+    RPCDefs.HAS_TIMESTAMP: _has_timestamp,
+    RPCDefs.READ_TIMESTAMP: _read_timestamp,
+    RPCDefs.READ_SEMANTIC_LABEL: _read_semantic_label,
+}
+
+
+def _call_many(lock: _LockLike, conn: Connection, data) -> None:
+    """Call a function for a list of maps and send the list of the results
+    using the provided pipe
+
+    This avoids a round trip between the client and the server for each map.
+    The results are in the same order as the maps.
+
+    :param lock: A multiprocessing.Lock instance
+    :param conn: A multiprocessing.connection.Connection object obtained from
+                 multiprocessing.Pipe used to send the list of results
+    :param data: The list of data entries [function_id, called_function_id,
+                 maptype, names, mapsets, layers]
+    """
+    results = []
+    try:
+        function = _MANY_FUNCTIONS[data[1]]
+        maptype = data[2]
+        collector = _ResultCollector()
+        for name, mapset, layer in zip(data[3], data[4], data[5], strict=True):
+            collector.result = None
+            function(lock, collector, [data[1], maptype, name, mapset, layer])
+            results.append(collector.result)
+    finally:
+        conn.send(results)
+
+
+###############################################################################
+
+
 def _stop(lock: _LockLike, conn: Connection, data) -> None:
     libgis.G_debug(1, "Stop C-interface server")
     conn.close()
@@ -1235,6 +1291,7 @@ def c_library_server(lock: _LockLike, conn: Connection) -> None:
     functions[RPCDefs.READ_SEMANTIC_LABEL] = _read_semantic_label
     functions[RPCDefs.REMOVE_SEMANTIC_LABEL] = _remove_semantic_label
     functions[RPCDefs.READ_MAP_HISTORY] = _read_map_history
+    functions[RPCDefs.CALL_MANY] = _call_many
     functions[RPCDefs.G_FATAL_ERROR] = _fatal_error
 
     libgis.G_gisinit("c_library_server")
@@ -1479,6 +1536,30 @@ class CLibrariesInterface(RPCServerBase):
         self.server.daemon = True
         self.server.start()
 
+    def _call_many(self, function_id, maptype, names, mapset, layer, caller):
+        """Call a function of the server for many maps using a single request
+
+        :param function_id: The identifier of the function to call for each map
+        :param maptype: The type of the maps
+        :param names: The names of the maps
+        :param mapset: The mapset of all maps or a list with the mapset of each map
+        :param layer: The layer of all maps or a list with the layer of each map
+        :param caller: The name of the calling method used in error messages
+        :returns: The list of results in the order of the maps
+        """
+        names = list(names)
+        if mapset is None or isinstance(mapset, str):
+            mapset = [mapset] * len(names)
+        if layer is None or isinstance(layer, (str, int)):
+            layer = [layer] * len(names)
+        if not names:
+            return []
+        self.check_server()
+        self.client_conn.send(
+            [RPCDefs.CALL_MANY, function_id, maptype, names, list(mapset), list(layer)]
+        )
+        return self.safe_receive(caller)
+
     def raster_map_exists(self, name, mapset):
         """Check if a raster map exists in the spatial database
 
@@ -1669,6 +1750,111 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("write_raster_semantic_label")
 
+    def raster_map_exists_many(self, names, mapset):
+        """Check if raster maps exist in the spatial database
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.MAP_EXISTS,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "raster_map_exists_many",
+        )
+
+    def read_raster_info_many(self, names, mapset):
+        """Read the info of many raster maps using a single request
+
+        See :meth:`read_raster_info` for the content of the returned dictionaries.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map specific metadata
+                  of each map, or None for maps with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_INFO,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "read_raster_info_many",
+        )
+
+    def read_raster_history_many(self, names, mapset):
+        """Read the history of many raster maps using a single request
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map history
+                  (creation, creation_time) of each map, or None for maps
+                  with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_HISTORY,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "read_raster_history_many",
+        )
+
+    def has_raster_timestamp_many(self, names, mapset):
+        """Check if file based raster timestamps exist for many maps
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.HAS_TIMESTAMP,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "has_raster_timestamp_many",
+        )
+
+    def read_raster_timestamp_many(self, names, mapset):
+        """Read file based raster timestamps of many maps using a single request
+
+        See :meth:`read_raster_timestamp` for the content of the result for each map.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of tuples with the return value of
+                  G_read_raster_timestamp and the timestamps for each map
+        """
+        return self._call_many(
+            RPCDefs.READ_TIMESTAMP,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "read_raster_timestamp_many",
+        )
+
+    def read_raster_semantic_label_many(self, names, mapset):
+        """Read the file based semantic labels of many raster maps
+        using a single request
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of semantic labels, None for maps without a semantic label
+        """
+        return self._call_many(
+            RPCDefs.READ_SEMANTIC_LABEL,
+            RPCDefs.TYPE_RASTER,
+            names,
+            mapset,
+            None,
+            "read_raster_semantic_label_many",
+        )
+
     def raster3d_map_exists(self, name, mapset):
         """Check if a 3D raster map exists in the spatial database
 
@@ -1791,6 +1977,94 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("write_raster3d_timestamp")
 
+    def raster3d_map_exists_many(self, names, mapset):
+        """Check if 3D raster maps exist in the spatial database
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.MAP_EXISTS,
+            RPCDefs.TYPE_RASTER3D,
+            names,
+            mapset,
+            None,
+            "raster3d_map_exists_many",
+        )
+
+    def read_raster3d_info_many(self, names, mapset):
+        """Read the info of many 3D raster maps using a single request
+
+        See :meth:`read_raster3d_info` for the content of the returned dictionaries.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map specific metadata
+                  of each map, or None for maps with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_INFO,
+            RPCDefs.TYPE_RASTER3D,
+            names,
+            mapset,
+            None,
+            "read_raster3d_info_many",
+        )
+
+    def read_raster3d_history_many(self, names, mapset):
+        """Read the history of many 3D raster maps using a single request
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map history
+                  (creation, creation_time) of each map, or None for maps
+                  with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_HISTORY,
+            RPCDefs.TYPE_RASTER3D,
+            names,
+            mapset,
+            None,
+            "read_raster3d_history_many",
+        )
+
+    def has_raster3d_timestamp_many(self, names, mapset):
+        """Check if file based 3D raster timestamps exist for many maps
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.HAS_TIMESTAMP,
+            RPCDefs.TYPE_RASTER3D,
+            names,
+            mapset,
+            None,
+            "has_raster3d_timestamp_many",
+        )
+
+    def read_raster3d_timestamp_many(self, names, mapset):
+        """Read file based 3D raster timestamps of many maps using a single request
+
+        See :meth:`read_raster3d_timestamp` for the content of the result for each map.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of tuples with the return value of
+                  G_read_raster3d_timestamp and the timestamps for each map
+        """
+        return self._call_many(
+            RPCDefs.READ_TIMESTAMP,
+            RPCDefs.TYPE_RASTER3D,
+            names,
+            mapset,
+            None,
+            "read_raster3d_timestamp_many",
+        )
+
     def vector_map_exists(self, name, mapset):
         """Check if a vector map exists in the spatial database
 
@@ -1932,6 +2206,97 @@ class CLibrariesInterface(RPCServerBase):
         )
         return self.safe_receive("write_vector_timestamp")
 
+    def vector_map_exists_many(self, names, mapset, layer=None):
+        """Check if vector maps exist in the spatial database
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :param layer: The layer of the vector maps
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.MAP_EXISTS,
+            RPCDefs.TYPE_VECTOR,
+            names,
+            mapset,
+            layer,
+            "vector_map_exists_many",
+        )
+
+    def read_vector_info_many(self, names, mapset):
+        """Read the info of many vector maps using a single request
+
+        See :meth:`read_vector_info` for the content of the returned dictionaries.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map specific metadata
+                  of each map, or None for maps with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_INFO,
+            RPCDefs.TYPE_VECTOR,
+            names,
+            mapset,
+            None,
+            "read_vector_info_many",
+        )
+
+    def read_vector_history_many(self, names, mapset):
+        """Read the history of many vector maps using a single request
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :returns: List of the key value pairs of the map history
+                  (creation, creation_time) of each map, or None for maps
+                  with an error
+        """
+        return self._call_many(
+            RPCDefs.READ_MAP_HISTORY,
+            RPCDefs.TYPE_VECTOR,
+            names,
+            mapset,
+            None,
+            "read_vector_history_many",
+        )
+
+    def has_vector_timestamp_many(self, names, mapset, layer=None):
+        """Check if file based vector timestamps exist for many maps
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :param layer: The layer of the vector maps
+        :returns: List of True or False for each map
+        """
+        return self._call_many(
+            RPCDefs.HAS_TIMESTAMP,
+            RPCDefs.TYPE_VECTOR,
+            names,
+            mapset,
+            layer,
+            "has_vector_timestamp_many",
+        )
+
+    def read_vector_timestamp_many(self, names, mapset, layer=None):
+        """Read file based vector timestamps of many maps using a single request
+
+        See :meth:`read_vector_timestamp` for the content of the result for each map.
+
+        :param names: The names of the maps
+        :param mapset: The mapset of the maps or a list with the mapset of each map
+        :param layer: The layer of the vector maps
+        :returns: List of tuples with the return value of
+                  G_read_vector_timestamp and the timestamps for each map
+        """
+        return self._call_many(
+            RPCDefs.READ_TIMESTAMP,
+            RPCDefs.TYPE_VECTOR,
+            names,
+            mapset,
+            layer,
+            "read_vector_timestamp_many",
+        )
+
     def available_mapsets(self):
         """Return all available mapsets the user can access as a list of strings
 
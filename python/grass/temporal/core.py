@@ -1236,6 +1236,57 @@ class SQLDatabaseInterfaceConnection:
 
         return self.connections[mapset].execute_transaction(statement)
 
+    def execute_many_transaction(self, statements, mapset=None):
+        """Execute SQL statements with many sets of arguments in one transaction
+
+        This is more efficient than executing the statements one by one or
+        as a mogrified script, e.g., for inserting many rows into a table.
+
+        :param statements: A list of tuples with two entries, the first entry
+                           is the SQL statement with DBMI specific place
+                           holders, the second entry is a list of argument
+                           tuples, one for each execution of the statement
+        :param mapset: The mapset of the temporal database, if None
+                       the current mapset will be used
+        """
+        if mapset is None:
+            mapset = self.current_mapset
+
+        mapset = decode(mapset)
+        if mapset not in self.tgis_mapsets.keys():
+            self.msgr.fatal(
+                _(
+                    "Unable to execute transaction. "
+                    + self._create_mapset_error_message(mapset)
+                )
+            )
+
+        return self.connections[mapset].execute_many_transaction(statements)
+
+    def select_by_ids(self, table, ids, columns="id", mapset=None):
+        """Select rows with the given ids from a table
+
+        The ids are queried in chunks, so this is efficient also for a large
+        number of ids.
+
+        :param table: The name of the table with an id column
+        :param ids: The ids of the rows to select
+        :param columns: The columns to select as a string
+        :param mapset: The mapset of the temporal database, if None
+                       the current mapset will be used
+        :return: A list of the selected rows
+        """
+        if mapset is None:
+            mapset = self.current_mapset
+
+        mapset = decode(mapset)
+        if mapset not in self.tgis_mapsets.keys():
+            self.msgr.fatal(
+                _("Unable to select. " + self._create_mapset_error_message(mapset))
+            )
+
+        return self.connections[mapset].select_by_ids(table, ids, columns)
+
     def _create_mapset_error_message(self, mapset) -> str:
         return (
             "You have no permission to "
@@ -1581,6 +1632,86 @@ class DBConnection:
         if connected:
             self.close()
 
+    def execute_many_transaction(self, statements):
+        """Execute SQL statements with many sets of arguments in one transaction
+
+        :param statements: A list of tuples with two entries, the first entry
+                           is the SQL statement with DBMI specific place
+                           holders, the second entry is a list of argument
+                           tuples, one for each execution of the statement
+        """
+        connected = False
+        if not self.connected:
+            self.connect()
+            connected = True
+
+        sqlite = self.dbmi.__name__ == "sqlite3"
+        try:
+            # The sqlite connection is in the autocommit mode,
+            # so the transaction needs to be started explicitly.
+            if sqlite:
+                self.cursor.execute("BEGIN TRANSACTION")
+            for sql, args in statements:
+                self.cursor.executemany(sql, args)
+            if sqlite:
+                self.cursor.execute("COMMIT")
+            else:
+                self.connection.commit()
+        except db_errors:
+            if sqlite:
+                if self.connection.in_transaction:
+                    self.cursor.execute("ROLLBACK")
+            else:
+                self.connection.rollback()
+            if connected:
+                self.close()
+            self.msgr.error(
+                _("Unable to execute transaction:\n %(sql)s")
+                % {"sql": "\n".join(sql for sql, unused in statements)}
+            )
+            raise
+
+        if connected:
+            self.close()
+
+    def select_by_ids(self, table, ids, columns="id"):
+        """Select rows with the given ids from a table
+
+        :param table: The name of the table with an id column
+        :param ids: The ids of the rows to select
+        :param columns: The columns to select as a string
+        :return: A list of the selected rows
+        """
+        connected = False
+        if not self.connected:
+            self.connect()
+            connected = True
+
+        placeholder = "?" if self.dbmi.paramstyle == "qmark" else "%s"
+        ids = list(ids)
+        rows = []
+        # Stay below the limit on the number of variables in old SQLite versions.
+        chunk_size = 500
+        try:
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start : start + chunk_size]
+                sql = "SELECT %s FROM %s WHERE id IN (%s)" % (
+                    columns,
+                    table,
+                    ",".join([placeholder] * len(chunk)),
+                )
+                self.cursor.execute(sql, chunk)
+                rows.extend(self.cursor.fetchall())
+        except db_errors:
+            if connected:
+                self.close()
+            self.msgr.error(_("Unable to select from table <%s>") % table)
+            raise
+
+        if connected:
+            self.close()
+        return rows
+
 
 ###############################################################################
 
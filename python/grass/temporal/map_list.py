@@ -0,0 +1,267 @@
+"""
+Columnar list of maps registered in a space time dataset
+
+The RegisteredMapList stores the ids, the temporal extents, the spatial extents
+and the semantic labels of the maps in NumPy arrays. Map objects are created
+only when they are accessed, so that listing maps or working with their time
+stamps does not require a map object for each registered map.
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    strds = tgis.open_old_stds("precipitation", "strds")
+    maps = strds.get_registered_maps_as_columns()
+    # Columns as NumPy arrays
+    print(maps.ids, maps.start_time, maps.end_time)
+    # Map objects are created when accessed
+    for map_ in maps:
+        print(map_.get_name())
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+
+# Order of the spatial extent columns
+EXTENT_COLUMNS = ("north", "south", "east", "west", "top", "bottom")
+
+
+def _item(value):
+    """Convert a NumPy scalar to the corresponding Python object"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _time_column(values, absolute):
+    """Create a NumPy array from the start or end times
+
+    Absolute times are stored as datetime64 in microseconds, missing times are
+    NaT. Relative times are stored as integer or floating point numbers.
+    Values which cannot be represented in that way (e.g., time zone aware
+    datetime objects or missing relative times) are kept in an object array.
+    """
+    if absolute:
+        if all(
+            value is None or (isinstance(value, datetime) and value.tzinfo is None)
+            for value in values
+        ):
+            return np.array(values, dtype="datetime64[us]")
+    elif all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in values
+    ):
+        return np.array(values)
+    return np.array(values, dtype=object)
+
+
+class RegisteredMapList(Sequence):
+    """Ordered list of maps registered in a space time dataset
+
+    The list behaves like a sequence of map objects. The objects are
+    initialized with their id, temporal type, start time, end time, spatial
+    extent, and semantic label the first time they are accessed and the same
+    object is returned for repeated access.
+
+    The columns can be used directly to avoid the creation of the map
+    objects. Start and end times of absolute time are NumPy datetime64 arrays,
+    with NaT for missing end times.
+
+    :param dataset: The space time dataset in which the maps are registered
+    :param ids: The map ids
+    :param start_time: The start times
+    :param end_time: The end times
+    :param extent: Array with one row per map and the columns north, south,
+                   east, west, top and bottom
+    :param semantic_label: The semantic labels or None if not available
+    """
+
+    def __init__(
+        self, dataset, ids, start_time, end_time, extent=None, semantic_label=None
+    ) -> None:
+        self._dataset = dataset
+        self._absolute = bool(dataset.is_time_absolute())
+        self._relative = bool(dataset.is_time_relative())
+        self._unit = dataset.get_relative_time_unit() if self._relative else None
+        self.ids = np.asarray(ids, dtype=object)
+        count = len(self.ids)
+        self.start_time = (
+            start_time
+            if isinstance(start_time, np.ndarray)
+            else _time_column(list(start_time), self._absolute)
+        )
+        self.end_time = (
+            end_time
+            if isinstance(end_time, np.ndarray)
+            else _time_column(list(end_time), self._absolute)
+        )
+        if extent is None:
+            extent = np.full((count, len(EXTENT_COLUMNS)), np.nan)
+        self.extent = np.asarray(extent, dtype=np.float64).reshape(
+            count, len(EXTENT_COLUMNS)
+        )
+        if semantic_label is None:
+            semantic_label = [None] * count
+        self.semantic_label = np.asarray(semantic_label, dtype=object)
+        self._maps = {}
+
+    @classmethod
+    def from_rows(cls, dataset, rows, dbif=None):
+        """Create the list from rows of the map register of the dataset
+
+        :param dataset: The space time dataset in which the maps are registered
+        :param rows: The rows with all columns of the map register view
+        :param dbif: The database interface used to select the spatial extent
+                     in case the rows do not contain the bottom and top columns
+        """
+        if not rows:
+            return cls(dataset, [], [], [])
+
+        # Older temporal databases have no bottom and top columns
+        # in their views so we need a work around to set the full
+        # spatial extent as well
+
+        # check keys in first row
+        # note that 'if "bottom" in row' does not work
+        # because row is not a dict but some db backend object
+        has_bt_columns = "bottom" in rows[0].keys()
+        has_semantic_label = "semantic_label" in rows[0].keys()
+
+        ids = []
+        start_time = []
+        end_time = []
+        extent = np.empty((len(rows), len(EXTENT_COLUMNS)))
+        semantic_label = []
+
+        for i, row in enumerate(rows):
+            ids.append(row["id"])
+            start_time.append(row["start_time"])
+            end_time.append(row["end_time"])
+            # The fast way
+            if has_bt_columns:
+                extent[i] = [row[column] for column in EXTENT_COLUMNS]
+            # The slow work around
+            else:
+                spatial_extent = dataset.get_new_map_instance(row["id"]).spatial_extent
+                spatial_extent.select(dbif)
+                extent[i] = spatial_extent.get_spatial_extent_as_tuple()
+
+            label = row["semantic_label"] if has_semantic_label else None
+            semantic_label.append(None if label == "None" else label)
+
+        return cls(dataset, ids, start_time, end_time, extent, semantic_label)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "map list index out of range"
+            raise IndexError(msg)
+        map_ = self._maps.get(index)
+        if map_ is None:
+            map_ = self._create_map(index)
+            self._maps[index] = map_
+        return map_
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} maps)"
+
+    def _create_map(self, index):
+        """Create the map object from the columns"""
+        map_ = self._dataset.get_new_map_instance(self.ids[index])
+        start = _item(self.start_time[index])
+        end = _item(self.end_time[index])
+        # time
+        if self._absolute:
+            map_.set_absolute_time(start, end)
+        elif self._relative:
+            map_.set_relative_time(start, end, self._unit)
+        # space
+        # Missing values are stored as NaN
+        north, south, east, west, top, bottom = (
+            None if np.isnan(value) else value for value in self.extent[index].tolist()
+        )
+        map_.set_spatial_extent_from_values(
+            north=north, south=south, east=east, west=west, top=top, bottom=bottom
+        )
+        # labels
+        label = self.semantic_label[index]
+        if label is not None:
+            map_.metadata.set_semantic_label(label)
+        return map_
+
+    def take(self, indices):
+        """Return a new list with the maps at the provided indices
+
+        Map objects which were already created are shared with the new list.
+
+        :param indices: Integer indices or a boolean mask
+        """
+        indices = np.arange(len(self))[np.asarray(indices)]
+        result = self.__class__(
+            self._dataset,
+            self.ids[indices],
+            self.start_time[indices],
+            self.end_time[indices],
+            self.extent[indices],
+            self.semantic_label[indices],
+        )
+        for new_index, index in enumerate(indices.tolist()):
+            if index in self._maps:
+                result._maps[new_index] = self._maps[index]
+        return result
+
+    def get_temporal_extents(self):
+        """Return the start and end times as a tuple of NumPy arrays
+
+        The end time of time instances is set to the start time.
+        """
+        end_time = self.end_time.copy()
+        if end_time.dtype.kind == "M":
+            missing = np.isnat(end_time)
+        else:
+            missing = np.array([value is None for value in end_time], dtype=bool)
+        end_time[missing] = self.start_time[missing]
+        return self.start_time, end_time
+
+    def get_spatial_extent_column(self, name):
+        """Return a column of the spatial extent as NumPy array
+
+        :param name: One of north, south, east, west, top, bottom
+        """
+        return self.extent[:, EXTENT_COLUMNS.index(name)]
+
+    def count_gaps(self):
+        """Return the number of gaps between consecutive maps
+
+        There is a gap if a map starts after the end (or start for time
+        instances) of the previous map. The list must be ordered by start time.
+        """
+        if len(self) < 2:
+            return 0
+        start, end = self.get_temporal_extents()
+        return int(np.count_nonzero(start[1:] > end[:-1]))
+
+    def tolist(self):
+        """Return a list with the map objects"""
+        return list(self)
@@ -0,0 +1,320 @@
+"""
+Sampling of raster maps at point locations
+
+The point coordinates are converted to rows and columns of the current
+computational region once. Each raster map is then opened a single time and
+only the rows which contain points are read, so that many maps can be sampled
+without starting a module for each map. The maps are sampled in parallel
+processes and the values are returned in the order of the maps.
+
+Usage:
+
+.. code-block:: python
+
+    import grass.temporal as tgis
+
+    cats, east, north = tgis.read_vector_points("points")
+    sampler = tgis.PointSampler(east, north)
+    for map_id, values in sampler.sample(["elevation@PERMANENT"]):
+        print(map_id, tgis.format_sampled_values(values, "*"))
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from multiprocessing import Pool
+
+import numpy as np
+
+import grass.lib.gis as libgis
+import grass.lib.raster as libraster
+import grass.lib.vector as libvect
+import grass.script as gs
+from grass.pygrass.gis.region import Region
+from grass.pygrass.raster import RasterRow
+from grass.pygrass.raster.raster_type import TYPE as RTYPE
+from grass.pygrass.vector import Vector
+from grass.pygrass.vector.geometry import c_read_next_line
+
+from .univar_statistics import _null_mask, _split_map_id
+
+# Same as PROJECTION_LL in gis.h
+PROJECTION_LL = 3
+
+# Output formats of r.what for the numpy types of CELL, FCELL and DCELL
+VALUE_FORMATS = {"i": "%d", "f4": "%.7g", "f8": "%.15g"}
+
+###############################################################################
+
+
+def scan_coordinates(east, north):
+    """Convert the strings of point coordinates to numbers like r.what
+
+    The strings are parsed with the projection of the current location,
+    so latitude-longitude coordinates can also be given in degrees,
+    minutes and seconds, e.g., ``12:30:00E``.
+
+    :param str east: The easting
+    :param str north: The northing
+    :return: A tuple of the easting and the northing as floats or None if
+             any of the coordinates is not valid
+    """
+    proj = libgis.G_projection()
+    x = ctypes.c_double()
+    y = ctypes.c_double()
+    if not libgis.G_scan_easting(east, ctypes.byref(x), proj):
+        return None
+    if not libgis.G_scan_northing(north, ctypes.byref(y), proj):
+        return None
+    return x.value, y.value
+
+
+def coordinates_to_cells(east, north, region=None):
+    """Convert point coordinates to rows and columns of a region
+
+    The conversion follows r.what: points on the southern or eastern edge
+    of the region are assigned to the last row or column and the
+    eastings are adjusted to the region in latitude-longitude locations.
+
+    :param east: The eastings of the points
+    :param north: The northings of the points
+    :param region: The pygrass Region, if None the current region is used
+    :return: A tuple of integer arrays with the rows and columns, rows and
+             columns of points outside of the region are -1
+    """
+    if region is None:
+        region = Region()
+    east = np.array(east, dtype=np.float64)
+    north = np.asarray(north, dtype=np.float64)
+    if region.proj == PROJECTION_LL:
+        while (above := east > region.east).any():
+            east[above] -= 360.0
+        while (below := east < region.west).any():
+            east[below] += 360.0
+
+    with np.errstate(invalid="ignore"):
+        rows = np.floor((region.north - north) / region.nsres)
+        cols = np.floor((east - region.west) / region.ewres)
+    rows[north == region.south] = region.rows - 1
+    cols[east == region.east] = region.cols - 1
+
+    outside = ~((rows >= 0) & (rows < region.rows) & (cols >= 0) & (cols < region.cols))
+    rows[outside] = -1
+    cols[outside] = -1
+    return rows.astype(np.int64), cols.astype(np.int64)
+
+
+def sample_raster_map(map_id, rows, cols):
+    """Read the values of a raster map at the provided cells
+
+    Only the rows with points are read, each of them once.
+
+    :param map_id: The id of the raster map
+    :param rows: The rows of the points as returned by coordinates_to_cells()
+    :param cols: The columns of the points as returned by coordinates_to_cells()
+    :return: A masked array with the type of the raster map, null cells and
+             points outside of the region are masked
+    """
+    name, mapset = _split_map_id(map_id)
+    inside = rows >= 0
+    needed_rows, inverse = np.unique(rows[inside], return_inverse=True)
+    with RasterRow(name, mapset=mapset) as raster:
+        dtype = RTYPE[raster.mtype]["numpy"]
+        data = np.empty((len(needed_rows), libraster.Rast_window_cols()), dtype=dtype)
+        for i, row in enumerate(needed_rows.tolist()):
+            raster.read_block(row, row + 1, out=data[i : i + 1])
+
+    values = np.zeros(len(rows), dtype=dtype)
+    mask = ~inside
+    values[inside] = data[inverse.ravel(), cols[inside]]
+    mask[inside] = _null_mask(values[inside])
+    return np.ma.MaskedArray(values, mask=mask)
+
+
+def format_sampled_values(values, null_value="*"):
+    """Format sampled values like r.what
+
+    CELL values are written as integers, FCELL values with 7 and DCELL
+    values with 15 significant digits.
+
+    :param values: A masked array as returned by sample_raster_map()
+    :param null_value: The string for null values and points outside
+                       of the region
+    :return: A list of strings
+    """
+    kind = "i" if values.dtype.kind in "iu" else f"f{values.dtype.itemsize}"
+    strings = np.char.mod(VALUE_FORMATS[kind], values.data).astype(object)
+    strings[np.ma.getmaskarray(values)] = null_value
+    return strings.tolist()
+
+
+def read_vector_points(name, mapset="", layer=None):
+    """Read the coordinates and categories of the points of a vector map
+
+    Points and centroids are read in the order in which they are stored,
+    other features are skipped.
+
+    :param name: The name of the vector map
+    :param mapset: The mapset of the vector map
+    :param layer: The layer of the categories, if None the first category
+                  of each point is used
+    :return: A tuple of arrays with the categories, eastings and northings,
+             the category of points without category is -1
+    """
+    cats = []
+    east = []
+    north = []
+    c_points = ctypes.pointer(libvect.line_pnts())
+    c_cats = ctypes.pointer(libvect.line_cats())
+    cat = ctypes.c_int()
+    vector = Vector(name, mapset)
+    vector.open("r")
+    try:
+        while True:
+            try:
+                ftype = c_read_next_line(vector.c_mapinfo, c_points, c_cats)[0]
+            except StopIteration:
+                break
+            if not ftype & libvect.GV_POINTS:
+                continue
+            east.append(c_points.contents.x[0])
+            north.append(c_points.contents.y[0])
+            if layer is None:
+                cats.append(
+                    c_cats.contents.cat[0] if c_cats.contents.n_cats > 0 else -1
+                )
+            else:
+                libvect.Vect_cat_get(c_cats, layer, ctypes.byref(cat))
+                cats.append(cat.value)
+    finally:
+        vector.close()
+    return (
+        np.array(cats, dtype=np.int64),
+        np.array(east, dtype=np.float64),
+        np.array(north, dtype=np.float64),
+    )
+
+
+def write_sampled_columns(table, cats, columns, valid=None, where=None):
+    """Write sampled values as columns of an attribute table
+
+    The columns which are not in the table are added, the type is INT for
+    CELL and DOUBLE PRECISION for floating point values. The rows are updated
+    like v.what.rast does it: points without category are skipped and rows
+    with several points of the same category are set to NULL. All rows are
+    updated in a single transaction.
+
+    :param table: The pygrass Table linked to the vector map
+    :param cats: The categories of the points
+    :param columns: A list of tuples with the column name and the values of
+                    the points as returned by sample_raster_map()
+    :param valid: Optional boolean array with the points to write, e.g.,
+                  to skip points outside of the region
+    :param where: Optional SQL where condition to select the rows to update
+    """
+    if not columns:
+        return
+    new_columns = [
+        (name, "INT" if values.dtype.kind in "iu" else "DOUBLE PRECISION")
+        for name, values in columns
+        if name not in table.columns
+    ]
+    if new_columns:
+        table.columns.add(*zip(*new_columns, strict=True))
+
+    cats = np.asarray(cats)
+    points = np.flatnonzero(cats >= 0 if valid is None else (cats >= 0) & valid)
+    unique, first, counts = np.unique(
+        cats[points], return_index=True, return_counts=True
+    )
+    for cat, count in zip(
+        unique[counts > 1].tolist(), counts[counts > 1].tolist(), strict=True
+    ):
+        gs.warning(
+            _("More points ({count}) of category {cat}, value set to 'NULL'").format(
+                count=count, cat=cat
+            )
+        )
+    points = points[first]
+    duplicate = counts > 1
+    if where:
+        cur = table.execute(f"SELECT {table.key} FROM {table.name} WHERE {where}")
+        selected = np.array([row[0] for row in cur.fetchall()], dtype=cats.dtype)
+        keep = np.isin(unique, selected)
+        unique, points, duplicate = unique[keep], points[keep], duplicate[keep]
+
+    values = []
+    for unused, column_values in columns:
+        column_values = column_values[points]
+        column_values[duplicate] = np.ma.masked
+        # Masked values are converted to None
+        values.append(column_values.tolist())
+    sql = "UPDATE {tname} SET {columns} WHERE {key}=?".format(
+        tname=table.name,
+        columns=",".join(f"{name}=?" for name, unused in columns),
+        key=table.key,
+    )
+    table.execute(
+        sql, many=True, values=list(zip(*values, unique.tolist(), strict=True))
+    )
+    table.conn.commit()
+
+
+# Rows and columns of the points in the sampling processes
+_worker_cells = None
+
+
+def _init_sampling_worker(rows, cols):
+    """Store the cells of the points in the sampling process"""
+    global _worker_cells
+    _worker_cells = (rows, cols)
+
+
+def _sample_in_worker(map_id):
+    """Sample a raster map in a sampling process"""
+    return map_id, sample_raster_map(map_id, *_worker_cells)
+
+
+class PointSampler:
+    """Sample raster maps at a fixed set of points
+
+    The coordinates are converted to cells of the region once when the
+    sampler is created and are reused for all sampled maps.
+
+    :param east: The eastings of the points
+    :param north: The northings of the points
+    :param region: The pygrass Region, if None the current region is used
+    """
+
+    def __init__(self, east, north, region=None) -> None:
+        self.rows, self.cols = coordinates_to_cells(east, north, region)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def sample(self, map_ids, nprocs=1):
+        """Sample the raster maps at the points
+
+        :param map_ids: The ids of the raster maps
+        :param nprocs: The number of processes which read the maps
+        :return: An iterator over tuples of the map id and the values
+                 as returned by sample_raster_map() in the order of the maps
+        """
+        map_ids = list(map_ids)
+        nprocs = min(max(nprocs, 1), len(map_ids))
+        if nprocs <= 1:
+            for map_id in map_ids:
+                yield map_id, sample_raster_map(map_id, self.rows, self.cols)
+            return
+        chunksize = max(1, min(64, len(map_ids) // (4 * nprocs)))
+        with Pool(
+            nprocs,
+            initializer=_init_sampling_worker,
+            initargs=(self.rows, self.cols),
+        ) as pool:
+            yield from pool.imap(_sample_in_worker, map_ids, chunksize)
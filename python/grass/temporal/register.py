@@ -22,7 +22,12 @@ from datetime import datetime
 import grass.script as gs
 
 from .abstract_map_dataset import AbstractMapDataset
-from .core import get_current_mapset, get_tgis_message_interface, init_dbif
+from .core import (
+    get_current_mapset,
+    get_enable_timestamp_write,
+    get_tgis_message_interface,
+    init_dbif,
+)
 from .datetime_math import (
     check_datetime_string,
     increment_datetime_by_string,
@@ -31,6 +36,9 @@ from .datetime_math import (
 from .factory import dataset_factory
 from .open_stds import open_old_stds
 
+# Number of maps written to the temporal database in one transaction
+REGISTER_CHUNK_SIZE = 10000
+
 ###############################################################################
 
 
@@ -231,27 +239,65 @@ def register_maps_in_space_time_dataset(
     num_maps = len(maplist)
     map_object_list = []
     statement = ""
+    # INSERT statements with arguments of all maps grouped by the SQL statement
+    inserts = {}
     # Store the ids of datasets that must be updated
     datatsets_to_modify = {}
 
     msgr.debug(2, "Gathering map information...")
 
-    for count, row in enumerate(maplist):
+    # Get new instances of the map type and check which maps are already
+    # in the temporal database using one query
+    map_objects = [dataset_factory(type, row["id"]) for row in maplist]
+    ids_in_db = set()
+    if map_objects:
+        ids_in_db = {
+            row[0]
+            for row in dbif.select_by_ids(
+                map_objects[0].base.get_table_name(),
+                [map_object.get_id() for map_object in map_objects],
+                mapset=mapset,
+            )
+        }
+
+    # Check the maps in the spatial database using a few requests
+    # to the C-library interface for all maps instead of several for each map
+    map_class = map_objects[0].__class__ if map_objects else None
+    has_timestamp = {}
+    if map_class:
+        for map_object, exists in zip(
+            map_objects, map_class.map_exists_many(map_objects), strict=True
+        ):
+            if not exists:
+                msgr.fatal(
+                    _(
+                        "Unable to update {t} map <{mid}>. The map does not exist."
+                    ).format(t=map_object.get_type(), mid=map_object.get_map_id())
+                )
+        maps_not_in_db = [
+            map_object
+            for map_object in map_objects
+            if map_object.get_id() not in ids_in_db
+        ]
+        has_timestamp = dict(
+            zip(
+                (map_object.get_id() for map_object in maps_not_in_db),
+                map_class.has_grass_timestamp_many(maps_not_in_db),
+                strict=True,
+            )
+        )
+
+    # Maps which are loaded from the spatial database with the time and semantic
+    # label to assign
+    maps_to_load = []
+
+    for count, (row, map_object) in enumerate(zip(maplist, map_objects, strict=True)):
         if count % 50 == 0:
             msgr.percent(count, num_maps, 1)
 
-        # Get a new instance of the map type
-        map_object = dataset_factory(type, row["id"])
-
         map_object_id = map_object.get_map_id()
         map_object_layer = map_object.get_layer()
         map_object_type = map_object.get_type()
-        if not map_object.map_exists():
-            msgr.fatal(
-                _("Unable to update {t} map <{mid}>. The map does not exist.").format(
-                    t=map_object_type, mid=map_object_id
-                )
-            )
 
         # Use the time data from file
         if "start" in row:
@@ -262,12 +308,14 @@ def register_maps_in_space_time_dataset(
         # Use the semantic label from file
         semantic_label = row.get("semantic_label", None)
 
-        is_in_db = map_object.is_in_db(dbif, mapset)
+        is_in_db = map_object.get_id() in ids_in_db
 
         # Put the map into the database of the current mapset
         if not is_in_db:
             # Break in case no valid time is provided
-            if (start == "" or start is None) and not map_object.has_grass_timestamp():
+            if (start == "" or start is None) and not has_timestamp[
+                map_object.get_id()
+            ]:
                 dbif.close()
                 if map_object_layer:
                     msgr.fatal(
@@ -329,6 +377,8 @@ def register_maps_in_space_time_dataset(
 
                 # Simple registration is allowed
                 if name:
+                    # Reload properties from database
+                    map_object.select(dbif, mapset=mapset)
                     map_object_list.append(map_object)
                 # Jump to next map
                 continue
@@ -365,23 +415,31 @@ def register_maps_in_space_time_dataset(
                             ).format(t=map_object_type, mid=map_object_id)
                         )
 
-        # Load the data from the grass file database
-        map_object.load()
+        maps_to_load.append((count, map_object, is_in_db, start, end, semantic_label))
+
+    msgr.percent(num_maps, num_maps, 1)
+
+    # Load the data from the grass file database
+    if maps_to_load:
+        map_class.load_many([item[1] for item in maps_to_load])
 
         # Try to read an existing time stamp from the grass spatial database
         # in case this map wasn't already registered in the temporal database
-        # Read the spatial database time stamp only, if no time stamp was provided for
-        # this map
-        # as method argument or in the input file
-        if not is_in_db and not start:
-            map_object.read_timestamp_from_grass()
+        # Read the spatial database time stamp only, if no time stamp was provided
+        # for this map as method argument or in the input file
+        map_class.read_timestamp_from_grass_many(
+            [item[1] for item in maps_to_load if not item[2] and not item[3]]
+        )
+
+    for count, map_object, is_in_db, start, end, semantic_label in maps_to_load:
+        if count % 50 == 0:
+            msgr.percent(count, num_maps, 1)
 
         # Set the valid time
         if start:
             # In case the time is in the input file we ignore the increment
             # counter
-            if start_time_in_file:
-                count = 1
+            mult = 1 if start_time_in_file else count
             assign_valid_time_to_map(
                 ttype=map_object.get_temporal_type(),
                 map_object=map_object,
@@ -389,34 +447,34 @@ def register_maps_in_space_time_dataset(
                 end=end,
                 unit=unit,
                 increment=increment,
-                mult=count,
+                mult=mult,
                 interval=interval,
             )
 
         # Set the semantic label (only raster type supported)
+        # The semantic label defined in the GRASS data base was already read
+        # when loading the map
         if semantic_label:
             # semantic label defined in input file
             # -> update raster metadata
             # -> write band identifier to GRASS data base
             map_object.set_semantic_label(semantic_label)
-        else:
-            # Try to read semantic label from GRASS data base if defined
-            map_object.read_semantic_label_from_grass()
 
         if is_in_db:
             #  Gather the SQL update statement
             statement += map_object.update_all(dbif=dbif, execute=False)
         else:
-            #  Gather the SQL insert statement
-            statement += map_object.insert(dbif=dbif, execute=False)
-
-        # Sqlite3 performance is better for huge datasets when committing in
-        # small chunks
-        if dbif.get_dbmi().__name__ == "sqlite3":
-            if count % 100 == 0:
-                if statement is not None and statement != "":
-                    dbif.execute_transaction(statement)
-                    statement = ""
+            #  Gather the SQL insert statements to be executed for many maps at once
+            if get_enable_timestamp_write():
+                map_object.write_timestamp_to_grass()
+            for sql, args in map_object.get_insert_statements():
+                inserts.setdefault(sql, []).append(args)
+
+        # Write the maps in large transactions
+        if (count + 1) % REGISTER_CHUNK_SIZE == 0:
+            _execute_register_statements(dbif, statement, inserts)
+            statement = ""
+            inserts = {}
 
         # Store the maps in a list to register in a space time dataset
         if name:
@@ -424,16 +482,11 @@ def register_maps_in_space_time_dataset(
 
     msgr.percent(num_maps, num_maps, 1)
 
-    if statement is not None and statement != "":
-        dbif.execute_transaction(statement)
+    _execute_register_statements(dbif, statement, inserts)
 
     # Finally Register the maps in the space time dataset
     if name and map_object_list:
-        num_maps = len(map_object_list)
-        for count, map_object in enumerate(map_object_list):
-            if count % 50 == 0:
-                msgr.percent(count, num_maps, 1)
-            sp.register_map(map=map_object, dbif=dbif)
+        sp.register_maps(map_object_list, dbif=dbif)
 
     # Update the space time tables
     if name and map_object_list:
@@ -459,6 +512,20 @@ def register_maps_in_space_time_dataset(
     msgr.percent(num_maps, num_maps, 1)
 
 
+def _execute_register_statements(dbif, statement, inserts) -> None:
+    """Execute gathered SQL statements for maps in the temporal database
+
+    :param dbif: The database interface to be used
+    :param statement: A mogrified SQL script (e.g., with updates)
+    :param inserts: A dictionary with SQL statements as keys and list of arguments
+                    as values to be executed as many statements
+    """
+    if statement:
+        dbif.execute_transaction(statement)
+    if inserts:
+        dbif.execute_many_transaction(list(inserts.items()))
+
+
 ###############################################################################
 
 
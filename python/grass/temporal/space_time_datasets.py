@@ -289,6 +289,16 @@ class RasterDataset(AbstractMapDataset):
             self.get_mapset(),
         )
 
+        return self._set_timestamp_from_grass(check, dates)
+
+    def _set_timestamp_from_grass(self, check, dates) -> bool:
+        """Set the time stamp read from the grass file system based
+        spatial database
+
+        :param check: The return value of G_read_raster_timestamp
+        :param dates: The time stamp read from the spatial database
+        :return: True if success, False on error
+        """
         if check < 1:
             self.msgr.error(
                 _("Unable to read timestamp file for raster map <%s>")
@@ -401,6 +411,79 @@ class RasterDataset(AbstractMapDataset):
         """
         return self.ciface.raster_map_exists(self.get_name(), self.get_mapset())
 
+    @classmethod
+    def map_exists_many(cls, maps):
+        """Check for many maps if they exist in the grass spatial database
+        using a single request
+
+        :param maps: A list of raster map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.raster_map_exists_many(*cls._get_names_and_mapsets(maps))
+
+    @classmethod
+    def has_grass_timestamp_many(cls, maps):
+        """Check for many maps if a grass file based time stamp exists
+        using a single request
+
+        :param maps: A list of raster map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.has_raster_timestamp_many(
+            *cls._get_names_and_mapsets(maps)
+        )
+
+    @classmethod
+    def read_timestamp_from_grass_many(cls, maps):
+        """Read the timestamps of many maps from the grass file system based
+        spatial database using a single request and set them in the map objects
+
+        :param maps: A list of raster map objects
+        :return: A list with True if the time stamp was set, False otherwise
+                 for each map
+        """
+        if not maps:
+            return []
+        results = maps[0].ciface.read_raster_timestamp_many(
+            *cls._get_names_and_mapsets(maps)
+        )
+        # Return value 0 means that the map has no time stamp
+        return [
+            check != 0 and map_object._set_timestamp_from_grass(check, dates)
+            for map_object, (check, dates) in zip(maps, results, strict=True)
+        ]
+
+    @classmethod
+    def load_many(cls, maps):
+        """Load all info of many existing raster maps into the map objects
+
+        The metadata of all maps is read using one request for each kind
+        of metadata.
+
+        :param maps: A list of raster map objects
+        :return: A list with True for each map which exists and its metadata
+                 was filled successfully, False otherwise
+        """
+        if not maps:
+            return []
+        ciface = maps[0].ciface
+        names, mapsets = cls._get_names_and_mapsets(maps)
+        return [
+            info is not None
+            and map_object._set_metadata_from_grass(history, info, semantic_label)
+            for map_object, history, info, semantic_label in zip(
+                maps,
+                ciface.read_raster_history_many(names, mapsets),
+                ciface.read_raster_info_many(names, mapsets),
+                ciface.read_raster_semantic_label_many(names, mapsets),
+                strict=True,
+            )
+        ]
+
     def load(self) -> bool:
         """Load all info from an existing raster map into the internal structure
 
@@ -415,8 +498,23 @@ class RasterDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        return self._set_metadata_from_grass(
+            self.ciface.read_raster_history(self.get_name(), self.get_mapset()),
+            self.ciface.read_raster_info(self.get_name(), self.get_mapset()),
+            self.ciface.read_raster_semantic_label(self.get_name(), self.get_mapset()),
+        )
+
+    def _set_metadata_from_grass(self, history, info, semantic_label) -> bool:
+        """Fill the internal structure with the metadata read from the
+        grass file system based spatial database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :param semantic_label: The semantic label of the map or None
+        :return: True if the metadata was filled successfully, False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_raster_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -427,7 +525,7 @@ class RasterDataset(AbstractMapDataset):
             self.base.set_creator(str(getpass.getuser()))
             self.base.set_ctime()
 
-        kvp = self.ciface.read_raster_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -453,9 +551,6 @@ class RasterDataset(AbstractMapDataset):
         self.metadata.set_number_of_cells(ncells)
 
         # Fill semantic label if defined
-        semantic_label = self.ciface.read_raster_semantic_label(
-            self.get_name(), self.get_mapset()
-        )
         if semantic_label:
             self.metadata.set_semantic_label(semantic_label)
 
@@ -725,6 +820,16 @@ class Raster3DDataset(AbstractMapDataset):
             self.get_mapset(),
         )
 
+        return self._set_timestamp_from_grass(check, dates)
+
+    def _set_timestamp_from_grass(self, check, dates) -> bool:
+        """Set the time stamp read from the grass file system based
+        spatial database
+
+        :param check: The return value of G_read_raster3d_timestamp
+        :param dates: The time stamp read from the spatial database
+        :return: True if success, False on error
+        """
         if check < 1:
             self.msgr.error(
                 _("Unable to read timestamp file for 3D raster map <%s>")
@@ -795,6 +900,79 @@ class Raster3DDataset(AbstractMapDataset):
         """
         return self.ciface.raster3d_map_exists(self.get_name(), self.get_mapset())
 
+    @classmethod
+    def map_exists_many(cls, maps):
+        """Check for many maps if they exist in the grass spatial database
+        using a single request
+
+        :param maps: A list of 3D raster map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.raster3d_map_exists_many(
+            *cls._get_names_and_mapsets(maps)
+        )
+
+    @classmethod
+    def has_grass_timestamp_many(cls, maps):
+        """Check for many maps if a grass file based time stamp exists
+        using a single request
+
+        :param maps: A list of 3D raster map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.has_raster3d_timestamp_many(
+            *cls._get_names_and_mapsets(maps)
+        )
+
+    @classmethod
+    def read_timestamp_from_grass_many(cls, maps):
+        """Read the timestamps of many maps from the grass file system based
+        spatial database using a single request and set them in the map objects
+
+        :param maps: A list of 3D raster map objects
+        :return: A list with True if the time stamp was set, False otherwise
+                 for each map
+        """
+        if not maps:
+            return []
+        results = maps[0].ciface.read_raster3d_timestamp_many(
+            *cls._get_names_and_mapsets(maps)
+        )
+        # Return value 0 means that the map has no time stamp
+        return [
+            check != 0 and map_object._set_timestamp_from_grass(check, dates)
+            for map_object, (check, dates) in zip(maps, results, strict=True)
+        ]
+
+    @classmethod
+    def load_many(cls, maps):
+        """Load all info of many existing 3D raster maps into the map objects
+
+        The metadata of all maps is read using one request for each kind
+        of metadata.
+
+        :param maps: A list of 3D raster map objects
+        :return: A list with True for each map which exists and its metadata
+                 was filled successfully, False otherwise
+        """
+        if not maps:
+            return []
+        ciface = maps[0].ciface
+        names, mapsets = cls._get_names_and_mapsets(maps)
+        return [
+            info is not None and map_object._set_metadata_from_grass(history, info)
+            for map_object, history, info in zip(
+                maps,
+                ciface.read_raster3d_history_many(names, mapsets),
+                ciface.read_raster3d_info_many(names, mapsets),
+                strict=True,
+            )
+        ]
+
     def load(self) -> bool:
         """Load all info from an existing 3d raster map into the internal structure
 
@@ -809,8 +987,21 @@ class Raster3DDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        return self._set_metadata_from_grass(
+            self.ciface.read_raster3d_history(self.get_name(), self.get_mapset()),
+            self.ciface.read_raster3d_info(self.get_name(), self.get_mapset()),
+        )
+
+    def _set_metadata_from_grass(self, history, info) -> bool:
+        """Fill the internal structure with the metadata read from the
+        grass file system based spatial database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :return: True if the metadata was filled successfully, False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_raster3d_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -822,7 +1013,7 @@ class Raster3DDataset(AbstractMapDataset):
             self.base.set_ctime()
 
         # Fill spatial extent
-        kvp = self.ciface.read_raster3d_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -1065,6 +1256,16 @@ class VectorDataset(AbstractMapDataset):
             self.get_mapset(),
         )
 
+        return self._set_timestamp_from_grass(check, dates)
+
+    def _set_timestamp_from_grass(self, check, dates) -> bool:
+        """Set the time stamp read from the grass file system based
+        spatial database
+
+        :param check: The return value of G_read_vector_timestamp
+        :param dates: The time stamp read from the spatial database
+        :return: True if success, False on error
+        """
         if check < 1:
             self.msgr.error(
                 _("Unable to read timestamp file for vector map <%s>")
@@ -1133,6 +1334,79 @@ class VectorDataset(AbstractMapDataset):
         """
         return self.ciface.vector_map_exists(self.get_name(), self.get_mapset())
 
+    @classmethod
+    def map_exists_many(cls, maps):
+        """Check for many maps if they exist in the grass spatial database
+        using a single request
+
+        :param maps: A list of vector map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.vector_map_exists_many(*cls._get_names_and_mapsets(maps))
+
+    @classmethod
+    def has_grass_timestamp_many(cls, maps):
+        """Check for many maps if a grass file based time stamp exists
+        using a single request
+
+        :param maps: A list of vector map objects
+        :return: A list with True or False for each map
+        """
+        if not maps:
+            return []
+        return maps[0].ciface.has_vector_timestamp_many(
+            *cls._get_names_and_mapsets(maps),
+            [map_object.get_layer() for map_object in maps],
+        )
+
+    @classmethod
+    def read_timestamp_from_grass_many(cls, maps):
+        """Read the timestamps of many maps from the grass file system based
+        spatial database using a single request and set them in the map objects
+
+        :param maps: A list of vector map objects
+        :return: A list with True if the time stamp was set, False otherwise
+                 for each map
+        """
+        if not maps:
+            return []
+        results = maps[0].ciface.read_vector_timestamp_many(
+            *cls._get_names_and_mapsets(maps),
+            [map_object.get_layer() for map_object in maps],
+        )
+        # Return value 0 means that the map has no time stamp
+        return [
+            check != 0 and map_object._set_timestamp_from_grass(check, dates)
+            for map_object, (check, dates) in zip(maps, results, strict=True)
+        ]
+
+    @classmethod
+    def load_many(cls, maps):
+        """Load all info of many existing vector maps into the map objects
+
+        The metadata of all maps is read using one request for each kind
+        of metadata.
+
+        :param maps: A list of vector map objects
+        :return: A list with True for each map which exists and its metadata
+                 was filled successfully, False otherwise
+        """
+        if not maps:
+            return []
+        ciface = maps[0].ciface
+        names, mapsets = cls._get_names_and_mapsets(maps)
+        return [
+            info is not None and map_object._set_metadata_from_grass(history, info)
+            for map_object, history, info in zip(
+                maps,
+                ciface.read_vector_history_many(names, mapsets),
+                ciface.read_vector_info_many(names, mapsets),
+                strict=True,
+            )
+        ]
+
     def load(self) -> bool:
         """Load all info from an existing vector map into the internal structure
 
@@ -1147,8 +1421,21 @@ class VectorDataset(AbstractMapDataset):
         if self.map_exists() is not True:
             return False
 
+        return self._set_metadata_from_grass(
+            self.ciface.read_vector_history(self.get_name(), self.get_mapset()),
+            self.ciface.read_vector_info(self.get_name(), self.get_mapset()),
+        )
+
+    def _set_metadata_from_grass(self, history, info) -> bool:
+        """Fill the internal structure with the metadata read from the
+        grass file system based spatial database
+
+        :param history: The key value pairs of the map history
+        :param info: The key value pairs of the map specific metadata
+        :return: True if the metadata was filled successfully, False otherwise
+        """
         # Fill base information
-        kvp = self.ciface.read_vector_history(self.get_name(), self.get_mapset())
+        kvp = history
 
         if kvp:
             self.base.set_creator(kvp["creator"])
@@ -1160,7 +1447,7 @@ class VectorDataset(AbstractMapDataset):
             self.base.set_ctime()
 
         # Get the data from an existing vector map
-        kvp = self.ciface.read_vector_info(self.get_name(), self.get_mapset())
+        kvp = info
 
         if not kvp:
             return False
@@ -18,7 +18,9 @@ for details.
 :authors: Soeren Gebbert
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from grass.lib import gis, rtree, vector
 
@@ -363,10 +365,36 @@ class SpatioTemporalTopologyBuilder:
 
     """
 
-    def __init__(self) -> None:
+    # Names of the temporal relations in the order in which they are
+    # tested by TemporalExtent.temporal_relation()
+    _temporal_relations = (
+        "equal",
+        "during",
+        "contains",
+        "overlaps",
+        "overlapped",
+        "after",
+        "before",
+        "starts",
+        "finishes",
+        "started",
+        "finished",
+        "follows",
+        "precedes",
+    )
+    # Maximum number of candidate map pairs processed at once
+    _chunk_size = 1000000
+
+    def __init__(self, use_rtree=False) -> None:
+        """
+        :param use_rtree: Search related maps using the R*-Tree of the
+                          GRASS C library instead of the vectorized
+                          sweep over the start times
+        """
         self._reset()
         # 0001-01-01 00:00:00
         self._timeref = datetime(1, 1, 1)
+        self._use_rtree = use_rtree
 
     def _reset(self) -> None:
         self._store = {}
@@ -515,6 +543,256 @@ class SpatioTemporalTopologyBuilder:
 
         return tree
 
+    def _build_relations_rtree(self, mapsA, mapsB, spatial=None) -> None:
+        """Set the relations between the maps of both lists using
+        the R*-Tree of the GRASS C library to search related maps
+
+        :param spatial: This indicates if the spatial topology is created
+                        as well: spatial can be None (no spatial topology),
+                        "2D" using west, east, south, north or "3D" using
+                        west, east, south, north, bottom, top
+        """
+        tree = self._build_rtree(mapsA, spatial)
+
+        list_ = gis.G_new_ilist()
+
+        for j in range(len(mapsB)):
+            rect = self._map_to_rect(tree, mapsB[j], spatial)
+            vector.RTreeSearch2(tree, rect, list_)
+            rtree.RTreeFreeRect(rect)
+
+            for k in range(list_.contents.n_values):
+                i = list_.contents.value[k] - 1
+
+                # Get the temporal relationship
+                relation = mapsB[j].temporal_relation(mapsA[i])
+
+                A = mapsA[i]
+                B = mapsB[j]
+                set_temporal_relationship(A, B, relation)
+
+                if spatial is not None:
+                    relation = mapsB[j].spatial_relation(mapsA[i])
+                    set_spatial_relationship(A, B, relation)
+
+        gis.G_free_ilist(list_)
+
+        rtree.RTreeDestroyTree(tree)
+
+    @staticmethod
+    def _get_time_type(maps):
+        """Return the common temporal type of the maps
+
+        :return: "absolute", the relative time unit, or None in case the
+                 maps have different temporal types or relative time units
+        """
+        time_types = set()
+        for map_ in maps:
+            if map_.is_time_absolute():
+                time_types.add("absolute")
+            elif map_.is_time_relative():
+                time_types.add(map_.get_relative_time_unit())
+            else:
+                return None
+            if len(time_types) > 1:
+                return None
+        if not time_types:
+            return None
+        return time_types.pop()
+
+    def _time_to_number(self, time, exact):
+        """Convert an absolute time to microseconds (exact) or seconds
+        since 0001-01-01, relative time is returned unchanged
+        """
+        if isinstance(time, datetime):
+            if exact:
+                return (time - self._timeref) // timedelta(microseconds=1)
+            return time_delta_to_relative_time_seconds(time - self._timeref)
+        return time
+
+    def _get_temporal_arrays(self, maps, exact, dtype):
+        """Return the temporal extents of the maps as NumPy arrays
+
+        The end time of a time instance is set to its start time.
+
+        :param exact: Represent absolute time exactly as integer microseconds
+        :param dtype: The NumPy data type of the start and end time arrays
+        :return: A tuple of arrays (start, end, has_end, has_start)
+        """
+        count = len(maps)
+        start = np.zeros(count, dtype=dtype)
+        end = np.zeros(count, dtype=dtype)
+        has_end = np.zeros(count, dtype=bool)
+        has_start = np.zeros(count, dtype=bool)
+        for i, map_ in enumerate(maps):
+            start_time, end_time = map_.get_temporal_extent_as_tuple()
+            if start_time is None:
+                continue
+            has_start[i] = True
+            start[i] = self._time_to_number(start_time, exact)
+            if end_time is None:
+                end[i] = start[i]
+            else:
+                has_end[i] = True
+                end[i] = self._time_to_number(end_time, exact)
+        return start, end, has_end, has_start
+
+    @staticmethod
+    def _get_spatial_arrays(maps, spatial):
+        """Return the lower and upper corners of the spatial extents
+        of the maps as NumPy arrays with one row per map
+
+        :param spatial: "2D" using west, east, south, north or "3D" using
+                        west, east, south, north, bottom, top
+        """
+        extents = np.array(
+            [map_.get_spatial_extent_as_tuple() for map_ in maps], dtype=np.float64
+        ).reshape(-1, 6)
+        north, south, east, west, top, bottom = extents.T
+        if spatial == "3D":
+            return (
+                np.column_stack((west, south, bottom)),
+                np.column_stack((east, north, top)),
+            )
+        return np.column_stack((west, south)), np.column_stack((east, north))
+
+    @staticmethod
+    def _classify_temporal_relations(startA, endA, has_endA, startB, endB, has_endB):
+        """Compute the temporal relations of the maps B to the maps A
+
+        This is the vectorized version of TemporalExtent.temporal_relation(),
+        the conditions are tested in the same order.
+
+        :return: An array with the index of the relation
+                 in _temporal_relations or -1 if there is no relation
+        """
+        both = has_endA & has_endB
+        conditions = [
+            # equal
+            np.where(
+                both,
+                (startB == startA) & (endB == endA),
+                ~has_endA & ~has_endB & (startB == startA),
+            ),
+            # during
+            has_endA
+            & np.where(
+                has_endB,
+                (startB > startA) & (endB < endA),
+                (startB >= startA) & (startB < endA),
+            ),
+            # contains
+            has_endB
+            & np.where(
+                has_endA,
+                (startB < startA) & (endB > endA),
+                (startB <= startA) & (endB > startA),
+            ),
+            # overlaps
+            both & (startB < startA) & (endB < endA) & (endB > startA),
+            # overlapped
+            both & (startB > startA) & (endB > endA) & (startB < endA),
+            # after
+            np.where(has_endA, startB > endA, startB > startA),
+            # before
+            np.where(has_endB, endB < startA, startB < startA),
+            # starts
+            both & (startB == startA) & (endB < endA),
+            # finishes
+            both & (endB == endA) & (startB > startA),
+            # started
+            both & (startB == startA) & (endB > endA),
+            # finished
+            both & (endB == endA) & (startB < startA),
+            # follows
+            has_endA & (startB == endA),
+            # precedes
+            has_endB & (endB == startA),
+        ]
+        return np.select(conditions, np.arange(len(conditions)), default=-1)
+
+    def _build_relations(self, mapsA, mapsB, spatial=None) -> None:
+        """Set the relations between the maps of both lists using
+        a vectorized sweep over the sorted start times to search related maps
+
+        The related maps are the same as found by the R*-Tree, i.e.,
+        maps with intersecting closed time intervals and spatial extents.
+        The temporal relations are computed in bulk if all maps have the same
+        temporal type and relative time unit.
+
+        :param spatial: This indicates if the spatial topology is created
+                        as well: spatial can be None (no spatial topology),
+                        "2D" using west, east, south, north or "3D" using
+                        west, east, south, north, bottom, top
+        """
+        time_type = self._get_time_type(list(mapsA) + list(mapsB))
+        exact = time_type is not None
+        dtype = np.int64 if time_type == "absolute" else np.float64
+
+        # The arrays are shared if both lists are the same object
+        identical = mapsA is mapsB
+        startA, endA, has_endA, has_startA = self._get_temporal_arrays(
+            mapsA, exact, dtype
+        )
+        if identical:
+            startB, endB, has_endB, has_startB = startA, endA, has_endA, has_startA
+        else:
+            startB, endB, has_endB, has_startB = self._get_temporal_arrays(
+                mapsB, exact, dtype
+            )
+
+        # Maps without start time are not related to any map
+        indicesA = np.flatnonzero(has_startA)
+        indicesB = np.flatnonzero(has_startB)
+        if not indicesA.size or not indicesB.size:
+            return
+
+        if spatial is not None:
+            lowerA, upperA = self._get_spatial_arrays(mapsA, spatial)
+            if identical:
+                lowerB, upperB = lowerA, upperA
+            else:
+                lowerB, upperB = self._get_spatial_arrays(mapsB, spatial)
+
+        relation_names = (*self._temporal_relations, None)
+
+        for i, j in find_intersecting_intervals(
+            startA[indicesA],
+            endA[indicesA],
+            startB[indicesB],
+            endB[indicesB],
+            self._chunk_size,
+        ):
+            i = indicesA[i]
+            j = indicesB[j]
+
+            if spatial is not None:
+                select = np.all(
+                    (lowerA[i] <= upperB[j]) & (upperA[i] >= lowerB[j]), axis=1
+                )
+                i = i[select]
+                j = j[select]
+
+            if exact:
+                relations = self._classify_temporal_relations(
+                    startA[i], endA[i], has_endA[i], startB[j], endB[j], has_endB[j]
+                ).tolist()
+            else:
+                relations = None
+
+            for k, (a, b) in enumerate(zip(i.tolist(), j.tolist(), strict=True)):
+                A = mapsA[a]
+                B = mapsB[b]
+                if relations is None:
+                    relation = B.temporal_relation(A)
+                else:
+                    relation = relation_names[relations[k]]
+                set_temporal_relationship(A, B, relation)
+
+                if spatial is not None:
+                    relation = B.spatial_relation(A)
+                    set_spatial_relationship(A, B, relation)
+
     def build(self, mapsA, mapsB=None, spatial=None) -> None:
         """Build the spatio-temporal topology structure between
         one or two unordered lists of abstract dataset objects
@@ -555,37 +833,15 @@ class SpatioTemporalTopologyBuilder:
             for map_ in mapsB:
                 map_.reset_topology()
 
-        tree = self._build_rtree(mapsA, spatial)
-
-        list_ = gis.G_new_ilist()
-
-        for j in range(len(mapsB)):
-            rect = self._map_to_rect(tree, mapsB[j], spatial)
-            vector.RTreeSearch2(tree, rect, list_)
-            rtree.RTreeFreeRect(rect)
-
-            for k in range(list_.contents.n_values):
-                i = list_.contents.value[k] - 1
-
-                # Get the temporal relationship
-                relation = mapsB[j].temporal_relation(mapsA[i])
-
-                A = mapsA[i]
-                B = mapsB[j]
-                set_temporal_relationship(A, B, relation)
-
-                if spatial is not None:
-                    relation = mapsB[j].spatial_relation(mapsA[i])
-                    set_spatial_relationship(A, B, relation)
+        if self._use_rtree:
+            self._build_relations_rtree(mapsA, mapsB, spatial)
+        else:
+            self._build_relations(mapsA, mapsB, spatial)
 
         self._build_internal_iteratable(mapsA, spatial)
         if not identical and mapsB is not None:
             self._build_iteratable(mapsB, spatial)
 
-        gis.G_free_ilist(list_)
-
-        rtree.RTreeDestroyTree(tree)
-
     def __iter__(self):
         start_ = self._first
         while start_ is not None:
@@ -605,6 +861,80 @@ class SpatioTemporalTopologyBuilder:
 ###############################################################################
 
 
+def find_intersecting_intervals(startA, endA, startB, endB, chunk_size=1000000):
+    """Find all pairs of intersecting closed time intervals of two lists
+
+    The intervals A are split into groups with durations differing at most
+    by a factor of two and each group is sorted by start time. The intervals
+    A of a group intersecting an interval B start between the start of B
+    minus the longest duration in the group and the end of B, which gives
+    a range in the sorted start times. Because of the grouping, a few long
+    intervals do not extend the ranges of the other intervals, so the number
+    of candidates is bounded by the intersecting intervals. The ranges of all
+    intervals B are expanded at once and the pairs are filtered by the end
+    times. The pairs are returned in chunks to limit the memory usage.
+
+    Time instances are represented by intervals with equal start and end.
+
+    :param startA: NumPy array with the start times of the intervals A
+    :param endA: NumPy array with the end times of the intervals A
+    :param startB: NumPy array with the start times of the intervals B
+    :param endB: NumPy array with the end times of the intervals B
+    :param chunk_size: Maximum number of candidate pairs processed at once
+    :return: A generator of tuples with index arrays (i, j) of the
+             intervals A and B of the pairs, ordered by j
+    """
+    if not len(startA) or not len(startB):
+        return
+    durations = np.maximum((endA - startA).astype(np.float64), 0)
+    with np.errstate(divide="ignore"):
+        # Time instances and intervals of zero length are in the group -inf
+        group_keys = np.floor(np.log2(durations))
+
+    groups = []
+    counts = np.zeros(len(startB), dtype=np.int64)
+    for key in np.unique(group_keys):
+        members = np.flatnonzero(group_keys == key)
+        order = members[np.argsort(startA[members], kind="stable")]
+        sorted_start = startA[order]
+        max_duration = (endA[order] - sorted_start).max()
+        lower = np.searchsorted(sorted_start, startB - max_duration, side="left")
+        upper = np.searchsorted(sorted_start, endB, side="right")
+        groups.append((order, endA[order], lower, upper - lower))
+        counts += upper - lower
+    total = np.cumsum(counts)
+
+    first = 0
+    while first < len(startB):
+        offset = total[first - 1] if first else 0
+        last = int(np.searchsorted(total, offset + chunk_size, side="right"))
+        last = max(last, first + 1)
+        pairs_i = []
+        pairs_j = []
+        for order, sorted_end, lower, group_counts in groups:
+            chunk_counts = group_counts[first:last]
+            j = np.repeat(np.arange(first, last), chunk_counts)
+            # Position of each pair in the sorted start times of the group
+            position = np.repeat(
+                lower[first:last] - np.cumsum(chunk_counts) + chunk_counts,
+                chunk_counts,
+            ) + np.arange(j.size)
+            select = sorted_end[position] >= startB[j]
+            pairs_i.append(order[position[select]])
+            pairs_j.append(j[select])
+        i = np.concatenate(pairs_i)
+        j = np.concatenate(pairs_j)
+        if len(groups) > 1:
+            by_j = np.argsort(j, kind="stable")
+            i = i[by_j]
+            j = j[by_j]
+        yield i, j
+        first = last
+
+
+###############################################################################
+
+
 def set_temporal_relationship(A, B, relation) -> None:
     if relation in {"equal", "equals"}:
         if A != B:
@@ -547,6 +547,115 @@ class TestRasterRegisterFunctions(TestCase):
         self.assertEqual(end, 2000000)
         self.assertEqual(unit, "seconds")
 
+    def test_absolute_time_two_strds(self) -> None:
+        """Test the registration of the same maps in two space time
+        raster datasets and repeated registration
+        """
+        strds = tgis.open_new_stds(
+            name="register_test_abs_2",
+            type="strds",
+            temporaltype="absolute",
+            title="Test strds",
+            descr="Test strds",
+            semantic="field",
+            overwrite=True,
+        )
+        for dataset in (self.strds_abs, strds, strds):
+            tgis.register_maps_in_space_time_dataset(
+                type="raster",
+                name=dataset.get_name(),
+                maps="register_map_1,register_map_2",
+                start="2001-01-01",
+                increment="1 day",
+                interval=True,
+            )
+
+        map = tgis.RasterDataset("register_map_2@" + tgis.get_current_mapset())
+        map.select()
+        self.assertEqual(
+            sorted(map.get_registered_stds()),
+            sorted([self.strds_abs.get_id(), strds.get_id()]),
+        )
+        for dataset in (self.strds_abs, strds):
+            dataset.select()
+            self.assertEqual(dataset.metadata.get_number_of_maps(), 2)
+            start, end = dataset.get_absolute_time()
+            self.assertEqual(start, datetime.datetime(2001, 1, 1))
+            self.assertEqual(end, datetime.datetime(2001, 1, 3))
+        strds.delete()
+
+    def test_registered_maps_as_columns(self) -> None:
+        """Test that the columnar map list creates the same maps as the
+        object list
+        """
+        tgis.register_maps_in_space_time_dataset(
+            type="raster",
+            name=self.strds_abs.get_name(),
+            maps="register_map_1,register_map_2",
+            start="2001-01-01",
+            increment="2 days",
+            interval=False,
+        )
+        self.strds_abs.select()
+        maps = self.strds_abs.get_registered_maps_as_columns()
+        objects = self.strds_abs.get_registered_maps_as_objects()
+
+        self.assertEqual(len(maps), 2)
+        self.assertEqual(list(maps.ids), [map_.get_id() for map_ in objects])
+        self.assertEqual(
+            maps.start_time[1].item(), objects[1].get_temporal_extent_as_tuple()[0]
+        )
+        self.assertEqual(maps.count_gaps(), self.strds_abs.count_gaps(objects))
+        self.assertEqual(maps.count_gaps(), 1)
+        for map_, obj in zip(maps, objects, strict=True):
+            self.assertEqual(
+                map_.get_temporal_extent_as_tuple(), obj.get_temporal_extent_as_tuple()
+            )
+            self.assertEqual(
+                map_.get_spatial_extent_as_tuple(), obj.get_spatial_extent_as_tuple()
+            )
+        self.assertIs(maps[0], maps[0])
+        self.assertEqual(maps[1:].ids[0], maps.ids[1])
+
+    def test_read_metadata_many(self) -> None:
+        """Test that the metadata of many maps read in a single request
+        is the same as when read map by map
+        """
+        ciface = tgis.get_tgis_c_library_interface()
+        mapset = tgis.get_current_mapset()
+        ciface.write_raster_timestamp("register_map_1", mapset, "1 Jan 2001")
+        ciface.remove_raster_timestamp("register_map_2", mapset)
+        names = ["register_map_1", "register_map_2", "register_map_missing"]
+
+        self.assertEqual(
+            ciface.raster_map_exists_many(names, mapset), [True, True, False]
+        )
+        self.assertEqual(
+            ciface.has_raster_timestamp_many(names, mapset), [True, False, False]
+        )
+        self.assertEqual(
+            ciface.read_raster_info_many(names, [mapset, mapset, mapset]),
+            [ciface.read_raster_info(name, mapset) for name in names],
+        )
+        self.assertEqual(
+            ciface.read_raster_timestamp_many(names[:1], mapset),
+            [ciface.read_raster_timestamp(names[0], mapset)],
+        )
+        self.assertEqual(ciface.read_raster_info_many([], mapset), [])
+
+        maps = [tgis.RasterDataset(f"{name}@{mapset}") for name in names]
+        self.assertEqual(tgis.RasterDataset.load_many(maps), [True, True, False])
+        self.assertEqual(
+            tgis.RasterDataset.read_timestamp_from_grass_many(maps[:2]), [True, False]
+        )
+        self.assertEqual(maps[0].get_absolute_time()[0], datetime.datetime(2001, 1, 1))
+        single = tgis.RasterDataset(f"register_map_2@{mapset}")
+        single.load()
+        self.assertEqual(maps[1].metadata.get_max(), single.metadata.get_max())
+        self.assertEqual(
+            maps[1].spatial_extent.get_north(), single.spatial_extent.get_north()
+        )
+
 
 class TestVectorRegisterFunctions(TestCase):
     @classmethod
@@ -0,0 +1,88 @@
+"""Unit test of the granularity resampling of map lists
+using tgis.AbstractSpaceTimeDataset.resample_maplist_by_granularity()
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+import grass.temporal as tgis
+
+
+def create_maps(intervals):
+    """Create raster maps with relative time from (start, end) tuples"""
+    maps = []
+    for i, (start, end) in enumerate(intervals):
+        map_ = tgis.RasterDataset(f"map{i}@test")
+        map_.set_relative_time(start, end, "days")
+        map_.set_spatial_extent_from_values(north=1, south=0, east=1, west=0)
+        maps.append(map_)
+    return maps
+
+
+def resample(maps, start, end, gran):
+    """Return the map ids and the temporal extents of each granule"""
+    result = tgis.AbstractSpaceTimeDataset.resample_maplist_by_granularity(
+        maps, start, end, gran
+    )
+    return [
+        [(map_.get_id(), map_.get_temporal_extent_as_tuple()) for map_ in granule]
+        for granule in result
+    ]
+
+
+class TestResampleMapList(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initiate the temporal GIS"""
+        tgis.init()
+
+    def test_search_order(self) -> None:
+        """Equal maps are used before containing, overlapping, overlapped
+        and included maps
+        """
+        maps = create_maps(
+            [(0, 2), (2, 4), (1, 3), (4, 5), (5, 7), (6, 9), (8, 9), (9, None)]
+        )
+        self.assertEqual(
+            resample(maps, 0, 12, 2),
+            [
+                [("map0@test", (0, 2))],
+                [("map1@test", (2, 4))],
+                # map4 starts in the granule and ends after it, map3 is during
+                [("map4@test", (4, 6))],
+                # map5 contains the granule, map4 overlaps it
+                [("map5@test", (6, 8))],
+                # map5 overlaps the granule, map6 and map7 are during
+                [("map5@test", (8, 10))],
+                [(None, (10, 12))],
+            ],
+        )
+
+    def test_gaps_and_instances(self) -> None:
+        maps = create_maps([(1, None), (2, None), (6, 8)])
+        self.assertEqual(
+            resample(maps, 0, 9, 3),
+            [
+                [("map0@test", (0, 3)), ("map1@test", (0, 3))],
+                [(None, (3, 6))],
+                [("map2@test", (6, 9))],
+            ],
+        )
+
+    def test_map_list(self) -> None:
+        """The map list is not modified"""
+        maps = create_maps([(0, 2), (2, 4)])
+        resample(maps, 0, 4, 1)
+        self.assertEqual(maps[0].get_temporal_relations(), {})
+        self.assertIsNone(
+            tgis.AbstractSpaceTimeDataset.resample_maplist_by_granularity([], 0, 4, 1)
+        )
+
+
+if __name__ == "__main__":
+    test()
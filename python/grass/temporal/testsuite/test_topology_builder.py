@@ -0,0 +1,166 @@
+"""Unit test of the spatio-temporal topology builder comparing the
+vectorized search of related maps with the R*-Tree search
+
+(C) 2025 by the GRASS Development Team
+This program is free software under the GNU General Public
+License (>=v2). Read the file COPYING that comes with GRASS
+for details.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from grass.gunittest.case import TestCase
+from grass.gunittest.main import test
+
+import grass.temporal as tgis
+from grass.temporal.spatio_temporal_relationships import find_intersecting_intervals
+
+
+def create_maps(prefix, intervals, absolute=True):
+    """Create a list of raster maps with the provided (start, end) intervals
+    in days and spatial extents shifted by the start
+    """
+    maps = []
+    start_date = datetime(2001, 1, 1)
+    for i, (start, end) in enumerate(intervals):
+        map_ = tgis.RasterDataset(f"{prefix}{i}@test")
+        if absolute:
+            map_.set_absolute_time(
+                start_date + timedelta(days=start),
+                None if end is None else start_date + timedelta(days=end),
+            )
+        else:
+            map_.set_relative_time(start, end, "days")
+        offset = start % 3
+        map_.set_spatial_extent_from_values(
+            north=offset + 2, south=offset, east=offset + 2, west=offset
+        )
+        maps.append(map_)
+    return maps
+
+
+def get_relations(maps):
+    """Return the temporal and spatial relations as dictionary of sets of ids"""
+    relations = {}
+    for map_ in maps:
+        items = [
+            *map_.get_temporal_relations().items(),
+            *map_.get_spatial_relations().items(),
+        ]
+        for name, related in items:
+            # The next and previous maps are not stored in a list
+            if not isinstance(related, list):
+                related = [related]
+            relations[map_.get_id(), name] = {m.get_id() for m in related}
+    return relations
+
+
+class TestTopologyBuilder(TestCase):
+    intervalsA = [
+        (0, 1),
+        (1, 2),
+        (1, 3),
+        (2, 3),
+        (2, None),
+        (3, 6),
+        (4, 5),
+        (4, 6),
+        (6, None),
+        (7, 9),
+        (8, 9),
+    ]
+    intervalsB = [(0, 2), (2, None), (2, 4), (5, 6), (6, 8), (9, 10), (12, None)]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Initiate the temporal GIS"""
+        tgis.init()
+
+    def assertSameTopology(self, mapsA, mapsB, spatial=None) -> None:
+        """Check that the vectorized and R*-Tree builders create
+        the same topology
+        """
+        tgis.SpatioTemporalTopologyBuilder(use_rtree=True).build(mapsA, mapsB, spatial)
+        expected = (get_relations(mapsA), get_relations(mapsB or []))
+        self.assertTrue(expected[0])
+
+        tgis.SpatioTemporalTopologyBuilder().build(mapsA, mapsB, spatial)
+        self.assertEqual((get_relations(mapsA), get_relations(mapsB or [])), expected)
+
+    def test_absolute_time(self) -> None:
+        mapsA = create_maps("a", self.intervalsA)
+        mapsB = create_maps("b", self.intervalsB)
+        self.assertSameTopology(mapsA, mapsB)
+        self.assertSameTopology(mapsA, None)
+
+    def test_relative_time(self) -> None:
+        mapsA = create_maps("a", self.intervalsA, absolute=False)
+        mapsB = create_maps("b", self.intervalsB, absolute=False)
+        self.assertSameTopology(mapsA, mapsB)
+        self.assertSameTopology(mapsB, None)
+
+    def test_spatial(self) -> None:
+        mapsA = create_maps("a", self.intervalsA)
+        mapsB = create_maps("b", self.intervalsB)
+        self.assertSameTopology(mapsA, mapsB, "2D")
+        self.assertSameTopology(mapsA, None, "3D")
+
+    def test_mixed_units(self) -> None:
+        mapsA = create_maps("a", self.intervalsA, absolute=False)
+        mapsB = create_maps("b", self.intervalsB, absolute=False)
+        mapsB[0].set_relative_time(0, 2, "months")
+        self.assertSameTopology(mapsA, mapsB)
+
+    def test_intersecting_intervals(self) -> None:
+        """Compare the intersecting intervals with a brute-force search"""
+        rng = np.random.default_rng(1)
+        startA = rng.integers(0, 1000, 300)
+        endA = startA + rng.choice([0, 1, 3, 50, 700], 300)
+        startB = rng.integers(0, 1000, 200)
+        endB = startB + rng.integers(0, 20, 200)
+        pairs = set()
+        for i, j in find_intersecting_intervals(
+            startA, endA, startB, endB, chunk_size=500
+        ):
+            self.assertTrue((np.diff(j) >= 0).all())
+            pairs.update(zip(i.tolist(), j.tolist(), strict=True))
+        expected = {
+            (i, j)
+            for i in range(len(startA))
+            for j in range(len(startB))
+            if startA[i] <= endB[j] and endA[i] >= startB[j]
+        }
+        self.assertEqual(pairs, expected)
+
+    def test_intersecting_intervals_long_interval(self) -> None:
+        """Check that one long interval does not add candidates of the others"""
+        start = np.arange(10000) * 10
+        start = np.append(start, 0)
+        end = start + 10
+        end[-1] = 100000
+        chunks = [
+            len(i)
+            for i, unused in find_intersecting_intervals(
+                start, end, start, end, chunk_size=10000
+            )
+        ]
+        self.assertEqual(sum(chunks), 3 * 10000 - 2 + 2 * 10000 + 1)
+        # The chunks are limited by the candidates, searching all intervals
+        # together gives thousands of chunks
+        self.assertLess(len(chunks), 10)
+
+    def test_iteration(self) -> None:
+        maps = create_maps("a", self.intervalsA)
+        tb = tgis.SpatioTemporalTopologyBuilder()
+        tb.build(maps)
+        self.assertEqual(len(tb), len(maps))
+        self.assertEqual(tb.get_first().get_id(), "a0@test")
+        self.assertEqual(
+            [map_.get_id() for map_ in tb], [map_.get_id() for map_ in maps]
+        )
+
+
+if __name__ == "__main__":
+    test()
@@ -21,19 +21,419 @@ for details.
 :authors: Soeren Gebbert
 """
 
+import json
+import math
+import sys
+from functools import partial
 from multiprocessing import Pool
 from subprocess import PIPE
 
+import numpy as np
+
+import grass.lib.raster as libraster
 import grass.script as gs
+from grass.exceptions import OpenError
 from grass.pygrass.modules import Module
+from grass.pygrass.raster import RasterRow, raster2numpy_tiles
 
 from .core import SQLDatabaseInterfaceConnection, get_current_mapset
 from .factory import dataset_factory
 from .open_stds import open_old_stds
 
+# Statistics printed for each map (and zone) of a space time raster or
+# raster3d dataset
+UNIVAR_COLUMNS = [
+    "mean",
+    "min",
+    "max",
+    "mean_of_abs",
+    "stddev",
+    "variance",
+    "coeff_var",
+    "sum",
+    "null_cells",
+    "cells",
+    "non_null_cells",
+]
+
+# The null value of CELL raster maps
+CELL_NULL = np.iinfo(np.int32).min
+
+# Same as GRASS_EPSILON in gis.h, used by r.univar to clamp the variance
+GRASS_EPSILON = 1.0e-15
+
 ###############################################################################
 
 
+def _get_percentile_column(percentile):
+    """Return the name of the column with the given percentile"""
+    return f"percentile_{str(percentile).rstrip('0').rstrip('.').replace('.', '_')}"
+
+
+def _get_univar_columns(type, zones=None, extended=False, percentile=None):
+    """Return the column names of the univariate statistics output
+
+    :param type: Type of Space-Time-Dataset, must be either strds or str3ds
+    :param zones: raster map with zones to calculate statistics for
+    :param extended: If True the extended statistics are included
+    :param percentile: List of percentiles to compute
+    """
+    columns = (
+        ["id", "semantic_label", "start", "end"]
+        if type == "strds"
+        else ["id", "start", "end"]
+    )
+    if zones:
+        columns.append("zone")
+    columns.extend(UNIVAR_COLUMNS)
+    if extended:
+        columns.extend(["first_quartile", "median", "third_quartile"])
+        if percentile:
+            columns.extend(_get_percentile_column(perc) for perc in percentile)
+    return columns
+
+
+def _format_univar_value(value, column):
+    """Format a value like the shell script style output of r.univar
+
+    Quartiles and percentiles are printed with 6 significant digits,
+    the other statistics with 15 significant digits.
+    """
+    if isinstance(value, float):
+        if column in {
+            "first_quartile",
+            "median",
+            "third_quartile",
+        } or column.startswith("percentile_"):
+            return f"{value:g}"
+        return f"{value:.15g}"
+    return f"{value}"
+
+
+def _parse_univar_output(output):
+    """Parse the shell script style output of r.univar or r3.univar
+
+    :param output: The output of the module run with the g flag
+    :return: A list of dictionaries with the statistics, one for each zone
+    """
+    stats_list = []
+    stats = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        if key == "zone":
+            # The zone number is followed by the zone label
+            stats = {"zone": int(value.split(";", 1)[0])}
+            stats_list.append(stats)
+            continue
+        if not stats_list:
+            stats_list.append(stats)
+        stats[key] = int(value) if key in {"n", "null_cells", "cells"} else float(value)
+    return stats_list
+
+
+def _univar_stats_to_values(stats, percentile=None):
+    """Return the values of the statistics in the order of the output columns"""
+    values = [stats["zone"]] if "zone" in stats else []
+    values.extend(
+        stats[key]
+        for key in (
+            "mean",
+            "min",
+            "max",
+            "mean_of_abs",
+            "stddev",
+            "variance",
+            "coeff_var",
+            "sum",
+            "null_cells",
+            "n",
+            "n",
+        )
+    )
+    if "median" in stats:
+        values.extend(
+            (stats["first_quartile"], stats["median"], stats["third_quartile"])
+        )
+        if percentile:
+            values.extend(stats[_get_percentile_column(perc)] for perc in percentile)
+    return values
+
+
+def _null_mask(array):
+    """Return a boolean array which is True for the null cells"""
+    if array.dtype.kind == "f":
+        return np.isnan(array)
+    return array == CELL_NULL
+
+
+def _split_map_id(map_id):
+    """Return the name and the mapset of a map id, the mapset may be empty"""
+    name, unused, mapset = map_id.partition("@")
+    return name, mapset
+
+
+def _read_raster_bands(map_id, zones=None, band_rows=256):
+    """Yield the rows of a raster map and of the zones map in bands
+
+    :return: Tuples of the cell values and the zones (None without zones)
+             of the non-null cells of the zones map as 1D arrays
+    """
+    name, mapset = _split_map_id(map_id)
+    bands = raster2numpy_tiles(name, tile_rows=band_rows, mapset=mapset)
+    if not zones:
+        for unused, band in bands:
+            yield band.ravel(), None
+        return
+
+    zone_name, zone_mapset = _split_map_id(zones)
+    zone_bands = raster2numpy_tiles(zone_name, tile_rows=band_rows, mapset=zone_mapset)
+    for (unused, band), (unused, zone_band) in zip(bands, zone_bands, strict=True):
+        zone_band = zone_band.ravel()
+        # Cells with null zones are not counted
+        valid = ~_null_mask(zone_band)
+        yield band.ravel()[valid], zone_band[valid].astype(np.int32)
+
+
+def _summarize_univar_values(
+    values, size, sums, min_value, max_value, extended, percentile
+):
+    """Compute the statistics of a zone like r.univar
+
+    :param values: The non-null values of the zone in case of extended statistics
+    :param size: The number of cells (null and non-null) of the zone
+    :param sums: List with the number of non-null cells, the sum, the sum of
+                 squared deviations from the mean and the sum of the
+                 absolute values
+    """
+    n, total, squared_deviations, total_abs = sums
+    stats = {"n": n, "null_cells": size - n, "cells": size}
+    if n == 0:
+        nan = float("nan")
+        stats.update(
+            dict.fromkeys(
+                (
+                    "min",
+                    "max",
+                    "range",
+                    "mean",
+                    "mean_of_abs",
+                    "stddev",
+                    "variance",
+                    "coeff_var",
+                    "sum",
+                ),
+                nan,
+            )
+        )
+        if extended:
+            stats.update(
+                dict.fromkeys(("first_quartile", "median", "third_quartile"), nan)
+            )
+            for perc in percentile or []:
+                stats[_get_percentile_column(perc)] = nan
+        return stats
+
+    mean = total / n
+    variance = squared_deviations / n
+    if variance < GRASS_EPSILON:
+        variance = 0.0
+    stddev = math.sqrt(variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coeff_var = float(np.float64(stddev) / mean * 100.0)
+    stats.update(
+        {
+            "min": float(min_value),
+            "max": float(max_value),
+            "range": float(max_value) - float(min_value),
+            "mean": mean,
+            "mean_of_abs": total_abs / n,
+            "stddev": stddev,
+            "variance": variance,
+            "coeff_var": coeff_var,
+            "sum": total,
+        }
+    )
+    if extended:
+        # The positions of the sorted values are computed as in r.univar
+        percentile = percentile or []
+        positions = {
+            "first_quartile": int(n * 0.25 - 0.5),
+            "third_quartile": int(n * 0.75 - 0.5),
+        }
+        for perc in percentile:
+            positions[_get_percentile_column(perc)] = int(n * 1e-2 * perc - 0.5)
+        median_positions = [n // 2] if n % 2 else [n // 2 - 1, n // 2]
+        values = np.partition(values, sorted({*positions.values(), *median_positions}))
+        for key, position in positions.items():
+            stats[key] = float(values[position])
+        if n % 2:
+            stats["median"] = float(values[n // 2])
+        else:
+            stats["median"] = float(values[n // 2 - 1] + values[n // 2]) / 2.0
+    return stats
+
+
+def compute_raster_univar_stats(
+    map_id, zones=None, extended=False, percentile=None, rast_region=False
+):
+    """Compute univariate statistics of a raster map in the current process
+
+    The raster map is read directly with PyGRASS in bands of rows and the
+    statistics are computed with NumPy, the results are the same as the
+    shell script style output of r.univar.
+
+    :param map_id: The id of the raster map
+    :param zones: raster map with zones to calculate statistics for
+    :param extended: If True compute extended statistics
+    :param percentile: List of percentiles to compute
+    :param rast_region: If set True ignore the current region settings
+           and use the raster map region
+    :return: A list of dictionaries with the statistics, one for each zone
+             with at least one cell ordered by the zone number
+    """
+    if rast_region:
+        raster = RasterRow(*_split_map_id(map_id))
+        if not raster.exist():
+            msg = f"Raster map <{map_id}> not found"
+            raise OpenError(msg)
+        raster.set_region_from_rast()
+    try:
+        # Number of non-null cells, sum, sum of squares relative to the shift,
+        # sum of absolute values, and the shift, i.e., the first value
+        sums = {}
+        sizes = {}
+        minima = {}
+        maxima = {}
+        values = {}
+        for band, band_zones in _read_raster_bands(map_id, zones):
+            null = _null_mask(band)
+            if band_zones is None:
+                groups = [(None, band, null)]
+            else:
+                # Split the band by zone
+                order = np.argsort(band_zones, kind="stable")
+                zone_ids, starts = np.unique(band_zones[order], return_index=True)
+                groups = zip(
+                    zone_ids.tolist(),
+                    np.split(band[order], starts[1:]),
+                    np.split(null[order], starts[1:]),
+                    strict=True,
+                )
+            for zone, zone_band, zone_null in groups:
+                sizes[zone] = sizes.get(zone, 0) + zone_band.size
+                data = zone_band[~zone_null]
+                if not data.size:
+                    continue
+                if data.dtype.kind == "f":
+                    data64 = data.astype(np.float64)
+                else:
+                    # Sums of CELL values of a band fit in 64-bit integers
+                    data64 = data.astype(np.int64)
+                zone_sums = sums.setdefault(zone, [0, [], [], [], data64[0]])
+                zone_sums[0] += data.size
+                zone_sums[1].append(data64.sum())
+                # Squares of CELL values may not fit in 64-bit integers, they
+                # are summed as doubles like in r.univar, but relative to the
+                # shift to avoid the cancellation for large values
+                deviations = (data64 - zone_sums[4]).astype(np.float64)
+                zone_sums[2].append(np.dot(deviations, deviations))
+                zone_sums[3].append(np.abs(data64).sum())
+                minimum = data64.min()
+                maximum = data64.max()
+                minima[zone] = min(minima.get(zone, minimum), minimum)
+                maxima[zone] = max(maxima.get(zone, maximum), maximum)
+                if extended:
+                    values.setdefault(zone, []).append(data)
+    finally:
+        if rast_region:
+            libraster.Rast_unset_window()
+
+    stats_list = []
+    for zone in sorted(sizes, key=lambda zone: -1 if zone is None else zone):
+        n, totals, squares, abs_totals, shift = sums.get(zone, [0, [], [], [], 0])
+        total = float(math.fsum(totals))
+        squared_deviations = 0.0
+        zone_values = None
+        if n:
+            deviation = total - n * float(shift)
+            squared_deviations = float(math.fsum(squares)) - deviation * deviation / n
+        if extended and n:
+            zone_values = np.concatenate(values[zone])
+        stats = _summarize_univar_values(
+            zone_values,
+            sizes[zone],
+            [n, total, squared_deviations, float(math.fsum(abs_totals))],
+            minima.get(zone),
+            maxima.get(zone),
+            extended,
+            percentile,
+        )
+        if zone is not None:
+            stats = {"zone": zone, **stats}
+        stats_list.append(stats)
+    return stats_list
+
+
+def _compute_univar_rows(
+    registered_map_info,
+    stats_module=None,
+    zones=None,
+    extended=False,
+    percentile=None,
+    rast_region=False,
+):
+    """Compute the output rows of the univariate statistics of a registered map
+
+    :param registered_map_info: dict or db row with tgis info for a registered map
+    :param stats_module: Pre-configured PyGRASS Module to compute univariate
+                         statistics with, if None the statistics of the raster
+                         map are computed in the current process
+    :return: A list of rows, one for each zone, or None if no statistics
+             are available
+    """
+    map_id = registered_map_info["id"]
+    start = registered_map_info["start_time"]
+    end = registered_map_info["end_time"]
+    is_raster = stats_module is None or stats_module.name == "r.univar"
+
+    if stats_module is None:
+        try:
+            stats_list = compute_raster_univar_stats(
+                map_id, zones, extended, percentile, rast_region
+            )
+        except OpenError:
+            stats_list = None
+    else:
+        stats_module.inputs.map = map_id
+        if rast_region and (
+            stats_module.inputs.zones or stats_module.name == "r3.univar"
+        ):
+            stats_module.env = gs.region_env(raster=map_id)
+        stats_module.run()
+        stats_list = _parse_univar_output(stats_module.outputs.stdout or "")
+        percentile = stats_module.inputs.percentile
+
+    if not stats_list:
+        gs.warning(
+            _("Unable to get statistics for raster map <%s>") % map_id
+            if is_raster
+            else _("Unable to get statistics for 3d raster map <%s>") % map_id
+        )
+        return None
+
+    if is_raster:
+        semantic_label = registered_map_info["semantic_label"] or ""
+        prefix = [map_id, semantic_label, start, end]
+    else:
+        prefix = [map_id, start, end]
+    return [
+        [*prefix, *_univar_stats_to_values(stats, percentile)] for stats in stats_list
+    ]
+
+
 def compute_univar_stats(
     registered_map_info, stats_module, fs, rast_region: bool = False
 ):
@@ -48,68 +448,82 @@ def compute_univar_stats(
            and use the raster map regions for univar statistical calculation.
            Only available for strds.
     """
-    string = ""
-    id = registered_map_info["id"]
-    start = registered_map_info["start_time"]
-    end = registered_map_info["end_time"]
-    semantic_label = (
-        ""
-        if stats_module.name == "r3.univar" or not registered_map_info["semantic_label"]
-        else registered_map_info["semantic_label"]
+    rows = _compute_univar_rows(
+        registered_map_info, stats_module, rast_region=rast_region
+    )
+    if rows is None:
+        return None
+    columns = _get_univar_columns(
+        "strds" if stats_module.name == "r.univar" else "str3ds",
+        stats_module.inputs.zones,
+        bool(stats_module.flags.e),
+        stats_module.inputs.percentile,
+    )
+    return "\n".join(
+        fs.join(
+            _format_univar_value(value, column)
+            for value, column in zip(row, columns, strict=True)
+        )
+        for row in rows
     )
 
-    stats_module.inputs.map = id
-    if rast_region and (stats_module.inputs.zones or stats_module.name == "r3.univar"):
-        stats_module.env = gs.region_env(raster=id)
-    stats_module.run()
-
-    univar_stats = stats_module.outputs.stdout
 
-    if not univar_stats:
-        gs.warning(
-            _("Unable to get statistics for raster map <%s>") % id
-            if stats_module.name == "r.univar"
-            else _("Unable to get statistics for 3d raster map <%s>") % id
+def _write_univar_plain(rows, columns, stream, fs, header):
+    """Write the rows of univariate statistics as separated values"""
+    if header:
+        stream.write(fs.join(columns) + "\n")
+    for row in rows:
+        stream.write(
+            fs.join(
+                _format_univar_value(value, column)
+                for value, column in zip(row, columns, strict=True)
+            )
+            + "\n"
         )
-        return None
-    eol = ""
 
-    for idx, stats_kv in enumerate(univar_stats.split(";")):
-        stats = gs.utils.parse_key_val(stats_kv)
-        string += (
-            f"{id}{fs}{semantic_label}{fs}{start}{fs}{end}"
-            if stats_module.name == "r.univar"
-            else f"{id}{fs}{start}{fs}{end}"
-        )
-        if stats_module.inputs.zones:
-            if idx == 0:
-                zone = str(stats["zone"])
-                string = ""
-                continue
-            string += f"{fs}{zone}"
-            if "zone" in stats:
-                zone = str(stats["zone"])
-                eol = "\n"
-            else:
-                eol = ""
-        string += f"{fs}{stats['mean']}{fs}{stats['min']}"
-        string += f"{fs}{stats['max']}{fs}{stats['mean_of_abs']}"
-        string += f"{fs}{stats['stddev']}{fs}{stats['variance']}"
-        string += f"{fs}{stats['coeff_var']}{fs}{stats['sum']}"
-        string += f"{fs}{stats['null_cells']}{fs}{stats['n']}"
-        string += f"{fs}{stats['n']}"
-        if "median" in stats:
-            string += f"{fs}{stats['first_quartile']}{fs}{stats['median']}"
-            string += f"{fs}{stats['third_quartile']}"
-            if stats_module.inputs.percentile:
-                for perc in stats_module.inputs.percentile:
-                    perc_value = stats[
-                        "percentile_"
-                        f"{str(perc).rstrip('0').rstrip('.').replace('.', '_')}"
-                    ]
-                    string += f"{fs}{perc_value}"
-        string += eol
-    return string
+
+def _write_univar_csv(rows, columns, stream, fs, header):
+    """Write the rows of univariate statistics as CSV"""
+    # Lazy import output format-specific dependencies.
+    # pylint: disable=import-outside-toplevel
+    import csv
+
+    writer = csv.writer(
+        stream,
+        delimiter=fs,
+        quotechar='"',
+        doublequote=True,
+        quoting=csv.QUOTE_NONNUMERIC,
+        lineterminator="\n",
+    )
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+
+
+def _write_univar_json(rows, columns, stream, fs, header):
+    """Write the rows of univariate statistics as JSON
+
+    The rows are written one by one, the column names are always included
+    in the metadata.
+    """
+
+    def to_json(value):
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        if isinstance(value, (str, int, float)):
+            return value
+        return f"{value}"
+
+    stream.write('{"data": [')
+    separator = ""
+    for row in rows:
+        record = {
+            column: to_json(value) for column, value in zip(columns, row, strict=True)
+        }
+        stream.write(separator + json.dumps(record))
+        separator = ", "
+    stream.write(f'], "metadata": {json.dumps({"column_names": columns})}}}\n')
 
 
 def print_gridded_dataset_univar_statistics(
@@ -125,12 +539,18 @@ def print_gridded_dataset_univar_statistics(
     zones=None,
     percentile=None,
     nprocs: int = 1,
+    output_format: str = "plain",
 ) -> None:
     """Print univariate statistics for a space time raster or raster3d dataset.
 
     Returns None if the space time raster dataset is empty or if applied
     filters (where, region_relation) do not return any maps to process.
 
+    The statistics of the maps of a space time raster dataset are computed
+    in-process by reading the raster maps directly, the maps of a space time
+    raster3d dataset are processed with r3.univar. With several processes,
+    the rows are written in the order of the maps as soon as they are computed.
+
     :param type: Type of Space-Time-Dataset, must be either strds or str3ds
     :param input: The name of the space time dataset
     :param output: Name of the optional output file, if None stdout is used
@@ -150,7 +570,17 @@ def print_gridded_dataset_univar_statistics(
            - "is_contained": maps that are fully within the provided spatial extent
            - "contains": maps that contain (fully cover) the provided spatial extent
     :param zones: raster map with zones to calculate statistics for
+    :param output_format: The output format, one of plain, csv and json
     """
+    writers = {
+        "plain": _write_univar_plain,
+        "csv": _write_univar_csv,
+        "json": _write_univar_json,
+    }
+    if output_format not in writers:
+        msg = f"Unknown value '{output_format}' for output_format"
+        raise ValueError(msg)
+
     # We need a database interface
     dbif = SQLDatabaseInterfaceConnection()
     dbif.connect()
@@ -174,9 +604,9 @@ def print_gridded_dataset_univar_statistics(
         spatial_extent=spatial_extent,
         spatial_relation=region_relation,
     )
+    dbif.close()
 
     if not rows and rows != [""]:
-        dbif.close()
         gs.verbose(
             _(
                 "No maps found to process. "
@@ -189,91 +619,56 @@ def print_gridded_dataset_univar_statistics(
 
         return
 
-    if output is not None:
-        out_file = open(output, "w")
+    columns = _get_univar_columns(type, zones, extended is True, percentile)
 
-    if no_header is False:
-        cols = (
-            ["id", "semantic_label", "start", "end"]
-            if type == "strds"
-            else ["id", "start", "end"]
-        )
-        if zones:
-            cols.append("zone")
-        cols.extend(
-            [
-                "mean",
-                "min",
-                "max",
-                "mean_of_abs",
-                "stddev",
-                "variance",
-                "coeff_var",
-                "sum",
-                "null_cells",
-                "cells",
-                "non_null_cells",
-            ]
+    if type == "strds":
+        compute = partial(
+            _compute_univar_rows,
+            zones=zones,
+            extended=extended is True,
+            percentile=percentile,
+            rast_region=rast_region,
         )
+    else:
+        # Define flags
+        flag = "g"
         if extended is True:
-            cols.extend(["first_quartile", "median", "third_quartile"])
-            if percentile:
-                cols.extend(
-                    [
-                        "percentile_"
-                        f"{str(perc).rstrip('0').rstrip('.').replace('.', '_')}"
-                        for perc in percentile
-                    ]
-                )
-        string = fs.join(cols)
-
-        if output is None:
-            print(string)
-        else:
-            out_file.write(string + "\n")
+            flag += "e"
+
+        # Setup pygrass module to use for computation
+        univar_module = Module(
+            "r3.univar",
+            flags=flag,
+            percentile=percentile,
+            stdout_=PIPE,
+            run_=False,
+        )
+        compute = partial(
+            _compute_univar_rows, stats_module=univar_module, rast_region=rast_region
+        )
 
-    # Define flags
-    flag = "g"
-    if extended is True:
-        flag += "e"
-    if type == "strds" and rast_region is True and not zones:
-        flag += "r"
-
-    # Setup pygrass module to use for computation
-    univar_module = Module(
-        "r.univar" if type == "strds" else "r3.univar",
-        flags=flag,
-        zones=zones,
-        percentile=percentile,
-        stdout_=PIPE,
-        run_=False,
-    )
+    def write(stream, results):
+        writers[output_format](
+            (row for map_rows in results if map_rows for row in map_rows),
+            columns,
+            stream,
+            fs,
+            no_header is False,
+        )
 
+    rows = [dict(row) for row in rows]
     nprocs = max(nprocs, 1)
-    if nprocs == 1:
-        strings = [
-            compute_univar_stats(
-                row,
-                univar_module,
-                fs,
-            )
-            for row in rows
-        ]
-    else:
-        with Pool(min(nprocs, len(rows))) as pool:
-            strings = pool.starmap(
-                compute_univar_stats, [(dict(row), univar_module, fs) for row in rows]
-            )
-
-    if output is None:
-        print("\n".join(filter(None, strings)))
-    else:
-        out_file.write("\n".join(filter(None, strings)))
-
-    dbif.close()
-
-    if output is not None:
-        out_file.close()
+    out_file = sys.stdout if output is None else open(output, "w", newline="")
+    try:
+        if nprocs == 1:
+            write(out_file, map(compute, rows))
+        else:
+            with Pool(min(nprocs, len(rows))) as pool:
+                # Results are returned in the order of the maps
+                write(out_file, pool.imap(compute, rows))
+    finally:
+        if output is not None:
+            out_file.close()
 
 
 ###############################################################################
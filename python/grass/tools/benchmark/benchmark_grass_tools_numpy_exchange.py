@@ -0,0 +1,110 @@
+"""Compare ways of passing NumPy arrays to and from raster maps
+
+The memmap path copies the array to a temporary file which is then imported
+by r.in.bin, and outputs are exported by r.out.bin to a temporary file.
+The in-memory path writes the array from its own file and reads outputs
+through a pipe, or, with the direct backend, writes and reads the maps using
+the raster library in the benchmark process.
+
+Run in a GRASS session.
+"""
+
+import time
+
+import numpy as np
+
+import grass.script.array as ga
+from grass.tools import Tools
+from grass.benchmark import (
+    num_cells_plot,
+    benchmark_resolutions,
+    load_results,
+    save_results,
+)
+
+
+class TimeMeasurer:
+    def __init__(self):
+        self._time = None
+        self._start = None
+
+    @property
+    def time(self):
+        return self._time
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self._time = time.perf_counter() - self._start
+
+
+class MemmapExchangeBenchmark(TimeMeasurer):
+    def run(self):
+        tools = Tools(overwrite=True)
+        region = tools.g_region(flags="p", format="json")
+        data = np.random.default_rng(42).random((region["rows"], region["cols"]))
+
+        self.start()
+        map2d = ga.array()
+        map2d[:] = data
+        map2d.write("benchmark_exchange", overwrite=True)
+        result = ga.array("benchmark_exchange")
+        self.stop()
+
+        print(result.sum())
+        tools.g_remove(type="raster", name="benchmark_exchange", flags="f")
+
+
+class InMemoryExchangeBenchmark(TimeMeasurer):
+    def __init__(self, backend="bin"):
+        super().__init__()
+        self.backend = backend
+
+    def run(self):
+        tools = Tools(overwrite=True)
+        region = tools.g_region(flags="p", format="json")
+        data = np.random.default_rng(42).random((region["rows"], region["cols"]))
+
+        self.start()
+        ga.write_raster(
+            data, "benchmark_exchange", overwrite=True, backend=self.backend
+        )
+        result = ga.read_raster("benchmark_exchange", backend=self.backend)
+        self.stop()
+
+        print(result.sum())
+        tools.g_remove(type="raster", name="benchmark_exchange", flags="f")
+
+
+def main():
+    resolutions = [5, 2, 1, 0.5]
+    repeat = 10
+    results = [
+        benchmark_resolutions(
+            module=MemmapExchangeBenchmark(),
+            label="memmap",
+            resolutions=resolutions,
+            repeat=repeat,
+        ),
+        benchmark_resolutions(
+            module=InMemoryExchangeBenchmark(),
+            label="in-memory",
+            resolutions=resolutions,
+            repeat=repeat,
+        ),
+        benchmark_resolutions(
+            module=InMemoryExchangeBenchmark(backend="direct"),
+            label="in-memory direct",
+            resolutions=resolutions,
+            repeat=repeat,
+        ),
+    ]
+    results = load_results(save_results(results))
+    plot_file = "test_res_plot.png"
+    num_cells_plot(results.results, filename=plot_file)
+    print(plot_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Compare per-call overhead of Tools with and without the persistent mode
+
+Run in a GRASS session. Tools doing almost no computation are called repeatedly,
+so the measured time per call is the overhead of starting the tool.
+"""
+
+from grass.tools import Tools
+
+
+def measure(persistent, repeat):
+    with Tools(persistent=persistent) as tools:
+        for unused in range(repeat):
+            # Python tool
+            tools.g_search_modules(keyword="slope", flags="g")
+            # C tool
+            tools.g_region(flags="p", format="json")
+        return tools.call_statistics()
+
+
+def main():
+    repeat = 50
+    for persistent in (False, True):
+        print(f"persistent={persistent}")
+        for call_type, statistics in measure(persistent, repeat).items():
+            print(
+                f"  {call_type}: {statistics['calls']} calls,"
+                f" {1000 * statistics['mean']:.1f} ms per call"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+##############################################################################
+# AUTHOR(S): GRASS Development Team
+#
+# PURPOSE:   Pre-initialized process for running GRASS Python tools
+#
+# COPYRIGHT: (C) 2025 by the GRASS Development Team
+#
+#            This program is free software under the GNU General Public
+#            License (>=v2). Read the file COPYING that comes with GRASS
+#            for details.
+##############################################################################
+
+"""
+Pre-initialized (warm) process for running GRASS tools written in Python
+
+Each tool run using a subprocess starts a new Python interpreter which then imports
+the grass.script package before the tool can do anything useful. For small tools,
+this startup is often most of the runtime. The tool server is a long-running Python
+process with the GRASS packages already imported. For each tool run, it forks
+itself, so the new tool process starts with everything already initialized,
+and the tool script then runs in the forked process with the environment, working
+directory, and standard input and outputs of the call.
+
+Tools which are not Python scripts (compiled tools) are not handled by the server
+because there is no startup to save for them. Forking is not available on all
+platforms (namely MS Windows), so the server is available only where *os.fork*
+exists.
+
+Do not use this module directly unless you are developing GRASS or its wrappers.
+In that case, be prepared to update your code if this module changes. This module may
+change between releases.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
+import os
+import runpy
+import selectors
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+import weakref
+from pathlib import Path
+
+import grass.script as gs
+
+DEFAULT_PRELOAD = ("grass.script",)
+
+# Popen options which the server can reproduce for the tool process.
+_SUPPORTED_POPEN_OPTIONS = {"env", "stdin", "stdout", "stderr", "cwd"}
+
+
+def is_available():
+    """Return True if the tool server can be used on this platform"""
+    return hasattr(os, "fork")
+
+
+def _read_responses(responses, waiting):
+    """Pass responses of the server to the waiting calls (run in a thread)
+
+    Each waiting call is a dictionary with an event which is set when
+    the response is available. When the server ends, the remaining calls
+    are released without a response.
+    """
+    with responses:
+        for line in responses:
+            response = json.loads(line)
+            call = waiting.pop(response["id"])
+            call["response"] = response
+            call["event"].set()
+    for request_id in list(waiting):
+        call = waiting.pop(request_id, None)
+        if call is not None:
+            call["event"].set()
+
+
+def _stop_server(process, requests):
+    """Stop the server process (used as a finalizer)"""
+    try:
+        requests.close()
+    except OSError:
+        pass
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class ToolServer:
+    """Run GRASS Python tools in processes forked from a pre-initialized process
+
+    The server process is started on the first call and it keeps running until
+    *close* is called or the object is garbage-collected. Calls from multiple
+    threads run concurrently, each tool in its own forked process, and each call
+    waits only for the response to its own request.
+
+    The *can_run* method tells if a given command can be executed by the server,
+    and the *run* method executes it returning the return code and the outputs
+    similarly to *subprocess.Popen.communicate*.
+    """
+
+    def __init__(self, preload=DEFAULT_PRELOAD):
+        """
+        :param preload: names of Python modules to import in the server process
+        """
+        self._preload = list(preload)
+        self._process = None
+        self._requests = None
+        self._finalizer = None
+        self._tmp_dir = None
+        # Guards the server process and writing of the requests.
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._waiting = {}
+        self._is_python_script = {}
+
+    def can_run(self, command, popen_options):
+        """Check if the command can be executed by the server
+
+        The server runs only tools which are Python scripts and only when
+        the subprocess options are limited to the ones the server can reproduce.
+        """
+        if not is_available():
+            return False
+        if not set(popen_options).issubset(_SUPPORTED_POPEN_OPTIONS):
+            return False
+        for stream in ("stdout", "stderr"):
+            if popen_options.get(stream) not in (None, subprocess.PIPE):
+                return False
+        return (
+            self._find_python_script(command[0], popen_options.get("env")) is not None
+        )
+
+    def _find_python_script(self, name, env):
+        """Return path to the tool if it is a Python script, None otherwise"""
+        path = env.get("PATH") if env else None
+        executable = shutil.which(name, path=path)
+        if not executable:
+            return None
+        if executable not in self._is_python_script:
+            try:
+                with open(executable, "rb") as file:
+                    first_line = file.readline(256)
+            except OSError:
+                first_line = b""
+            self._is_python_script[executable] = first_line.startswith(b"#!") and (
+                b"python" in first_line
+            )
+        if self._is_python_script[executable]:
+            return executable
+        return None
+
+    def _start(self):
+        """Start the server process"""
+        if self._finalizer is not None:
+            # Clean up after a server which ended.
+            self._finalizer()
+        request_read, request_write = os.pipe()
+        response_read, response_write = os.pipe()
+        env = os.environ.copy()
+        # The server needs to be able to import the same packages as this process.
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+        self._process = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "from grass.tools.server import main; main()",
+                str(request_read),
+                str(response_write),
+                *self._preload,
+            ],
+            pass_fds=(request_read, response_write),
+            env=env,
+        )
+        os.close(request_read)
+        os.close(response_write)
+        self._requests = os.fdopen(request_write, "w", encoding="utf-8")
+        # Calls waiting for a previous server are released by its reader thread.
+        self._waiting = {}
+        threading.Thread(
+            target=_read_responses,
+            args=(os.fdopen(response_read, encoding="utf-8"), self._waiting),
+            daemon=True,
+        ).start()
+        if self._tmp_dir is None:
+            self._tmp_dir = tempfile.TemporaryDirectory(prefix="grass_tool_server_")
+        self._finalizer = weakref.finalize(
+            self, _stop_server, self._process, self._requests
+        )
+
+    def run(self, command, input=None, **popen_options):
+        """Run the tool and wait for it to finish
+
+        :param command: list of strings to execute as the command
+        :param input: text or bytes for the standard input of the tool
+        :param **popen_options: subset of options for :py:func:`subprocess.Popen`
+
+        :returns: tuple with return code, standard output, and standard error output
+        """
+        script = self._find_python_script(command[0], popen_options.get("env"))
+        if script is None:
+            msg = f"Tool {command[0]} is not a Python script"
+            raise ValueError(msg)
+        request = {
+            "argv": [script, *command[1:]],
+            "env": dict(popen_options.get("env") or os.environ),
+            "cwd": os.fspath(popen_options.get("cwd") or Path.cwd()),
+        }
+        call = {"event": threading.Event()}
+        files = {}
+        try:
+            with self._lock:
+                if self._process is None or self._process.poll() is not None:
+                    self._start()
+                if input is not None:
+                    fd, files["stdin"] = tempfile.mkstemp(dir=self._tmp_dir.name)
+                    with os.fdopen(fd, "wb") as file:
+                        file.write(gs.encode(input))
+                    request["stdin"] = files["stdin"]
+                for stream in ("stdout", "stderr"):
+                    if popen_options.get(stream) == subprocess.PIPE:
+                        fd, files[stream] = tempfile.mkstemp(dir=self._tmp_dir.name)
+                        os.close(fd)
+                        request[stream] = files[stream]
+                request["id"] = next(self._request_ids)
+                waiting = self._waiting
+                waiting[request["id"]] = call
+                try:
+                    self._requests.write(json.dumps(request) + "\n")
+                    self._requests.flush()
+                except OSError:
+                    waiting.pop(request["id"], None)
+                    raise
+            # The lock is not held while the tool runs, so other calls can run
+            # their tools at the same time.
+            call["event"].wait()
+            if "response" not in call:
+                msg = "Tool server process ended unexpectedly"
+                raise RuntimeError(msg)
+            returncode = call["response"]["returncode"]
+            outputs = {}
+            for stream in ("stdout", "stderr"):
+                if stream in request:
+                    with open(files[stream], "rb") as file:
+                        outputs[stream] = gs.decode(file.read())
+                else:
+                    outputs[stream] = None
+        finally:
+            for path in files.values():
+                os.remove(path)
+        return returncode, outputs["stdout"], outputs["stderr"]
+
+    def close(self):
+        """Stop the server process"""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+                self._finalizer = None
+            if self._tmp_dir is not None:
+                self._tmp_dir.cleanup()
+                self._tmp_dir = None
+            self._process = None
+            self._requests = None
+
+
+def _exit_code(error):
+    """Translate SystemExit to a return code in the same way Python does"""
+    if error.code is None:
+        return 0
+    if isinstance(error.code, int):
+        return error.code
+    print(error.code, file=sys.stderr)
+    return 1
+
+
+def _run_tool(request):
+    """Run the tool script in the current (forked) process and exit"""
+    returncode = 1
+    try:
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        streams = (
+            ("stdin", 0, os.O_RDONLY),
+            ("stdout", 1, os.O_WRONLY),
+            ("stderr", 2, os.O_WRONLY),
+        )
+        for name, target_fd, mode in streams:
+            path = request.get(name)
+            if path:
+                fd = os.open(path, mode)
+                os.dup2(fd, target_fd)
+                os.close(fd)
+        sys.argv = request["argv"]
+        # Exit functions registered by the tool are run explicitly below,
+        # not the ones inherited from the server.
+        atexit._clear()
+        try:
+            runpy.run_path(request["argv"][0], run_name="__main__")
+            returncode = 0
+        except SystemExit as error:
+            returncode = _exit_code(error)
+        except BaseException:  # noqa: BLE001
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            atexit._run_exitfuncs()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+        os._exit(returncode)
+
+
+def _write_finished(children, responses):
+    """Write responses for the tool processes which finished"""
+    while children:
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if not pid:
+            break
+        response = {
+            "id": children.pop(pid),
+            "returncode": os.waitstatus_to_exitcode(status),
+        }
+        responses.write(json.dumps(response) + "\n")
+    responses.flush()
+
+
+def main():
+    """Serve tool run requests (entry point of the server process)
+
+    Each request is run in a forked process right away, so requests sent
+    while other tools are running run concurrently. The response for a request
+    is written when its tool process ends, identified by the request id.
+    """
+    request_fd = int(sys.argv[1])
+    response_fd = int(sys.argv[2])
+    for module in sys.argv[3:]:
+        __import__(module)
+    # Ended tool processes wake up the loop below through the signal wakeup pipe.
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_read, False)
+    os.set_blocking(wakeup_write, False)
+    signal.set_wakeup_fd(wakeup_write)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    # Request ids by process ids of the running tools
+    children = {}
+    pending = b""
+    with (
+        os.fdopen(response_fd, "w", encoding="utf-8") as responses,
+        selectors.DefaultSelector() as selector,
+    ):
+        selector.register(request_fd, selectors.EVENT_READ)
+        selector.register(wakeup_read, selectors.EVENT_READ)
+        reading = True
+        while reading or children:
+            for key, unused in selector.select():
+                if key.fd == wakeup_read:
+                    try:
+                        while os.read(wakeup_read, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    _write_finished(children, responses)
+                    continue
+                data = os.read(request_fd, 65536)
+                if not data:
+                    selector.unregister(request_fd)
+                    reading = False
+                    continue
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    request = json.loads(line)
+                    pid = os.fork()
+                    if pid == 0:
+                        signal.set_wakeup_fd(-1)
+                        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                        selector.close()
+                        for fd in (request_fd, response_fd, wakeup_read, wakeup_write):
+                            os.close(fd)
+                        _run_tool(request)
+                    children[pid] = request["id"]
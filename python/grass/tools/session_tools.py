@@ -14,12 +14,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 import grass.script as gs
 from grass.exceptions import CalledModuleError
 
 from .importexport import ImporterExporter
+from .server import ToolServer
 from .support import ParameterConverter, ToolFunctionResolver, ToolResult
 
 
@@ -244,6 +250,39 @@ class Tools:
     Using NumPy or out-of-project native GRASS raster files, adds computational
     and IO cost, but generally not more than the cost of the same operation done
     directly without the aid of a Tools object.
+
+    Tools written in Python spend a considerable part of each run starting
+    the Python interpreter and importing GRASS packages. With `persistent=True`,
+    these tools are started from a pre-initialized process which is kept running
+    (see :py:mod:`grass.tools.server`), removing most of the startup time
+    of each call. Other tools are executed as usual. Time spent in the calls
+    is available through *call_statistics*:
+
+    >>> tools = Tools(session=session, persistent=True)
+    >>> tools.g_region(flags="p", format="json")["cells"]
+    6
+    >>> tools.call_statistics()  # doctest: +SKIP
+    {'process': {'calls': 1, 'total': 0.0035, 'mean': 0.0035}}
+    >>> tools.cleanup()
+
+    Tools can be also executed asynchronously using *run_async* and *run_cmd_async*
+    which can be awaited in an asyncio event loop. Many independent tool runs can be
+    executed concurrently with *run_batch* (or *run_batch_async*) which takes
+    a list of tool names with parameters and runs at most *max_concurrency* of them
+    at the same time. Each run can have its own environment, e.g., with a different
+    computational region:
+
+    >>> env = session.env.copy()
+    >>> env["GRASS_REGION"] = gs.region_env(rows=4, cols=5, env=session.env)
+    >>> results = tools.run_batch(
+    ...     [
+    ...         ("g.region", {"flags": "p", "format": "json"}),
+    ...         ("g.region", {"flags": "p", "format": "json", "env": env}),
+    ...     ],
+    ...     max_concurrency=2,
+    ... )
+    >>> [result["cells"] for result in results]
+    [6, 20]
     """
 
     def __init__(
@@ -260,6 +299,7 @@ class Tools:
         capture_stderr=None,
         consistent_return_value=False,
         use_cache=None,
+        persistent=False,
     ):
         """
         If session is provided and has an env attribute, it is used to execute tools.
@@ -311,6 +351,11 @@ class Tools:
         explicit `use_cache=True` requires explicit call to *cleanup* to remove
         the data from the current mapset.
 
+        If *persistent* is set to `True`, tools written in Python are executed
+        through a pre-initialized process which is kept running until *cleanup*
+        is called or until the end of the context. Where this is not available
+        (platforms without *fork*), all tools run as separate processes as usual.
+
         If *env* or other *Popen* arguments are provided to one of the tool running
         functions, the constructor parameters except *errors* are ignored.
         """
@@ -338,6 +383,12 @@ class Tools:
         self._delete_on_context_exit = False
         # User request to keep the data.
         self._use_cache = use_cache
+        self._persistent = persistent
+        self._tool_server = None
+        self._call_statistics = {}
+        # Guards state shared by concurrent runs.
+        self._lock = threading.Lock()
+        self._import_export_lock = threading.RLock()
 
     def _modified_env_if_needed(self):
         """Get the environment for subprocesses
@@ -486,44 +537,120 @@ class Tools:
             # Parameters were not processed yet, so process them now.
             parameter_converter = ParameterConverter()
             parameter_converter.process_parameter_list(command[1:])
-        try:
-            # Processing parameters for import and export is costly, so we do it
-            # only when we previously determined there might be such parameters.
-            if parameter_converter.import_export:
-                if self._importer_exporter is None:
-                    # The importer exporter instance may be reused in later calls
-                    # based on how the cache is used.
-                    self._importer_exporter = ImporterExporter(
-                        run_function=self.call, run_cmd_function=self.call_cmd
+        # Runs with external files share the state of the importer-exporter,
+        # so these runs are serialized when running concurrently.
+        if parameter_converter.import_export:
+            lock = self._import_export_lock
+        else:
+            lock = nullcontext()
+        with lock:
+            try:
+                # Processing parameters for import and export is costly, so we do it
+                # only when we previously determined there might be such parameters.
+                if parameter_converter.import_export:
+                    if self._importer_exporter is None:
+                        # The importer exporter instance may be reused in later calls
+                        # based on how the cache is used.
+                        self._importer_exporter = ImporterExporter(
+                            run_function=self.call, run_cmd_function=self.call_cmd
+                        )
+                    command = self._importer_exporter.process_parameter_list(
+                        command, **popen_options
                     )
-                command = self._importer_exporter.process_parameter_list(
-                    command, **popen_options
-                )
-                # The command now has external files replaced with in-project data,
-                # so now we import the data.
-                self._importer_exporter.import_data(env=popen_options["env"])
-            result = self.call_cmd(
-                command,
-                tool_kwargs=tool_kwargs,  # used in error reporting
-                input=input,
-                **popen_options,
-            )
-            if parameter_converter.import_export:
-                # Exporting data inherits the overwrite flag from the command
-                # if provided, otherwise it is driven by the environment.
-                overwrite = None
-                if "--o" in command or "--overwrite" in command:
-                    overwrite = True
-                self._importer_exporter.export_data(
-                    env=popen_options["env"], overwrite=overwrite
+                    # The command now has external files replaced with in-project data,
+                    # so now we import the data.
+                    self._importer_exporter.import_data(env=popen_options["env"])
+                result = self.call_cmd(
+                    command,
+                    tool_kwargs=tool_kwargs,  # used in error reporting
+                    input=input,
+                    **popen_options,
                 )
-        finally:
-            if parameter_converter.import_export:
-                if not self._delete_on_context_exit and not self._use_cache:
-                    # Delete the in-project data after each call.
-                    self._importer_exporter.cleanup(env=popen_options["env"])
+                if parameter_converter.import_export:
+                    # Exporting data inherits the overwrite flag from the command
+                    # if provided, otherwise it is driven by the environment.
+                    overwrite = None
+                    if "--o" in command or "--overwrite" in command:
+                        overwrite = True
+                    self._importer_exporter.export_data(
+                        env=popen_options["env"], overwrite=overwrite
+                    )
+            finally:
+                if parameter_converter.import_export:
+                    if not self._delete_on_context_exit and not self._use_cache:
+                        # Delete the in-project data after each call.
+                        self._importer_exporter.cleanup(env=popen_options["env"])
         return result
 
+    async def run_async(self, tool_name_: str, /, **kwargs):
+        """Run a tool asynchronously by specifying its name and parameters.
+
+        The tool runs in a separate thread, so the event loop is not blocked while
+        the tool is running. The parameters and return value are the same as for
+        the *run* function.
+
+        :param tool_name_: name of a GRASS tool
+        :param kwargs: tool parameters
+        """
+        return await asyncio.to_thread(self.run, tool_name_, **kwargs)
+
+    async def run_cmd_async(self, command: list[str], **popen_options):
+        """Run a tool asynchronously by passing its name and parameters as a list.
+
+        The parameters and return value are the same as for the *run_cmd* function.
+
+        :param command: list of strings to execute as the command
+        :param **popen_options: additional options for :py:func:`subprocess.Popen`
+        """
+        return await asyncio.to_thread(self.run_cmd, command, **popen_options)
+
+    async def run_batch_async(self, calls, *, max_concurrency: int | None = None):
+        """Run independent tool runs concurrently in an asyncio event loop.
+
+        Each item of *calls* is a tool name and a dictionary with its parameters
+        as they would be passed to the *run* function. The parameters may include
+        *env* to run each tool with a different environment, e.g., with a different
+        computational region.
+
+        Results are returned in the order of *calls*. If a run fails and errors
+        are raised, the first exception is raised, but the runs which already
+        started are not interrupted.
+
+        :param calls: iterable of pairs of tool name and dictionary of parameters
+        :param max_concurrency: maximum number of tools running at the same time
+                                (number of CPUs by default)
+        """
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(tool_name, kwargs):
+            async with semaphore:
+                return await self.run_async(tool_name, **kwargs)
+
+        return await asyncio.gather(
+            *(run_one(tool_name, kwargs) for tool_name, kwargs in calls)
+        )
+
+    def run_batch(self, calls, *, max_concurrency: int | None = None) -> list:
+        """Run independent tool runs concurrently and wait for all to finish.
+
+        This is a blocking variant of *run_batch_async* which can be used without
+        an event loop. See *run_batch_async* for details about the parameters.
+
+        :param calls: iterable of pairs of tool name and dictionary of parameters
+        :param max_concurrency: maximum number of tools running at the same time
+                                (number of CPUs by default)
+        """
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.run, tool_name, **kwargs)
+                for tool_name, kwargs in calls
+            ]
+            return [future.result() for future in futures]
+
     def call(self, tool_name_: str, /, **kwargs):
         """Run a tool by specifying its name as a string and parameters.
 
@@ -566,12 +693,21 @@ class Tools:
             popen_options["stdin"] = gs.PIPE
         else:
             popen_options["stdin"] = None
-        process = gs.Popen(
-            command,
-            **popen_options,
-        )
-        stdout, stderr = process.communicate(input=input)
-        returncode = process.poll()
+        start = time.perf_counter()
+        if self._persistent and self._get_tool_server().can_run(command, popen_options):
+            returncode, stdout, stderr = self._tool_server.run(
+                command, input=input, **popen_options
+            )
+            call_type = "server"
+        else:
+            process = gs.Popen(
+                command,
+                **popen_options,
+            )
+            stdout, stderr = process.communicate(input=input)
+            returncode = process.poll()
+            call_type = "process"
+        self._record_call(call_type, time.perf_counter() - start)
         # We don't have the keyword arguments to pass to the resulting object.
         result = ToolResult(
             name=command[0],
@@ -602,6 +738,34 @@ class Tools:
             return None
         return result
 
+    def _get_tool_server(self):
+        """Get the tool server, creating it if needed"""
+        with self._lock:
+            if self._tool_server is None:
+                self._tool_server = ToolServer()
+            return self._tool_server
+
+    def _record_call(self, call_type, seconds):
+        """Add duration of one call to the statistics"""
+        with self._lock:
+            calls, total = self._call_statistics.get(call_type, (0, 0))
+            self._call_statistics[call_type] = (calls + 1, total + seconds)
+
+    def call_statistics(self) -> dict:
+        """Get number of tool calls and time spent in them
+
+        The calls are grouped by the way they were executed, `process` for tools
+        started as new processes and `server` for tools started from
+        the pre-initialized process (see the *persistent* parameter).
+        For each group, the number of calls, total time, and mean time
+        in seconds are provided. For tools doing little computation,
+        the mean time is dominated by the per-call overhead.
+        """
+        return {
+            call_type: {"calls": calls, "total": total, "mean": total / calls}
+            for call_type, (calls, total) in self._call_statistics.items()
+        }
+
     def __getattr__(self, name):
         """Get a function representing a GRASS tool.
 
@@ -638,7 +802,13 @@ class Tools:
         """Exit the context manager context."""
         if not self._use_cache:
             self.cleanup()
+        elif self._tool_server is not None:
+            self._tool_server.close()
+            self._tool_server = None
 
     def cleanup(self):
+        if self._tool_server is not None:
+            self._tool_server.close()
+            self._tool_server = None
         if self._importer_exporter is not None:
             self._importer_exporter.cleanup(env=self._modified_env_if_needed())
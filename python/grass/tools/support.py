@@ -23,8 +23,9 @@ from __future__ import annotations
 
 import json
 import shutil
+from bisect import bisect_left
+from collections import Counter, defaultdict, namedtuple
 from io import StringIO
-from collections import namedtuple
 
 try:
     import numpy as np
@@ -104,11 +105,14 @@ class ParameterConverter:
             self.import_export = False
 
     def translate_objects_to_data(self, kwargs, env):
-        """Convert NumPy arrays to GRASS data"""
+        """Convert NumPy arrays to GRASS data
+
+        The arrays are written to raster maps without an intermediate copy
+        when possible (see :py:func:`grass.script.array.write_raster`).
+        """
         for name, value in self._numpy_inputs.values():
-            map2d = ga.array(env=env)
-            map2d[:] = value
-            map2d.write(name)
+            # Inputs are always double for consistent results of computations.
+            ga.write_raster(value.astype(np.float64, copy=False), name, env=env)
             self.temporary_rasters.append(name)
 
     def translate_data_to_objects(self, kwargs, env):
@@ -116,11 +120,18 @@ class ParameterConverter:
 
         Returns True if there is one or more output arrays, False otherwise.
         The arrays are stored in the *result* attribute.
+
+        Arrays of *grass.script.array.array* type are returned when requested,
+        otherwise the data are read into plain in-memory NumPy arrays without
+        an intermediate file (see :py:func:`grass.script.array.read_raster`).
         """
         output_arrays = []
         output_arrays_dict = {}
-        for name, key, unused in self._numpy_outputs:
-            output_array = ga.array(name, env=env)
+        for name, key, array_type in self._numpy_outputs:
+            if array_type is ga.array:
+                output_array = ga.array(name, env=env)
+            else:
+                output_array = ga.read_raster(name, env=env)
             output_arrays.append(output_array)
             output_arrays_dict[key] = output_array
             self.temporary_rasters.append(name)
@@ -138,11 +149,130 @@ class ParameterConverter:
         return False
 
 
+def bounded_levenshtein_distance(text1: str, text2: str, limit: int) -> int:
+    """Return the Levenshtein distance or *limit* + 1 if it is larger than *limit*
+
+    The computation stops as soon as the distance cannot be within the limit.
+    """
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    if len(text1) - len(text2) > limit:
+        return limit + 1
+
+    previous_row = list(range(len(text2) + 1))
+    for i, char1 in enumerate(text1):
+        current_row = [i + 1]
+        for j, char2 in enumerate(text2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (char1 != char2)
+            current_row.append(min(insertions, deletions, substitutions))
+        if min(current_row) > limit:
+            return limit + 1
+        previous_row = current_row
+
+    return min(previous_row[-1], limit + 1)
+
+
+class ToolNameIndex:
+    """Index of tool names for lookups by name or prefix and for suggestions
+
+    Names are stored in the form used for functions, i.e., with underscores
+    instead of dots. For suggestions, the edit distance is computed only for names
+    with a length close enough to the text.
+    """
+
+    def __init__(self, names):
+        """
+        :param names: dotted tool names
+        """
+        self.source = frozenset(names)
+        self._names = sorted(name.replace(".", "_") for name in self.source)
+        self._name_set = frozenset(self._names)
+        self._names_by_length = defaultdict(list)
+        for name in self._names:
+            self._names_by_length[len(name)].append((name, Counter(name)))
+
+    def __contains__(self, name):
+        return name in self._name_set
+
+    def __len__(self):
+        return len(self._names)
+
+    def names(self, prefix=None):
+        """Return sorted names, optionally only names starting with a prefix"""
+        if not prefix:
+            return list(self._names)
+        start = bisect_left(self._names, prefix)
+        end = start
+        while end < len(self._names) and self._names[end].startswith(prefix):
+            end += 1
+        return self._names[start:end]
+
+    def suggest(self, text, max_suggestions=5, prefix=None):
+        """Return names similar to the text sorted alphabetically
+
+        The names with an edit distance smaller than half of the length of
+        the text are considered and at most *max_suggestions* closest names
+        are returned.
+        """
+        text = text.replace(".", "_")
+        text_counts = Counter(text)
+        # Largest distance which is smaller than half of the text length
+        limit = (len(text) - 1) // 2
+        candidates = []
+        # Names with the length of the text are likely the closest, so they are
+        # tried first and the limit is lowered once there are enough candidates
+        lengths = sorted(
+            range(len(text) - limit, len(text) + limit + 1),
+            key=lambda length: abs(length - len(text)),
+        )
+        for length in lengths:
+            if abs(length - len(text)) > limit:
+                break
+            for name, counts in self._names_by_length.get(length, ()):
+                if prefix and not name.startswith(prefix):
+                    continue
+                # Each edit changes at most one character in each of the texts,
+                # so the difference of character counts is a lower bound
+                if (
+                    max((text_counts - counts).total(), (counts - text_counts).total())
+                    > limit
+                ):
+                    continue
+                distance = bounded_levenshtein_distance(text, name, limit)
+                if distance <= limit:
+                    candidates.append((distance, name))
+                    if len(candidates) >= max_suggestions:
+                        candidates.sort()
+                        # Keep ties with the last candidate for alphabetical order
+                        limit = candidates[max_suggestions - 1][0]
+        candidates.sort()
+        return sorted(name for unused, name in candidates[:max_suggestions])
+
+
+# Index shared by all resolvers, rebuilt when the available tools change
+_tool_name_index = None
+
+
+def get_tool_name_index(env=None):
+    """Return an index of the names of the available tools
+
+    The index is shared and built again only when the list of tools changes.
+    """
+    global _tool_name_index  # pylint: disable=global-statement
+    names = gs.get_commands(env=env)[0]
+    if _tool_name_index is None or _tool_name_index.source != names:
+        _tool_name_index = ToolNameIndex(names)
+    return _tool_name_index
+
+
 class ToolFunctionResolver:
     def __init__(self, *, run_function, env, allowed_prefix=None):
         self._run_function = run_function
         self._env = env
-        self._names = None
+        if allowed_prefix:
+            allowed_prefix = allowed_prefix.replace(".", "_")
         self._allowed_prefix = allowed_prefix
 
     def get_tool_name(self, name, exception_type):
@@ -154,9 +284,9 @@ class ToolFunctionResolver:
         # We first try to find the tool on path which is much faster than getting
         # and checking the names, but if the tool is not found, likely because runtime
         # is not set up, we check the names.
-        if (
-            not shutil.which(tool_name, path=self._env["PATH"])
-            and name not in self.names()
+        if not shutil.which(tool_name, path=self._env["PATH"]) and not (
+            name in get_tool_name_index(env=self._env)
+            and (not self._allowed_prefix or name.startswith(self._allowed_prefix))
         ):
             suggestions = self.suggest_tools(tool_name)
             if suggestions:
@@ -196,55 +326,23 @@ class ToolFunctionResolver:
 
     @staticmethod
     def levenshtein_distance(text1: str, text2: str) -> int:
-        if len(text1) < len(text2):
-            return ToolFunctionResolver.levenshtein_distance(text2, text1)
-
-        if len(text2) == 0:
-            return len(text1)
-
-        previous_row = list(range(len(text2) + 1))
-        for i, char1 in enumerate(text1):
-            current_row = [i + 1]
-            for j, char2 in enumerate(text2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (char1 != char2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        return bounded_levenshtein_distance(text1, text2, max(len(text1), len(text2)))
 
     def suggest_tools(self, text):
         """Suggest matching tool names based on provided text.
 
-        The first five tools matching the condition are returned,
-        so this always returns at most five names, but it may not be the best matches.
+        At most five tools with the smallest edit distance to the text are
+        returned, considering only tools with the distance smaller than half
+        of the length of the text.
         The returned names are sorted alphabetically (not by priority).
         This specific behavior may change in the future versions.
         """
-        result = []
-        max_suggestions = 5
-        for name in self.names():
-            if ToolFunctionResolver.levenshtein_distance(text, name) < len(text) / 2:
-                result.append(name)
-            if len(result) >= max_suggestions:
-                break
-        result.sort()
-        return result
+        return get_tool_name_index(env=self._env).suggest(
+            text, prefix=self._allowed_prefix
+        )
 
     def names(self):
-        if self._names:
-            return self._names
-        if self._allowed_prefix:
-            dotted_allow_prefix = self._allowed_prefix.replace("_", ".")
-        else:
-            dotted_allow_prefix = None
-        self._names = [
-            name.replace(".", "_")
-            for name in gs.get_commands()[0]
-            if not dotted_allow_prefix or name.startswith(dotted_allow_prefix)
-        ]
-        return self._names
+        return get_tool_name_index(env=self._env).names(prefix=self._allowed_prefix)
 
 
 class ToolResult:
@@ -1,13 +1,17 @@
 """Test grass.tools.Tools class"""
 
+import asyncio
 import io
 import os
+import sys
+import threading
 
 import pytest
 
 import grass.script as gs
 from grass.experimental.mapset import TemporaryMapsetSession
 from grass.tools import Tools, ToolError
+from grass.tools.server import ToolServer, is_available
 
 
 has_pandas = False
@@ -946,3 +950,120 @@ def test_tool_doc_access_python_tools():
     tools = Tools()
     assert tools.g_search_modules.__doc__
     assert tools.r_mask.__doc__
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Tool server requires fork")
+def test_persistent_python_tool(xy_dataset_session):
+    """Check Python tools run through the tool server give the same results"""
+    tools = Tools(session=xy_dataset_session)
+    expected = tools.g_search_modules(keyword="slope", flags="g").text
+    with Tools(session=xy_dataset_session, persistent=True) as persistent_tools:
+        assert persistent_tools.g_search_modules(keyword="slope", flags="g").text == (
+            expected
+        )
+        persistent_tools.g_region(rows=2, cols=3)
+        persistent_tools.r_mapcalc_simple(expression="A + 1", a=1, output="simple")
+        assert persistent_tools.r_info(map="simple", format="json")["cells"] == 6
+        statistics = persistent_tools.call_statistics()
+    assert statistics["server"]["calls"] == 2
+    assert statistics["process"]["calls"] == 2
+    assert statistics["server"]["mean"] > 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Tool server requires fork")
+def test_persistent_python_tool_error(xy_dataset_session):
+    """Check errors from Python tools run through the tool server are raised"""
+    with Tools(session=xy_dataset_session, persistent=True) as tools:
+        with pytest.raises(ToolError, match="does_not_exist"):
+            tools.r_mapcalc_simple(expression="A", a="does_not_exist", output="out")
+        # Works after errors as usual.
+        assert tools.g_search_modules(keyword="slope", flags="g").text
+        assert tools.call_statistics()["server"]["calls"] == 2
+
+
+@pytest.mark.skipif(not is_available(), reason="Tool server requires os.fork")
+def test_tool_server_concurrent_calls(tmp_path):
+    """Check that calls from multiple threads run their tools concurrently"""
+    # Each tool creates one file and waits for the other one, so the calls
+    # succeed only when both tools run at the same time.
+    code = (
+        "import pathlib, sys, time\n"
+        "pathlib.Path(sys.argv[1]).touch()\n"
+        "for i in range(200):\n"
+        "    if pathlib.Path(sys.argv[2]).exists():\n"
+        "        sys.exit(0)\n"
+        "    time.sleep(0.05)\n"
+        "sys.exit(1)\n"
+    )
+    path = tmp_path / "touch_and_wait"
+    path.write_text(f"#!{sys.executable}\n{code}")
+    path.chmod(0o755)
+    env = os.environ.copy()
+    env["PATH"] = os.pathsep.join([str(tmp_path), env["PATH"]])
+    first = str(tmp_path / "first")
+    second = str(tmp_path / "second")
+    server = ToolServer(preload=[])
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(
+            first=server.run(["touch_and_wait", first, second], env=env)
+        )
+    )
+    try:
+        thread.start()
+        assert server.run(["touch_and_wait", second, first], env=env) == (
+            0,
+            None,
+            None,
+        )
+        thread.join()
+    finally:
+        server.close()
+    assert results["first"] == (0, None, None)
+
+
+def test_run_async(xy_dataset_session):
+    """Check that a tool can be awaited and returns the usual result"""
+    tools = Tools(session=xy_dataset_session)
+    tools.g_region(rows=2, cols=3)
+
+    async def main():
+        result = await tools.run_async("g.region", flags="p", format="json")
+        no_output = await tools.run_async("g.region", rows=3)
+        cmd_result = await tools.run_cmd_async(["g.region", "-p", "format=json"])
+        return result, no_output, cmd_result
+
+    result, no_output, cmd_result = asyncio.run(main())
+    assert result["cells"] == 6
+    assert no_output is None
+    assert cmd_result["cells"] == 9
+
+
+def test_run_batch_with_different_regions(xy_dataset_session):
+    """Check that batch runs use their own environments and keep the order"""
+    tools = Tools(session=xy_dataset_session)
+    tools.g_region(rows=2, cols=3)
+    calls = []
+    for rows in range(1, 9):
+        env = xy_dataset_session.env.copy()
+        env["GRASS_REGION"] = gs.region_env(rows=rows, env=xy_dataset_session.env)
+        calls.append(("g.region", {"flags": "p", "format": "json", "env": env}))
+    results = tools.run_batch(calls, max_concurrency=3)
+    assert [result["cells"] for result in results] == [rows * 3 for rows in range(1, 9)]
+    results = asyncio.run(tools.run_batch_async(calls, max_concurrency=3))
+    assert [result["rows"] for result in results] == list(range(1, 9))
+    # The current region is not modified.
+    assert tools.g_region(flags="p", format="json")["cells"] == 6
+
+
+def test_run_batch_raises(xy_dataset_session):
+    """Check that a failed run in a batch raises"""
+    tools = Tools(session=xy_dataset_session)
+    calls = [
+        ("g.region", {"flags": "p"}),
+        ("g.mapset", {"mapset": "does_not_exist"}),
+    ]
+    with pytest.raises(ToolError, match="does_not_exist"):
+        tools.run_batch(calls, max_concurrency=2)
+    with pytest.raises(ToolError, match="does_not_exist"):
+        asyncio.run(tools.run_batch_async(calls))
@@ -4,7 +4,11 @@ import os
 
 import pytest
 
-from grass.tools.support import ToolFunctionResolver
+from grass.tools.support import (
+    ToolFunctionResolver,
+    ToolNameIndex,
+    bounded_levenshtein_distance,
+)
 
 
 class CustomException(Exception):
@@ -115,3 +119,31 @@ def test_allowed_prefix_d_with_underscore():
         assert resolver.r_info
     with pytest.raises(TypeError, match="r_info"):
         assert resolver.get_function("r_info", exception_type=TypeError)
+
+
+def test_levenshtein_distance():
+    assert ToolFunctionResolver.levenshtein_distance("r_info", "v_info") == 1
+    assert ToolFunctionResolver.levenshtein_distance("kitten", "sitting") == 3
+    assert bounded_levenshtein_distance("kitten", "sitting", 2) == 3
+    assert bounded_levenshtein_distance("r_info", "r_mapcalc", 1) == 2
+
+
+def test_tool_name_index():
+    """Check lookups and suggestions of the tool name index"""
+    index = ToolNameIndex(
+        ["db.univar", "r.univar", "r3.univar", "v.univar", "v.db.univar", "v.info"]
+    )
+    assert "v_info" in index
+    assert "v.info" not in index
+    assert index.names(prefix="v_") == ["v_db_univar", "v_info", "v_univar"]
+    assert index.names(prefix="r") == ["r3_univar", "r_univar"]
+    assert index.suggest("db.v.univar") == [
+        "db_univar",
+        "r3_univar",
+        "r_univar",
+        "v_db_univar",
+        "v_univar",
+    ]
+    assert index.suggest("db.v.univar", max_suggestions=2) == ["db_univar", "v_univar"]
+    assert index.suggest("db.v.univar", prefix="v_") == ["v_db_univar", "v_univar"]
+    assert index.suggest("g.region") == []
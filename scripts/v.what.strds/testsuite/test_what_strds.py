@@ -81,6 +81,25 @@ class TestWhatStrds(TestCase):
 1|100|200|300|400
 2|100|200|300|400
 3|100|200|300|400
+"""
+        self.assertMultiLineEqual(output, decode(db_sel.outputs.stdout))
+
+    def test_where_nprocs(self):
+        self.assertModule(
+            "v.what.strds",
+            input="points",
+            strds="A",
+            output="what_strds",
+            where="cat = 2",
+            nprocs=2,
+            overwrite=True,
+        )
+        db_sel = SimpleModule("v.db.select", map="what_strds")
+        self.assertModule(db_sel)
+        output = """cat|A_2001_01_01|A_2001_04_01|A_2001_07_01|A_2001_10_01
+1||||
+2|100|200|300|400
+3||||
 """
         self.assertMultiLineEqual(output, decode(db_sel.outputs.stdout))
 
@@ -43,15 +43,29 @@
 # % key: t_where
 # %end
 
+# %option
+# % key: nprocs
+# % type: integer
+# % description: Number of processes to run in parallel
+# % required: no
+# % multiple: no
+# % answer: 1
+# %end
+
 # %flag
 # % key: u
 # % label: Update attribute table of input vector map
 # % description: Instead of creating a new vector map update the attribute table with value(s)
 # %end
 
+from itertools import islice
+
 import grass.script as gs
 from grass.exceptions import CalledModuleError
 
+# Number of raster maps which are written to the table in one transaction
+COLUMNS_PER_TRANSACTION = 100
+
 ############################################################################
 
 
@@ -105,6 +119,7 @@ def main():
     strds = options["strds"]
     where = options["where"]
     tempwhere = options["t_where"]
+    nprocs = int(options["nprocs"])
 
     if output and flags["u"]:
         gs.fatal(_("Cannot combine 'output' option and 'u' flag"))
@@ -118,13 +133,6 @@ def main():
     if where in {"", " ", "\n"}:
         where = None
 
-    overwrite = gs.overwrite()
-
-    quiet = True
-
-    if gs.verbosity() > 2:
-        quiet = False
-
     # Check the number of sample strds and the number of columns
     strds_names = strds.split(",")
 
@@ -218,9 +226,6 @@ def main():
     else:
         output = input
 
-    msgr = Messenger()
-    perc_curr = 0
-    perc_tot = len(samples)
     pymap = Vector(output)
     try:
         pymap.open("r")
@@ -238,55 +243,51 @@ def main():
     if pymap.is_open():
         pymap.close()
 
+    # The points are read and converted to cells of the region once,
+    # all raster maps are sampled at these cells
+    name, unused, mapset = output.partition("@")
+    cats, east, north = tgis.read_vector_points(name, mapset, layer=1)
+    sampler = tgis.PointSampler(east, north)
+
+    columns = []
     for sample in samples:
-        raster_names = sample.raster_names
-        # Call v.what.rast for each raster map
-
-        for name in raster_names:
-            coltype = "DOUBLE PRECISION"
-            # Get raster map type
-            raster_map = tgis.RasterDataset(name)
-            raster_map.load()
-            if raster_map.metadata.get_datatype() == "CELL":
-                coltype = "INT"
-            day = sample.printDay()
-            column_name = "%s_%s" % (sample.strds_name, day)
-            column_string = "%s %s" % (column_name, coltype)
-            column_string.replace(".", "_")
-            try:
-                gs.run_command(
-                    "v.db.addcolumn",
-                    map=output,
-                    column=column_string,
-                    overwrite=overwrite,
-                )
-            except CalledModuleError:
-                dbif.close()
-                gs.fatal(
-                    _("Unable to add column %s to vector map <%s> ")
-                    % (column_string, output)
+        for name in sample.raster_names:
+            column_name = "%s_%s" % (sample.strds_name, sample.printDay())
+            columns.append((column_name, name))
+    values = sampler.sample([name for unused, name in columns], nprocs)
+
+    msgr = Messenger()
+    pymap.open("r")
+    # Errors of the database driver, e.g., when adding the columns
+    # or committing, are not converted to ValueError by pygrass
+    db_error = getattr(pymap.table.conn, "Error", ValueError)
+    try:
+        # The values of several maps are written in one transaction
+        for start in range(0, len(columns), COLUMNS_PER_TRANSACTION):
+            chunk = columns[start : start + COLUMNS_PER_TRANSACTION]
+            chunk_values = [
+                (column_name, map_values)
+                for (column_name, unused), (unused, map_values) in zip(
+                    chunk, islice(values, len(chunk)), strict=True
                 )
+            ]
             try:
-                gs.run_command(
-                    "v.what.rast",
-                    map=output,
-                    raster=name,
-                    column=column_name,
+                tgis.write_sampled_columns(
+                    pymap.table,
+                    cats,
+                    chunk_values,
+                    valid=sampler.rows >= 0,
                     where=where,
-                    quiet=quiet,
                 )
-            except CalledModuleError:
+            except (TypeError, ValueError, db_error) as error:
                 dbif.close()
                 gs.fatal(
-                    _(
-                        "Unable to run v.what.rast for vector map"
-                        " <%s> and raster map <%s>"
-                    )
-                    % (output, str(raster_names))
+                    _("Unable to write the values to vector map <%s>: %s")
+                    % (output, error)
                 )
-
-        msgr.percent(perc_curr, perc_tot, 1)
-        perc_curr += 1
+            msgr.percent(start + len(chunk), len(columns), 1)
+    finally:
+        pymap.close()
 
     dbif.close()
 
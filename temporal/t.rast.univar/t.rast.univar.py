@@ -68,8 +68,15 @@
 # % multiple: no
 # %end
 
+# %option G_OPT_F_FORMAT
+# % options: plain,csv,json
+# % descriptions: plain;Plain text output;csv;CSV (Comma Separated Values);json;JSON (JavaScript Object Notation)
+# % guisection: Formatting
+# %end
+
 # %option G_OPT_F_SEP
 # % label: Field separator character between the output columns
+# % answer: {NULL}
 # % guisection: Formatting
 # %end
 
@@ -116,6 +123,7 @@ def main():
     no_header = flags["u"]
     rast_region = bool(flags["r"])
     separator = gs.separator(options["separator"])
+    output_format = options["format"]
     percentile = None
     if options["percentile"]:
         try:
@@ -126,6 +134,11 @@ def main():
                     options["percentile"]
                 )
             )
+    if output_format == "json" and no_header:
+        gs.fatal(_("Column names are always included in the JSON output"))
+    if not separator:
+        separator = "," if output_format == "csv" else "|"
+
     # Make sure the temporal database exists
     tgis.init()
 
@@ -150,6 +163,7 @@ def main():
         rast_region=rast_region,
         region_relation=region_relation,
         nprocs=nprocs,
+        output_format=output_format,
     )
 
 
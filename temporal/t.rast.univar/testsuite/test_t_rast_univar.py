@@ -8,10 +8,13 @@ for details.
 @author Soeren Gebbert
 """
 
+import json
 from pathlib import Path
 
+import grass.script as gs
 from grass.gunittest.case import TestCase
 from grass.gunittest.gmodules import SimpleModule
+from grass.temporal.univar_statistics import _parse_univar_output
 
 
 class TestRasterUnivar(TestCase):
@@ -549,6 +552,146 @@ d_1@stbl||2001-01-01 00:00:00|2001-04-01 00:00:00|100|100|100|100|0|0|0|960000|2
                 res_line = res.split("|", 1)[1]
                 self.assertLooksLike(ref_line, res_line)
 
+    def test_csv_format(self):
+        """Test the CSV output"""
+        t_rast_univar = SimpleModule(
+            "t.rast.univar",
+            input="B.S2_B1",
+            where="start_time >= '2001-01-01'",
+            format="csv",
+            overwrite=True,
+            verbose=True,
+        )
+        self.runModule("g.region", **self.default_region, res=1)
+        self.assertModule(t_rast_univar)
+
+        lines = t_rast_univar.outputs.stdout.splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[0].startswith('"id","semantic_label","start","end"'))
+        self.assertEqual(
+            lines[1].split(",", 4)[4],
+            "110.0,110.0,110.0,110.0,0.0,0.0,0.0,1056000.0,0,9600,9600",
+        )
+
+    def test_json_format(self):
+        """Test the JSON output with extended statistics"""
+        t_rast_univar = SimpleModule(
+            "t.rast.univar",
+            flags="e",
+            input="B.S2_B1",
+            where="start_time >= '2001-01-01'",
+            percentile=[10.0, 97.5],
+            format="json",
+            nprocs=2,
+            overwrite=True,
+            verbose=True,
+        )
+        self.runModule("g.region", **self.default_region, res=1)
+        self.assertModule(t_rast_univar)
+
+        result = json.loads(t_rast_univar.outputs.stdout)
+        self.assertEqual(
+            result["metadata"]["column_names"][-2:],
+            ["percentile_10", "percentile_97_5"],
+        )
+        self.assertEqual(len(result["data"]), 4)
+        self.assertEqual(result["data"][1]["id"].split("@")[0], "b_2")
+        self.assertEqual(result["data"][1]["semantic_label"], "S2_B1")
+        self.assertEqual(result["data"][1]["start"], "2001-04-01 00:00:00")
+        self.assertEqual(result["data"][1]["sum"], 2112000)
+        self.assertEqual(result["data"][1]["percentile_97_5"], 220)
+
+    def test_same_as_r_univar(self):
+        """Test that the statistics of maps with null cells and floating point
+        values are the same as computed by r.univar
+        """
+        self.runModule("g.region", **self.default_region, res=1)
+        self.runModule(
+            "r.mapcalc",
+            expression="e_1 = if(row() < 3, null(), sin(row() * col()) * 100)",
+            overwrite=True,
+        )
+        self.runModule("r.mapcalc", expression="e_2 = float(e_1)", overwrite=True)
+        self.runModule(
+            "t.create",
+            type="strds",
+            temporaltype="absolute",
+            output="E",
+            title="E test",
+            description="E test",
+            overwrite=True,
+        )
+        self.runModule(
+            "t.register",
+            flags="i",
+            type="raster",
+            input="E",
+            maps="e_1,e_2",
+            start="2001-01-01",
+            increment="3 months",
+            overwrite=True,
+        )
+        t_rast_univar = SimpleModule(
+            "t.rast.univar",
+            flags="e",
+            input="E",
+            zones="zones",
+            percentile=[10.0, 97.5],
+            format="json",
+            overwrite=True,
+            verbose=True,
+        )
+        self.assertModule(t_rast_univar)
+        result = json.loads(t_rast_univar.outputs.stdout)["data"]
+
+        expected = []
+        for name in ["e_1", "e_2"]:
+            output = gs.read_command(
+                "r.univar", map=name, zones="zones", flags="ge", percentile=[10, 97.5]
+            )
+            expected.extend(_parse_univar_output(output))
+        self.assertEqual(len(result), len(expected))
+        for row, reference in zip(result, expected, strict=True):
+            self.assertEqual(row["zone"], reference["zone"])
+            # Compare with the precision of the quartiles printed by r.univar
+            for key in ["mean", "min", "max", "stddev", "median", "percentile_97_5"]:
+                self.assertEqual(f"{row[key]:g}", f"{reference[key]:g}", msg=key)
+            self.assertEqual(row["null_cells"], reference["null_cells"])
+        self.runModule("t.remove", flags="df", type="strds", inputs="E")
+
+    def test_large_cell_values(self):
+        """Test that the sum of squares of large CELL values does not overflow"""
+        # Sum of squares over 9.2e18 in one band of rows
+        self.runModule("g.region", **self.default_region, res=0.5)
+        self.runModule(
+            "r.mapcalc", expression="l_1 = 20010101 + col() % 2", overwrite=True
+        )
+        self.runModule(
+            "t.create",
+            type="strds",
+            temporaltype="absolute",
+            output="L",
+            title="L test",
+            description="L test",
+            overwrite=True,
+        )
+        self.runModule(
+            "t.register",
+            type="raster",
+            input="L",
+            maps="l_1",
+            start="2001-01-01",
+            overwrite=True,
+        )
+        t_rast_univar = SimpleModule(
+            "t.rast.univar", input="L", format="json", overwrite=True, verbose=True
+        )
+        self.assertModule(t_rast_univar)
+        row = json.loads(t_rast_univar.outputs.stdout)["data"][0]
+        self.assertAlmostEqual(row["mean"], 20010101.5)
+        self.assertAlmostEqual(row["variance"], 0.25)
+        self.assertAlmostEqual(row["stddev"], 0.5)
+
 
 if __name__ == "__main__":
     from grass.gunittest.main import test
@@ -82,7 +82,7 @@
 # %option
 # % key: nprocs
 # % type: integer
-# % description: Number of r.what processes to run in parallel
+# % description: Number of processes to run in parallel
 # % required: no
 # % multiple: no
 # % answer: 1
@@ -103,18 +103,20 @@
 # % description: Show the category for vector points map
 # %end
 
-import copy
 import sys
 from contextlib import nullcontext
+from itertools import islice
 
 import grass.script as gs
 
+# Number of maps which are transformed into the output layout together
+MAPS_PER_CHUNK = 400
+
 ############################################################################
 
 
 def main(options, flags):
     # lazy imports
-    import grass.pygrass.modules as pymod
     import grass.temporal as tgis
 
     # Get the options
@@ -137,8 +139,6 @@ def main(options, flags):
     # output_color = flags["r"]
     # output_cat = flags["i"]
 
-    overwrite = gs.overwrite()
-
     if coordinates and points:
         gs.fatal(_("Options coordinates and points are mutually exclusive"))
 
@@ -177,150 +177,53 @@ def main(options, flags):
     if not maps:
         gs.fatal(_("Space time raster dataset <%s> is empty") % sp.get_id())
 
-    # Setup flags are disabled due to test issues
-    flags = ""
-    # if output_cat_label is True:
-    #    flags += "f"
-    # if output_color is True:
-    #    flags += "r"
-    # if output_cat is True:
-    #    flags += "i"
-    if vcat is True:
-        flags += "v"
-
-    # Configure the r.what module
+    # The leading columns of each point as written by r.what:
+    # the optional category, the coordinates and the site name
     if points:
-        r_what = pymod.Module(
-            "r.what",
-            map="dummy",
-            output="dummy",
-            run_=False,
-            separator=separator,
-            points=points,
-            overwrite=overwrite,
-            flags=flags,
-            null_value=null_value,
-            quiet=True,
-        )
+        name, unused, mapset = points.partition("@")
+        cats, east, north = tgis.read_vector_points(name, mapset)
+        prefixes = [
+            [f"{x:.15g}", f"{y:.15g}", ""]
+            for x, y in zip(east.tolist(), north.tolist(), strict=True)
+        ]
+        if vcat:
+            for prefix, cat in zip(prefixes, cats.tolist(), strict=True):
+                prefix.insert(0, str(cat))
     elif coordinates:
-        # Create a list of values
         coord_list = coordinates.split(",")
-        r_what = pymod.Module(
-            "r.what",
-            map="dummy",
-            output="dummy",
-            run_=False,
-            separator=separator,
-            coordinates=coord_list,
-            overwrite=overwrite,
-            flags=flags,
-            null_value=null_value,
-            quiet=True,
-        )
-    elif use_stdin:
-        r_what = pymod.Module(
-            "r.what",
-            map="dummy",
-            output="dummy",
-            run_=False,
-            separator=separator,
-            stdin_=coordinates_stdin,
-            overwrite=overwrite,
-            flags=flags,
-            null_value=null_value,
-            quiet=True,
-        )
+        if len(coord_list) % 2:
+            gs.fatal(_("Two coordinates (east north) required for each point"))
+        prefixes = [
+            [x, y, ""] for x, y in zip(coord_list[::2], coord_list[1::2], strict=True)
+        ]
+        prefixes, east, north = parse_coordinates(prefixes)
     else:
-        gs.error(_("Please specify points or coordinates"))
-
-    nprocs = min(len(maps), nprocs)
-
-    # The module queue for parallel execution
-    process_queue = pymod.ParallelModuleQueue(int(nprocs))
-    num_maps = len(maps)
-
-    # 400 Maps is the absolute maximum in r.what
-    # We need to determie the number of maps that can be processed
-    # in parallel
-
-    # First estimate the number of maps per process. We use 400 maps
-    # simultaneously as maximum for a single process
-
-    num_loops = int(num_maps / (400 * nprocs))
-    remaining_maps = num_maps % (400 * nprocs)
-
-    if num_loops == 0:
-        num_loops = 1
-        remaining_maps = 0
-
-    # Compute the number of maps for each process
-    maps_per_loop = int((num_maps - remaining_maps) / num_loops)
-    maps_per_process = int(maps_per_loop / nprocs)
-    remaining_maps_per_loop = maps_per_loop % nprocs
-
-    # We put the output files in an ordered list
-    output_files = []
-    output_time_list = []
-
-    count = 0
-    for loop in range(num_loops):
-        file_name = gs.tempfile() + "_%i" % (loop)
-        count = process_loop(
-            nprocs,
-            maps,
-            file_name,
-            count,
-            maps_per_process,
-            remaining_maps_per_loop,
-            output_files,
-            output_time_list,
-            r_what,
-            process_queue,
-        )
+        prefixes = []
+        for line in coordinates_stdin.splitlines():
+            fields = line.split(None, 2)
+            if not fields:
+                # skip blank lines
+                continue
+            if len(fields) < 2:
+                gs.warning(
+                    _("Two coordinates (east north) required, line skipped: %s") % line
+                )
+                continue
+            prefixes.append([*fields[:2], fields[2] if len(fields) > 2 else ""])
+        prefixes, east, north = parse_coordinates(prefixes)
 
-    process_queue.wait()
-
-    gs.verbose(
-        "Number of raster map layers remaining for sampling %i" % (remaining_maps)
-    )
-    if remaining_maps > 0:
-        # Use a single process if less then 100 maps
-        if remaining_maps <= 100:
-            map_names = []
-            for i in range(remaining_maps):
-                map = maps[count]
-                map_names.append(map.get_id())
-                count += 1
-            mod = copy.deepcopy(r_what)
-            mod(map=map_names, output=file_name)
-            process_queue.put(mod)
-        else:
-            maps_per_process = int(remaining_maps / nprocs)
-            remaining_maps_per_loop = remaining_maps % nprocs
-
-            file_name = "out_remain"
-            process_loop(
-                nprocs,
-                maps,
-                file_name,
-                count,
-                maps_per_process,
-                remaining_maps_per_loop,
-                output_files,
-                output_time_list,
-                r_what,
-                process_queue,
-            )
+    if not prefixes:
+        gs.fatal(_("No points found to sample"))
 
-    # Wait for unfinished processes
-    process_queue.wait()
+    # The coordinates are converted to cells once for all maps
+    sampler = tgis.PointSampler(east, north)
+    chunks = sample_chunks(sampler, maps, prefixes, null_value, nprocs)
 
-    # Out the output files in the correct order together
+    # Write the output in the requested layout
     if layout == "row":
         one_point_per_row_output(
             separator,
-            output_files,
-            output_time_list,
+            chunks,
             output,
             write_header,
             site_input,
@@ -329,8 +232,7 @@ def main(options, flags):
     elif layout == "col":
         one_point_per_col_output(
             separator,
-            output_files,
-            output_time_list,
+            chunks,
             output,
             write_header,
             site_input,
@@ -339,8 +241,7 @@ def main(options, flags):
     else:
         one_point_per_timerow_output(
             separator,
-            output_files,
-            output_time_list,
+            chunks,
             output,
             write_header,
             site_input,
@@ -351,9 +252,75 @@ def main(options, flags):
 ############################################################################
 
 
-def one_point_per_row_output(
-    separator, output_files, output_time_list, output, write_header, site_input, vcat
-):
+def parse_coordinates(prefixes):
+    """Convert the coordinate strings of the points to numbers
+
+    The coordinates are parsed like in r.what, so latitude-longitude
+    coordinates can be given in degrees, minutes and seconds.
+    Points with invalid coordinates are skipped with a warning.
+
+    :return: A tuple of the valid prefixes, the eastings and the northings
+    """
+    # lazy imports
+    import grass.temporal as tgis
+
+    valid = []
+    east = []
+    north = []
+    for prefix in prefixes:
+        coordinates = tgis.scan_coordinates(prefix[0], prefix[1])
+        if coordinates is None:
+            gs.warning(
+                _("Invalid coordinate(s), point skipped: %s") % " ".join(prefix[:2])
+            )
+            continue
+        valid.append(prefix)
+        east.append(coordinates[0])
+        north.append(coordinates[1])
+    return valid, east, north
+
+
+############################################################################
+
+
+def sample_chunks(sampler, maps, prefixes, null_value, nprocs):
+    """Sample the maps at the points and yield the results in chunks of maps
+
+    Each chunk is a tuple of the list of maps and a matrix with one row per
+    point, which contains the leading columns of the point and the values of
+    the maps like a line of the r.what output.
+    """
+    # lazy imports
+    import grass.temporal as tgis
+
+    samples = sampler.sample([map.get_id() for map in maps], nprocs)
+    for start in range(0, len(maps), MAPS_PER_CHUNK):
+        map_list = maps[start : start + MAPS_PER_CHUNK]
+        gs.verbose(
+            _("Process maps %(samp_start)i to %(samp_end)i (of %(total)i)")
+            % (
+                {
+                    "samp_start": start + 1,
+                    "samp_end": start + len(map_list),
+                    "total": len(maps),
+                }
+            )
+        )
+        columns = [
+            tgis.format_sampled_values(values, null_value)
+            for unused, values in islice(samples, len(map_list))
+        ]
+        matrix = [
+            prefix + list(values)
+            for prefix, values in zip(prefixes, zip(*columns, strict=True), strict=True)
+        ]
+        yield map_list, matrix
+
+
+############################################################################
+
+
+def one_point_per_row_output(separator, chunks, output, write_header, site_input, vcat):
     """Write one point per row
     output is of type: x,y,start,end,value
     """
@@ -369,68 +336,59 @@ def one_point_per_row_output(
                 out_str += "x{sep}y{sep}start{sep}end{sep}value\n"
             out_file.write(out_str.format(sep=separator))
 
-        for count in range(len(output_files)):
-            file_name = output_files[count]
-            gs.verbose(_("Transforming r.what output file %s") % (file_name))
-            map_list = output_time_list[count]
-            with open(file_name) as in_file:
-                for line in in_file:
-                    line = line.split(separator)
-                    if vcat:
-                        cat = line[0]
-                        x = line[1]
-                        y = line[2]
-                        values = line[4:]
-                        if site_input:
-                            site = line[3]
-                            values = line[5:]
+        for map_list, matrix in chunks:
+            for line in matrix:
+                if vcat:
+                    cat = line[0]
+                    x = line[1]
+                    y = line[2]
+                    values = line[4:]
+                    if site_input:
+                        site = line[3]
+                        values = line[5:]
 
-                    else:
-                        x = line[0]
-                        y = line[1]
-                        if site_input:
-                            site = line[2]
-                        values = line[3:]
-
-                    for i in range(len(values)):
-                        start, end = map_list[i].get_temporal_extent_as_tuple()
-                        cat_str = (
-                            "{ca}{sep}".format(ca=cat, sep=separator) if vcat else ""
-                        )
-                        if site_input:
-                            coor_string = (
-                                "%(x)10.10f%(sep)s%(y)10.10f%(sep)s%(site_name)s%(sep)s"
-                                % (
-                                    {
-                                        "x": float(x),
-                                        "y": float(y),
-                                        "site_name": str(site),
-                                        "sep": separator,
-                                    }
-                                )
-                            )
-                        else:
-                            coor_string = "%(x)10.10f%(sep)s%(y)10.10f%(sep)s" % (
-                                {"x": float(x), "y": float(y), "sep": separator}
+                else:
+                    x = line[0]
+                    y = line[1]
+                    if site_input:
+                        site = line[2]
+                    values = line[3:]
+
+                for i in range(len(values)):
+                    start, end = map_list[i].get_temporal_extent_as_tuple()
+                    cat_str = "{ca}{sep}".format(ca=cat, sep=separator) if vcat else ""
+                    if site_input:
+                        coor_string = (
+                            "%(x)10.10f%(sep)s%(y)10.10f%(sep)s%(site_name)s%(sep)s"
+                            % (
+                                {
+                                    "x": float(x),
+                                    "y": float(y),
+                                    "site_name": str(site),
+                                    "sep": separator,
+                                }
                             )
-                        time_string = "%(start)s%(sep)s%(end)s%(sep)s%(val)s\n" % (
-                            {
-                                "start": str(start),
-                                "end": str(end),
-                                "val": (values[i].strip()),
-                                "sep": separator,
-                            }
                         )
+                    else:
+                        coor_string = "%(x)10.10f%(sep)s%(y)10.10f%(sep)s" % (
+                            {"x": float(x), "y": float(y), "sep": separator}
+                        )
+                    time_string = "%(start)s%(sep)s%(end)s%(sep)s%(val)s\n" % (
+                        {
+                            "start": str(start),
+                            "end": str(end),
+                            "val": (values[i].strip()),
+                            "sep": separator,
+                        }
+                    )
 
-                        out_file.write(cat_str + coor_string + time_string)
+                    out_file.write(cat_str + coor_string + time_string)
 
 
 ############################################################################
 
 
-def one_point_per_col_output(
-    separator, output_files, output_time_list, output, write_header, site_input, vcat
-):
+def one_point_per_col_output(separator, chunks, output, write_header, site_input, vcat):
     """Write one point per col
     output is of type:
     start,end,point_1 value,point_2 value,...,point_n value
@@ -441,16 +399,7 @@ def one_point_per_col_output(
 
     first = True
     with open(output, "w") if output != "-" else nullcontext(sys.stdout) as out_file:
-        for count in range(len(output_files)):
-            file_name = output_files[count]
-            gs.verbose(_("Transforming r.what output file %s") % (file_name))
-            with open(file_name) as in_file:
-                lines = in_file.readlines()
-
-            matrix = []
-            for line in lines:
-                matrix.append(line.split(separator))
-
+        for map_list, matrix in chunks:
             num_cols = len(matrix[0])
 
             if first is True:
@@ -493,7 +442,7 @@ def one_point_per_col_output(
 
             ncol = 4 if vcat else 3
             for col in range(num_cols - ncol):
-                start, end = output_time_list[count][col].get_temporal_extent_as_tuple()
+                start, end = map_list[col].get_temporal_extent_as_tuple()
                 time_string = "%(start)s%(sep)s%(end)s" % (
                     {"start": str(start), "end": str(end), "sep": separator}
                 )
@@ -511,7 +460,7 @@ def one_point_per_col_output(
 
 
 def one_point_per_timerow_output(
-    separator, output_files, output_time_list, output, write_header, site_input, vcat
+    separator, chunks, output, write_header, site_input, vcat
 ):
     """Use the original layout of the r.what output and print instead of
     the raster names, the time stamps as header
@@ -526,11 +475,7 @@ def one_point_per_timerow_output(
     header = ""
 
     first = True
-    for count in range(len(output_files)):
-        file_name = output_files[count]
-        gs.verbose("Transforming r.what output file %s" % (file_name))
-        map_list = output_time_list[count]
-
+    for map_list, lines in chunks:
         if write_header:
             if first is True:
                 header = "cat{sep}".format(sep=separator) if vcat else ""
@@ -545,11 +490,8 @@ def one_point_per_timerow_output(
                 )
                 header += time_string
 
-        with open(file_name) as in_file:
-            lines = in_file.readlines()
-
         for i in range(len(lines)):
-            cols = lines[i].split(separator)
+            cols = lines[i]
 
             if first is True:
                 if vcat and site_input:
@@ -585,62 +527,6 @@ def one_point_per_timerow_output(
             out_file.write("\n")
 
 
-############################################################################
-
-
-def process_loop(
-    nprocs,
-    maps,
-    file_name,
-    count,
-    maps_per_process,
-    remaining_maps_per_loop,
-    output_files,
-    output_time_list,
-    r_what,
-    process_queue,
-):
-    """Call r.what in parallel subprocesses"""
-    first = True
-    for process in range(nprocs):
-        num = maps_per_process
-        # Add the remaining maps to the first process
-        if first is True:
-            num += remaining_maps_per_loop
-        first = False
-
-        # Temporary output file
-        final_file_name = file_name + "_%i" % (process)
-        output_files.append(final_file_name)
-
-        map_names = []
-        map_list = []
-        for i in range(num):
-            map = maps[count]
-            map_names.append(map.get_id())
-            map_list.append(map)
-            count += 1
-
-        output_time_list.append(map_list)
-
-        gs.verbose(
-            _("Process maps %(samp_start)i to %(samp_end)i (of %(total)i)")
-            % (
-                {
-                    "samp_start": count - len(map_names) + 1,
-                    "samp_end": count,
-                    "total": len(maps),
-                }
-            )
-        )
-        mod = copy.deepcopy(r_what)
-        mod(map=map_names, output=final_file_name)
-        # print(mod.get_bash())
-        process_queue.put(mod)
-
-    return count
-
-
 ############################################################################
 
 if __name__ == "__main__":
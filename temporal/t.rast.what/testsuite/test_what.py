@@ -317,6 +317,56 @@ class TestRasterWhat(TestCase):
             "out_where.txt", "af731bec01fedc262f4ac162fe420707", text=True
         )
 
+    def test_same_as_r_what(self):
+        """Floating point values, null values and points outside of the
+        region or on its edges are sampled like r.what does it
+        """
+        self.runModule("r.mapcalc", expression="b_1 = float(row()) / 3", overwrite=True)
+        self.runModule(
+            "r.mapcalc",
+            expression="b_2 = if(col() == 2, null(), double(col()) / 7)",
+            overwrite=True,
+        )
+        self.runModule(
+            "t.create",
+            type="strds",
+            temporaltype="absolute",
+            output="B",
+            title="B test",
+            description="B test",
+            overwrite=True,
+        )
+        self.runModule(
+            "t.register",
+            flags="i",
+            type="raster",
+            input="B",
+            maps="b_1,b_2",
+            start="2001-01-01",
+            increment="3 months",
+            overwrite=True,
+        )
+        coordinates = (15, 75, 120, 0, 0, 80, 200, 200, 55.5, 33.3)
+        t_rast_what = SimpleModule(
+            "t.rast.what",
+            strds="B",
+            output="-",
+            coordinates=coordinates,
+            layout="timerow",
+            nprocs=2,
+        )
+        self.assertModule(t_rast_what)
+        r_what = SimpleModule("r.what", map="b_1,b_2", coordinates=coordinates)
+        self.assertModule(r_what)
+        self.runModule("t.remove", flags="df", type="strds", inputs="B")
+
+        expected = []
+        for line in r_what.outputs.stdout.splitlines():
+            columns = line.split("|")
+            # The site name is not part of the timerow layout
+            expected.append("|".join(columns[:2] + columns[3:]))
+        self.assertEqual(t_rast_what.outputs.stdout.splitlines(), expected)
+
     def test_empty_strds(self):
         self.assertModuleFail(
             "t.rast.what",